@@ -42,6 +42,7 @@ from .grid import (
     RasterModelGrid,
     VoronoiDelaunayGrid,
     NetworkModelGrid,
+    TiledRasterModelGrid,
     create_and_initialize_grid,
 )
 from .plot import (
@@ -82,6 +83,7 @@ __all__ = [
     "RasterModelGrid",
     "VoronoiDelaunayGrid",
     "NetworkModelGrid",
+    "TiledRasterModelGrid",
     "BAD_INDEX_VALUE",
     "CORE_NODE",
     "FIXED_VALUE_BOUNDARY",
@@ -586,29 +586,17 @@ class LatticeNormalFault(HexLatticeTectonicizer):
         >>> pdata = np.arange(25)
         >>> ohcts = OrientedHexCTS(mg, nsd, xnlist, nsg)
         >>> lnf = LatticeNormalFault(-0.1, grid=mg)
-        >>> pq = ohcts.priority_queue._queue
-        >>> (int(1000 * pq[11][0]), pq[11][1:])
-        (752, (11, 23))
-        >>> (int(1000 * pq[12][0]), pq[12][1:])
-        (483, (9, 20))
-        >>> (int(1000 * pq[30][0]), pq[30][1:])
-        (575, (6, 16))
+        >>> def events_at(links):
+        ...     events = dict((link, (int(1000 * time), index))
+        ...                   for (time, index, link) in ohcts.priority_queue._queue)
+        ...     return [events[link] for link in links]
+        >>> events_at([23, 20, 16])
+        [(752, 11), (483, 9), (575, 6)]
         >>> lnf.do_offset(ca=ohcts)
-        >>> (int(1000 * pq[48][0]), pq[48][1:])
-        (752, (11, 43))
-        >>> (int(1000 * pq[54][0]), pq[54][1:])
-        (483, (9, 40))
-        >>> (int(1000 * pq[61][0]), pq[61][1:])
-        (575, (6, 37))
+        >>> events_at([43, 40, 37])
+        [(752, 11), (483, 9), (575, 6)]
         """
-        for i in range(len(ca.priority_queue._queue)):
-            link = ca.priority_queue._queue[i][2]
-            if self.link_offset_id[link] != link:
-                ca.priority_queue._queue[i] = (
-                    ca.priority_queue._queue[i][0],
-                    ca.priority_queue._queue[i][1],
-                    self.link_offset_id[link],
-                )
+        ca.priority_queue.remap_items(self.link_offset_id)
 
     def shift_link_states(self, ca, current_time):
         """Shift link data up and right.
@@ -980,21 +968,15 @@ class LatticeUplifter(HexLatticeTectonicizer):
             ca.next_trn_id[lnk] = ca.next_trn_id[lnk - shift]
             ca.next_update[lnk] = ca.next_update[lnk - shift]
 
-        # Sweep through event queue, shifting links upward. Do NOT shift links
+        # Shift the links of scheduled events upward. Do NOT shift links
         # with IDs greater than NL - [SHIFT + (NC - 1)], because these are so
         # close to the top of the grid that either the events would refer to
         # non-existent links (>= NL) or would involve shifting an event onto
-        # an upper-boundary link. Note that because the event data are stored
-        # in a tuple, we have to replace the entire tuple (can't simply change
-        # the one item, because tuples are immutable)
+        # an upper-boundary link.
         first_no_shift_id = self.grid.number_of_links - (shift + (nc - 1))
-        for i in range(len(ca.priority_queue._queue)):
-            if ca.priority_queue._queue[i][2] < first_no_shift_id:
-                ca.priority_queue._queue[i] = (
-                    ca.priority_queue._queue[i][0],
-                    ca.priority_queue._queue[i][1],
-                    (ca.priority_queue._queue[i][2] + shift),
-                )
+        new_link = np.arange(self.grid.number_of_links)
+        new_link[:first_no_shift_id] += shift
+        ca.priority_queue.remap_items(new_link)
 
         # Update state of links along the boundaries.
         for lk in self.links_to_update:
@@ -1017,6 +999,7 @@ class LatticeUplifter(HexLatticeTectonicizer):
                 ca.next_update[lk] = event_time
                 ca.next_trn_id[lk] = this_trn_id
             else:
+                ca.priority_queue.remove(lk)
                 ca.next_update[lk] = _NEVER
                 ca.next_trn_id[lk] = -1
 
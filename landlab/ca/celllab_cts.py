@@ -83,9 +83,9 @@ node_pair : list (x number of possible link states)
     you to look up the node states and orientation corresponding to a
     particular link-state ID.
 
-priority_queue : heap containing event records
-    Queue containing all future transition events, sorted by time of occurrence
-    (from soonest to latest).
+priority_queue : PriorityQueue
+    Queue containing the next transition event at each link, sorted by time
+    of occurrence (from soonest to latest).
 
 next_update : 1d array (x number of active links)
     Time (in the future) at which the link will undergo its next transition.
@@ -158,6 +158,7 @@ if _CYTEST:
         do_transition_new,
         update_link_states_and_transitions_new,
         run_cts_new,
+        run_cts_compiled,
         get_next_event_new,
     )
 
@@ -522,7 +523,7 @@ class CellLabCTSModel(object):
         # X self.event_queue = []
         # X heapify(self.event_queue)
         self.next_update = self.grid.add_zeros("link", "next_update_time")
-        self.priority_queue = PriorityQueue()
+        self.priority_queue = PriorityQueue(self.grid.number_of_links)
         self.next_trn_id = -np.ones(self.grid.number_of_links, dtype=np.int)
 
         # Assign link types from node types
@@ -1282,6 +1283,7 @@ class CellLabCTSModel(object):
             self.next_update[link] = event_time
             self.next_trn_id[link] = trn_id
         else:
+            self.priority_queue.remove(link)
             self.next_update[link] = _NEVER
             self.next_trn_id[link] = -1
 
@@ -1856,17 +1858,99 @@ class CellLabCTSModel(object):
     #                if _DEBUG:
     #                    print(self.node_state)
 
+    def run_compiled(self, run_to, plot_each_transition=False, plotter=None):
+        """Run the model forward with a fully compiled event loop.
+
+        If no plotting is requested and no transition has a property update
+        function, the whole loop of popping events, checking that they are
+        still valid, doing the transitions and scheduling new ones runs in
+        compiled code, without calling back into Python. Otherwise, this is
+        the same as :meth:`run`.
+
+        Transition times are drawn from the model's own random number
+        generator, which is seeded from numpy's global generator the first
+        time the model is run this way. Runs are therefore reproducible with
+        ``np.random.seed``, but do not give the same sequence of events as
+        :meth:`run`.
+
+        Parameters
+        ----------
+        run_to : float
+            Time to run to, starting from self.current_time
+        plot_each_transition : bool (optional)
+            Option to display the grid after each transition
+        plotter : CAPlotter object (optional)
+            Needed if caller wants to plot after every transition
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.ca.celllab_cts import Transition
+        >>> from landlab.ca.oriented_raster_cts import OrientedRasterCTS
+        >>> import numpy as np
+        >>> grid = RasterModelGrid((3, 5))
+        >>> nsd = {0 : 'zero', 1 : 'one'}
+        >>> trn_list = []
+        >>> trn_list.append(Transition((0, 1, 0), (1, 0, 0), 1.0))
+        >>> trn_list.append(Transition((1, 0, 0), (0, 1, 0), 2.0))
+        >>> trn_list.append(Transition((0, 1, 1), (1, 0, 1), 3.0))
+        >>> trn_list.append(Transition((0, 1, 1), (1, 1, 1), 4.0))
+        >>> ins = np.arange(15) % 2
+        >>> cts = OrientedRasterCTS(grid, nsd, trn_list, ins)
+        >>> cts.run_compiled(10.0)
+        >>> cts.current_time
+        10.0
+        """
+        if plot_each_transition or np.any(self.trn_prop_update_fn != 0):
+            self.run(
+                run_to, plot_each_transition=plot_each_transition, plotter=plotter
+            )
+            return
+
+        if not hasattr(self, "_rng_state"):
+            self._rng_state = np.random.randint(
+                1, np.iinfo(np.int64).max, size=1, dtype=np.int64
+            ).astype(np.uint64)
+
+        self.current_time = run_cts_compiled(
+            run_to,
+            self.current_time,
+            self.priority_queue,
+            self.next_update,
+            self.grid.node_at_link_tail,
+            self.grid.node_at_link_head,
+            self.node_state,
+            self.next_trn_id,
+            self.trn_to,
+            self.grid.status_at_node,
+            self.num_node_states,
+            self.num_node_states_sq,
+            self.bnd_lnk,
+            self.link_orientation,
+            self.link_state,
+            self.n_trn,
+            self.trn_id,
+            self.trn_rate,
+            self.grid.links_at_node,
+            self.grid.active_link_dirs_at_node,
+            self.trn_propswap,
+            self.propid,
+            self.prop_data,
+            self.prop_reset_value,
+            self._rng_state,
+        )
+
     def run_new(self, run_to, plot_each_transition=False, plotter=None):
         """Test of new approach using priority queue."""
 
         # Continue until we've run out of either time or events
-        while self.current_time < run_to and self.priority_queue._queue:
+        while self.current_time < run_to and len(self.priority_queue) > 0:
 
             if _DEBUG:
                 print("Current Time = ", self.current_time)
 
             # Is there an event scheduled to occur within this run?
-            if self.priority_queue._queue[0][0] <= run_to:
+            if self.priority_queue.peek()[0] <= run_to:
 
                 # If so, pick the next transition event from the event queue
                 (ev_time, ev_idx, ev_link) = self.priority_queue.pop()
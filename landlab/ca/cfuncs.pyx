@@ -35,22 +35,223 @@ cdef char _DEBUG = 0
 
 cdef class PriorityQueue:
     """
-    Implements a priority queue.
-    """
-    cdef public object _queue
-    cdef public int _index
+    Implements an indexed priority queue of events at links.
+
+    The queue is a binary heap stored in typed arrays. Each item (a link ID)
+    has at most one entry in the queue: pushing an item that is already in
+    the queue replaces its entry, moving it up or down the heap as needed.
+    Entries are ordered by priority (event time) and then by the order in
+    which they were pushed.
 
-    def __init__(self):
-        self._queue = []
+    Examples
+    --------
+    >>> from landlab.ca.cfuncs import PriorityQueue
+    >>> pq = PriorityQueue()
+    >>> pq.push(2, 2.2)
+    >>> pq.push(5, 5.5)
+    >>> pq.push(0, 0.11)
+    >>> len(pq)
+    3
+    >>> pq.peek()
+    (0.11, 2, 0)
+
+    Pushing an item that is already queued reschedules it.
+
+    >>> pq.push(5, 0.5)
+    >>> len(pq)
+    3
+    >>> pq.pop()
+    (0.11, 2, 0)
+    >>> pq.pop()
+    (0.5, 3, 5)
+    >>> pq.remove(2)
+    >>> len(pq)
+    0
+    """
+    cdef DTYPE_t[:] _priority
+    cdef long[:] _order
+    cdef long[:] _item
+    cdef long[:] _position
+    cdef public long _index
+    cdef long _size
+
+    def __init__(self, long number_of_items=0):
+        self._priority = np.empty(max(number_of_items, 1), dtype=np.double)
+        self._order = np.empty(max(number_of_items, 1), dtype=np.int_)
+        self._item = np.empty(max(number_of_items, 1), dtype=np.int_)
+        self._position = np.full(max(number_of_items, 1), -1, dtype=np.int_)
         self._index = 0
+        self._size = 0
 
-    def push(self, int item, double priority):
-        heappush(self._queue, (priority, self._index, item))
-        self._index += 1
+    def __len__(self):
+        return self._size
+
+    property _queue:
+        """Entries as (priority, index, item) tuples, in heap order."""
+        def __get__(self):
+            return [(self._priority[i], self._order[i], self._item[i])
+                    for i in range(self._size)]
+
+    def push(self, long item, double priority):
+        self._push(item, priority)
 
     def pop(self):
-        assert len(self._queue) > 0, 'Q is empty'
-        return heappop(self._queue)
+        assert self._size > 0, 'Q is empty'
+        entry = (self._priority[0], self._order[0], self._item[0])
+        self._pop()
+        return entry
+
+    def peek(self):
+        """Return the first entry without removing it from the queue."""
+        assert self._size > 0, 'Q is empty'
+        return (self._priority[0], self._order[0], self._item[0])
+
+    def remove(self, long item):
+        """Remove the entry of an item, if it is in the queue."""
+        self._remove(item)
+
+    def remap_items(self, np.ndarray[DTYPE_INT_t, ndim=1] new_item):
+        """Move queued entries from one item to another.
+
+        The entry of item *i* becomes an entry of item ``new_item[i]``. An
+        entry that moves onto an item replaces that item's own entry unless
+        it also moves.
+        """
+        cdef long i, item, n = 0
+        cdef np.ndarray[DTYPE_INT8_t, ndim=1] is_target = np.zeros(
+            max(new_item.shape[0], self._position.shape[0]), dtype=np.int8)
+
+        for i in range(self._size):
+            item = self._item[i]
+            if new_item[item] != item:
+                is_target[new_item[item]] = 1
+
+        for i in range(self._size):
+            item = self._item[i]
+            self._position[item] = -1
+            if new_item[item] != item or not is_target[item]:
+                self._priority[n] = self._priority[i]
+                self._order[n] = self._order[i]
+                self._item[n] = new_item[item]
+                n += 1
+        self._size = n
+
+        self._grow(new_item.shape[0])
+        for i in range(n):
+            self._position[self._item[i]] = i
+        for i in range(n // 2 - 1, -1, -1):
+            self._sift_down(i)
+
+    cdef void _grow(self, long number_of_items):
+        cdef long n
+        if number_of_items > self._position.shape[0]:
+            n = max(number_of_items, 2 * self._position.shape[0])
+            position = np.full(n, -1, dtype=np.int_)
+            position[:self._position.shape[0]] = self._position
+            self._position = position
+        if self._size == self._item.shape[0]:
+            n = 2 * self._item.shape[0]
+            self._priority = np.resize(self._priority, n)
+            self._order = np.resize(self._order, n)
+            self._item = np.resize(self._item, n)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef inline bint _before(self, long i, long j) nogil:
+        return (self._priority[i] < self._priority[j] or
+                (self._priority[i] == self._priority[j] and
+                 self._order[i] < self._order[j]))
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef inline void _swap(self, long i, long j) nogil:
+        cdef double priority = self._priority[i]
+        cdef long order = self._order[i]
+        cdef long item = self._item[i]
+        self._priority[i] = self._priority[j]
+        self._order[i] = self._order[j]
+        self._item[i] = self._item[j]
+        self._priority[j] = priority
+        self._order[j] = order
+        self._item[j] = item
+        self._position[self._item[i]] = i
+        self._position[self._item[j]] = j
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _sift_up(self, long i) nogil:
+        cdef long parent
+        while i > 0:
+            parent = (i - 1) >> 1
+            if self._before(i, parent):
+                self._swap(i, parent)
+                i = parent
+            else:
+                break
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _sift_down(self, long i) nogil:
+        cdef long child
+        while True:
+            child = 2 * i + 1
+            if child >= self._size:
+                break
+            if child + 1 < self._size and self._before(child + 1, child):
+                child += 1
+            if self._before(child, i):
+                self._swap(i, child)
+                i = child
+            else:
+                break
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _push(self, long item, double priority) nogil:
+        cdef long i
+
+        if item >= self._position.shape[0] or self._size == self._item.shape[0]:
+            with gil:
+                self._grow(item + 1)
+
+        i = self._position[item]
+        if i < 0:
+            i = self._size
+            self._size += 1
+            self._item[i] = item
+            self._position[item] = i
+            self._priority[i] = priority
+            self._order[i] = self._index
+            self._sift_up(i)
+        else:
+            self._priority[i] = priority
+            self._order[i] = self._index
+            self._sift_up(i)
+            self._sift_down(self._position[item])
+        self._index += 1
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _remove_at(self, long i) nogil:
+        cdef long last = self._size - 1
+        cdef long item
+        if i != last:
+            self._swap(i, last)
+        self._position[self._item[last]] = -1
+        self._size -= 1
+        if i != last:
+            item = self._item[i]
+            self._sift_up(i)
+            self._sift_down(self._position[item])
+
+    cdef void _pop(self) nogil:
+        self._remove_at(0)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _remove(self, long item) nogil:
+        if item < self._position.shape[0] and self._position[item] >= 0:
+            self._remove_at(self._position[item])
 
 
 cdef class Event:
@@ -584,10 +785,11 @@ cdef void update_link_state_new(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
         (event_time, this_trn_id) = get_next_event_new(link, new_link_state, 
                                                        current_time,
                                                        n_trn, trn_id, trn_rate)
-        priority_queue.push(link, event_time)
+        priority_queue._push(link, event_time)
         next_update[link] = event_time
         next_trn_id[link] = this_trn_id
     else:
+        priority_queue._remove(link)
         next_update[link] = _NEVER
         next_trn_id[link] = -1
 
@@ -991,26 +1193,25 @@ cpdef double run_cts_new(double run_to, double current_time,
         Needed if caller wants to plot after every transition
     (see celllab_cts.py for other parameters)
     """
-    import sys
     cdef double ev_time
-    cdef int ev_idx
     cdef int ev_link
 
     # Continue until we've run out of either time or events
-    while current_time < run_to and priority_queue._queue:
+    while current_time < run_to and priority_queue._size > 0:
 
         if _DEBUG:
             print('current time = ', current_time)
 
         # Is there an event scheduled to occur within this run?
-        if priority_queue._queue[0][0] <= run_to:
+        if priority_queue._priority[0] <= run_to:
 
             # If so, pick the next transition event from the event queue
-            (ev_time, ev_idx, ev_link) = priority_queue.pop()
+            ev_time = priority_queue._priority[0]
+            ev_link = priority_queue._item[0]
+            priority_queue._pop()
 
             if _DEBUG:
                 print('event:', ev_time, ev_link, trn_to[next_trn_id[ev_link]])
-                print('pq top is now:', priority_queue._queue[0])
 
             # ... and execute the transition
             do_transition_new(ev_link, ev_time, priority_queue, next_update,
@@ -1052,6 +1253,220 @@ cpdef double run_cts_new(double run_to, double current_time,
     return current_time
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef inline double _exponential(double rate, np.uint64_t *state) nogil:
+    """Draw a random time from an exponential distribution.
+
+    Uniform random numbers come from a xorshift64* generator whose state is
+    updated in place.
+    """
+    state[0] ^= state[0] >> 12
+    state[0] ^= state[0] << 25
+    state[0] ^= state[0] >> 27
+    return -log(
+        1.0 - ((state[0] * 2685821657736338717ULL) >> 11) / 9007199254740992.0
+    ) / rate
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void _update_link_state_compiled(DTYPE_INT_t link,
+                                      DTYPE_INT_t new_link_state,
+                                      DTYPE_t current_time,
+                                      PriorityQueue priority_queue,
+                                      const DTYPE_INT8_t[:] bnd_lnk,
+                                      DTYPE_INT_t[:] node_state,
+                                      const DTYPE_INT_t[:] node_at_link_tail,
+                                      const DTYPE_INT_t[:] node_at_link_head,
+                                      const DTYPE_INT8_t[:] link_orientation,
+                                      DTYPE_INT_t num_node_states,
+                                      DTYPE_INT_t num_node_states_sq,
+                                      DTYPE_INT_t[:] link_state,
+                                      const DTYPE_INT_t[:] n_trn,
+                                      DTYPE_t[:] next_update,
+                                      DTYPE_INT_t[:] next_trn_id,
+                                      const DTYPE_INT_t[:, :] trn_id,
+                                      const DTYPE_t[:] trn_rate,
+                                      np.uint64_t *rng_state) nogil:
+    """Update the state of a link and reschedule its next transition.
+
+    This is the same as update_link_state_new, but draws transition times
+    from the compiled random number generator and does not need the GIL.
+    """
+    cdef DTYPE_INT_t i, this_trn_id, next_id
+    cdef double next_time, this_next
+
+    if bnd_lnk[link]:
+        new_link_state = (
+            link_orientation[link] * num_node_states_sq +
+            node_state[node_at_link_tail[link]] * num_node_states +
+            node_state[node_at_link_head[link]])
+
+    link_state[link] = new_link_state
+    if n_trn[new_link_state] > 0:
+        next_time = _NEVER
+        next_id = -1
+        for i in range(n_trn[new_link_state]):
+            this_trn_id = trn_id[new_link_state, i]
+            this_next = _exponential(trn_rate[this_trn_id], rng_state)
+            if this_next < next_time:
+                next_time = this_next
+                next_id = this_trn_id
+        priority_queue._push(link, current_time + next_time)
+        next_update[link] = current_time + next_time
+        next_trn_id[link] = next_id
+    else:
+        priority_queue._remove(link)
+        next_update[link] = _NEVER
+        next_trn_id[link] = -1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef double run_cts_compiled(double run_to, double current_time,
+                              PriorityQueue priority_queue,
+                              DTYPE_t[:] next_update,
+                              const DTYPE_INT_t[:] node_at_link_tail,
+                              const DTYPE_INT_t[:] node_at_link_head,
+                              DTYPE_INT_t[:] node_state,
+                              DTYPE_INT_t[:] next_trn_id,
+                              const DTYPE_INT_t[:] trn_to,
+                              const DTYPE_UINT8_t[:] status_at_node,
+                              DTYPE_INT_t num_node_states,
+                              DTYPE_INT_t num_node_states_sq,
+                              const DTYPE_INT8_t[:] bnd_lnk,
+                              const DTYPE_INT8_t[:] link_orientation,
+                              DTYPE_INT_t[:] link_state,
+                              const DTYPE_INT_t[:] n_trn,
+                              const DTYPE_INT_t[:, :] trn_id,
+                              const DTYPE_t[:] trn_rate,
+                              const DTYPE_INT_t[:, :] links_at_node,
+                              const DTYPE_INT8_t[:, :] active_link_dirs_at_node,
+                              const DTYPE_INT8_t[:] trn_propswap,
+                              DTYPE_INT_t[:] propid,
+                              object prop_data,
+                              object prop_reset_value,
+                              np.uint64_t[:] rng_state):
+    """Run the model forward without calling back into Python.
+
+    This does the same as run_cts_new, but without plotting or property
+    update functions, so the loop over events runs without the GIL. The GIL
+    is only taken to reset the property of a cell that is swapped onto a
+    boundary node.
+
+    Parameters
+    ----------
+    run_to : float
+        Time to run to.
+    current_time : float
+        Current time in the simulation.
+    rng_state : ndarray of uint64, shape (1, )
+        State of the random number generator used to draw transition
+        times. Updated in place.
+    (see celllab_cts.py for other parameters)
+
+    Returns
+    -------
+    float
+        The time the model was run to.
+    """
+    cdef double ev_time
+    cdef DTYPE_INT_t ev_link, link
+    cdef DTYPE_INT_t tail_node, head_node
+    cdef DTYPE_INT_t old_tail_node_state, old_head_node_state
+    cdef DTYPE_INT_t this_trn_id, this_trn_to, tmp
+    cdef DTYPE_INT_t node, old_node_state
+    cdef Py_ssize_t i, k
+    cdef Py_ssize_t max_links_at_node = links_at_node.shape[1]
+    cdef np.uint64_t state = rng_state[0]
+
+    with nogil:
+        while current_time < run_to and priority_queue._size > 0:
+
+            # Is there an event scheduled to occur within this run? If not,
+            # simply advance current_time to the end of the run.
+            if priority_queue._priority[0] > run_to:
+                current_time = run_to
+                break
+
+            ev_time = priority_queue._priority[0]
+            ev_link = priority_queue._item[0]
+            priority_queue._pop()
+
+            if ev_time == next_update[ev_link]:
+
+                tail_node = node_at_link_tail[ev_link]
+                head_node = node_at_link_head[ev_link]
+                old_tail_node_state = node_state[tail_node]
+                old_head_node_state = node_state[head_node]
+
+                this_trn_id = next_trn_id[ev_link]
+                this_trn_to = trn_to[this_trn_id]
+
+                if status_at_node[tail_node] == _CORE:
+                    node_state[tail_node] = (
+                        this_trn_to / num_node_states) % num_node_states
+                if status_at_node[head_node] == _CORE:
+                    node_state[head_node] = this_trn_to % num_node_states
+
+                _update_link_state_compiled(
+                    ev_link, this_trn_to, ev_time, priority_queue, bnd_lnk,
+                    node_state, node_at_link_tail, node_at_link_head,
+                    link_orientation, num_node_states, num_node_states_sq,
+                    link_state, n_trn, next_update, next_trn_id, trn_id,
+                    trn_rate, &state)
+
+                # Update the other links at nodes whose state has changed
+                for k in range(2):
+                    if k == 0:
+                        node = tail_node
+                        old_node_state = old_tail_node_state
+                    else:
+                        node = head_node
+                        old_node_state = old_head_node_state
+                    if node_state[node] == old_node_state:
+                        continue
+
+                    for i in range(max_links_at_node):
+                        link = links_at_node[node, i]
+                        if (active_link_dirs_at_node[node, i] != 0 and
+                                link != ev_link):
+                            _update_link_state_compiled(
+                                link,
+                                link_orientation[link] * num_node_states_sq +
+                                node_state[node_at_link_tail[link]] *
+                                num_node_states +
+                                node_state[node_at_link_head[link]],
+                                ev_time, priority_queue, bnd_lnk, node_state,
+                                node_at_link_tail, node_at_link_head,
+                                link_orientation, num_node_states,
+                                num_node_states_sq, link_state, n_trn,
+                                next_update, next_trn_id, trn_id, trn_rate,
+                                &state)
+
+                if trn_propswap[this_trn_id]:
+                    tmp = propid[tail_node]
+                    propid[tail_node] = propid[head_node]
+                    propid[head_node] = tmp
+                    if (status_at_node[tail_node] != _CORE or
+                            status_at_node[head_node] != _CORE):
+                        with gil:
+                            if status_at_node[tail_node] != _CORE:
+                                prop_data[propid[tail_node]] = prop_reset_value
+                            if status_at_node[head_node] != _CORE:
+                                prop_data[propid[head_node]] = prop_reset_value
+
+            current_time = ev_time
+
+    rng_state[0] = state
+
+    return current_time
+
+
 cpdef double run_cts(double run_to, double current_time,
                      char plot_each_transition,
                      object plotter,
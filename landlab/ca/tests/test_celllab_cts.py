@@ -236,6 +236,41 @@ def test_priority_queue():
     assert item == 5, "incorrect item in PQ test"
 
 
+def test_priority_queue_reschedule():
+    """Test that pushing a queued item replaces its entry."""
+    from ..cfuncs import PriorityQueue
+
+    pq = PriorityQueue()
+    for item in range(6):
+        pq.push(item, float(item))
+
+    pq.push(4, 0.5)  # earlier
+    pq.push(1, 9.0)  # later
+    pq.remove(2)
+    pq.remove(2)  # no longer in the queue
+
+    assert len(pq) == 5, "rescheduled items should not be duplicated"
+    assert [pq.pop()[2] for _ in range(5)] == [0, 4, 3, 5, 1]
+    assert pq._queue == [], "event queue should now be empty but is not"
+
+
+def test_priority_queue_remap_items():
+    """Test moving queued events from one item to another."""
+    from ..cfuncs import PriorityQueue
+
+    pq = PriorityQueue()
+    pq.push(0, 1.0)
+    pq.push(1, 2.0)
+    pq.push(2, 3.0)
+
+    pq.remap_items(np.array([0, 2, 3]))  # 1 -> 2, 2 -> 3
+
+    assert len(pq) == 3
+    assert pq.pop() == (1.0, 0, 0)
+    assert pq.pop() == (2.0, 1, 2)
+    assert pq.pop() == (3.0, 2, 3)
+
+
 def test_run_oriented_raster():
     """Test running with a small grid, 2 states, 4 transition types."""
 
@@ -276,6 +311,50 @@ def test_run_oriented_raster():
     assert_array_equal(cts.node_state, [0, 1, 0, 1, 0, 1, 0, 0, 1, 1, 0, 1, 0, 1, 0])
 
 
+def test_run_compiled():
+    """Test running the compiled event loop on a hex lattice."""
+    mg = HexModelGrid(9, 9, 1.0, orientation="vertical", shape="rect")
+    nsd = {0: "fluid", 1: "grain"}
+    xnlist = []
+    for orientation in range(3):
+        xnlist.append(Transition((0, 1, orientation), (1, 0, orientation), 1.0))
+        xnlist.append(Transition((1, 0, orientation), (0, 1, orientation), 1.0))
+    nsg = mg.add_zeros("node", "node_state_grid", dtype=int)
+    nsg[::2] = 1
+    ca = OrientedHexCTS(mg, nsd, xnlist, nsg)
+
+    ca.run_compiled(5.0)
+
+    assert ca.current_time == 5.0
+    assert np.count_nonzero(ca.node_state) == np.count_nonzero(nsg)
+
+    links = mg.active_links
+    assert_array_equal(
+        ca.link_state[links],
+        ca.link_orientation[links] * ca.num_node_states_sq
+        + ca.node_state[mg.node_at_link_tail[links]] * ca.num_node_states
+        + ca.node_state[mg.node_at_link_head[links]],
+    )
+    for (event_time, index, link) in ca.priority_queue._queue:
+        assert event_time == ca.next_update[link]
+        assert event_time > 5.0
+
+
+def test_run_compiled_with_callback():
+    """Test that the compiled event loop falls back when given a callback."""
+    mg = RasterModelGrid((4, 4))
+    mg.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    nsg = mg.add_ones("node", "node_state_map", dtype=int)
+    nsg[6] = 0
+    xnlist = [Transition((1, 0, 0), (0, 1, 0), 0.1, "", True, callback_function)]
+    ca = RasterCTS(mg, {0: "black", 1: "white"}, xnlist, nsg)
+
+    ca.run_compiled(1.0e6)
+
+    assert not hasattr(ca, "_rng_state")
+    assert ca.node_state[6] == 1
+
+
 def test_grain_hill_model():
     """Run a lattice-grain-based hillslope evolution model."""
     from .grain_hill import GrainHill
@@ -424,7 +424,11 @@ class LinearDiffuser(Component):
             self.updated_boundary_conditions()  # just in case
             self._run_before = True
         if self._bc_set_code != self.grid.bc_set_code:
-            self.updated_boundary_conditions()
+            # fixed-gradient nodes are found from the status of links so, if
+            # no link changed status, there is nothing to update.
+            changed_links = self.grid.changed_links_since(self._bc_set_code)
+            if changed_links is None or changed_links.size > 0:
+                self.updated_boundary_conditions()
             self._bc_set_code = self.grid.bc_set_code
 
         core_nodes = self.grid.node_at_core_cell
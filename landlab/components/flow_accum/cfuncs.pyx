@@ -11,29 +11,196 @@ ctypedef np.double_t DTYPE_FLOAT_t
 
 
 @cython.boundscheck(False)
-cpdef _add_to_stack(DTYPE_INT_t l, DTYPE_INT_t j,
-                    np.ndarray[DTYPE_INT_t, ndim=1] s,
-                    np.ndarray[DTYPE_INT_t, ndim=1] delta,
-                    np.ndarray[DTYPE_INT_t, ndim=1] donors):
+@cython.wraparound(False)
+cpdef DTYPE_INT_t _add_to_stack(DTYPE_INT_t l, DTYPE_INT_t j,
+                                np.ndarray[DTYPE_INT_t, ndim=1] s,
+                                np.ndarray[DTYPE_INT_t, ndim=1] delta,
+                                np.ndarray[DTYPE_INT_t, ndim=1] donors,
+                                np.ndarray[DTYPE_INT_t, ndim=1] work):
 
     """
-    Adds node l to the stack and increments the current index (j).
+    Adds node l, and everything upstream of it, to the stack.
+
+    Rather than recursing, nodes still to be visited are kept on an
+    explicit stack, *work*, which must be at least as long as *donors*.
+    Donors are pushed in reverse order so that the resulting ordering is
+    the same as that of Braun & Willett's recursive add_to_stack. Returns
+    the incremented index (j).
+    """
+    cdef DTYPE_INT_t top, node, m, n
+
+    work[0] = l
+    top = 1
+    while top > 0:
+        top -= 1
+        node = work[top]
+
+        s[j] = node
+        j += 1
+
+        for n in range(delta[node + 1] - 1, delta[node] - 1, -1):
+            m = donors[n]
+            if m != node:
+                work[top] = m
+                top += 1
+
+    return j
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef DTYPE_INT_t _make_stack_bw(np.ndarray[DTYPE_INT_t, ndim=1] baselevel_nodes,
+                                 np.ndarray[DTYPE_INT_t, ndim=1] s,
+                                 np.ndarray[DTYPE_INT_t, ndim=1] delta,
+                                 np.ndarray[DTYPE_INT_t, ndim=1] donors,
+                                 np.ndarray[DTYPE_INT_t, ndim=1] work):
     """
-    cdef int m, n, delta_l, delta_lplus1
+    Builds the full downstream-to-upstream stack from the base-level nodes.
 
-    s[j] = l
-    j += 1
-    delta_l = delta[l]
-    delta_lplus1 = delta[l+1]
+    Returns the number of nodes added to the stack, *s*.
+    """
+    cdef DTYPE_INT_t j = 0
+    cdef DTYPE_INT_t k
 
-    for n in range(delta_l, delta_lplus1):
-        m = donors[n]
-        if m != l:
-            j = _add_to_stack(m, j, s, delta, donors)
+    for k in range(baselevel_nodes.shape[0]):
+        j = _add_to_stack(baselevel_nodes[k], j, s, delta, donors, work)
 
     return j
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef _fill_array_of_donors(np.ndarray[DTYPE_INT_t, ndim=1] r,
+                            np.ndarray[DTYPE_INT_t, ndim=1] delta,
+                            np.ndarray[DTYPE_INT_t, ndim=1] w,
+                            np.ndarray[DTYPE_INT_t, ndim=1] D):
+    """
+    Fills the donor array, D, in place using *w* as scratch space.
+    """
+    cdef DTYPE_INT_t n_nodes = r.shape[0]
+    cdef DTYPE_INT_t i, ri
+
+    for i in range(n_nodes):
+        w[i] = 0
+
+    for i in range(n_nodes):
+        ri = r[i]
+        D[delta[ri] + w[ri]] = i
+        w[ri] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef _count_upstream_bw(np.ndarray[DTYPE_INT_t, ndim=1] s,
+                         np.ndarray[DTYPE_INT_t, ndim=1] r,
+                         np.ndarray[DTYPE_INT_t, ndim=1] n_upstream):
+    """
+    Counts the number of nodes upstream of each node, including itself.
+    """
+    cdef DTYPE_INT_t n_nodes = s.shape[0]
+    cdef DTYPE_INT_t i, donor, recvr
+
+    for i in range(n_nodes):
+        n_upstream[i] = 1
+
+    for i in range(n_nodes - 1, -1, -1):
+        donor = s[i]
+        recvr = r[donor]
+        if donor != recvr:
+            n_upstream[recvr] += n_upstream[donor]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _add_along_path(DTYPE_INT_t node,
+                          DTYPE_INT_t count,
+                          DTYPE_FLOAT_t area,
+                          DTYPE_FLOAT_t flux,
+                          DTYPE_INT_t * r,
+                          DTYPE_INT_t * n_upstream,
+                          DTYPE_FLOAT_t * drainage_area,
+                          DTYPE_FLOAT_t * discharge):
+    """
+    Adds to each node from *node* downstream to its base-level node.
+    """
+    while True:
+        n_upstream[node] += count
+        drainage_area[node] += area
+        discharge[node] += flux
+        if r[node] == node:
+            break
+        node = r[node]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef bint _reroute_subtree_bw(DTYPE_INT_t node,
+                               DTYPE_INT_t new_receiver,
+                               np.ndarray[DTYPE_INT_t, ndim=1] r,
+                               np.ndarray[DTYPE_INT_t, ndim=1] s,
+                               np.ndarray[DTYPE_INT_t, ndim=1] position,
+                               np.ndarray[DTYPE_INT_t, ndim=1] n_upstream,
+                               np.ndarray[DTYPE_FLOAT_t, ndim=1] drainage_area,
+                               np.ndarray[DTYPE_FLOAT_t, ndim=1] discharge,
+                               np.ndarray[DTYPE_INT_t, ndim=1] work):
+    """
+    Reconnects *node*, and everything upstream of it, to a new receiver.
+
+    In a Braun & Willett stack, the nodes upstream of a node occupy a
+    contiguous block that starts at that node. Rerouting a node therefore
+    moves its block so that it immediately follows its new receiver (or to
+    the end of the stack if the node becomes a base-level node). The
+    upstream counts, drainage area and discharge of the nodes along the old
+    and new downstream paths are updated accordingly.
+
+    Returns False, without changing anything, if *new_receiver* is
+    currently upstream of *node*; the move is then only possible once
+    some other node has been rerouted.
+    """
+    cdef DTYPE_INT_t n_nodes = s.shape[0]
+    cdef DTYPE_INT_t start = position[node]
+    cdef DTYPE_INT_t size = n_upstream[node]
+    cdef DTYPE_INT_t old_receiver = r[node]
+    cdef DTYPE_FLOAT_t area = drainage_area[node]
+    cdef DTYPE_FLOAT_t flux = discharge[node]
+    cdef DTYPE_INT_t dest, i
+
+    if new_receiver != node:
+        if start <= position[new_receiver] < start + size:
+            return False
+        dest = position[new_receiver] + 1
+    else:
+        dest = n_nodes
+
+    if old_receiver != node:
+        _add_along_path(old_receiver, - size, - area, - flux, &r[0],
+                        &n_upstream[0], &drainage_area[0], &discharge[0])
+    r[node] = new_receiver
+    if new_receiver != node:
+        _add_along_path(new_receiver, size, area, flux, &r[0],
+                        &n_upstream[0], &drainage_area[0], &discharge[0])
+
+    for i in range(size):
+        work[i] = s[start + i]
+
+    if dest > start + size:
+        for i in range(start + size, dest):
+            s[i - size] = s[i]
+        for i in range(size):
+            s[dest - size + i] = work[i]
+        for i in range(start, dest):
+            position[s[i]] = i
+    elif dest < start:
+        for i in range(start - 1, dest - 1, -1):
+            s[i + size] = s[i]
+        for i in range(size):
+            s[dest + i] = work[i]
+        for i in range(dest, start + size):
+            position[s[i]] = i
+
+    return True
+
+
 @cython.boundscheck(False)
 cpdef _accumulate_to_n(DTYPE_INT_t np, DTYPE_INT_t q,
                        np.ndarray[DTYPE_INT_t, ndim=1] s,
@@ -22,6 +22,14 @@ If you simply want the ordered list by itself, use::
 
     s = make_ordered_node_array(r)
 
+The stack is built without recursion, so it works for drainage networks of
+any depth. When the ordering has to be rebuilt many times for the same grid
+(e.g., once per time step), a _StackWorkspace can be passed to
+make_ordered_node_array so that its buffers are allocated only once. If
+only a few receivers change between calls, _StackWorkspace.reroute updates
+the stack, and the drainage area and discharge, by moving only the parts of
+the network that were rerouted.
+
 Created: GT Nov 2013
 """
 import numpy
@@ -29,7 +37,14 @@ from six.moves import range
 
 from landlab.core.utils import as_id_array
 
-from .cfuncs import _accumulate_bw, _add_to_stack
+from .cfuncs import (
+    _accumulate_bw,
+    _add_to_stack,
+    _count_upstream_bw,
+    _fill_array_of_donors,
+    _make_stack_bw,
+    _reroute_subtree_bw,
+)
 
 
 class _DrainageStack:
@@ -52,6 +67,7 @@ class _DrainageStack:
         self.s = numpy.zeros(len(D), dtype=int)
         self.delta = delta
         self.D = D
+        self._work = numpy.empty(len(D), dtype=int)
 
     def add_to_stack(self, l):
 
@@ -69,11 +85,208 @@ class _DrainageStack:
         >>> ds.s
         array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
         """
-        # we invoke cython here to attempt to suppress Python's RecursionLimit
-        self.j = _add_to_stack(l, self.j, self.s, self.delta, self.D)
+        # the cython function uses an explicit stack rather than recursion,
+        # so there is no limit on the length of the drainage network.
+        self.j = _add_to_stack(l, self.j, self.s, self.delta, self.D, self._work)
+
+
+class _StackWorkspace(object):
+
+    """Preallocated buffers used to build a Braun & Willett stack.
+
+    The number-of-donors, delta, donor and stack arrays, as well as the
+    scratch space used while traversing the network, are allocated once
+    when the workspace is created and then filled in place each time the
+    stack is rebuilt.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum.flow_accum_bw import(
+    ... _StackWorkspace)
+    >>> r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8]) - 1
+    >>> ws = _StackWorkspace(10)
+    >>> ws.update(r)
+    array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
+    >>> ws.delta
+    array([ 0,  0,  2,  2,  2,  6,  7,  9, 10, 10, 10])
+    >>> ws.D
+    array([0, 2, 1, 4, 5, 7, 6, 3, 8, 9])
+
+    The buffers are reused on subsequent calls.
 
+    >>> s = ws.s
+    >>> r[8] = 9
+    >>> ws.update(r) is s
+    True
+    >>> s
+    array([4, 1, 0, 2, 5, 6, 3, 7, 9, 8])
+    """
 
-def _make_number_of_donors_array(r):
+    def __init__(self, n_nodes):
+        self.nd = numpy.empty(n_nodes, dtype=int)
+        self.delta = numpy.empty(n_nodes + 1, dtype=int)
+        self.D = numpy.empty(n_nodes, dtype=int)
+        self.s = numpy.empty(n_nodes, dtype=int)
+        self._work = numpy.empty(n_nodes, dtype=int)
+        self._n_in_stack = 0
+
+        # bookkeeping for incremental updates, created by reroute
+        self._receivers = None
+        self._position = None
+        self._n_upstream = None
+
+    @property
+    def number_of_nodes(self):
+        """Number of nodes the workspace was allocated for."""
+        return len(self.s)
+
+    def update(self, receiver_nodes):
+        """Rebuild the donor arrays and the stack for new receivers.
+
+        Parameters
+        ----------
+        receiver_nodes : ndarray of int
+            ID of receiver for each node.
+
+        Returns
+        -------
+        ndarray of int
+            The stack (a reference to the workspace buffer, *s*).
+        """
+        receiver_nodes = as_id_array(receiver_nodes)
+        if receiver_nodes.size != self.number_of_nodes:
+            raise ValueError(
+                "receiver array size does not match workspace "
+                "({0} != {1})".format(receiver_nodes.size, self.number_of_nodes)
+            )
+
+        _make_number_of_donors_array(receiver_nodes, out=self.nd)
+        _make_delta_array(self.nd, out=self.delta)
+        _make_array_of_donors(receiver_nodes, self.delta, out=self.D)
+
+        baselevel_nodes = as_id_array(
+            numpy.where(numpy.arange(receiver_nodes.size) == receiver_nodes)[0]
+        )
+        n_in_stack = _make_stack_bw(
+            baselevel_nodes, self.s, self.delta, self.D, self._work
+        )
+        self.s[n_in_stack:] = 0
+        self._n_in_stack = n_in_stack
+        self._receivers = None
+
+        return self.s
+
+    def reroute(self, receiver_nodes, drainage_area, discharge, max_fraction=0.05):
+        """Update the stack for the receivers that changed since the last call.
+
+        Nodes whose receiver changed are moved, together with everything
+        upstream of them, to follow their new receiver in the stack. The
+        drainage area and discharge of the nodes along the old and new
+        downstream paths of each moved node are updated in place. The
+        number-of-donors array is updated for the changed nodes only, while
+        delta and D are refilled from it.
+
+        If the previous call did not go through this method, if the stack
+        did not contain every node, if more than *max_fraction* of the
+        nodes changed receiver, or if the changes cannot be applied one at
+        a time without creating a loop, the stack is rebuilt from scratch.
+
+        Parameters
+        ----------
+        receiver_nodes : ndarray of int
+            ID of receiver for each node.
+        drainage_area : ndarray of float
+            Drainage area at each node for the previous receivers.
+        discharge : ndarray of float
+            Discharge at each node for the previous receivers.
+        max_fraction : float, optional
+            Largest fraction of nodes with changed receivers that is
+            rerouted incrementally.
+
+        Returns
+        -------
+        bool
+            True if the stack, drainage area and discharge were updated
+            incrementally. False if the stack was rebuilt, in which case
+            drainage area and discharge must be recalculated.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab.components.flow_accum.flow_accum_bw import(
+        ... _StackWorkspace, flow_accumulation)
+        >>> r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8]) - 1
+        >>> a, q, s = flow_accumulation(r)
+        >>> ws = _StackWorkspace(10)
+        >>> ws.reroute(r, a, q)
+        False
+        >>> r[8] = 9
+        >>> ws.reroute(r, a, q, max_fraction=1.)
+        True
+        >>> ws.s
+        array([4, 1, 0, 2, 5, 6, 3, 7, 9, 8])
+        >>> a
+        array([  1.,   3.,   1.,   1.,  10.,   3.,   2.,   3.,   1.,   2.])
+        >>> ws.D
+        array([0, 2, 1, 4, 5, 7, 6, 3, 9, 8])
+        """
+        receiver_nodes = as_id_array(receiver_nodes)
+        if self._receivers is None or self._n_in_stack < self.number_of_nodes:
+            self._rebuild_for_reroute(receiver_nodes)
+            return False
+
+        changed = numpy.flatnonzero(receiver_nodes != self._receivers)
+        if changed.size == 0:
+            return True
+        elif changed.size > max_fraction * self.number_of_nodes:
+            self._rebuild_for_reroute(receiver_nodes)
+            return False
+
+        numpy.subtract.at(self.nd, self._receivers[changed], 1)
+        numpy.add.at(self.nd, receiver_nodes[changed], 1)
+
+        pending = changed
+        while pending.size > 0:
+            deferred = [
+                node
+                for node in pending
+                if not _reroute_subtree_bw(
+                    node,
+                    receiver_nodes[node],
+                    self._receivers,
+                    self.s,
+                    self._position,
+                    self._n_upstream,
+                    drainage_area,
+                    discharge,
+                    self._work,
+                )
+            ]
+            if len(deferred) == pending.size:
+                self._rebuild_for_reroute(receiver_nodes)
+                return False
+            pending = numpy.array(deferred, dtype=int)
+
+        _make_delta_array(self.nd, out=self.delta)
+        _make_array_of_donors(receiver_nodes, self.delta, out=self.D)
+
+        return True
+
+    def _rebuild_for_reroute(self, receiver_nodes):
+        """Rebuild the stack along with the bookkeeping used by reroute."""
+        self.update(receiver_nodes)
+
+        if self._position is None:
+            self._position = numpy.empty(self.number_of_nodes, dtype=int)
+            self._n_upstream = numpy.empty(self.number_of_nodes, dtype=int)
+
+        self._position[self.s] = numpy.arange(self.number_of_nodes)
+        _count_upstream_bw(self.s, receiver_nodes, self._n_upstream)
+        self._receivers = receiver_nodes.copy()
+
+
+def _make_number_of_donors_array(r, out=None):
 
     """Number of donors for each node.
 
@@ -83,6 +296,8 @@ def _make_number_of_donors_array(r):
     ----------
     r : ndarray
         ID of receiver for each node.
+    out : ndarray of int, optional
+        Buffer to place the result into.
 
     Returns
     -------
@@ -108,13 +323,13 @@ def _make_number_of_donors_array(r):
     #    for i in range(np):
     #        nd[r[i]] += 1
 
-    nd = numpy.zeros(r.size, dtype=int)
-    max_index = numpy.max(r)
-    nd[: (max_index + 1)] = numpy.bincount(r)
-    return nd
+    if out is None:
+        out = numpy.empty(r.size, dtype=int)
+    out[:] = numpy.bincount(r, minlength=r.size)
+    return out
 
 
-def _make_delta_array(nd):
+def _make_delta_array(nd, out=None):
 
     r"""
     Delta array.
@@ -126,6 +341,8 @@ def _make_delta_array(nd):
     ----------
     nd : ndarray of int
         Number of donors for each node
+    out : ndarray of int, optional
+        Buffer, of length one greater than *nd*, to place the result into.
 
     Returns
     -------
@@ -155,13 +372,14 @@ def _make_delta_array(nd):
 
     # DEJH efficient delooping (only a small gain)
     np = len(nd)
-    delta = numpy.zeros(np + 1, dtype=int)
-    delta.fill(np)
-    delta[-2::-1] -= numpy.cumsum(nd[::-1])
-    return delta
+    if out is None:
+        out = numpy.empty(np + 1, dtype=int)
+    out.fill(np)
+    out[-2::-1] -= numpy.cumsum(nd[::-1])
+    return out
 
 
-def _make_array_of_donors(r, delta):
+def _make_array_of_donors(r, delta, out=None):
 
     """Creates and returns an array containing the IDs of donors for each node.
 
@@ -172,8 +390,6 @@ def _make_array_of_donors(r, delta):
     Table 1 (except that here the ID numbers are one less, because we number
     indices from zero).
 
-    Vectorized - inefficiently! - DEJH, 5/20/14
-
     Examples
     --------
     >>> import numpy as np
@@ -186,31 +402,16 @@ def _make_array_of_donors(r, delta):
     array([0, 2, 1, 4, 5, 7, 6, 3, 8, 9])
     """
     np = len(r)
-    w = numpy.zeros(np, dtype=int)
-    D = numpy.zeros(np, dtype=int)
+    if out is None:
+        out = numpy.empty(np, dtype=int)
+    w = numpy.empty(np, dtype=int)
 
-    for i in range(np):
-        ri = r[i]
-        D[delta[ri] + w[ri]] = i
-        w[ri] += 1
+    _fill_array_of_donors(as_id_array(r), as_id_array(delta), w, out)
 
-    return D
+    return out
 
-    # DEJH notes that for reasons he's not clear on, this looped version is
-    # actually much slower!
-    # D = numpy.zeros(np, dtype=int)
-    # wri_fin = numpy.bincount(r)
-    # wri_fin_nz = wri_fin.nonzero()[0]
-    # wri_fin_nz_T = wri_fin_nz.reshape((wri_fin_nz.size,1))
-    # logical = numpy.tile(r,(wri_fin_nz.size,1))==wri_fin_nz_T
-    # cum_logical = numpy.cumsum(logical, axis=1)
-    # wri = numpy.sum(numpy.where(logical, cum_logical-1,0) ,axis=0)
-    # D_index = delta[r] + wri
-    # D[D_index] = numpy.arange(r.size)
-    # return D
 
-
-def make_ordered_node_array(receiver_nodes):
+def make_ordered_node_array(receiver_nodes, workspace=None):
 
     """Create an array of node IDs that is arranged in order from.
 
@@ -220,6 +421,15 @@ def make_ordered_node_array(receiver_nodes):
     The lack of a leading underscore is meant to signal that this operation
     could be useful outside of this module!
 
+    Parameters
+    ----------
+    receiver_nodes : ndarray of int
+        ID of receiver for each node.
+    workspace : _StackWorkspace, optional
+        Preallocated buffers to build the stack in. If provided, the
+        returned array is the workspace's stack buffer and is overwritten
+        by the next call that uses the same workspace.
+
     Examples
     --------
     >>> import numpy as np
@@ -228,18 +438,19 @@ def make_ordered_node_array(receiver_nodes):
     >>> s = make_ordered_node_array(r)
     >>> s
     array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
-    """
-    node_id = numpy.arange(receiver_nodes.size)
-    baselevel_nodes = numpy.where(node_id == receiver_nodes)[0]
-    nd = _make_number_of_donors_array(receiver_nodes)
-    delta = _make_delta_array(nd)
-    D = _make_array_of_donors(receiver_nodes, delta)
-    dstack = _DrainageStack(delta, D)
-    add_it = dstack.add_to_stack
-    for k in baselevel_nodes:
-        add_it(k)  # don't think this is a bottleneck, so no C++
 
-    return dstack.s
+    The ordering does not depend on recursion, so even very long drainage
+    networks can be ordered.
+
+    >>> r = np.arange(-1, 99999)
+    >>> r[0] = 0
+    >>> s = make_ordered_node_array(r)
+    >>> np.all(s == np.arange(100000))
+    True
+    """
+    if workspace is None:
+        workspace = _StackWorkspace(receiver_nodes.size)
+    return workspace.update(receiver_nodes)
 
 
 def find_drainage_area_and_discharge(
@@ -459,7 +670,11 @@ def find_drainage_area_and_discharge_lossy(
 
 
 def flow_accumulation(
-    receiver_nodes, node_cell_area=1.0, runoff_rate=1.0, boundary_nodes=None
+    receiver_nodes,
+    node_cell_area=1.0,
+    runoff_rate=1.0,
+    boundary_nodes=None,
+    workspace=None,
 ):
 
     """Calculate drainage area and (steady) discharge.
@@ -467,6 +682,9 @@ def flow_accumulation(
     Calculates and returns the drainage area and (steady) discharge at each
     node, along with a downstream-to-upstream ordered list (array) of node IDs.
 
+    If a *workspace* (a _StackWorkspace) is given, the stack is built in its
+    preallocated buffers (see make_ordered_node_array).
+
     Examples
     --------
     >>> import numpy as np
@@ -481,7 +699,7 @@ def flow_accumulation(
     array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
     """
 
-    s = as_id_array(make_ordered_node_array(receiver_nodes))
+    s = as_id_array(make_ordered_node_array(receiver_nodes, workspace=workspace))
     # Note that this ordering of s DOES INCLUDE closed nodes. It really shouldn't!
     # But as we don't have a copy of the grid accessible here, we'll solve this
     # problem as part of route_flow_dn.
@@ -116,9 +116,21 @@ class FlowAccumulator(Component):
          uninstantiated DepressionFinder class, or an instance of a
          DepressionFinder class.
          This sets the method for depression finding.
+    incremental_routing : bool, optional
+         If True, and flow is directed to one receiver, only the parts of
+         the drainage network whose receivers changed since the previous
+         call are rerouted. The upstream node order is then updated by
+         moving just those subnetworks, and drainage area and discharge are
+         updated only along the old and new flow paths below them (to
+         within floating-point roundoff of a full accumulation). A full
+         recalculation is done whenever *water__unit_flux_in* changes,
+         contains negative values, or too many receivers changed. Node
+         order within the stack may then differ from that of a full
+         rebuild, but is always downstream-to-upstream. Default is False.
     **kwargs : any additional parameters to pass to a FlowDirector or
          DepressionFinderAndRouter instance (e.g., partion_method for
-         FlowDirectorMFD). This will have no effect if an instantiated component
+         FlowDirectorMFD, or method='priority_flood' for
+         DepressionFinderAndRouter). This will have no effect if an instantiated component
          is passed using the flow_director or depression_finder keywords.
 
     Examples
@@ -627,6 +639,10 @@ class FlowAccumulator(Component):
 
     _name = "FlowAccumulator"
 
+    # drainage area and discharge can be updated along rerouted flow paths
+    # rather than being reaccumulated from scratch.
+    _accumulates_incrementally = True
+
     _input_var_names = ("topographic__elevation", "water__unit_flux_in")
 
     _output_var_names = (
@@ -688,6 +704,7 @@ class FlowAccumulator(Component):
         flow_director="FlowDirectorSteepest",
         runoff_rate=None,
         depression_finder=None,
+        incremental_routing=False,
         **kwargs
     ):
         """Initialize the FlowAccumulator component.
@@ -792,6 +809,16 @@ class FlowAccumulator(Component):
 
         self.nodes_not_in_stack = True
 
+        # buffers used to build the stack for route-to-one flow directors.
+        # These are created the first time they are needed and then reused.
+        self._stack_workspace = None
+
+        # state kept between calls when rerouting incrementally.
+        self._incremental_routing = incremental_routing
+        self._last_runoff = None
+        self._area_buffer = None
+        self._discharge_buffer = None
+
     @property
     def node_drainage_area(self):
         """Return the drainage area."""
@@ -996,7 +1023,7 @@ class FlowAccumulator(Component):
 
             # collect potential kwargs to pass to depression_finder
             # instantiation
-            potential_kwargs = ["routing"]
+            potential_kwargs = ["routing", "method"]
             kw = {}
             for p_k in potential_kwargs:
                 if p_k in self.kwargs.keys():
@@ -1140,19 +1167,34 @@ class FlowAccumulator(Component):
                     self.flow_director._determine_link_directions()
 
             # step 3. Stack, D, delta construction
-            nd = as_id_array(flow_accum_bw._make_number_of_donors_array(r))
-            delta = as_id_array(flow_accum_bw._make_delta_array(nd))
-            D = as_id_array(flow_accum_bw._make_array_of_donors(r, delta))
-            s = as_id_array(flow_accum_bw.make_ordered_node_array(r))
+            if self._stack_workspace is None:
+                self._stack_workspace = flow_accum_bw._StackWorkspace(
+                    self._grid.number_of_nodes
+                )
+            if self._incremental_routing:
+                s, accumulated = self._reroute_incrementally(r)
+            else:
+                s = flow_accum_bw.make_ordered_node_array(
+                    r, workspace=self._stack_workspace
+                )
+                accumulated = False
+            delta = self._stack_workspace.delta
+            D = self._stack_workspace.D
 
             # put these in grid so that depression finder can use it.
-            # store the generated data in the grid
+            # store the generated data in the grid. D is a workspace buffer
+            # that the next run overwrites, but np.array copies it.
             self._grid["node"]["flow__data_structure_delta"][:] = delta[1:]
             self._grid["grid"]["flow__data_structure_D"] = np.array([D], dtype=object)
             self._grid["node"]["flow__upstream_node_order"][:] = s
 
             # step 4. Accumulate (to one or to N depending on direction method)
-            a[:], q[:] = self._accumulate_A_Q_to_one(s, r)
+            if accumulated:
+                a[:], q[:] = self._area_buffer, self._discharge_buffer
+            else:
+                a[:], q[:] = self._accumulate_A_Q_to_one(s, r)
+                if self._incremental_routing:
+                    self._store_accumulation(a, q)
 
         else:
             # Get p
@@ -1178,6 +1220,41 @@ class FlowAccumulator(Component):
 
         return (a, q)
 
+    def _reroute_incrementally(self, r):
+        """Update the stack for only those nodes whose receivers changed.
+
+        Returns the stack and whether the drainage area and discharge held
+        by the component were updated along with it.
+        """
+        runoff = self._grid.at_node["water__unit_flux_in"]
+        can_update_accumulation = (
+            self._accumulates_incrementally
+            and self._last_runoff is not None
+            and np.array_equal(runoff, self._last_runoff)
+        )
+
+        if self._area_buffer is None:
+            self._area_buffer = np.zeros(self._grid.number_of_nodes, dtype=float)
+            self._discharge_buffer = np.zeros(
+                self._grid.number_of_nodes, dtype=float
+            )
+
+        rerouted = self._stack_workspace.reroute(
+            r, self._area_buffer, self._discharge_buffer
+        )
+
+        return self._stack_workspace.s, rerouted and can_update_accumulation
+
+    def _store_accumulation(self, a, q):
+        """Keep copies of the accumulated flow for the next incremental update."""
+        runoff = self._grid.at_node["water__unit_flux_in"]
+        self._area_buffer[:] = a
+        self._discharge_buffer[:] = q
+        if np.all(runoff >= 0.):
+            self._last_runoff = runoff.copy()
+        else:
+            self._last_runoff = None
+
     def _accumulate_A_Q_to_one(self, s, r):
         """Accumulate area and discharge for a route-to-one scheme.
 
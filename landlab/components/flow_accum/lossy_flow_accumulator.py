@@ -267,6 +267,10 @@ class LossyFlowAccumulator(FlowAccumulator):
 
     _name = "LossyFlowAccumulator"
 
+    # losses along each flow path mean that drainage area and discharge
+    # must always be reaccumulated from scratch.
+    _accumulates_incrementally = False
+
     _input_var_names = ("topographic__elevation", "water__unit_flux_in")
 
     _output_var_names = (
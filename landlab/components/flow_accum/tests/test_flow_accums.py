@@ -2,7 +2,12 @@
 import numpy as np
 from numpy.testing import assert_array_equal
 
-from landlab.components.flow_accum import find_drainage_area_and_discharge
+from landlab.components.flow_accum import (
+    find_drainage_area_and_discharge,
+    flow_accumulation,
+    make_ordered_node_array,
+)
+from landlab.components.flow_accum.flow_accum_bw import _StackWorkspace
 from landlab.components.flow_accum.flow_accum_to_n import (
     find_drainage_area_and_discharge_to_n
 )
@@ -50,3 +55,30 @@ def test_boundary_bw():
     a, q = find_drainage_area_and_discharge(s, r, boundary_nodes=[0])
     true_a = np.array([0., 2., 1., 1., 9., 4., 3., 2., 1., 1.])
     assert_array_equal(a, true_a)
+
+
+def test_stack_of_long_network():
+    """A single river much longer than Python's recursion limit."""
+    n_nodes = 500000
+    r = np.arange(n_nodes) + 1
+    r[-1] = n_nodes - 1
+
+    a, q, s = flow_accumulation(r)
+
+    assert_array_equal(s, np.arange(n_nodes)[::-1])
+    assert_array_equal(a, np.arange(n_nodes) + 1.)
+
+
+def test_stack_workspace_reuse():
+    r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8]) - 1
+    workspace = _StackWorkspace(r.size)
+
+    s = make_ordered_node_array(r, workspace=workspace)
+    assert s is workspace.s
+    assert_array_equal(s, make_ordered_node_array(r))
+
+    r[[1, 8]] = [1, 1]
+    s = make_ordered_node_array(r, workspace=workspace)
+    assert s is workspace.s
+    assert_array_equal(s, make_ordered_node_array(r))
+    assert_array_equal(s, [1, 0, 2, 8, 4, 5, 6, 3, 7, 9])
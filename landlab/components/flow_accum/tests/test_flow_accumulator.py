@@ -1076,3 +1076,87 @@ def test_nmg_no_cell_area():
     nmg.add_field("topographic__elevation", nmg.x_of_node + nmg.y_of_node, at="node")
     with pytest.raises(FieldError):
         FlowAccumulator(nmg)
+
+
+@pytest.mark.parametrize(
+    "flow_director,depression_finder",
+    [("D4", None), ("D8", None), ("D8", "DepressionFinderAndRouter")],
+)
+def test_incremental_routing_matches_full(flow_director, depression_finder):
+    """Incremental rerouting gives the same flow as starting from scratch."""
+    np.random.seed(42)
+    mg = RasterModelGrid((20, 25))
+    z = mg.add_field("topographic__elevation", np.random.rand(mg.number_of_nodes))
+    fa = FlowAccumulator(
+        mg,
+        flow_director=flow_director,
+        depression_finder=depression_finder,
+        incremental_routing=True,
+    )
+
+    for _ in range(10):
+        perturbed = np.random.choice(mg.core_nodes, size=5, replace=False)
+        z[perturbed] += np.random.rand(5) * 0.5
+        fa.run_one_step()
+
+        s = mg.at_node["flow__upstream_node_order"]
+        r = mg.at_node["flow__receiver_node"]
+        assert_array_equal(np.sort(s), np.arange(mg.number_of_nodes))
+        position = np.empty_like(s)
+        position[s] = np.arange(mg.number_of_nodes)
+        assert np.all(position[r] <= position)
+
+        mg2 = RasterModelGrid((20, 25))
+        mg2.add_field("topographic__elevation", z.copy())
+        FlowAccumulator(
+            mg2, flow_director=flow_director, depression_finder=depression_finder
+        ).run_one_step()
+
+        assert_array_equal(r, mg2.at_node["flow__receiver_node"])
+        np.testing.assert_array_almost_equal(
+            mg.at_node["drainage_area"], mg2.at_node["drainage_area"]
+        )
+        np.testing.assert_array_almost_equal(
+            mg.at_node["surface_water__discharge"],
+            mg2.at_node["surface_water__discharge"],
+        )
+        assert_array_equal(
+            mg.at_node["flow__data_structure_delta"],
+            mg2.at_node["flow__data_structure_delta"],
+        )
+
+
+def test_incremental_routing_with_changing_runoff():
+    mg = RasterModelGrid((5, 6))
+    z = mg.add_field("topographic__elevation", mg.x_of_node + mg.y_of_node ** 2)
+    runoff = mg.add_ones("node", "water__unit_flux_in")
+    fa = FlowAccumulator(mg, incremental_routing=True)
+    fa.run_one_step()
+
+    z[14] += 10.
+    runoff[:] = 2.
+    fa.run_one_step()
+
+    mg2 = RasterModelGrid((5, 6))
+    mg2.add_field("topographic__elevation", z.copy())
+    mg2.add_field("node", "water__unit_flux_in", runoff.copy())
+    FlowAccumulator(mg2).run_one_step()
+
+    assert_array_equal(
+        mg.at_node["surface_water__discharge"], mg2.at_node["surface_water__discharge"]
+    )
+
+
+def test_data_structure_D_is_not_overwritten():
+    mg = RasterModelGrid((5, 6))
+    z = mg.add_field("topographic__elevation", mg.x_of_node + mg.y_of_node)
+    fa = FlowAccumulator(mg)
+    fa.run_one_step()
+    D = mg.at_grid["flow__data_structure_D"]
+    expected = D.copy()
+
+    z[:] = -z
+    fa.run_one_step()
+
+    assert_array_equal(D, expected)
+    assert np.any(mg.at_grid["flow__data_structure_D"] != expected)
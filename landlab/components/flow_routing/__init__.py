@@ -1,5 +1,5 @@
 from .route_flow_dn import FlowRouter
-from .lake_mapper import DepressionFinderAndRouter
+from .lake_mapper import DepressionFinderAndRouter, find_pits
 from ..flow_director import flow_direction_DN
 from ..flow_director.flow_direction_DN import flow_directions
 
@@ -7,6 +7,7 @@ from ..flow_director.flow_direction_DN import flow_directions
 __all__ = [
     "FlowRouter",
     "DepressionFinderAndRouter",
+    "find_pits",
     "flow_directions",
     "flow_direction_DN",
 ]
@@ -0,0 +1,344 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+cdef inline bint _heap_less(DTYPE_FLOAT_t * key, DTYPE_INT_t * tie,
+                            DTYPE_INT_t a, DTYPE_INT_t b):
+    """Compare two heap entries by key, then by insertion order."""
+    return key[a] < key[b] or (key[a] == key[b] and tie[a] < tie[b])
+
+
+cdef inline void _heap_swap(DTYPE_FLOAT_t * key, DTYPE_INT_t * tie,
+                            DTYPE_INT_t * item, DTYPE_INT_t a, DTYPE_INT_t b):
+    cdef DTYPE_FLOAT_t k = key[a]
+    cdef DTYPE_INT_t t = tie[a]
+    cdef DTYPE_INT_t i = item[a]
+
+    key[a] = key[b]
+    tie[a] = tie[b]
+    item[a] = item[b]
+    key[b] = k
+    tie[b] = t
+    item[b] = i
+
+
+cdef inline DTYPE_INT_t _heap_push(DTYPE_FLOAT_t * key, DTYPE_INT_t * tie,
+                                   DTYPE_INT_t * item, DTYPE_INT_t size,
+                                   DTYPE_FLOAT_t new_key, DTYPE_INT_t new_tie,
+                                   DTYPE_INT_t new_item):
+    """Add an entry to the heap and return the new size of the heap."""
+    cdef DTYPE_INT_t child = size
+    cdef DTYPE_INT_t parent
+
+    key[child] = new_key
+    tie[child] = new_tie
+    item[child] = new_item
+
+    while child > 0:
+        parent = (child - 1) // 2
+        if _heap_less(key, tie, child, parent):
+            _heap_swap(key, tie, item, child, parent)
+            child = parent
+        else:
+            break
+
+    return size + 1
+
+
+cdef inline DTYPE_INT_t _heap_pop(DTYPE_FLOAT_t * key, DTYPE_INT_t * tie,
+                                  DTYPE_INT_t * item, DTYPE_INT_t size):
+    """Remove the smallest entry and return the item it held.
+
+    The size of the heap must be decremented by the caller.
+    """
+    cdef DTYPE_INT_t top = item[0]
+    cdef DTYPE_INT_t parent = 0
+    cdef DTYPE_INT_t child, smallest
+
+    size -= 1
+    key[0] = key[size]
+    tie[0] = tie[size]
+    item[0] = item[size]
+
+    while True:
+        smallest = parent
+        child = 2 * parent + 1
+        if child < size and _heap_less(key, tie, child, smallest):
+            smallest = child
+        if child + 1 < size and _heap_less(key, tie, child + 1, smallest):
+            smallest = child + 1
+        if smallest == parent:
+            break
+        _heap_swap(key, tie, item, parent, smallest)
+        parent = smallest
+
+    return top
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def priority_flood(np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                   np.ndarray[DTYPE_INT_t, ndim=2] nbrs,
+                   np.ndarray[DTYPE_INT_t, ndim=1] seeds,
+                   DTYPE_FLOAT_t epsilon,
+                   np.ndarray[DTYPE_FLOAT_t, ndim=1] fill,
+                   np.ndarray[DTYPE_INT_t, ndim=1] donor_of,
+                   np.ndarray[DTYPE_INT_t, ndim=1] nbr_index,
+                   np.ndarray[DTYPE_INT_t, ndim=1] visit_order):
+    """Fill depressions by flooding inward from the seed nodes.
+
+    This is the Priority-Flood algorithm of Barnes et al. (2014). Nodes are
+    visited in order of increasing water-surface elevation, starting from
+    the *seeds* (typically the open boundary nodes). Each node that is
+    reached from a node with a higher water surface is raised to that
+    surface plus *epsilon*.
+
+    Parameters
+    ----------
+    z : ndarray of float
+        Elevation at each node.
+    nbrs : ndarray of int, shape (n_nodes, max_neighbors)
+        Neighbors of each node through which water can flow. Missing
+        neighbors (and closed nodes) are given as -1.
+    seeds : ndarray of int
+        Nodes from which flooding starts.
+    epsilon : float
+        Increment added to the water surface of each node that would
+        otherwise be flat with, or lower than, the node it was reached
+        from. If zero, depressions are filled to flat surfaces.
+    fill : ndarray of float
+        Output: water-surface (filled) elevation at each node. Nodes that
+        cannot be reached from a seed keep their elevation.
+    donor_of : ndarray of int
+        Output: the node from which each node was reached (a seed node
+        refers to itself). Following these nodes always leads to a seed
+        without rising on the filled surface. Nodes that cannot be reached
+        from a seed are given -1.
+    nbr_index : ndarray of int
+        Output: column of *nbrs* in which each node's *donor_of* appears,
+        or -1 for seeds and unreached nodes.
+    visit_order : ndarray of int
+        Output: the order in which nodes were visited. Nodes that cannot be
+        reached are given -1. Each node is visited after its *donor_of*
+        node and no earlier than any node with a lower water surface.
+
+    Returns
+    -------
+    int
+        Number of nodes visited.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_routing.cfuncs import priority_flood
+    >>> z = np.array([0., 3., 1., 2., 4.])
+    >>> nbrs = np.array([[-1, 1], [0, 2], [1, 3], [2, 4], [3, -1]])
+    >>> fill = np.empty(5)
+    >>> donor_of = np.empty(5, dtype=int)
+    >>> nbr_index = np.empty(5, dtype=int)
+    >>> order = np.empty(5, dtype=int)
+    >>> priority_flood(z, nbrs, np.array([0, 4]), 0., fill, donor_of,
+    ...                nbr_index, order)
+    5
+    >>> fill
+    array([ 0.,  3.,  3.,  3.,  4.])
+    >>> donor_of
+    array([0, 0, 1, 2, 4])
+    """
+    cdef DTYPE_INT_t n_nodes = z.shape[0]
+    cdef DTYPE_INT_t n_nbrs = nbrs.shape[1]
+    cdef np.ndarray[DTYPE_FLOAT_t, ndim=1] heap_key = np.empty(n_nodes,
+                                                               dtype=float)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] heap_tie = np.empty(n_nodes,
+                                                             dtype=int)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] heap_item = np.empty(n_nodes,
+                                                              dtype=int)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] pit_queue = np.empty(n_nodes,
+                                                              dtype=int)
+    cdef DTYPE_INT_t size = 0
+    cdef DTYPE_INT_t pit_head = 0
+    cdef DTYPE_INT_t pit_tail = 0
+    cdef DTYPE_INT_t n_pushed = 0
+    cdef DTYPE_INT_t n_visited = 0
+    cdef DTYPE_INT_t i, k, node, nbr
+    cdef DTYPE_FLOAT_t surface
+
+    for i in range(n_nodes):
+        fill[i] = z[i]
+        donor_of[i] = -1
+        nbr_index[i] = -1
+        visit_order[i] = -1
+
+    for i in range(seeds.shape[0]):
+        node = seeds[i]
+        if donor_of[node] == -1:
+            donor_of[node] = node
+            size = _heap_push(&heap_key[0], &heap_tie[0], &heap_item[0], size,
+                              fill[node], n_pushed, node)
+            n_pushed += 1
+
+    # Without an epsilon, nodes that are raised to (or are level with) the
+    # surface of the node that reached them can never be lower than anything
+    # left in the heap, so they go into a plain FIFO queue that is emptied
+    # first (the "improved" variant of Barnes et al., 2014). With an epsilon
+    # they can be, so they go into the heap to keep the fill minimal.
+    while size > 0 or pit_head < pit_tail:
+        if pit_head < pit_tail:
+            node = pit_queue[pit_head]
+            pit_head += 1
+        else:
+            node = _heap_pop(&heap_key[0], &heap_tie[0], &heap_item[0], size)
+            size -= 1
+
+        visit_order[node] = n_visited
+        n_visited += 1
+
+        for k in range(n_nbrs):
+            nbr = nbrs[node, k]
+            if nbr == -1 or donor_of[nbr] != -1:
+                continue
+
+            donor_of[nbr] = node
+            nbr_index[nbr] = k
+
+            surface = fill[node] + epsilon
+            if fill[nbr] <= surface:
+                fill[nbr] = surface
+                if epsilon == 0.:
+                    pit_queue[pit_tail] = nbr
+                    pit_tail += 1
+                else:
+                    size = _heap_push(&heap_key[0], &heap_tie[0],
+                                      &heap_item[0], size, fill[nbr],
+                                      n_pushed, nbr)
+                    n_pushed += 1
+            else:
+                size = _heap_push(&heap_key[0], &heap_tie[0], &heap_item[0],
+                                  size, fill[nbr], n_pushed, nbr)
+                n_pushed += 1
+
+    return n_visited
+
+
+cdef DTYPE_INT_t _find_root(DTYPE_INT_t * parent, DTYPE_INT_t label):
+    """Find the root of a label, compressing the path as we go."""
+    cdef DTYPE_INT_t root = label
+    cdef DTYPE_INT_t next_label
+
+    while parent[root] != root:
+        root = parent[root]
+    while parent[label] != root:
+        next_label = parent[label]
+        parent[label] = root
+        label = next_label
+
+    return root
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def label_flooded_regions(np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                          np.ndarray[DTYPE_FLOAT_t, ndim=1] fill,
+                          np.ndarray[DTYPE_INT_t, ndim=2] nbrs,
+                          np.ndarray[DTYPE_INT_t, ndim=1] donor_of,
+                          np.ndarray[DTYPE_INT_t, ndim=1] visit_order,
+                          np.ndarray[DTYPE_INT_t, ndim=1] label,
+                          np.ndarray[DTYPE_INT_t, ndim=1] outlet):
+    """Label connected regions of flooded nodes and find their outlets.
+
+    A node is flooded if its water surface, *fill*, is above its elevation.
+    Flooded nodes are given the label of their *donor_of* node if it too is
+    flooded; otherwise they start a new region, whose outlet is that
+    (unflooded) donor. Neighboring flooded nodes at the same water level
+    that were reached through different outlets are then merged; the merged
+    region keeps the outlet through which it was first reached.
+
+    Parameters
+    ----------
+    z : ndarray of float
+        Elevation at each node.
+    fill : ndarray of float
+        Water-surface elevation at each node.
+    nbrs : ndarray of int, shape (n_nodes, max_neighbors)
+        Neighbors of each node, or -1.
+    donor_of : ndarray of int
+        The node from which each node was flooded.
+    visit_order : ndarray of int
+        The order in which nodes were visited, or -1.
+    label : ndarray of int
+        Output: region label for each flooded node (numbered from 0), -1
+        for other nodes.
+    outlet : ndarray of int
+        Output: outlet node of each region. Must be at least as long as the
+        number of flooded nodes.
+
+    Returns
+    -------
+    int
+        Number of flooded regions.
+    """
+    cdef DTYPE_INT_t n_nodes = z.shape[0]
+    cdef DTYPE_INT_t n_nbrs = nbrs.shape[1]
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] by_visit = np.empty(n_nodes, dtype=int)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] parent
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] new_label
+    cdef DTYPE_INT_t n_visited = 0
+    cdef DTYPE_INT_t n_labels = 0
+    cdef DTYPE_INT_t n_regions = 0
+    cdef DTYPE_INT_t i, k, node, nbr, donor, a, b
+
+    for i in range(n_nodes):
+        label[i] = -1
+        if visit_order[i] >= 0:
+            by_visit[visit_order[i]] = i
+            n_visited += 1
+
+    for i in range(n_visited):
+        node = by_visit[i]
+        if fill[node] > z[node]:
+            donor = donor_of[node]
+            if label[donor] >= 0:
+                label[node] = label[donor]
+            else:
+                label[node] = n_labels
+                outlet[n_labels] = donor
+                n_labels += 1
+
+    parent = np.arange(n_labels, dtype=int)
+    for i in range(n_visited):
+        node = by_visit[i]
+        if label[node] < 0:
+            continue
+        for k in range(n_nbrs):
+            nbr = nbrs[node, k]
+            if nbr == -1 or label[nbr] < 0 or fill[nbr] != fill[node]:
+                continue
+            a = _find_root(&parent[0], label[node])
+            b = _find_root(&parent[0], label[nbr])
+            if a < b:
+                parent[b] = a
+            elif b < a:
+                parent[a] = b
+
+    new_label = np.full(n_labels, -1, dtype=int)
+    for i in range(n_labels):
+        a = _find_root(&parent[0], i)
+        if new_label[a] == -1:
+            new_label[a] = n_regions
+            outlet[n_regions] = outlet[a]
+            n_regions += 1
+        new_label[i] = new_label[a]
+
+    for i in range(n_nodes):
+        if label[i] >= 0:
+            label[i] = new_label[label[i]]
+
+    return n_regions
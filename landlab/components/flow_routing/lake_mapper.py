@@ -23,6 +23,9 @@ from landlab.core.messages import error_message, warning_message
 from landlab.core.model_parameter_dictionary import MissingKeyError
 from landlab.core.utils import as_id_array
 from landlab.grid.base import BAD_INDEX_VALUE as LOCAL_BAD_INDEX_VALUE
+from landlab.utils.return_array import return_array_at_node
+
+from .cfuncs import label_flooded_regions, priority_flood
 
 # Codes for depression status
 _UNFLOODED = 0
@@ -33,6 +36,92 @@ _FLOODED = 3
 use_cfuncs = True
 
 
+def _clear_pits_along(nodes, z, status, is_pit):
+    """Clear the pit flag of nodes that could drain along a set of links.
+
+    *nodes* is an (n_links, 2) array of the tail and head nodes of each
+    link. A node is not a pit if it is higher than the node at the other end
+    of a link, or if it is level with an open (fixed-value) boundary node.
+    """
+    tail, head = nodes[:, 0], nodes[:, 1]
+    z_tail, z_head = z[tail], z[head]
+
+    is_pit[head[z_head > z_tail]] = False
+    is_pit[tail[z_tail > z_head]] = False
+
+    is_level = z_head == z_tail
+    is_pit[tail[is_level & (status[head] == FIXED_VALUE_BOUNDARY)]] = False
+    is_pit[head[is_level & (status[tail] == FIXED_VALUE_BOUNDARY)]] = False
+
+
+def find_pits(grid, elevation="topographic__elevation", routing="D8", out=None):
+    """Locate local depressions ("pits") in a gridded elevation field.
+
+    A node is defined as being a pit if and only if:
+
+    1. It is a core node,
+    2. All neighboring core nodes have equal or greater elevation, and
+    3. Any neighboring open boundary nodes have a greater elevation.
+
+    Neighbors are those connected to the node by an active link or, for
+    D8 routing on a raster, by an active diagonal.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        A landlab grid.
+    elevation : field name or array of float, optional
+        Elevation at each node.
+    routing : 'D8' or 'D4' (optional)
+        If grid is a raster type, controls whether diagonal neighbors are
+        considered ('D8', default), or only orthogonal ones ('D4'). Has no
+        effect if grid is not a raster.
+    out : ndarray of bool, optional
+        Buffer to place the result into.
+
+    Returns
+    -------
+    ndarray of bool
+        True at nodes that are pits.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components.flow_routing import find_pits
+    >>> grid = RasterModelGrid((4, 5))
+    >>> z = grid.add_field('node', 'topographic__elevation',
+    ...                    grid.x_of_node.copy())
+    >>> z[[7, 12]] = -1.
+    >>> z[8] = -2.
+    >>> find_pits(grid).reshape(grid.shape)  # doctest: +NORMALIZE_WHITESPACE
+    array([[False, False, False, False, False],
+           [False, False, False,  True, False],
+           [False, False, False, False, False],
+           [False, False, False, False, False]], dtype=bool)
+    >>> find_pits(grid, routing='D4').reshape(grid.shape)
+    ... # doctest: +NORMALIZE_WHITESPACE
+    array([[False, False, False, False, False],
+           [False, False, False,  True, False],
+           [False, False,  True, False, False],
+           [False, False, False, False, False]], dtype=bool)
+    """
+    z = return_array_at_node(grid, elevation)
+    status = grid.status_at_node
+
+    if out is None:
+        out = np.empty(grid.number_of_nodes, dtype=bool)
+    out.fill(True)
+    out[grid.boundary_nodes] = False
+
+    _clear_pits_along(grid.nodes_at_link[grid.active_links], z, status, out)
+    if isinstance(grid, RasterModelGrid) and routing == "D8":
+        _clear_pits_along(
+            grid.nodes_at_diagonal[grid.active_diagonals], z, status, out
+        )
+
+    return out
+
+
 class DepressionFinderAndRouter(Component):
 
     """Find depressions on a topographic surface.
@@ -133,6 +222,48 @@ class DepressionFinderAndRouter(Component):
     Because rereoute_flow defaults to True, the flow connectivity fields
     created by the FlowAccumulator will have now been modified to route flow over
     the depressions in the surface. The topogrphy itself is not modified.
+
+    Depressions can instead be found, in a single O(N log N) sweep over the
+    grid, with a compiled priority-flood algorithm (Barnes et al., 2014).
+    This finds the same lakes, depths and outlets, although the paths that
+    flow takes across each lake, and out of outlets that spill into another
+    lake, can differ. The exception is a pit that is exactly level with the
+    node it spills through, such as a perfectly flat patch of core nodes.
+    'lake_by_lake' maps such a flat as a lake with a depth of zero, while
+    'priority_flood' leaves it dry and routes flow across it to its outlet.
+
+    >>> mg = RasterModelGrid((7, 7), xy_spacing=0.5)
+    >>> z = mg.add_field('node', 'topographic__elevation', mg.node_x.copy())
+    >>> z += 0.01 * mg.node_y
+    >>> mg.at_node['topographic__elevation'].reshape(mg.shape)[2:5, 2:5] *= 0.1
+    >>> fr = FlowAccumulator(
+    ...     mg,
+    ...     flow_director='D8',
+    ...     depression_finder='DepressionFinderAndRouter',
+    ...     method='priority_flood',
+    ... )
+    >>> fr.run_one_step()
+    >>> df = fr.depression_finder
+    >>> df.lake_at_node.reshape(mg.shape)  # doctest: +NORMALIZE_WHITESPACE
+    array([[False, False, False, False, False, False, False],
+           [False, False, False, False, False, False, False],
+           [False, False,  True,  True,  True, False, False],
+           [False, False,  True,  True,  True, False, False],
+           [False, False,  True,  True,  True, False, False],
+           [False, False, False, False, False, False, False],
+           [False, False, False, False, False, False, False]], dtype=bool)
+    >>> df.lake_codes
+    array([16])
+    >>> df.lake_outlets
+    array([8])
+    >>> mg.at_node['drainage_area'][8]
+    5.25
+
+    References
+    ----------
+    Barnes, R., Lehman, C., Mulla, D. (2014). Priority-flood: An optimal
+    depression-filling and watershed-labeling algorithm for digital
+    elevation models. Computers & Geosciences 62, 117-127.
     """
 
     _name = "DepressionFinderAndRouter"
@@ -160,7 +291,7 @@ class DepressionFinderAndRouter(Component):
         "otherwise BAD_INDEX_VALUE",
     }
 
-    def __init__(self, grid, routing="D8"):
+    def __init__(self, grid, routing="D8", method="lake_by_lake"):
         """Create a DepressionFinderAndRouter.
 
         Constructor assigns a copy of the grid, sets the current time, and
@@ -174,6 +305,15 @@ class DepressionFinderAndRouter(Component):
             If grid is a raster type, controls whether lake connectivity can
             occur on diagonals ('D8', default), or only orthogonally ('D4').
             Has no effect if grid is not a raster.
+        method : 'lake_by_lake' or 'priority_flood' (optional)
+            Algorithm used to find depressions. 'lake_by_lake' (default)
+            grows each lake outward from its pit, one node at a time.
+            'priority_flood' floods the whole grid inward from its open
+            boundaries in a single compiled sweep. It always maps every
+            depression on the grid, so the *pits* argument of
+            map_depressions is ignored. Lakes are identified by their
+            lowest node. Exact flats at the level of their outlet are not
+            mapped as (zero-depth) lakes.
         """
         super(DepressionFinderAndRouter, self).__init__(grid)
         self._grid = grid
@@ -183,6 +323,13 @@ class DepressionFinderAndRouter(Component):
             assert routing is "D4"
         self._routing = routing
 
+        if method not in ("lake_by_lake", "priority_flood"):
+            raise ValueError(
+                "method must be 'lake_by_lake' or 'priority_flood' "
+                "(got {0!r})".format(method)
+            )
+        self._method = method
+
         if isinstance(grid, RasterModelGrid) and (routing is "D8"):
             self._D8 = True
             self.num_nbrs = 8
@@ -321,6 +468,8 @@ class DepressionFinderAndRouter(Component):
             self._link_lengths[1] = dy
             self._link_lengths[3] = dy
             self._link_lengths[4:].fill(np.sqrt(dx * dx + dy * dy))
+            self._links_to_nbrs = self._grid.d8s_at_node
+            self._length_of_links_to_nbrs = self._grid.length_of_d8
         elif (type(self.grid) is landlab.grid.raster.RasterModelGrid) and (
             self._routing is "D4"
         ):
@@ -329,8 +478,12 @@ class DepressionFinderAndRouter(Component):
             self._link_lengths[2] = dx
             self._link_lengths[1] = dy
             self._link_lengths[3] = dy
+            self._links_to_nbrs = self._grid.links_at_node
+            self._length_of_links_to_nbrs = self._grid.length_of_link
         else:
             self._link_lengths = self.grid.length_of_link
+            self._links_to_nbrs = self._grid.links_at_node
+            self._length_of_links_to_nbrs = self._grid.length_of_link
 
     def _find_pits(self):
         """Locate local depressions ("pits") in a gridded elevation field.
@@ -356,48 +509,14 @@ class DepressionFinderAndRouter(Component):
         2. Any neighboring open boundary nodes have a greater elevation.
 
         The algorithm starts off assuming that all core nodes are pits. We then
-        loop through all active links. For each link, if one node is higher
-        than the other, the higher one cannot be a pit, so we flag it False.
-        We also look at cases in which an active link's nodes have equal
-        elevations. If one is an open boundary, then the other must be a core
-        node, and we declare the latter not to be a pit (via rule 2 above).
+        look at all active links (and diagonals, for D8). For each link, if one
+        node is higher than the other, the higher one cannot be a pit, so we
+        flag it False. We also look at cases in which an active link's nodes
+        have equal elevations. If one is an open boundary, then the other must
+        be a core node, and we declare the latter not to be a pit (via rule 2
+        above). See :func:`find_pits`.
         """
-        # Create the is_pit array, with all core nodes initialized to True and
-        # all boundary nodes initialized to False.
-        self.is_pit.fill(True)
-        self.is_pit[self._grid.boundary_nodes] = False
-
-        # Loop over all active links: if one of a link's two nodes is higher
-        # than the other, the higher one is not a pit. Also, if they have
-        # equal elevations and one is an open boundary, the other is not a pit.
-        act_links = self._grid.active_links
-        h_orth = self._grid.node_at_link_head[act_links]
-        t_orth = self._grid.node_at_link_tail[act_links]
-
-        # These two lines assign the False flag to any node that is higher
-        # than its partner on the other end of its link
-        self.is_pit[
-            h_orth[np.where(self._elev[h_orth] > self._elev[t_orth])[0]]
-        ] = False
-        self.is_pit[
-            t_orth[np.where(self._elev[t_orth] > self._elev[h_orth])[0]]
-        ] = False
-
-        # If we have a raster grid, handle the diagonal active links too
-        # (At the moment, their data structure is a bit different)
-        # TODO: update the diagonal link data structures
-        # DEJH doesn't understand why this can't be vectorized as above...
-        if self._D8:
-            for h, t in self.grid.nodes_at_diagonal[self.grid.active_diagonals]:
-                if self._elev[h] > self._elev[t]:
-                    self.is_pit[h] = False
-                elif self._elev[t] > self._elev[h]:
-                    self.is_pit[t] = False
-                elif self._elev[h] == self._elev[t]:
-                    if self._grid.status_at_node[h] == FIXED_VALUE_BOUNDARY:
-                        self.is_pit[t] = False
-                    elif self._grid.status_at_node[t] == FIXED_VALUE_BOUNDARY:
-                        self.is_pit[h] = False
+        find_pits(self._grid, self._elev, routing=self._routing, out=self.is_pit)
 
         # Record the number of pits and the IDs of pit nodes.
         self.number_of_pits = np.count_nonzero(self.is_pit)
@@ -904,6 +1023,11 @@ class DepressionFinderAndRouter(Component):
         self.depression_outlet_map.fill(LOCAL_BAD_INDEX_VALUE)
         self.depression_depth.fill(0.)
         self.depression_outlets = []  # reset these
+
+        if self._method == "priority_flood":
+            self._map_depressions_by_priority_flood(reroute_flow=reroute_flow)
+            return
+
         # Locate nodes with pits
         if type(pits) == str:
             try:
@@ -947,6 +1071,129 @@ class DepressionFinderAndRouter(Component):
             self._route_flow()
             self._reaccumulate_flow()
 
+    def _map_depressions_by_priority_flood(self, reroute_flow=True):
+        """Map depressions/lakes, and route flow across them, in one sweep.
+
+        The grid is flooded inward from its open boundary nodes, visiting
+        nodes in order of increasing water-surface elevation. Nodes whose
+        water surface ends up above their elevation are in a lake; each
+        lake's outlet is the unflooded node through which it was first
+        reached.
+
+        When rerouting, every node whose receiver is not strictly lower on
+        the water surface is given a new one. Lake nodes drain toward the
+        node through which they were flooded; other nodes (outlets and
+        flats at the spill level) drain to their steepest neighbor with a
+        lower water surface if they have one. Every receiver is then either
+        lower on the water surface or was reached earlier in the sweep, so
+        the new flow network cannot contain loops.
+        """
+        z = np.asarray(self._elev, dtype=float)
+        n_nodes = self._grid.number_of_nodes
+
+        fill = np.empty(n_nodes, dtype=float)
+        donor_of = np.empty(n_nodes, dtype=int)
+        nbr_index = np.empty(n_nodes, dtype=int)
+        visit_order = np.empty(n_nodes, dtype=int)
+        nbrs = as_id_array(self._node_nbrs)
+
+        priority_flood(
+            z,
+            nbrs,
+            as_id_array(self._grid.open_boundary_nodes),
+            0.,
+            fill,
+            donor_of,
+            nbr_index,
+            visit_order,
+        )
+
+        lake_id = np.empty(n_nodes, dtype=int)
+        outlet_of_lake = np.empty(n_nodes, dtype=int)
+        n_lakes = label_flooded_regions(
+            z, fill, nbrs, donor_of, visit_order, lake_id, outlet_of_lake
+        )
+        outlet_of_lake = outlet_of_lake[:n_lakes]
+
+        # identify each lake by its lowest node
+        lake_nodes = np.where(lake_id >= 0)[0]
+        by_lake = lake_nodes[
+            np.lexsort((lake_nodes, z[lake_nodes], lake_id[lake_nodes]))
+        ]
+        is_lowest = np.ones(by_lake.size, dtype=bool)
+        is_lowest[1:] = np.diff(lake_id[by_lake]) != 0
+        code_of_lake = np.empty(n_lakes, dtype=int)
+        code_of_lake[lake_id[by_lake[is_lowest]]] = by_lake[is_lowest]
+
+        self.depression_depth[lake_nodes] = fill[lake_nodes] - z[lake_nodes]
+        self.depression_outlet_map[lake_nodes] = outlet_of_lake[lake_id[lake_nodes]]
+        self._lake_map[lake_nodes] = code_of_lake[lake_id[lake_nodes]]
+        self.flood_status.fill(_UNFLOODED)
+        self.flood_status[lake_nodes] = _FLOODED
+
+        # store the lakes as though each were found from its own pit
+        sorted_lakes = np.argsort(code_of_lake)
+        self.pit_node_ids = as_id_array(code_of_lake[sorted_lakes])
+        self.number_of_pits = n_lakes
+        self.is_pit.fill(False)
+        self.is_pit[self.pit_node_ids] = True
+        self._pits_flooded = n_lakes
+        self._unique_pits = np.ones(n_lakes, dtype=bool)
+        self.depression_outlets = list(outlet_of_lake[sorted_lakes])
+        self.unique_lake_outlets = outlet_of_lake[sorted_lakes]
+
+        if reroute_flow and ("flow__receiver_node" in self._grid.at_node):
+            self.receivers = self._grid.at_node["flow__receiver_node"]
+            self.sinks = self._grid.at_node["flow__sink_flag"]
+            self.grads = self._grid.at_node["topographic__steepest_slope"]
+            self.links = self._grid.at_node["flow__link_to_receiver_node"]
+            self._route_flow_by_priority_flood(
+                z, fill, donor_of, nbr_index, visit_order
+            )
+            self._reaccumulate_flow()
+
+    def _route_flow_by_priority_flood(self, z, fill, donor_of, nbr_index, visit_order):
+        """Reroute flow using the results of a priority-flood sweep."""
+        nodes = np.arange(self._grid.number_of_nodes)
+        needs_receiver = (
+            (visit_order >= 0)
+            & (donor_of != nodes)
+            & ~(fill[self.receivers] < fill)
+        )
+        rerouted = np.where(needs_receiver)[0]
+
+        new_receiver = donor_of[rerouted]
+        new_link = self._links_to_nbrs[rerouted, nbr_index[rerouted]]
+
+        # nodes that are not flooded drain down the steepest path on the
+        # water surface, if there is one
+        is_dry = np.where(fill[rerouted] == z[rerouted])[0]
+        if is_dry.size > 0:
+            dry = rerouted[is_dry]
+            nbrs = self._node_nbrs[dry]
+            links = self._links_to_nbrs[dry]
+            is_lower = (nbrs != -1) & (fill[nbrs] < fill[dry].reshape((-1, 1)))
+            slopes = np.where(
+                is_lower,
+                (z[dry].reshape((-1, 1)) - z[nbrs])
+                / self._length_of_links_to_nbrs[links],
+                -np.inf,
+            )
+            steepest = np.argmax(slopes, axis=1)
+            has_lower = np.any(is_lower, axis=1)
+            rows = np.where(has_lower)[0]
+            new_receiver[is_dry[rows]] = nbrs[rows, steepest[rows]]
+            new_link[is_dry[rows]] = links[rows, steepest[rows]]
+
+        self.receivers[rerouted] = new_receiver
+        self.links[rerouted] = new_link
+        self.grads[rerouted] = np.maximum(
+            (z[rerouted] - z[new_receiver])
+            / self._length_of_links_to_nbrs[new_link],
+            0.,
+        )
+        self.sinks[rerouted] = False
+
     def _find_unresolved_neighbors(self, nbrs, receivers):
         """Make and return list of neighbors of node with unresolved flow dir.
 
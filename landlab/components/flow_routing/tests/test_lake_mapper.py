@@ -12,8 +12,14 @@ from numpy import pi, sin
 from numpy.testing import assert_array_equal
 from pytest import approx
 
-from landlab import BAD_INDEX_VALUE as XX, RasterModelGrid
+from landlab import (
+    BAD_INDEX_VALUE as XX,
+    CLOSED_BOUNDARY,
+    FIXED_VALUE_BOUNDARY,
+    RasterModelGrid,
+)
 from landlab.components import DepressionFinderAndRouter, FlowAccumulator
+from landlab.components.flow_routing import find_pits
 
 NUM_GRID_ROWS = 8
 NUM_GRID_COLS = 8
@@ -1949,3 +1955,125 @@ def test_D8_D4_route(d4_grid):
     assert d4_grid.mg1.at_node["drainage_area"].reshape((7, 7))[:, 0].sum() == approx(
         d4_grid.mg2.at_node["drainage_area"].reshape((7, 7))[:, 0].sum()
     )
+
+
+def test_bad_method():
+    mg = RasterModelGrid((5, 5))
+    mg.add_zeros("node", "topographic__elevation")
+    with pytest.raises(ValueError):
+        DepressionFinderAndRouter(mg, method="bogus")
+
+
+@pytest.mark.parametrize("routing", ["D8", "D4"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_priority_flood_matches_lake_by_lake(routing, seed):
+    np.random.seed(seed)
+    z = np.random.rand(15 * 17)
+
+    lakes = {}
+    for method in ("lake_by_lake", "priority_flood"):
+        mg = RasterModelGrid((15, 17))
+        mg.set_closed_boundaries_at_grid_edges(True, False, True, False)
+        mg.add_field("node", "topographic__elevation", z.copy())
+        fa = FlowAccumulator(
+            mg,
+            flow_director="D8" if routing == "D8" else "D4",
+            depression_finder="DepressionFinderAndRouter",
+            routing=routing,
+            method=method,
+        )
+        fa.run_one_step()
+        lakes[method] = (mg, fa.depression_finder)
+
+    (mg1, df1), (mg2, df2) = lakes["lake_by_lake"], lakes["priority_flood"]
+    assert df2.number_of_lakes > 0
+    assert_array_equal(df1.lake_at_node, df2.lake_at_node)
+    assert_array_equal(
+        mg1.at_node["depression__outlet_node"], mg2.at_node["depression__outlet_node"]
+    )
+    assert mg1.at_node["depression__depth"] == approx(mg2.at_node["depression__depth"])
+    assert_array_equal(np.sort(df1.lake_outlets), np.sort(df2.lake_outlets))
+    assert df1.lake_areas.sum() == approx(df2.lake_areas.sum())
+
+    # all of the flow leaves through the open boundaries
+    area = mg2.at_node["drainage_area"]
+    assert area[mg2.open_boundary_nodes].sum() == approx(
+        mg2.cell_area_at_node[mg2.core_nodes].sum()
+    )
+    assert np.all(mg2.at_node["flow__receiver_node"][mg2.core_nodes] != mg2.core_nodes)
+
+
+def test_priority_flood_lake_codes():
+    mg = RasterModelGrid((5, 6))
+    z = mg.add_field(
+        "node", "topographic__elevation", mg.x_of_node + 0.01 * mg.y_of_node
+    )
+    z[[9, 15]] = [1.5, 1.01]
+    df = DepressionFinderAndRouter(mg, method="priority_flood")
+    df.map_depressions()
+
+    assert_array_equal(df.lake_codes, [15])
+    assert_array_equal(df.lake_outlets, [2])
+    assert_array_equal(np.where(df.lake_at_node)[0], [9, 15])
+    assert df.lake_volumes == approx([0.5 + 0.99])
+
+
+def test_priority_flood_leaves_exact_flats_dry():
+    """Exact flats are zero-depth lakes only when mapped lake by lake."""
+    lakes = {}
+    for method in ("lake_by_lake", "priority_flood"):
+        mg = RasterModelGrid((6, 6))
+        mg.add_zeros("node", "topographic__elevation")
+        fa = FlowAccumulator(
+            mg,
+            flow_director="D8",
+            depression_finder="DepressionFinderAndRouter",
+            method=method,
+        )
+        fa.run_one_step()
+        lakes[method] = (mg, fa.depression_finder)
+
+    mg, df = lakes["lake_by_lake"]
+    assert_array_equal(np.where(df.lake_at_node)[0], mg.core_nodes)
+    assert_array_equal(mg.at_node["depression__depth"], 0.)
+
+    mg, df = lakes["priority_flood"]
+    assert df.number_of_lakes == 0
+    assert not np.any(df.lake_at_node)
+    area = mg.at_node["drainage_area"]
+    assert area[mg.open_boundary_nodes].sum() == approx(
+        mg.cell_area_at_node[mg.core_nodes].sum()
+    )
+
+
+@pytest.mark.parametrize("routing", ["D8", "D4"])
+def test_find_pits_matches_neighbor_search(routing):
+    mg = RasterModelGrid((12, 10))
+    mg.set_closed_boundaries_at_grid_edges(True, False, True, False)
+    np.random.seed(0)
+    z = mg.add_field(
+        "node", "topographic__elevation", np.round(np.random.rand(120) * 4.)
+    )
+
+    if routing == "D8":
+        nbrs = np.hstack(
+            (mg.adjacent_nodes_at_node, mg.diagonal_adjacent_nodes_at_node)
+        )
+    else:
+        nbrs = mg.adjacent_nodes_at_node
+    status = mg.status_at_node
+    expected = np.zeros(mg.number_of_nodes, dtype=bool)
+    for node in mg.core_nodes:
+        expected[node] = True
+        for nbr in nbrs[node]:
+            if nbr == -1 or status[nbr] == CLOSED_BOUNDARY:
+                continue
+            if z[nbr] < z[node] or (z[nbr] == z[node] and status[nbr] == FIXED_VALUE_BOUNDARY):
+                expected[node] = False
+
+    assert_array_equal(find_pits(mg, routing=routing), expected)
+
+    df = DepressionFinderAndRouter(mg, routing=routing)
+    df._find_pits()
+    assert_array_equal(df.is_pit, expected)
+    assert df.number_of_pits == np.count_nonzero(expected)
@@ -0,0 +1,106 @@
+"""Helpers for advancing overland flow with local time steps.
+
+With local time stepping, each link is assigned a time-step *level*, *k*,
+and its discharge is only updated every ``2 ** k`` time steps of the
+smallest (level 0) time step, using a time step that is ``2 ** k`` times as
+long. Water depths at nodes are updated at every level-0 time step from the
+current discharge at all links, so water is conserved exactly.
+"""
+import numpy as np
+
+
+def time_step_level_at_link(grid, h, n_levels, out=None):
+    """Assign each link the longest stable time-step level.
+
+    The stable time step at a link is taken to scale with
+    ``1 / sqrt(h)`` (Bates et al., 2010), where *h* is the greatest water
+    depth at the link's nodes and their neighbors. A link whose depth is a
+    quarter of the greatest depth on the grid can therefore take a time step
+    twice as long as the shortest one. Looking at neighboring nodes as well
+    keeps a buffer of short time steps around deep water, into which it
+    can spread within a cycle of time steps.
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A landlab grid.
+    h : ndarray of float
+        Water depth at nodes.
+    n_levels : int
+        Number of time-step levels. Levels are numbered from 0 (the
+        shortest time step) to *n_levels* - 1.
+    out : ndarray of int, optional
+        Buffer to place the result into.
+
+    Returns
+    -------
+    ndarray of int
+        Time-step level at each link.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components.overland_flow._local_time_step import (
+    ...     time_step_level_at_link)
+    >>> grid = RasterModelGrid((3, 7))
+    >>> h = np.tile([1., 1., 0.25, 0.0625, 0.0625, 0.0625, 0.], 3)
+    >>> levels = time_step_level_at_link(grid, h, 4)
+    >>> levels[grid.horizontal_links].reshape((3, 6))
+    array([[0, 0, 0, 1, 2, 2],
+           [0, 0, 0, 1, 2, 2],
+           [0, 0, 0, 1, 2, 2]])
+    >>> levels = time_step_level_at_link(grid, h, 2)
+    >>> levels[grid.horizontal_links].reshape((3, 6))
+    array([[0, 0, 0, 1, 1, 1],
+           [0, 0, 0, 1, 1, 1],
+           [0, 0, 0, 1, 1, 1]])
+    """
+    if out is None:
+        out = np.empty(grid.number_of_links, dtype=int)
+
+    h = np.maximum(h, 0.)
+    nbrs = grid.adjacent_nodes_at_node
+    h_near_node = np.maximum(h, np.where(nbrs == -1, 0., h[nbrs]).max(axis=1))
+    h_at_link = grid.map_max_of_link_nodes_to_link(h_near_node)
+    h_max = h_at_link.max()
+    with np.errstate(divide="ignore"):
+        level = np.floor(0.5 * np.log2(h_max / h_at_link))
+    level[~np.isfinite(level)] = n_levels - 1
+    out[:] = np.clip(level, 0, n_levels - 1)
+
+    return out
+
+
+def level_zero_time_step(dt_min, n_levels, time_remaining):
+    """Find the level-0 time step of the next cycle of local time steps.
+
+    A cycle is made up of ``2 ** (n_levels - 1)`` level-0 time steps, so
+    that every level is updated a whole number of times. The time step is
+    shortened, if necessary, so that the cycle does not overshoot the time
+    remaining.
+
+    Parameters
+    ----------
+    dt_min : float
+        Stable time step at the deepest link.
+    n_levels : int
+        Number of time-step levels.
+    time_remaining : float
+        Time left to run.
+
+    Returns
+    -------
+    float
+        Level-0 time step.
+
+    Examples
+    --------
+    >>> from landlab.components.overland_flow._local_time_step import (
+    ...     level_zero_time_step)
+    >>> level_zero_time_step(1., 3, 10.)
+    1.0
+    >>> level_zero_time_step(1., 3, 2.)
+    0.5
+    """
+    return min(dt_min, time_remaining / 2 ** (n_levels - 1))
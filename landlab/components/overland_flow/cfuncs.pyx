@@ -0,0 +1,305 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+from libc.math cimport cbrt, fabs
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+@cython.cdivision(True)
+cdef inline double _de_almeida_discharge(double q, double q_neighbors,
+                                         double h, double slope, double n,
+                                         double theta, double g,
+                                         double dt) nogil:
+    """New discharge at a link from Eq. 41 of de Almeida et al. (2012).
+
+    *q_neighbors* is the sum of the discharges at the link's two neighbors.
+    Links whose flow depth, *h*, is not positive are dry and are given zero
+    discharge.
+    """
+    if h > 0.:
+        return (
+            theta * q + (1. - theta) / 2. * q_neighbors - g * h * dt * slope
+        ) / (1. + g * dt * n * n * fabs(q) / (h * h * cbrt(h)))
+    else:
+        return 0.
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def update_discharge_at_links(np.ndarray[DTYPE_INT_t, ndim=1] links,
+                              np.ndarray[DTYPE_INT_t, ndim=2] neighbors,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] q,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] h_at_link,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] slope,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] mannings_n,
+                              DTYPE_FLOAT_t theta,
+                              DTYPE_FLOAT_t g,
+                              DTYPE_FLOAT_t dt,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] out):
+    """Update discharge at a family of parallel links (de Almeida et al.).
+
+    Each link's new discharge is found from the old discharge at the link
+    and at its two upstream/downstream neighbors, the water depth and water
+    surface slope at the link, and Manning's n. All of the new discharges
+    are found before any of them are stored, so the update is the same as
+    the vectorized one. Links whose flow depth is not positive are dry and
+    are given zero discharge.
+
+    Parameters
+    ----------
+    links : ndarray of int
+        Links to update.
+    neighbors : ndarray of int, shape (n_links, 2)
+        The two neighbors of each of *links* along the direction of flow.
+        Neighbors that do not exist must refer to a link that has zero
+        discharge.
+    q : ndarray of float
+        Discharge at all links. Updated in place.
+    h_at_link : ndarray of float
+        Flow depth at all links.
+    slope : ndarray of float
+        Water surface slope at all links.
+    mannings_n : ndarray of float
+        Manning's n at all links, or a single value for all links.
+    theta : float
+        Weighting factor from de Almeida et al. (2012).
+    g : float
+        Acceleration due to gravity.
+    dt : float
+        Time step.
+    out : ndarray of float
+        Work array that is at least as long as *links*.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.overland_flow.cfuncs import (
+    ...     update_discharge_at_links)
+    >>> q = np.array([0., 1., 2., 0.])
+    >>> update_discharge_at_links(
+    ...     np.array([1, 2]), np.array([[0, 2], [1, 3]]), q,
+    ...     np.array([0., 1., 0., 0.]), np.zeros(4), np.array([0.]), 1., 9.81, 1.,
+    ...     np.empty(2))
+    >>> q
+    array([ 0.,  1.,  0.,  0.])
+    """
+    cdef Py_ssize_t n_links = links.shape[0]
+    cdef int n_stride = 1 if mannings_n.shape[0] > 1 else 0
+    cdef Py_ssize_t i
+    cdef DTYPE_INT_t link
+
+    with nogil:
+        for i in range(n_links):
+            link = links[i]
+            out[i] = _de_almeida_discharge(
+                q[link], q[neighbors[i, 0]] + q[neighbors[i, 1]],
+                h_at_link[link], slope[link], mannings_n[link * n_stride],
+                theta, g, dt)
+
+        for i in range(n_links):
+            q[links[i]] = out[i]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def update_discharge_by_level(np.ndarray[DTYPE_INT_t, ndim=1] links,
+                              np.ndarray[DTYPE_INT_t, ndim=2] neighbors,
+                              np.ndarray[DTYPE_INT_t, ndim=1] level_at_link,
+                              DTYPE_INT_t substep,
+                              np.ndarray[DTYPE_INT_t, ndim=1] is_active,
+                              np.ndarray[DTYPE_INT_t, ndim=2] nodes_at_link,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] length_of_link,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] h,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] q,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] h_at_link,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] slope,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] mannings_n,
+                              DTYPE_FLOAT_t theta,
+                              DTYPE_FLOAT_t g,
+                              DTYPE_FLOAT_t dt,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=1] out):
+    """Update discharge at the links that are due at a local time step.
+
+    A link at time-step level *k* advances with a time step of
+    ``dt * 2 ** k`` and is only updated at substeps that are a multiple of
+    ``2 ** k``. Before being updated, the flow depth and water surface
+    slope at an active link are found from the water depth and elevation at
+    its nodes (Bates et al., 2010); other links keep their stored values.
+
+    Parameters
+    ----------
+    links : ndarray of int
+        Links that can be updated.
+    neighbors : ndarray of int, shape (n_links, 2)
+        The two neighbors of every link along the direction of flow.
+        Neighbors that do not exist must refer to a link that has zero
+        discharge.
+    level_at_link : ndarray of int
+        Time-step level of every link.
+    substep : int
+        Number of time steps of length *dt* since the start of the cycle.
+    is_active : ndarray of int
+        Flag (0 or 1) for whether each link is active.
+    nodes_at_link : ndarray of int, shape (n_links, 2)
+        Tail and head nodes of every link.
+    length_of_link : ndarray of float
+        Length of every link.
+    z : ndarray of float
+        Elevation at nodes.
+    h : ndarray of float
+        Water depth at nodes.
+    q : ndarray of float
+        Discharge at all links. Updated in place.
+    h_at_link : ndarray of float
+        Flow depth at all links. Updated in place at active links.
+    slope : ndarray of float
+        Water surface slope at all links. Updated in place at active links.
+    mannings_n : ndarray of float
+        Manning's n at all links, or a single value for all links.
+    theta : float
+        Weighting factor from de Almeida et al. (2012).
+    g : float
+        Acceleration due to gravity.
+    dt : float
+        Time step of level 0.
+    out : ndarray of float
+        Work array that is at least as long as *links*.
+
+    Returns
+    -------
+    int
+        Number of links that were updated.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.overland_flow.cfuncs import (
+    ...     update_discharge_by_level)
+    >>> nodes_at_link = np.array([[0, 1], [1, 2]])
+    >>> q = np.zeros(3)
+    >>> h_at_link = np.zeros(2)
+    >>> slope = np.zeros(2)
+    >>> args = (np.array([0, 1]), np.array([[2, 1], [0, 2]]),
+    ...         np.array([0, 1]))
+    >>> kwds = (np.array([1, 1]), nodes_at_link, np.ones(2),
+    ...         np.zeros(3), np.array([1., 0.5, 0.5]), q, h_at_link, slope,
+    ...         np.array([0.]), 1., 10., 0.1, np.empty(2))
+    >>> update_discharge_by_level(*(args + (1, ) + kwds))
+    1
+    >>> q
+    array([ 0.5,  0. ,  0. ])
+    >>> update_discharge_by_level(*(args + (2, ) + kwds))
+    2
+    >>> q
+    array([ 1.,  0.,  0.])
+    """
+    cdef Py_ssize_t n_links = links.shape[0]
+    cdef int n_stride = 1 if mannings_n.shape[0] > 1 else 0
+    cdef Py_ssize_t i
+    cdef DTYPE_INT_t link, step, tail, head
+    cdef DTYPE_INT_t n_updated = 0
+    cdef double w_tail, w_head
+
+    with nogil:
+        for i in range(n_links):
+            link = links[i]
+            step = 1 << level_at_link[link]
+            if substep % step != 0:
+                continue
+
+            if is_active[link]:
+                tail = nodes_at_link[link, 0]
+                head = nodes_at_link[link, 1]
+                w_tail = h[tail] + z[tail]
+                w_head = h[head] + z[head]
+                h_at_link[link] = max(w_tail, w_head) - max(z[tail], z[head])
+                slope[link] = (w_head - w_tail) / length_of_link[link]
+
+            out[n_updated] = _de_almeida_discharge(
+                q[link], q[neighbors[link, 0]] + q[neighbors[link, 1]],
+                h_at_link[link], slope[link], mannings_n[link * n_stride],
+                theta, g, dt * step)
+            n_updated += 1
+
+        n_updated = 0
+        for i in range(n_links):
+            link = links[i]
+            if substep % (1 << level_at_link[link]) == 0:
+                q[link] = out[n_updated]
+                n_updated += 1
+
+    return n_updated
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def update_depth_at_nodes(np.ndarray[DTYPE_INT_t, ndim=1] nodes,
+                          np.ndarray[DTYPE_INT_t, ndim=2] links_at_node,
+                          np.ndarray[DTYPE_FLOAT_t, ndim=2] flux_weight,
+                          np.ndarray[DTYPE_FLOAT_t, ndim=1] q,
+                          np.ndarray[DTYPE_FLOAT_t, ndim=1] rainfall,
+                          DTYPE_FLOAT_t dt,
+                          np.ndarray[DTYPE_FLOAT_t, ndim=1] dhdt,
+                          np.ndarray[DTYPE_FLOAT_t, ndim=1] h):
+    """Update water depth at nodes from rainfall and discharge divergence.
+
+    Parameters
+    ----------
+    nodes : ndarray of int
+        Nodes to update.
+    links_at_node : ndarray of int, shape (n_nodes, max_links)
+        Links at each node. Links that do not exist must refer to a link
+        that has zero discharge.
+    flux_weight : ndarray of float, shape (n_nodes, max_links)
+        Direction of each link relative to the node (1 for incoming, -1 for
+        outgoing) times the width of its face, divided by the area of the
+        node's cell.
+    q : ndarray of float
+        Discharge at links.
+    rainfall : ndarray of float
+        Rainfall intensity at all nodes, or a single value for all nodes.
+    dt : float
+        Time step.
+    dhdt : ndarray of float
+        Output: rate of change of water depth at *nodes*.
+    h : ndarray of float
+        Water depth at all nodes. Updated in place.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.overland_flow.cfuncs import (
+    ...     update_depth_at_nodes)
+    >>> h = np.array([1., 1.])
+    >>> dhdt = np.zeros(2)
+    >>> update_depth_at_nodes(
+    ...     np.array([1]), np.array([[2, 0], [0, 2]]),
+    ...     np.array([[0., 0.], [1., -1.]]), np.array([2., 0., 0.]),
+    ...     np.array([0.5]), 0.1, dhdt, h)
+    >>> dhdt
+    array([ 0. ,  2.5])
+    >>> h
+    array([ 1.  ,  1.25])
+    """
+    cdef Py_ssize_t n_nodes = nodes.shape[0]
+    cdef Py_ssize_t n_links = links_at_node.shape[1]
+    cdef int r_stride = 1 if rainfall.shape[0] > 1 else 0
+    cdef Py_ssize_t i, k
+    cdef DTYPE_INT_t node
+    cdef double rate
+
+    with nogil:
+        for i in range(n_nodes):
+            node = nodes[i]
+            rate = rainfall[node * r_stride]
+            for k in range(n_links):
+                rate = rate + flux_weight[node, k] * q[links_at_node[node, k]]
+            dhdt[node] = rate
+            h[node] = h[node] + rate * dt
@@ -88,11 +88,17 @@ array([ 0. ,  0. ,  0. ,  0. ,
 """
 import numpy as np
 
-from landlab import Component, FieldError
+from landlab import ACTIVE_LINK, BAD_INDEX_VALUE, Component, FieldError
+from landlab.core.utils import as_id_array
 from landlab.grid.structured_quad import links
 from landlab.utils.decorators import use_file_name_or_kwds
 
-_SEVEN_OVER_THREE = 7.0 / 3.0
+from ._local_time_step import level_zero_time_step, time_step_level_at_link
+from .cfuncs import (
+    update_depth_at_nodes,
+    update_discharge_at_links,
+    update_discharge_by_level,
+)
 
 
 class OverlandFlow(Component):
@@ -170,6 +176,8 @@ class OverlandFlow(Component):
         theta=0.8,
         rainfall_intensity=0.0,
         steep_slopes=False,
+        local_time_stepping=False,
+        time_step_levels=4,
         **kwds
     ):
         """Create an overland flow component.
@@ -192,6 +200,15 @@ class OverlandFlow(Component):
             Weighting factor from de Almeida et al., 2012.
         rainfall_intensity : float, optional
             Rainfall intensity.
+        local_time_stepping : bool, optional
+            If True, links are grouped into time-step levels by their flow
+            depth, and discharge at a link at level *k* is only updated
+            every ``2 ** k`` time steps, with a time step ``2 ** k`` times as
+            long. Water depths are updated at every time step, so water is
+            conserved. This saves work where most of the grid is much
+            shallower than its deepest part.
+        time_step_levels : int, optional
+            Number of time-step levels used with *local_time_stepping*.
         """
         super(OverlandFlow, self).__init__(grid, **kwds)
 
@@ -210,6 +227,8 @@ class OverlandFlow(Component):
         self.theta = theta
         self.rainfall_intensity = rainfall_intensity
         self.steep_slopes = steep_slopes
+        self._local_time_stepping = local_time_stepping
+        self._time_step_levels = time_step_levels
 
         # Now setting up fields at the links...
         # For water discharge
@@ -283,6 +302,73 @@ class OverlandFlow(Component):
         # Assiging a class variable to the elevation field.
         self.z = self._grid.at_node["topographic__elevation"]
 
+        # Scratch arrays are allocated once here and updated in place at every
+        # time step.
+        self._allocate_workspace()
+
+    def _allocate_workspace(self):
+        """Allocate the scratch arrays used at each time step.
+
+        The discharge field is a view into a buffer that has one extra
+        "ghost" link at its end. The ghost link always has zero discharge, so
+        link neighbors that do not exist (given as -1) can be indexed into
+        the buffer directly.
+        """
+        self._q_padded = np.zeros(self._grid.number_of_links + 1)
+        self._q_padded[:-1] = self.q
+        self.q = self._q_padded[:-1]
+        self._grid.at_link["surface_water__discharge"] = self.q
+
+        self._w = self._grid.empty(at="node")
+        self._zmax = self._grid.empty(at="link")
+        self._wmax = self._grid.empty(at="link")
+        self._hflow = self._grid.empty(at="link")
+        self._grad_w = self._grid.empty(at="link")
+        self._q_update = self._grid.empty(at="link")
+        self._level_at_link = self._grid.zeros(at="link", dtype=int)
+
+        # Links that do not exist refer to the ghost link.
+        self._links_at_node = _with_ghost_link(
+            self._grid.links_at_node, self._grid.number_of_links
+        )
+
+        # Weights that turn discharge at links into the rate of change of
+        # water depth at nodes (zero at nodes without cells).
+        width = np.zeros(self._grid.number_of_links + 1)
+        has_face = self._grid.face_at_link != BAD_INDEX_VALUE
+        width[:-1][has_face] = self._grid.width_of_face[
+            self._grid.face_at_link[has_face]
+        ]
+        area = self._grid.cell_area_at_node
+        self._flux_weight_at_node = (
+            self._grid.link_dirs_at_node * width[self._links_at_node]
+        )
+        self._flux_weight_at_node[area > 0.] /= area[area > 0., np.newaxis]
+        self._flux_weight_at_node[area == 0.] = 0.
+
+    def _get_mannings_n_at_link(self):
+        """Return Manning's n as a single value or a value at every link."""
+        mannings_n = np.array(self.mannings_n, dtype=float, copy=False, ndmin=1)
+        if mannings_n.size not in (1, self._grid.number_of_links):
+            # if manning's n is in a field
+            self.mannings_n = self.grid["link"]["mannings_n"]
+            mannings_n = np.asarray(self.mannings_n, dtype=float)
+        return mannings_n
+
+    def _get_padded_discharge(self):
+        """Return the padded discharge buffer, synced with the field.
+
+        If the discharge field has been replaced by another component, its
+        values are copied into the buffer and the field is once again made a
+        view into it.
+        """
+        q = self._grid.at_link["surface_water__discharge"]
+        if q is not self.q:
+            self._q_padded[:-1] = q
+            self.q = self._q_padded[:-1]
+            self._grid.at_link["surface_water__discharge"] = self.q
+        return self._q_padded
+
     def calc_time_step(self):
         """Calculate time step.
 
@@ -404,6 +490,35 @@ class OverlandFlow(Component):
         ids = self.vert_bdy_ids[ids]
         self.south_neighbors[ids] = self.vertical_active_link_ids[ids]
 
+        # Neighbors for the compiled discharge update, with links that do not
+        # exist referring to the ghost link.
+        self._horizontal_neighbors = _with_ghost_link(
+            np.column_stack((self.west_neighbors, self.east_neighbors)),
+            self.grid.number_of_links,
+        )
+        self._vertical_neighbors = _with_ghost_link(
+            np.column_stack((self.north_neighbors, self.south_neighbors)),
+            self.grid.number_of_links,
+        )
+
+        # ...and the same neighbors indexed by link, together with the links
+        # that are updated, for local time stepping.
+        self._neighbors_at_link = np.full(
+            (self.grid.number_of_links, 2), self.grid.number_of_links, dtype=int
+        )
+        self._neighbors_at_link[self.horizontal_ids] = self._horizontal_neighbors
+        self._neighbors_at_link[self.vertical_ids] = self._vertical_neighbors
+        self._updated_links = np.sort(
+            np.concatenate(
+                (
+                    self.horizontal_active_link_ids[
+                        self.horizontal_active_link_ids >= 0
+                    ],
+                    self.vertical_active_link_ids[self.vertical_active_link_ids >= 0],
+                )
+            )
+        )
+
         # Set up arrays for discharge in the horizontal & vertical directions.
         self.q_horizontal = np.zeros(links.number_of_horizontal_links(self.grid.shape))
         self.q_vertical = np.zeros(links.number_of_vertical_links(self.grid.shape))
@@ -423,10 +538,15 @@ class OverlandFlow(Component):
         Outputs water depth, discharge and shear stress values through time at
         every point in the input grid.
         """
+        if self._local_time_stepping:
+            self._overland_flow_by_level(dt=dt)
+            return
+
         # DH adds a loop to enable an imposed tstep while maintaining stability
         local_elapsed_time = 0.
         if dt is None:
             dt = np.inf  # to allow the loop to begin
+        zmax_is_set = False
         while local_elapsed_time < dt:
             dt_local = self.calc_time_step()
             # Can really get into trouble if nothing happens but we still run:
@@ -446,30 +566,38 @@ class OverlandFlow(Component):
             # discharge variables to the fields.
             self.h = self.grid["node"]["surface_water__depth"]
             self.z = self.grid["node"]["topographic__elevation"]
-            self.q = self.grid["link"]["surface_water__discharge"]
             self.h_links = self.grid["link"]["surface_water__depth"]
 
+            # To handle links with neighbors that do not exist, we index into
+            # a discharge buffer that has an extra link of zero discharge at
+            # its end. Non-existent links or inactive links have an index of
+            # '-1' which, in Python, looks to the end of the array.
+            q = self._get_padded_discharge()
+
             # Here we identify the core nodes and active links for later use.
             self.core_nodes = self.grid.core_nodes
             self.active_links = self.grid.active_links
 
             # Per Bates et al., 2010, this solution needs to find difference
             # between the highest water surface in the two cells and the
-            # highest bed elevation
-            zmax = self._grid.map_max_of_link_nodes_to_link(self.z)
-            w = self.h + self.z
-            wmax = self._grid.map_max_of_link_nodes_to_link(w)
-            hflow = wmax[self._grid.active_links] - zmax[self._grid.active_links]
+            # highest bed elevation. The topography does not change during
+            # the time step, so its maximum at links is only found once.
+            if not zmax_is_set:
+                self._grid.map_max_of_link_nodes_to_link(self.z, out=self._zmax)
+                zmax_is_set = True
+            w = np.add(self.h, self.z, out=self._w)
+            wmax = self._grid.map_max_of_link_nodes_to_link(w, out=self._wmax)
+            hflow = np.subtract(wmax, self._zmax, out=self._hflow)
 
             # Insert this water depth into an array of water depths at the
             # links.
-            self.h_links[self.active_links] = hflow
+            self.h_links[self.active_links] = hflow[self.active_links]
 
             # Now we calculate the slope of the water surface elevation at
             # active links
-            self.water_surface__gradient = self.grid.calc_grad_at_link(w)[
-                self.grid.active_links
-            ]
+            self.water_surface__gradient = self.grid.calc_grad_at_link(
+                w, out=self._grad_w
+            )[self.active_links]
 
             # And insert these values into an array of all links
             self.water_surface_slope[self.active_links] = self.water_surface__gradient
@@ -479,100 +607,33 @@ class OverlandFlow(Component):
             if self.default_fixed_links is True:
                 self.q[self.grid.fixed_links] = self.q[self.active_neighbors]
 
-            # Now we can calculate discharge. To handle links with neighbors
-            # that do not exist, we will do a fancy indexing trick. Non-
-            # existent links or inactive links have an index of '-1', which in
-            # Python, looks to the end of a list or array. To accommodate these
-            # '-1' indices, we will simply insert an value of 0.0 discharge (in
-            # units of L^2/T) to the end of the discharge array.
-            self.q = np.append(self.q, [0])
-
-            horiz = self.horizontal_ids
-            vert = self.vertical_ids
-            # Now we calculate discharge in the horizontal direction
-            try:
-                self.q[horiz] = (
-                    self.theta * self.q[horiz]
-                    + (1. - self.theta)
-                    / 2.
-                    * (self.q[self.west_neighbors] + self.q[self.east_neighbors])
-                    - self.g
-                    * self.h_links[horiz]
-                    * self.dt
-                    * self.water_surface_slope[horiz]
-                ) / (
-                    1
-                    + self.g
-                    * self.dt
-                    * self.mannings_n ** 2.
-                    * abs(self.q[horiz])
-                    / self.h_links[horiz] ** _SEVEN_OVER_THREE
-                )
-
-                # ... and in the vertical direction
-                self.q[vert] = (
-                    self.theta * self.q[vert]
-                    + (1 - self.theta)
-                    / 2.
-                    * (self.q[self.north_neighbors] + self.q[self.south_neighbors])
-                    - self.g
-                    * self.h_links[vert]
-                    * self.dt
-                    * self.water_surface_slope[vert]
-                ) / (
-                    1
-                    + self.g
-                    * self.dt
-                    * self.mannings_n ** 2.
-                    * abs(self.q[vert])
-                    / self.h_links[vert] ** _SEVEN_OVER_THREE
-                )
-
-            except ValueError:
-                self.mannings_n = self.grid["link"]["mannings_n"]
-                # if manning's n in a field
-                # calc discharge in horizontal
-                self.q[horiz] = (
-                    self.theta * self.q[horiz]
-                    + (1. - self.theta)
-                    / 2.
-                    * (self.q[self.west_neighbors] + self.q[self.east_neighbors])
-                    - self.g
-                    * self.h_links[horiz]
-                    * self.dt
-                    * self.water_surface_slope[horiz]
-                ) / (
-                    1
-                    + self.g
-                    * self.dt
-                    * self.mannings_n[horiz] ** 2.
-                    * abs(self.q[horiz])
-                    / self.h_links[horiz] ** _SEVEN_OVER_THREE
-                )
-
-                # ... and in the vertical direction
-                self.q[vert] = (
-                    self.theta * self.q[vert]
-                    + (1 - self.theta)
-                    / 2.
-                    * (self.q[self.north_neighbors] + self.q[self.south_neighbors])
-                    - self.g
-                    * self.h_links[vert]
-                    * self.dt
-                    * self.water_surface_slope[self.vertical_ids]
-                ) / (
-                    1
-                    + self.g
-                    * self.dt
-                    * self.mannings_n[vert] ** 2.
-                    * abs(self.q[vert])
-                    / self.h_links[vert] ** _SEVEN_OVER_THREE
-                )
-
-            # Now to return the array to its original length (length of number
-            # of all links), we delete the extra 0.0 value from the end of the
-            # array.
-            self.q = np.delete(self.q, len(self.q) - 1)
+            # Now we calculate discharge in the horizontal direction and then
+            # in the vertical direction.
+            mannings_n = self._get_mannings_n_at_link()
+            update_discharge_at_links(
+                self.horizontal_ids,
+                self._horizontal_neighbors,
+                q,
+                self.h_links,
+                self.water_surface_slope,
+                mannings_n,
+                self.theta,
+                self.g,
+                self.dt,
+                self._q_update,
+            )
+            update_discharge_at_links(
+                self.vertical_ids,
+                self._vertical_neighbors,
+                q,
+                self.h_links,
+                self.water_surface_slope,
+                mannings_n,
+                self.theta,
+                self.g,
+                self.dt,
+                self._q_update,
+            )
 
             # Updating the discharge array to have the boundary links set to
             # their neighbor
@@ -580,81 +641,21 @@ class OverlandFlow(Component):
                 self.q[self.grid.fixed_links] = self.q[self.active_neighbors]
 
             if self.steep_slopes is True:
-                # To prevent water from draining too fast for our time steps...
-                # Our Froude number.
-                Fr = 1.0
-                # Our two limiting factors, the froude number and courant
-                # number.
-                # Looking a calculated q to be compared to our Fr number.
-                calculated_q = (self.q / self.h_links) / np.sqrt(self.g * self.h_links)
-
-                # Looking at our calculated q and comparing it to Courant no.,
-                q_courant = self.q * self.dt / self.grid.dx
-
-                # Water depth split equally between four links..
-                water_div_4 = self.h_links / 4.
-
-                # IDs where water discharge is positive...
-                (positive_q,) = np.where(self.q > 0)
-
-                # ... and negative.
-                (negative_q,) = np.where(self.q < 0)
-
-                # Where does our calculated q exceed the Froude number? If q
-                # does exceed the Froude number, we are getting supercritical
-                # flow and discharge needs to be reduced to maintain stability.
-                (Froude_logical,) = np.where((calculated_q) > Fr)
-                (Froude_abs_logical,) = np.where(abs(calculated_q) > Fr)
-
-                # Where does our calculated q exceed the Courant number and
-                # water depth divided amongst 4 links? If the calculated q
-                # exceeds the Courant number and is greater than the water
-                # depth divided by 4 links, we reduce discharge to maintain
-                # stability.
-                (water_logical,) = np.where(q_courant > water_div_4)
-                (water_abs_logical,) = np.where(abs(q_courant) > water_div_4)
-
-                # Where are these conditions met? For positive and negative q,
-                # there are specific rules to reduce q. This step finds where
-                # the discharge values are positive or negative and where
-                # discharge exceeds the Froude or Courant number.
-                self.if_statement_1 = np.intersect1d(positive_q, Froude_logical)
-                self.if_statement_2 = np.intersect1d(negative_q, Froude_abs_logical)
-                self.if_statement_3 = np.intersect1d(positive_q, water_logical)
-                self.if_statement_4 = np.intersect1d(negative_q, water_abs_logical)
-
-                # Rules 1 and 2 reduce discharge by the Froude number.
-                self.q[self.if_statement_1] = self.h_links[self.if_statement_1] * (
-                    np.sqrt(self.g * self.h_links[self.if_statement_1]) * Fr
-                )
-
-                self.q[self.if_statement_2] = 0. - (
-                    self.h_links[self.if_statement_2]
-                    * np.sqrt(self.g * self.h_links[self.if_statement_2])
-                    * Fr
-                )
-
-                # Rules 3 and 4 reduce discharge by the Courant number.
-                self.q[self.if_statement_3] = (
-                    (self.h_links[self.if_statement_3] * self.grid.dx) / 5.
-                ) / self.dt
-
-                self.q[self.if_statement_4] = (
-                    0.
-                    - (self.h_links[self.if_statement_4] * self.grid.dx / 5.) / self.dt
-                )
+                self._limit_discharge_on_steep_slopes()
 
             # Once stability has been restored, we calculate the change in
             # water depths on all core nodes by finding the difference between
             # inputs (rainfall) and the inputs/outputs (flux divergence of
-            # discharge)
-            self.dhdt = self.rainfall_intensity - self.grid.calc_flux_div_at_node(
-                self.q
-            )
-
-            # Updating our water depths...
-            self.h[self.core_nodes] = (
-                self.h[self.core_nodes] + self.dhdt[self.core_nodes] * self.dt
+            # discharge), and update our water depths.
+            update_depth_at_nodes(
+                self.core_nodes,
+                self._links_at_node,
+                self._flux_weight_at_node,
+                q,
+                np.array(self.rainfall_intensity, dtype=float, copy=False, ndmin=1),
+                self.dt,
+                self.dhdt,
+                self.h,
             )
 
             # To prevent divide by zero errors, a minimum threshold water depth
@@ -666,10 +667,9 @@ class OverlandFlow(Component):
             if self.steep_slopes is True:
                 self.h[self.h < self.h_init] = self.h_init * 10.0 ** -3
 
-            # And reset our field values with the newest water depth and
-            # discharge.
+            # And reset our field values with the newest water depth. The
+            # discharge field is already a view of our discharge buffer.
             self.grid.at_node["surface_water__depth"] = self.h
-            self.grid.at_link["surface_water__discharge"] = self.q
             #
             #
             #            self.helper_q = self.grid.map_upwind_node_link_max_to_node(self.q)
@@ -695,6 +695,165 @@ class OverlandFlow(Component):
                 break
             local_elapsed_time += self.dt
 
+    def _overland_flow_by_level(self, dt=None):
+        """Generate overland flow using local time steps.
+
+        Time is advanced in cycles of ``2 ** (time_step_levels - 1)`` time
+        steps of the stable time step at the deepest link. At the start of
+        each cycle every link is assigned a time-step level; links at level
+        *k* are updated every ``2 ** k`` time steps (see
+        :func:`~._local_time_step.time_step_level_at_link`). If *dt* is not
+        given, a single cycle is run.
+        """
+        n_levels = self._time_step_levels
+        n_steps = 2 ** (n_levels - 1)
+
+        if self.neighbor_flag is False:
+            self.set_up_neighbor_arrays()
+        is_active = as_id_array(self._grid.status_at_link == ACTIVE_LINK)
+
+        local_elapsed_time = 0.
+        if dt is None:
+            dt = np.inf  # to allow the loop to begin
+        while local_elapsed_time < dt:
+            dt_local = self.calc_time_step()
+            if not dt_local < np.inf:
+                break
+            self.dt = level_zero_time_step(
+                dt_local, n_levels, dt - local_elapsed_time
+            )
+
+            self.h = self.grid["node"]["surface_water__depth"]
+            self.z = self.grid["node"]["topographic__elevation"]
+            self.h_links = self.grid["link"]["surface_water__depth"]
+            q = self._get_padded_discharge()
+            self.core_nodes = self.grid.core_nodes
+
+            time_step_level_at_link(
+                self._grid, self.h, n_levels, out=self._level_at_link
+            )
+            mannings_n = self._get_mannings_n_at_link()
+            rainfall = np.array(
+                self.rainfall_intensity, dtype=float, copy=False, ndmin=1
+            )
+
+            for substep in range(n_steps):
+                update_discharge_by_level(
+                    self._updated_links,
+                    self._neighbors_at_link,
+                    self._level_at_link,
+                    substep,
+                    is_active,
+                    self._grid.nodes_at_link,
+                    self._grid.length_of_link,
+                    self.z,
+                    self.h,
+                    q,
+                    self.h_links,
+                    self.water_surface_slope,
+                    mannings_n,
+                    self.theta,
+                    self.g,
+                    self.dt,
+                    self._q_update,
+                )
+
+                if self.default_fixed_links is True:
+                    self.q[self.grid.fixed_links] = self.q[self.active_neighbors]
+
+                if self.steep_slopes is True:
+                    self._limit_discharge_on_steep_slopes()
+
+                update_depth_at_nodes(
+                    self.core_nodes,
+                    self._links_at_node,
+                    self._flux_weight_at_node,
+                    q,
+                    rainfall,
+                    self.dt,
+                    self.dhdt,
+                    self.h,
+                )
+
+                if self.steep_slopes is True:
+                    self.h[self.h < self.h_init] = self.h_init * 10.0 ** -3
+
+            self.grid.at_node["surface_water__depth"] = self.h
+
+            if dt is np.inf:
+                break
+            local_elapsed_time += self.dt * n_steps
+
+    def _limit_discharge_on_steep_slopes(self):
+        """Reduce discharge where it would drain water too fast.
+
+        Discharge is reduced where flow would be supercritical, or where it
+        would move more water than is available in a time step.
+        """
+        # To prevent water from draining too fast for our time steps...
+        # Our Froude number.
+        Fr = 1.0
+        # Our two limiting factors, the froude number and courant
+        # number.
+        # Looking a calculated q to be compared to our Fr number.
+        calculated_q = (self.q / self.h_links) / np.sqrt(self.g * self.h_links)
+
+        # Looking at our calculated q and comparing it to Courant no.,
+        q_courant = self.q * self.dt / self.grid.dx
+
+        # Water depth split equally between four links..
+        water_div_4 = self.h_links / 4.
+
+        # IDs where water discharge is positive...
+        (positive_q,) = np.where(self.q > 0)
+
+        # ... and negative.
+        (negative_q,) = np.where(self.q < 0)
+
+        # Where does our calculated q exceed the Froude number? If q
+        # does exceed the Froude number, we are getting supercritical
+        # flow and discharge needs to be reduced to maintain stability.
+        (Froude_logical,) = np.where((calculated_q) > Fr)
+        (Froude_abs_logical,) = np.where(abs(calculated_q) > Fr)
+
+        # Where does our calculated q exceed the Courant number and
+        # water depth divided amongst 4 links? If the calculated q
+        # exceeds the Courant number and is greater than the water
+        # depth divided by 4 links, we reduce discharge to maintain
+        # stability.
+        (water_logical,) = np.where(q_courant > water_div_4)
+        (water_abs_logical,) = np.where(abs(q_courant) > water_div_4)
+
+        # Where are these conditions met? For positive and negative q,
+        # there are specific rules to reduce q. This step finds where
+        # the discharge values are positive or negative and where
+        # discharge exceeds the Froude or Courant number.
+        self.if_statement_1 = np.intersect1d(positive_q, Froude_logical)
+        self.if_statement_2 = np.intersect1d(negative_q, Froude_abs_logical)
+        self.if_statement_3 = np.intersect1d(positive_q, water_logical)
+        self.if_statement_4 = np.intersect1d(negative_q, water_abs_logical)
+
+        # Rules 1 and 2 reduce discharge by the Froude number.
+        self.q[self.if_statement_1] = self.h_links[self.if_statement_1] * (
+            np.sqrt(self.g * self.h_links[self.if_statement_1]) * Fr
+        )
+
+        self.q[self.if_statement_2] = 0. - (
+            self.h_links[self.if_statement_2]
+            * np.sqrt(self.g * self.h_links[self.if_statement_2])
+            * Fr
+        )
+
+        # Rules 3 and 4 reduce discharge by the Courant number.
+        self.q[self.if_statement_3] = (
+            (self.h_links[self.if_statement_3] * self.grid.dx) / 5.
+        ) / self.dt
+
+        self.q[self.if_statement_4] = (
+            0.
+            - (self.h_links[self.if_statement_4] * self.grid.dx / 5.) / self.dt
+        )
+
     def run_one_step(self, dt=None):
         """Generate overland flow across a grid.
 
@@ -751,6 +910,23 @@ class OverlandFlow(Component):
         return discharge_vals
 
 
+def _with_ghost_link(link_ids, ghost_link):
+    """Copy an array of link IDs, replacing missing links with a ghost link.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.overland_flow import (
+    ...     generate_overland_flow_deAlmeida as deAlmeida)
+    >>> deAlmeida._with_ghost_link(np.array([[0, -1], [-1, 2]]), 3)
+    array([[0, 3],
+           [3, 2]])
+    """
+    link_ids = as_id_array(link_ids).copy()
+    link_ids[link_ids == -1] = ghost_link
+    return link_ids
+
+
 def find_active_neighbors_for_fixed_links(grid):
     """Find active link neighbors for every fixed link.
 
@@ -5,6 +5,7 @@ Unit tests for landlab.components.overland_flow.OverlandFlowBates
 last updated: 3/14/16
 """
 import numpy as np
+import pytest
 
 from landlab.components.overland_flow import OverlandFlowBates
 
@@ -82,3 +83,22 @@ def test_Bates_analytical():
     hBates = hBates[1][1:]
     hBates = np.append(hBates, [0])
     np.testing.assert_almost_equal(h_analytical, hBates, decimal=1)
+
+
+def test_Bates_local_time_stepping_conserves_water():
+    from landlab import RasterModelGrid
+
+    grid = RasterModelGrid((20, 30), xy_spacing=10)
+    grid.add_field("node", "topographic__elevation", 0.001 * grid.x_of_node)
+    h = grid.add_ones("node", "surface_water__depth")
+    h *= 0.01
+    h[grid.nodes[10, 1:-1]] = 0.1
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    bates = OverlandFlowBates(grid, alpha=0.3, local_time_stepping=True)
+
+    volume = bates.h[grid.core_nodes].sum()
+    for _ in range(5):
+        bates.overland_flow(dt=20.)
+
+    assert np.all(np.isfinite(bates.h))
+    assert bates.h[grid.core_nodes].sum() == pytest.approx(volume, rel=1e-12)
@@ -5,6 +5,7 @@ Unit tests for landlab.components.overland_flow.OverlandFlow
 last updated: 3/14/16
 """
 import numpy as np
+from pytest import approx
 
 from landlab import RasterModelGrid
 from landlab.components.overland_flow import OverlandFlow
@@ -143,3 +144,105 @@ def test_deAlm_analytical_imposed_dt_long():
     hdeAlm = hdeAlm[1][1:]
     hdeAlm = np.append(hdeAlm, [0])
     np.testing.assert_almost_equal(h_analytical, hdeAlm, decimal=1)
+
+
+def test_deAlm_discharge_buffer_is_reused():
+    grid = RasterModelGrid((10, 12), xy_spacing=25)
+    grid.add_zeros("node", "topographic__elevation")
+    h = grid.add_ones("node", "surface_water__depth")
+    h[grid.core_nodes[:5]] = 1.5
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    deAlm = OverlandFlow(grid, mannings_n=0.01, h_init=0.001)
+
+    q = grid.at_link["surface_water__discharge"]
+    deAlm.run_one_step(100.)
+    assert grid.at_link["surface_water__discharge"] is q
+    assert np.any(q != 0.)
+    assert deAlm._q_padded[-1] == 0.
+
+    # a discharge field that is replaced by someone else is picked up
+    q_new = np.zeros(grid.number_of_links)
+    grid.at_link["surface_water__discharge"] = q_new
+    deAlm.run_one_step(1.)
+    q_after = grid.at_link["surface_water__discharge"]
+    assert q_after is deAlm.q
+    assert q_after is not q_new
+    assert deAlm._q_padded[-1] == 0.
+
+
+def test_deAlm_dry_links_have_no_discharge():
+    grid = RasterModelGrid((20, 20), xy_spacing=25)
+    np.random.seed(3)
+    grid.add_field(
+        "node", "topographic__elevation", 0.01 * np.random.rand(grid.number_of_nodes)
+    )
+    h = grid.add_zeros("node", "surface_water__depth")
+    h[grid.core_nodes[::7]] = 0.05
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, False)
+    deAlm = OverlandFlow(grid, mannings_n=0.03)
+
+    for _ in range(10):
+        deAlm.run_one_step(30.)
+
+    q = grid.at_link["surface_water__discharge"]
+    h_links = grid.at_link["surface_water__depth"]
+    assert np.all(np.isfinite(q))
+    assert np.all(np.isfinite(h))
+    assert np.all(q[h_links <= 0.] == 0.)
+
+
+def test_deAlm_analytical_local_time_stepping():
+    grid = RasterModelGrid((32, 240), xy_spacing=25)
+    grid.add_zeros("node", "surface_water__depth")
+    grid.add_zeros("node", "topographic__elevation")
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    left_inactive_ids = left_edge_horizontal_ids(grid.shape)
+    deAlm = OverlandFlow(
+        grid,
+        mannings_n=0.01,
+        h_init=0.001,
+        local_time_stepping=True,
+        time_step_levels=3,
+    )
+    time = 0.0
+
+    while time < 500.:
+        grid.at_link["surface_water__discharge"][left_inactive_ids] = grid.at_link[
+            "surface_water__discharge"
+        ][left_inactive_ids + 1]
+        dt = 10.
+        deAlm.run_one_step(dt)
+        h_boundary = ((7. / 3.) * (0.01 ** 2) * (0.4 ** 3) * time) ** (3. / 7.)
+        grid.at_node["surface_water__depth"][grid.nodes[1:-1, 1]] = h_boundary
+        time += dt
+
+    x = np.arange(0, ((grid.shape[1]) * grid.dx), grid.dx)
+    h_analytical = -(7. / 3.) * (0.01 ** 2) * (0.4 ** 2) * (x - (0.4 * 500))
+
+    h_analytical[np.where(h_analytical > 0)] = h_analytical[
+        np.where(h_analytical > 0)
+    ] ** (3. / 7.)
+    h_analytical[np.where(h_analytical < 0)] = 0.0
+
+    hdeAlm = deAlm.h.reshape(grid.shape)
+    hdeAlm = hdeAlm[1][1:]
+    hdeAlm = np.append(hdeAlm, [0])
+    np.testing.assert_almost_equal(h_analytical, hdeAlm, decimal=1)
+
+
+def test_deAlm_local_time_stepping_conserves_water():
+    grid = RasterModelGrid((20, 30), xy_spacing=10)
+    grid.add_field("node", "topographic__elevation", 0.001 * grid.x_of_node)
+    h = grid.add_ones("node", "surface_water__depth")
+    h *= 0.01
+    h[grid.nodes[10, 1:-1]] = 1.
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    deAlm = OverlandFlow(grid, local_time_stepping=True)
+
+    volume = h[grid.core_nodes].sum()
+    for _ in range(5):
+        deAlm.run_one_step(20.)
+
+    assert np.all(np.isfinite(h))
+    assert h[grid.core_nodes].sum() == approx(volume, rel=1e-12)
+    assert np.any(deAlm._level_at_link > 0)
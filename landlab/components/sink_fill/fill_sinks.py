@@ -9,9 +9,16 @@ from __future__ import print_function
 import numpy as np
 
 import landlab
-from landlab import Component, FieldError, ModelParameterDictionary
+from landlab import (
+    CLOSED_BOUNDARY,
+    Component,
+    FieldError,
+    ModelParameterDictionary,
+)
 from landlab.components import DepressionFinderAndRouter, FlowAccumulator
+from landlab.components.flow_routing.cfuncs import priority_flood
 from landlab.core.model_parameter_dictionary import MissingKeyError
+from landlab.core.utils import as_id_array
 from landlab.grid.base import BAD_INDEX_VALUE
 from landlab.utils.decorators import deprecated, use_file_name_or_kwds
 
@@ -75,6 +82,34 @@ class SinkFiller(Component):
     >>> fr.run_one_step()
     >>> mg.at_node['flow__sink_flag'][mg.core_nodes].sum()
     0
+
+    The same depressions can be filled in a single compiled sweep over the
+    grid with the priority-flood method:
+
+    >>> field[:] = z
+    >>> hf = SinkFiller(mg, method='priority_flood')
+    >>> hf.run_one_step()
+    >>> np.allclose(mg.at_node['topographic__elevation'][lake1], 4.)
+    True
+    >>> np.allclose(mg.at_node['topographic__elevation'][lake2], 7.)
+    True
+
+    With *apply_slope*, each filled node is raised a tiny increment above
+    the node from which it was flooded, so that flow can be routed across
+    the filled surface:
+
+    >>> field[:] = z
+    >>> hf = SinkFiller(mg, apply_slope=True, method='priority_flood')
+    >>> hf.run_one_step()
+    >>> fr.run_one_step()
+    >>> mg.at_node['flow__sink_flag'][mg.core_nodes].sum()
+    0
+
+    References
+    ----------
+    Barnes, R., Lehman, C., Mulla, D. (2014). Priority-flood: An optimal
+    depression-filling and watershed-labeling algorithm for digital elevation
+    models. Computers & Geosciences 62, 117-127.
     """
 
     _name = "SinkFiller"
@@ -93,7 +128,15 @@ class SinkFiller(Component):
     }
 
     @use_file_name_or_kwds
-    def __init__(self, grid, routing="D8", apply_slope=False, fill_slope=1.e-5, **kwds):
+    def __init__(
+        self,
+        grid,
+        routing="D8",
+        apply_slope=False,
+        fill_slope=1.e-5,
+        method="lake_by_lake",
+        **kwds
+    ):
         """
         Parameters
         ----------
@@ -113,6 +156,16 @@ class SinkFiller(Component):
         fill_slope : float (m/m)
             The slope added to the top surface of filled pits to allow flow
             routing across them, if apply_slope.
+        method : {'lake_by_lake', 'priority_flood'} (optional)
+            Algorithm used to fill the depressions. 'lake_by_lake' (default)
+            maps the depressions with a DepressionFinderAndRouter and then
+            fills (and tilts) each lake in turn. 'priority_flood' floods
+            the whole grid inward from its open boundaries in a single
+            compiled sweep, writing the filled surface straight into the
+            elevation field. If apply_slope, each node is then raised
+            fill_slope times the shortest link length above the node from
+            which it was flooded; note that this also gives a gradient to
+            flats that are not part of any depression.
         """
         if "flow__receiver_node" in grid.at_node:
             if grid.at_node["flow__receiver_node"].size != grid.size("node"):
@@ -129,6 +182,12 @@ class SinkFiller(Component):
         if routing is not "D8":
             assert routing is "D4"
         self._routing = routing
+        if method not in ("lake_by_lake", "priority_flood"):
+            raise ValueError(
+                "method must be 'lake_by_lake' or 'priority_flood' "
+                "(got {0!r})".format(method)
+            )
+        self._method = method
         if (type(self._grid) is landlab.grid.raster.RasterModelGrid) and (
             routing is "D8"
         ):
@@ -195,6 +254,8 @@ class SinkFiller(Component):
             "node", "sediment_fill__depth", noclobber=False
         )
 
+        if self._method == "priority_flood":
+            return
         self._lf = DepressionFinderAndRouter(self._grid, routing=self._routing)
         self._fr = FlowAccumulator(self._grid, flow_director=self._routing)
 
@@ -214,6 +275,9 @@ class SinkFiller(Component):
             self._apply_slope = kwds["apply_slope"]
         except KeyError:
             pass
+        if self._method == "priority_flood":
+            self._fill_by_priority_flood()
+            return
         self.original_elev = self._elev.copy()
         # We need this, as we'll have to do ALL this again if we manage
         # to jack the elevs too high in one of the "subsidiary" lakes.
@@ -278,6 +342,51 @@ class SinkFiller(Component):
         # fill the output field
         self.sed_fill_depth[:] = self._elev - self.original_elev
 
+    def _get_node_neighbors(self):
+        """
+        Returns the neighbors of each node through which the grid can be
+        flooded, honoring the *routing* method (D4/D8) if applicable. Missing
+        and closed neighbors are given as -1.
+        """
+        nbrs = self._grid.active_adjacent_nodes_at_node
+        if self._D8:
+            diag_nbrs = self._grid.diagonal_adjacent_nodes_at_node.copy()
+            diag_nbrs[self._grid.status_at_node[diag_nbrs] == CLOSED_BOUNDARY] = -1
+            nbrs = np.concatenate((nbrs, diag_nbrs), axis=1)
+        return as_id_array(nbrs)
+
+    def _fill_by_priority_flood(self):
+        """
+        Fills every depression on the grid in one priority-flood sweep,
+        updating the elevation field in place.
+        """
+        n_nodes = self._grid.number_of_nodes
+        try:
+            donor_of, nbr_index, visit_order = self._flood_workspace
+        except AttributeError:
+            donor_of = np.empty(n_nodes, dtype=int)
+            nbr_index = np.empty(n_nodes, dtype=int)
+            visit_order = np.empty(n_nodes, dtype=int)
+            self._flood_workspace = (donor_of, nbr_index, visit_order)
+
+        if self._apply_slope:
+            epsilon = self._fill_slope * self._grid.length_of_link.min()
+        else:
+            epsilon = 0.
+
+        np.negative(self._elev, out=self.sed_fill_depth)
+        priority_flood(
+            self._elev,
+            self._get_node_neighbors(),
+            as_id_array(self._grid.open_boundary_nodes),
+            epsilon,
+            self._elev,
+            donor_of,
+            nbr_index,
+            visit_order,
+        )
+        self.sed_fill_depth += self._elev
+
     @deprecated(use="fill_pits", version=1.0)
     def _fill_pits_old(self, apply_slope=None):
         """
@@ -262,3 +262,56 @@ def test_D4_filling(sink_grid5):
     assert_array_almost_equal(
         sink_grid5.at_node["topographic__elevation"][sink_grid5.lake2], hole2
     )
+
+
+def test_bad_method(sink_grid1):
+    with pytest.raises(ValueError):
+        SinkFiller(sink_grid1, method="bogus")
+
+
+@pytest.mark.parametrize("routing", ["D8", "D4"])
+def test_priority_flood_matches_lake_by_lake(sink_grid4, routing):
+    z = sink_grid4.at_node["topographic__elevation"]
+    z_init = z.copy()
+    SinkFiller(sink_grid4, routing=routing).run_one_step()
+    z_expected = z.copy()
+
+    z[:] = z_init
+    hf = SinkFiller(sink_grid4, routing=routing, method="priority_flood")
+    hf.run_one_step()
+
+    assert_array_almost_equal(z, z_expected)
+    assert_array_almost_equal(
+        sink_grid4.at_node["sediment_fill__depth"], z_expected - z_init
+    )
+
+
+@pytest.mark.parametrize("routing", ["D8", "D4"])
+def test_priority_flood_with_slope(sink_grid4, routing):
+    z = sink_grid4.at_node["topographic__elevation"]
+    z_init = z.copy()
+    hf = SinkFiller(
+        sink_grid4, routing=routing, apply_slope=True, method="priority_flood"
+    )
+    hf.run_one_step()
+
+    assert np.all(z >= z_init)
+    assert np.all(z[sink_grid4.lake1] > 4.)
+    assert np.all(z[sink_grid4.lake1] < 4.01)
+
+    fr = FlowAccumulator(sink_grid4, flow_director=routing)
+    fr.run_one_step()
+    assert sink_grid4.at_node["flow__sink_flag"][sink_grid4.core_nodes].sum() == 0
+
+
+def test_priority_flood_with_slope_is_minimal():
+    grid = RasterModelGrid((3, 7))
+    grid.set_closed_boundaries_at_grid_edges(False, True, False, True)
+    z = grid.add_zeros("node", "topographic__elevation")
+    z[grid.core_nodes] = -1.
+
+    hf = SinkFiller(grid, routing="D4", apply_slope=True, method="priority_flood")
+    hf.run_one_step()
+
+    epsilon = hf._fill_slope * grid.length_of_link.min()
+    assert_array_almost_equal(z[grid.core_nodes], epsilon * np.array([1, 2, 3, 2, 1]))
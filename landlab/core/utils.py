@@ -10,6 +10,7 @@ Landlab utilities
     ~landlab.core.utils.radians_to_degrees
     ~landlab.core.utils.extend_array
     ~landlab.core.utils.as_id_array
+    ~landlab.core.utils.float_dtype_of
     ~landlab.core.utils.make_optional_arg_into_id_array
     ~landlab.core.utils.get_functions_from_module
     ~landlab.core.utils.add_functions_to_class
@@ -186,6 +187,49 @@ def as_id_array(array):
         return np.asarray(array, dtype=np.int)
 
 
+def float_dtype_of(*arrays):
+    """Floating-point type that holds the values of arrays.
+
+    Find the floating-point type to use for the result of an operation on
+    the given arrays such that floating-point arrays keep their precision.
+    Arrays that are not floating-point (integers, for example) have no say
+    in the result.
+
+    Parameters
+    ----------
+    arrays : array_like
+        Arrays of values.
+
+    Returns
+    -------
+    numpy.dtype or None
+        The floating-point type of the result, or ``None`` if none of the
+        arrays are floating-point.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.core.utils import float_dtype_of
+    >>> float_dtype_of(np.zeros(3, dtype=np.float32))
+    dtype('float32')
+    >>> float_dtype_of(np.zeros(3, dtype=np.float32), np.arange(3))
+    dtype('float32')
+    >>> float_dtype_of(np.zeros(3, dtype=np.float32), np.zeros(3))
+    dtype('float64')
+    >>> float_dtype_of(np.arange(3)) is None
+    True
+    """
+    dtypes = [
+        array.dtype if hasattr(array, "dtype") else np.asarray(array).dtype
+        for array in arrays
+    ]
+    dtypes = [dtype for dtype in dtypes if np.issubdtype(dtype, np.floating)]
+    if dtypes:
+        return np.result_type(*dtypes)
+    else:
+        return None
+
+
 def make_optional_arg_into_id_array(number_of_elements, *args):
     """Transform an optional argument into an array of element ids.
 
@@ -3,7 +3,13 @@ import six
 import xarray as xr
 
 from .grouped import GroupError
-from .scalar_data_fields import FieldError
+from .scalar_data_fields import (
+    FieldError,
+    _is_same_memory,
+    check_new_field_block,
+    find_field_block,
+    prune_field_blocks,
+)
 
 FIELD_LOCATIONS = ("node", "link", "patch", "corner", "face", "cell", "grid")
 
@@ -138,20 +144,41 @@ def shape_for_storage(array, field_size=None):
 
 class FieldDataset(dict):
 
-    """Wrap an xarray.Dataset as a landlab field.
+    """Store the fields at a grid location.
 
-    This is a light wrapping of xarray.Dataset. The main differences
-    are that a `FieldDataset` can be created with a size but not
-    allocate any memory for data arrays until an array is actually
-    needed. The setitem method is also overriden so that when arrays
-    are added they are stored reshaped in the landlab style. That
-    is shaped as `(n_elements, values_per_element)`.
+    A `FieldDataset` is a `dict` that maps field names to arrays of
+    values. The main differences are that a `FieldDataset` can be created
+    with a size but not allocate any memory for data arrays until an array
+    is actually needed, and that when arrays are added they are stored
+    reshaped in the landlab style. That is shaped as
+    `(n_elements, values_per_element)`.
+
+    Field values are stored as plain arrays so that getting a field is a
+    `dict` lookup. An xarray.Dataset of the fields, which shares memory
+    with them, is only created when asked for through the *dataset*
+    attribute.
+
+    Examples
+    --------
+    >>> from landlab.field.graph_field import FieldDataset
+    >>> fields = FieldDataset("node", 3)
+    >>> fields["air__temperature"] = [1., 2., 3.]
+    >>> fields["air__temperature"]
+    array([ 1.,  2.,  3.])
+    >>> fields.units["air__temperature"]
+    '?'
+    >>> fields.dataset["air__temperature"].dims
+    ('node',)
+    >>> fields.dataset["air__temperature"].values is fields["air__temperature"]
+    True
     """
 
     def __init__(self, *args, **kwds):
         self._name, self._size = args[0], args[1]
-        self._ds = xr.Dataset()
+        self._attrs = {}
         self._units = {}
+        self._blocks = {}
+        self._ds = None
 
     @property
     def size(self):
@@ -163,10 +190,35 @@ class FieldDataset(dict):
 
     @property
     def dataset(self):
+        """The fields as an xarray.Dataset."""
+        if self._ds is None:
+            self._ds = xr.Dataset(
+                dict(
+                    (
+                        name,
+                        xr.DataArray(
+                            values,
+                            dims=self._dims_of(name, values),
+                            attrs=self._attrs[name],
+                        ),
+                    )
+                    for name, values in self.items()
+                )
+            )
         return self._ds
 
-    def keys(self):
-        return self._ds.variables
+    def _dims_of(self, name, values):
+        """Names of the dimensions of a field."""
+        if self._size == 1:
+            if values.ndim > 0:
+                dims = (name + "_per_" + self._name,)
+            else:
+                dims = ()
+        else:
+            dims = (self._name,)
+            if values.ndim > 1:
+                dims += (name + "_per_" + self._name,)
+        return dims
 
     def set_value(self, name, value_array, attrs=None):
         attrs = attrs or {}
@@ -177,48 +229,65 @@ class FieldDataset(dict):
         if not self._size:
             self._size = value_array.size
 
-        if name in self._ds and self._ds[name].values is value_array:
-            self._ds[name].values.shape = shape_for_storage(value_array, self.size)
+        if self.get(name) is value_array:
+            value_array.shape = shape_for_storage(value_array, self.size)
+            self._ds = None
             return
 
         value_array = reshape_for_storage(value_array, self._size)
 
-        if self._size == 1:
-            if value_array.ndim > 0:
-                dims = (name + "_per_" + self._name,)
-            else:
-                dims = ()
-        else:
-            dims = (self._name,)
-            if value_array.ndim > 1:
-                dims += (name + "_per_" + self._name,)
-
-        if name in self._ds:
-            self._ds = self._ds.drop(name)
-
-        self._ds.update({name: xr.DataArray(value_array, dims=dims, attrs=attrs)})
+        dict.__setitem__(self, name, value_array)
+        self._attrs[name] = attrs
         self._units[name] = attrs["units"]
+        self._ds = None
+        if self._blocks:
+            prune_field_blocks(self._blocks, self)
 
-    def __getitem__(self, name):
+    def __missing__(self, name):
         if isinstance(name, six.string_types):
-            try:
-                return self._ds[name].values
-            except KeyError:
-                raise FieldError(name)
+            raise FieldError(name)
         else:
             raise TypeError("field name not a string")
 
     def __setitem__(self, name, value_array):
         self.set_value(name, value_array)
 
-    def __contains__(self, name):
-        return name in self._ds
+    def __reduce__(self):
+        # Restore the fields through __setstate__ rather than letting
+        # pickle call __setitem__ before the dataset's attributes exist.
+        return (FieldDataset, (self._name, self._size), self.__getstate__())
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_ds"] = None
+        state["_fields"] = dict(self)
+        state["_block_rows"] = dict(
+            (name, (names, row))
+            for names, block in self._blocks.items()
+            for row, name in enumerate(names)
+            if _is_same_memory(self.get(name), block[row])
+        )
+        return state
+
+    def __setstate__(self, state):
+        state = state.copy()
+        fields = state.pop("_fields")
+        block_rows = state.pop("_block_rows")
+        self.__dict__.update(state)
+        for name, (names, row) in block_rows.items():
+            fields[name] = self._blocks[names][row]
+        dict.update(self, fields)
+
+    def __delitem__(self, name):
+        dict.__delitem__(self, name)
+        del self._attrs[name]
+        del self._units[name]
+        self._ds = None
+        if self._blocks:
+            prune_field_blocks(self._blocks, self)
 
     def __str__(self):
-        return str(self._ds)
-
-    # def __repr__(self):
-    #     return repr(self._ds)
+        return str(self.dataset)
 
     def __len__(self):
         return self._size
@@ -283,6 +352,8 @@ class GraphFields(object):
     ['topographic__elevation']
     """
 
+    _default_dtype = np.dtype(float)
+
     def __init__(self, *args, **kwds):
         try:
             dims = args[0]
@@ -304,6 +375,42 @@ class GraphFields(object):
         except AttributeError:
             raise GroupError(name)
 
+    @property
+    def default_dtype(self):
+        """Data type of new arrays when one is not given.
+
+        The data type of arrays created by *empty*, *ones* and *zeros*, and
+        so of fields added with *add_empty*, *add_ones* and *add_zeros*,
+        unless a *dtype* keyword is given.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab.field import GraphFields
+        >>> fields = GraphFields()
+        >>> fields.new_field_location('node', 4)
+        >>> fields.default_dtype
+        dtype('float64')
+        >>> fields.default_dtype = np.float32
+        >>> fields.add_zeros('node', 'surface_water__depth').dtype
+        dtype('float32')
+        >>> fields.ones('node', dtype=int).dtype == np.int
+        True
+
+        LLCATS: FIELDINF
+        """
+        return self._default_dtype
+
+    @default_dtype.setter
+    def default_dtype(self, dtype):
+        self._default_dtype = np.dtype(dtype)
+
+    def _with_default_dtype(self, kwds):
+        """Add the default dtype to keywords that don't have one."""
+        if kwds.get("dtype") is None:
+            kwds = dict(kwds, dtype=self.default_dtype)
+        return kwds
+
     @property
     def default_group(self):
         return self._default_group
@@ -596,7 +703,7 @@ class GraphFields(object):
 
         LLCATS: FIELDINF
         """
-        return self[group]._ds[field].attrs["units"]
+        return self[group].units[field]
 
     def empty(self, *args, **kwds):
         """Uninitialized array whose size is that of the field.
@@ -652,7 +759,7 @@ class GraphFields(object):
         except AttributeError:
             size = getattr(self, "number_of_" + group)
 
-        return np.empty(size, **kwds)
+        return np.empty(size, **self._with_default_dtype(kwds))
 
     def ones(self, *args, **kwds):
         """Array, initialized to 1, whose size is that of the field.
@@ -864,7 +971,107 @@ class GraphFields(object):
             ds = getattr(self, "at_" + loc)
         except AttributeError:
             raise KeyError(loc)
-        ds._ds = ds._ds.drop(name)
+        del ds[name]
+
+    def add_field_block(self, *args, **kwds):
+        """add_field_block(at, names, units='?', noclobber=True, dtype=float)
+
+        Add fields whose values are stored in one block of memory.
+
+        The values of the new fields, initialized to zero, are the rows of
+        a single array of shape *(n_fields, n_elements)*. Functions that
+        work with several fields at once can then use the block rather
+        than each of the fields.
+
+        Parameters
+        ----------
+        at : str
+            Grid location of the fields.
+        names : iterable of str
+            Names of the new fields.
+        units : str or iterable of str, optional
+            Units of the fields, either one for all of the fields or one
+            for each of them.
+        noclobber : boolean, optional
+            Raise an exception if any of the fields already exists.
+        dtype : numpy.dtype, optional
+            The data type of the fields.
+
+        Returns
+        -------
+        numpy.array
+            The block of field values, one row per field.
+
+        Examples
+        --------
+        >>> from landlab.field import GraphFields
+        >>> fields = GraphFields()
+        >>> fields.new_field_location('link', 3)
+        >>> block = fields.add_field_block(
+        ...     'link', ['channel__width', 'channel__depth'], units='m'
+        ... )
+        >>> fields.at_link['channel__depth'][:] = 2.
+        >>> block
+        array([[ 0.,  0.,  0.],
+               [ 2.,  2.,  2.]])
+        >>> fields.field_block('link', ['channel__width', 'channel__depth'])
+        array([[ 0.,  0.,  0.],
+               [ 2.,  2.,  2.]])
+
+        LLCATS: FIELDCR
+        """
+        if len(args) == 2:
+            at, names = args
+        elif len(args) == 1:
+            at, names = kwds.pop("at", self._default_group), args[0]
+        else:
+            raise ValueError("number of arguments must be 1 or 2")
+
+        dtype = kwds.get("dtype", float)
+
+        ds = getattr(self, "at_" + at)
+        try:
+            names, units = check_new_field_block(
+                ds,
+                names,
+                units=kwds.get("units", "?"),
+                noclobber=kwds.get("noclobber", True),
+            )
+        except FieldError as error:
+            raise FieldError("{name}@{at}".format(name=error, at=at))
+
+        block = np.zeros((len(names), ds.size), dtype=dtype)
+        for name, row, unit in zip(names, block, units):
+            ds.set_value(name, row, attrs={"units": unit})
+        ds._blocks[names] = block
+
+        return block
+
+    def field_block(self, at, names):
+        """Get the block of memory that holds the values of fields.
+
+        Parameters
+        ----------
+        at : str
+            Grid location of the fields.
+        names : iterable of str
+            Names of fields that were added, in the same order, with
+            *add_field_block*.
+
+        Returns
+        -------
+        numpy.array
+            A view of the fields' values, one row per field.
+
+        Raises
+        ------
+        FieldError
+            If the fields are not stored, in order, in a block.
+
+        LLCATS: FIELDIO
+        """
+        ds = self[at]
+        return find_field_block(ds._blocks, ds, names)
 
     def add_empty(self, *args, **kwds):
         """add_empty(name, at='node', units='-', noclobber=True)
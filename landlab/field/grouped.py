@@ -1,5 +1,6 @@
 #! /usr/bin/env python
 """Store collections of data fields."""
+import numpy as np
 
 from .scalar_data_fields import ScalarDataFields
 
@@ -102,11 +103,49 @@ class ModelDataFields(object):
     ['topographic__elevation']
     """
 
+    _default_dtype = np.dtype(float)
+
     def __init__(self, **kwds):
         self._groups = dict()
         self._default_group = None
         super(ModelDataFields, self).__init__(**kwds)
 
+    @property
+    def default_dtype(self):
+        """Data type of new arrays when one is not given.
+
+        The data type of arrays created by *empty*, *ones* and *zeros*, and
+        so of fields added with *add_empty*, *add_ones* and *add_zeros*,
+        unless a *dtype* keyword is given.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab.field import ModelDataFields
+        >>> fields = ModelDataFields()
+        >>> fields.new_field_location('node', 4)
+        >>> fields.default_dtype
+        dtype('float64')
+        >>> fields.default_dtype = np.float32
+        >>> fields.add_zeros('node', 'surface_water__depth').dtype
+        dtype('float32')
+        >>> fields.ones('node', dtype=int).dtype == np.int
+        True
+
+        LLCATS: FIELDINF
+        """
+        return self._default_dtype
+
+    @default_dtype.setter
+    def default_dtype(self, dtype):
+        self._default_dtype = np.dtype(dtype)
+
+    def _with_default_dtype(self, kwds):
+        """Add the default dtype to keywords that don't have one."""
+        if kwds.get("dtype") is None:
+            kwds = dict(kwds, dtype=self.default_dtype)
+        return kwds
+
     @property
     def groups(self):
         """List of group names.
@@ -450,7 +489,7 @@ class ModelDataFields(object):
                 "grid.at_grid['value_name']=value\n"
                 "instead."
             )
-        return self[group].empty(**kwds)
+        return self[group].empty(**self._with_default_dtype(kwds))
 
     def ones(self, group, **kwds):
         """Array, initialized to 1, whose size is that of the field.
@@ -496,7 +535,7 @@ class ModelDataFields(object):
                 "instead.\nAlternatively, if you want ones "
                 "of the shape stored at_grid, use np.array(1)."
             )
-        return self[group].ones(**kwds)
+        return self[group].ones(**self._with_default_dtype(kwds))
 
     def zeros(self, group, **kwds):
         """Array, initialized to 0, whose size is that of the field.
@@ -543,7 +582,7 @@ class ModelDataFields(object):
                 "of the shape stored at_grid, use np.array(0)."
             )
 
-        return self[group].zeros(**kwds)
+        return self[group].zeros(**self._with_default_dtype(kwds))
 
     def add_empty(self, *args, **kwds):
         """add_empty(group, name, units='-', noclobber=True)
@@ -819,6 +858,110 @@ class ModelDataFields(object):
 
         return self[group].add_field(name, value_array, **kwds)
 
+    def add_field_block(self, *args, **kwds):
+        """add_field_block(group, names, units='?', noclobber=True, dtype=float)
+
+        Add fields whose values are stored in one block of memory.
+
+        The values of the new fields, initialized to zero, are the rows of
+        a single array of shape *(n_fields, n_elements)*. Functions that
+        work with several fields at once can then use the block rather
+        than each of the fields.
+
+        Parameters
+        ----------
+        group : str
+            Name of the group.
+        names : iterable of str
+            Names of the new fields.
+        units : str or iterable of str, optional
+            Units of the fields, either one for all of the fields or one
+            for each of them.
+        noclobber : boolean, optional
+            Raise an exception if any of the fields already exists.
+        dtype : numpy.dtype, optional
+            The data type of the fields.
+
+        Returns
+        -------
+        numpy.array
+            The block of field values, one row per field.
+
+        Examples
+        --------
+        >>> from landlab.field import ModelDataFields
+        >>> fields = ModelDataFields()
+        >>> fields.new_field_location('node', 3)
+        >>> block = fields.add_field_block(
+        ...     'node', ['surface_water__depth', 'surface_water__discharge']
+        ... )
+        >>> block.shape
+        (2, 3)
+        >>> block[:] = [[1., 2., 3.], [4., 5., 6.]]
+        >>> fields.at_node['surface_water__discharge']
+        array([ 4.,  5.,  6.])
+
+        LLCATS: FIELDCR
+        """
+        if len(args) == 2:
+            group, names = args
+        elif len(args) == 1:
+            group, names = kwds.pop("at", self._default_group), args[0]
+        else:
+            raise ValueError("number of arguments must be 1 or 2")
+
+        if not group:
+            raise ValueError("missing group name")
+
+        return self[group].add_field_block(names, **kwds)
+
+    def field_block(self, group, names):
+        """Get the block of memory that holds the values of fields.
+
+        Parameters
+        ----------
+        group : str
+            Name of the group.
+        names : iterable of str
+            Names of fields that were added, in the same order, with
+            *add_field_block*.
+
+        Returns
+        -------
+        numpy.array
+            A view of the fields' values, one row per field.
+
+        Raises
+        ------
+        FieldError
+            If the fields are not stored, in order, in a block.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((3, 4))
+        >>> _ = grid.add_field_block(
+        ...     'node', ['surface_water__depth', 'surface_water__discharge']
+        ... )
+        >>> grid.at_node['surface_water__discharge'] += 1.
+        >>> grid.field_block(
+        ...     'node', ['surface_water__depth', 'surface_water__discharge']
+        ... ).sum(axis=1)
+        array([  0.,  12.])
+
+        Replacing one of the fields removes it from the block.
+
+        >>> grid.at_node['surface_water__discharge'] = grid.ones('node')
+        >>> grid.field_block(
+        ...     'node', ['surface_water__depth', 'surface_water__discharge']
+        ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        FieldError: surface_water__depth, surface_water__discharge
+
+        LLCATS: FIELDIO
+        """
+        return self[group].field_block(names)
+
     def set_units(self, group, name, units):
         """Set the units for a field of values.
 
@@ -2,6 +2,7 @@
 """Container that holds a collection of named data-fields."""
 
 import numpy as np
+import six
 
 _UNKNOWN_UNITS = "?"
 
@@ -24,6 +25,161 @@ class FieldError(Error, KeyError):
         return self._field
 
 
+def _units_of_block(names, units):
+    """Units for each field of a block of fields."""
+    if units is None or isinstance(units, six.string_types):
+        return [units] * len(names)
+    elif len(units) != len(names):
+        raise ValueError("number of units must match the number of fields")
+    return list(units)
+
+
+def _is_same_memory(array, other):
+    """Check if two arrays are views of the same memory."""
+    return (
+        isinstance(array, np.ndarray)
+        and array.ctypes.data == other.ctypes.data
+        and array.shape == other.shape
+        and array.strides == other.strides
+        and array.dtype == other.dtype
+    )
+
+
+def check_new_field_block(fields, names, units=_UNKNOWN_UNITS, noclobber=True):
+    """Check that a block of fields can be added to a collection of fields.
+
+    Parameters
+    ----------
+    fields : dict
+        Field values, keyed by name, with a *size* attribute that is the
+        number of elements of each field.
+    names : iterable of str
+        Names of the new fields.
+    units : str or iterable of str, optional
+        Units of the fields, either one for all of the fields or one for
+        each of them.
+    noclobber : boolean, optional
+        Raise an exception if any of the fields already exists.
+
+    Returns
+    -------
+    tuple of (tuple of str, list of str)
+        Names and units of each of the fields.
+
+    Raises
+    ------
+    ValueError
+        If the names are not unique, the number of units does not match
+        the number of names, or the size of the fields is not set.
+    FieldError
+        If *noclobber* is set and one of the fields already exists.
+    """
+    names = tuple(names)
+    if len(set(names)) != len(names):
+        raise ValueError("field names must be unique")
+    units = _units_of_block(names, units)
+    if not fields.size:
+        raise ValueError("size of the fields is not set")
+    if noclobber:
+        for name in names:
+            if name in fields:
+                raise FieldError(name)
+    return names, units
+
+
+def prune_field_blocks(blocks, fields):
+    """Forget blocks that no longer hold the values of any field.
+
+    Parameters
+    ----------
+    blocks : dict
+        Blocks of field values as 2D arrays, keyed by the names of the
+        fields that they hold.
+    fields : dict
+        Field values, keyed by name.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.field.scalar_data_fields import prune_field_blocks
+    >>> block = np.arange(4.).reshape((2, 2))
+    >>> blocks = {("a", "b"): block}
+    >>> fields = {"a": block[0], "b": np.zeros(2)}
+    >>> prune_field_blocks(blocks, fields)
+    >>> list(blocks)
+    [('a', 'b')]
+    >>> del fields["a"]
+    >>> prune_field_blocks(blocks, fields)
+    >>> blocks
+    {}
+    """
+    for names, block in list(blocks.items()):
+        if not any(
+            _is_same_memory(fields.get(name), row) for name, row in zip(names, block)
+        ):
+            del blocks[names]
+
+
+def find_field_block(blocks, fields, names):
+    """Find the block of memory that holds the values of fields.
+
+    Parameters
+    ----------
+    blocks : dict
+        Blocks of field values as 2D arrays, keyed by the names of the
+        fields that they hold.
+    fields : dict
+        Field values, keyed by name.
+    names : iterable of str
+        Names of fields.
+
+    Returns
+    -------
+    ndarray
+        A view of the block of memory as an array of shape
+        *(n_fields, n_elements)*.
+
+    Raises
+    ------
+    FieldError
+        If the fields are not stored, in order, in a block.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.field.scalar_data_fields import find_field_block
+    >>> block = np.arange(6.).reshape((3, 2))
+    >>> blocks = {("a", "b", "c"): block}
+    >>> fields = {"a": block[0], "b": block[1], "c": block[2]}
+    >>> find_field_block(blocks, fields, ["b", "c"])
+    array([[ 2.,  3.],
+           [ 4.,  5.]])
+
+    A field that no longer refers to its row of the block is no longer
+    part of the block.
+
+    >>> fields["c"] = np.zeros(2)
+    >>> find_field_block(blocks, fields, ["b", "c"])
+    ...     # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    FieldError: b, c
+    """
+    names = tuple(names)
+    for block_names, block in blocks.items():
+        try:
+            start = block_names.index(names[0])
+        except (ValueError, IndexError):
+            continue
+        if block_names[start : start + len(names)] != names:
+            continue
+        rows = block[start : start + len(names)]
+        if all(
+            _is_same_memory(fields.get(name), row) for name, row in zip(names, rows)
+        ):
+            return rows
+    raise FieldError(", ".join(names))
+
+
 def need_to_reshape_array(array, field_size):
     """Check to see if an array needs to be resized before storing.
 
@@ -136,6 +292,7 @@ class ScalarDataFields(dict):
 
         super(ScalarDataFields, self).__init__()
         self._units = dict()
+        self._blocks = dict()
 
     @property
     def units(self):
@@ -459,6 +616,100 @@ class ScalarDataFields(dict):
         self.set_units(name, units)
         return self[name]
 
+    def add_field_block(
+        self, names, units=_UNKNOWN_UNITS, noclobber=True, dtype=float
+    ):
+        """Add fields whose values are stored in one block of memory.
+
+        The values of the new fields, initialized to zero, are the rows of
+        a single array of shape *(n_fields, n_elements)*, so that a
+        function that works with several of the fields at once reads from
+        one contiguous block of memory. Each of the fields is an ordinary
+        field that can be used on its own.
+
+        Parameters
+        ----------
+        names : iterable of str
+            Names of the new fields.
+        units : str or iterable of str, optional
+            Units of the fields, either one for all of the fields or one
+            for each of them.
+        noclobber : boolean, optional
+            Raise an exception if any of the fields already exists.
+        dtype : numpy.dtype, optional
+            The data type of the fields.
+
+        Returns
+        -------
+        numpy.array
+            The block of field values, one row per field.
+
+        Examples
+        --------
+        >>> from landlab.field import ScalarDataFields
+        >>> fields = ScalarDataFields(4)
+        >>> block = fields.add_field_block(
+        ...     ['surface_water__depth', 'surface_water__discharge'],
+        ...     units=['m', 'm3/s'],
+        ... )
+        >>> fields['surface_water__depth'][:] = 2.
+        >>> block
+        array([[ 2.,  2.,  2.,  2.],
+               [ 0.,  0.,  0.,  0.]])
+        >>> block[1] += 1.
+        >>> fields['surface_water__discharge']
+        array([ 1.,  1.,  1.,  1.])
+        >>> fields.units['surface_water__discharge']
+        'm3/s'
+
+        LLCATS: FIELDCR
+        """
+        names, units = check_new_field_block(
+            self, names, units=units, noclobber=noclobber
+        )
+
+        block = np.zeros((len(names), self.size), dtype=dtype)
+        for name, row, unit in zip(names, block, units):
+            self.add_field(name, row, units=unit, noclobber=False)
+        self._blocks[names] = block
+
+        return block
+
+    def field_block(self, names):
+        """Get the block of memory that holds the values of fields.
+
+        Parameters
+        ----------
+        names : iterable of str
+            Names of fields that were added, in the same order, with
+            *add_field_block*.
+
+        Returns
+        -------
+        numpy.array
+            A view of the fields' values, one row per field.
+
+        Raises
+        ------
+        FieldError
+            If the fields are not stored, in order, in a block.
+
+        Examples
+        --------
+        >>> from landlab.field import ScalarDataFields
+        >>> fields = ScalarDataFields(3)
+        >>> _ = fields.add_field_block(['air__temperature', 'air__pressure'])
+        >>> fields['air__pressure'][:] = 1.
+        >>> fields.field_block(['air__temperature', 'air__pressure'])
+        array([[ 0.,  0.,  0.],
+               [ 1.,  1.,  1.]])
+        >>> fields.field_block(['air__pressure'])
+        array([[ 1.,  1.,  1.]])
+
+        LLCATS: FIELDIO
+        """
+        return find_field_block(self._blocks, self, names)
+
     def set_units(self, name, units):
         """Set the units for a field of values.
 
@@ -492,6 +743,14 @@ class ScalarDataFields(dict):
             self.set_units(name, None)
 
         super(ScalarDataFields, self).__setitem__(name, value_array)
+        if self._blocks:
+            prune_field_blocks(self._blocks, self)
+
+    def __delitem__(self, name):
+        """Remove a data field by name."""
+        super(ScalarDataFields, self).__delitem__(name)
+        if self._blocks:
+            prune_field_blocks(self._blocks, self)
 
     def __getitem__(self, name):
         """Get a data field by name."""
@@ -1,4 +1,6 @@
 #! /usr/bin/env python
+import pickle
+
 import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
@@ -261,3 +263,112 @@ def test_nd_field():
         fields.add_field("newest_value", np.ones((13, 4, 5)), at="node")
     with pytest.raises(ValueError):
         fields.add_field("newestest_value", np.ones((13)), at="node")
+
+
+def test_getitem_returns_stored_array():
+    fields = ModelDataFields()
+    fields.new_field_location("node", 4)
+    values = np.arange(4.)
+    fields.add_field("node", "topographic__elevation", values)
+    assert fields.at_node["topographic__elevation"] is values
+
+    with pytest.raises(FieldError):
+        fields.at_node["not_a_field"]
+    with pytest.raises(TypeError):
+        fields.at_node[0]
+
+
+def test_dataset_tracks_fields():
+    fields = ModelDataFields()
+    fields.new_field_location("node", 4)
+    fields.add_ones("node", "topographic__elevation")
+    fields.add_zeros("node", "water__depth")
+    assert sorted(fields.at_node.dataset.variables) == [
+        "topographic__elevation",
+        "water__depth",
+    ]
+
+    fields.at_node["topographic__elevation"][0] = 10.
+    assert fields.at_node.dataset["topographic__elevation"].values[0] == 10.
+
+    fields.delete_field("node", "water__depth")
+    assert list(fields.at_node.dataset.variables) == ["topographic__elevation"]
+    assert "water__depth" not in fields.at_node
+    assert "water__depth" not in fields.at_node.units
+
+    fields.at_node["topographic__elevation"] = np.arange(8.)
+    assert fields.at_node.dataset["topographic__elevation"].dims == (
+        "node",
+        "topographic__elevation_per_node",
+    )
+
+
+def test_add_field_block():
+    fields = ModelDataFields()
+    fields.new_field_location("node", 4)
+    block = fields.add_field_block("node", ["spam", "eggs"], units=["m", "s"])
+    assert block.shape == (2, 4)
+
+    fields.at_node["eggs"] += 1.
+    assert_array_equal(
+        fields.field_block("node", ["spam", "eggs"]), [[0.] * 4, [1.] * 4]
+    )
+    assert fields.at_node.units == {"spam": "m", "eggs": "s"}
+
+    with pytest.raises(FieldError):
+        fields.add_field_block("node", ["eggs"])
+
+    fields.delete_field("node", "spam")
+    with pytest.raises(FieldError):
+        fields.field_block("node", ["spam", "eggs"])
+    assert list(fields.at_node._blocks) == [("spam", "eggs")]
+
+    fields.at_node["eggs"] = np.zeros(4)
+    assert fields.at_node._blocks == {}
+
+
+def test_pickle_round_trip():
+    fields = ModelDataFields()
+    fields.new_field_location("node", 4)
+    fields.new_field_location("link", 3)
+    fields.add_field("node", "topographic__elevation", np.arange(4.))
+    fields.add_field_block("link", ["spam", "eggs"], units="s")
+    fields.at_link["eggs"] += 1.
+
+    copy = pickle.loads(pickle.dumps(fields))
+
+    assert_array_equal(copy.at_node["topographic__elevation"], np.arange(4.))
+    assert copy.at_link.units == {"spam": "s", "eggs": "s"}
+    assert copy.at_node.dataset["topographic__elevation"].dims == ("node",)
+    assert copy.at_link.size == 3
+
+    copy.at_link["spam"][:] = 2.
+    assert_array_equal(
+        copy.field_block("link", ["spam", "eggs"]), [[2.] * 3, [1.] * 3]
+    )
+    assert_array_equal(fields.at_link["spam"], [0.] * 3)
+
+
+def test_pickle_network_grid():
+    from landlab import NetworkModelGrid
+
+    grid = NetworkModelGrid(((0, 1, 2), (0, 0, 0)), links=((0, 1), (1, 2)))
+    grid.add_ones("node", "topographic__elevation")
+
+    copy = pickle.loads(pickle.dumps(grid))
+
+    assert_array_equal(copy.at_node["topographic__elevation"], [1., 1., 1.])
+    assert_array_equal(copy.nodes_at_link, grid.nodes_at_link)
+
+
+def test_default_dtype():
+    fields = ModelDataFields()
+    fields.new_field_location("node", 4)
+    assert fields.default_dtype == np.float64
+
+    fields.default_dtype = np.float32
+    assert fields.empty("node").dtype == np.float32
+    assert fields.zeros("node").dtype == np.float32
+    assert fields.add_ones("node", "z").dtype == np.float32
+    assert fields.ones("node", dtype=int).dtype == np.int_
+    assert ModelDataFields().default_dtype == np.float64
@@ -257,3 +257,72 @@ def test_nd_field():
         fields.add_field("newest_value", np.ones((13, 4, 5)), at="node")
     with pytest.raises(ValueError):
         fields.add_field("newestest_value", np.ones((13)), at="node")
+
+
+def test_add_field_block():
+    """Test creating fields that share one block of memory."""
+    fields = ModelDataFields()
+    fields.new_field_location("node", 12)
+    names = ["water__depth", "water__discharge", "water__velocity"]
+
+    block = fields.add_field_block("node", names, units=["m", "m3/s", "m/s"])
+    assert block.shape == (3, 12)
+    assert block.flags["C_CONTIGUOUS"]
+    assert_array_equal(block, 0.)
+
+    for row, name in enumerate(names):
+        fields.at_node[name][:] = row
+    assert_array_equal(block, [[0.] * 12, [1.] * 12, [2.] * 12])
+    assert fields.at_node.units == {
+        "water__depth": "m",
+        "water__discharge": "m3/s",
+        "water__velocity": "m/s",
+    }
+
+    assert fields.field_block("node", names) is not block
+    assert_array_equal(fields.field_block("node", names), block)
+    assert_array_equal(fields.field_block("node", names[1:]), block[1:])
+
+
+def test_add_field_block_with_dtype():
+    fields = ModelDataFields()
+    fields.new_field_location("link", 5)
+    block = fields.add_field_block(["spam", "eggs"], at="link", dtype=np.float32)
+    assert block.dtype == np.float32
+    assert fields.at_link["eggs"].dtype == np.float32
+
+
+def test_add_field_block_errors():
+    fields = ModelDataFields()
+    fields.new_field_location("node", 12)
+    fields.add_zeros("node", "water__depth")
+
+    with pytest.raises(FieldError):
+        fields.add_field_block("node", ["water__depth", "water__discharge"])
+    with pytest.raises(ValueError):
+        fields.add_field_block("node", ["spam", "spam"])
+    with pytest.raises(ValueError):
+        fields.add_field_block("node", ["spam", "eggs"], units=["m"])
+
+    fields.add_field_block("node", ["spam", "eggs"])
+    with pytest.raises(FieldError):
+        fields.field_block("node", ["eggs", "spam"])
+    with pytest.raises(FieldError):
+        fields.field_block("node", ["water__depth"])
+
+    fields.at_node["eggs"] = np.zeros(12)
+    with pytest.raises(FieldError):
+        fields.field_block("node", ["spam", "eggs"])
+    assert_array_equal(fields.field_block("node", ["spam"]), np.zeros((1, 12)))
+
+
+def test_field_block_is_released():
+    fields = ModelDataFields()
+    fields.new_field_location("node", 12)
+    fields.add_field_block("node", ["spam", "eggs"])
+
+    fields.at_node["spam"] = np.ones(12)
+    assert list(fields.at_node._blocks) == [("spam", "eggs")]
+
+    fields.delete_field("node", "eggs")
+    assert fields.at_node._blocks == {}
@@ -4,6 +4,7 @@ from .radial import RadialModelGrid
 from .raster import RasterModelGrid
 from .voronoi import VoronoiDelaunayGrid
 from .network import NetworkModelGrid
+from .tiled import TiledRasterModelGrid
 
 from .base import (
     BAD_INDEX_VALUE,
@@ -25,6 +26,7 @@ __all__ = [
     "RasterModelGrid",
     "VoronoiDelaunayGrid",
     "NetworkModelGrid",
+    "TiledRasterModelGrid",
     "BAD_INDEX_VALUE",
     "CORE_NODE",
     "FIXED_VALUE_BOUNDARY",
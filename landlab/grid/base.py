@@ -22,8 +22,18 @@ from ..core.utils import add_module_functions_to_class
 from ..layers.eventlayers import EventLayersMixIn
 from ..layers.materiallayers import MaterialLayersMixIn
 from ..utils.decorators import cache_result_in_object
-from .decorators import override_array_setitem_and_reset, return_readonly_id_array
-from .linkstatus import ACTIVE_LINK, FIXED_LINK, INACTIVE_LINK, set_status_at_link
+from .decorators import (
+    BatchStatusUpdateMixIn,
+    override_array_setitem_and_reset,
+    return_readonly_id_array,
+)
+from .linkstatus import (
+    ACTIVE_LINK,
+    FIXED_LINK,
+    INACTIVE_LINK,
+    set_status_at_link,
+    update_status_at_link,
+)
 from .nodestatus import (
     CLOSED_BOUNDARY,
     CORE_NODE,
@@ -54,6 +64,9 @@ _ARRAY_LENGTH_ATTRIBUTES = {
 # Fields whose sizes can not change.
 _SIZED_FIELDS = {"node", "link", "patch", "corner", "face", "cell"}
 
+# Number of changes to the status of links that a grid remembers.
+_MAX_LINK_STATUS_CHANGES = 64
+
 
 def _sort_points_into_quadrants(x, y, nodes):
     """Divide x, y points into quadrants.
@@ -260,7 +273,12 @@ def find_true_vector_from_link_vector_pair(L1, L2, b1x, b1y, b2x, b2y):
     return ax, ay
 
 
-class ModelGrid(ModelDataFieldsMixIn, EventLayersMixIn, MaterialLayersMixIn):
+class ModelGrid(
+    ModelDataFieldsMixIn,
+    EventLayersMixIn,
+    MaterialLayersMixIn,
+    BatchStatusUpdateMixIn,
+):
     """Base class for 2D structured or unstructured grids for numerical models.
 
     The idea is to have at least two inherited
@@ -431,7 +449,7 @@ class ModelGrid(ModelDataFieldsMixIn, EventLayersMixIn, MaterialLayersMixIn):
             return self._setup_nodes()
 
     @property
-    @override_array_setitem_and_reset("reset_status_at_node")
+    @override_array_setitem_and_reset("reset_status_at_node", pass_changed=True)
     def status_at_node(self):
         """Get array of the boundary status for each node.
 
@@ -465,8 +483,7 @@ class ModelGrid(ModelDataFieldsMixIn, EventLayersMixIn, MaterialLayersMixIn):
     @status_at_node.setter
     def status_at_node(self, new_status):
         """Set the array of node boundary statuses."""
-        self._node_status[:] = new_status[:]
-        self.reset_status_at_node()
+        self.status_at_node[:] = new_status[:]
 
     @property
     @deprecated(use="adjacent_nodes_at_node", version=1.2)
@@ -523,8 +540,8 @@ class ModelGrid(ModelDataFieldsMixIn, EventLayersMixIn, MaterialLayersMixIn):
         return out
 
     @property
-    @cache_result_in_object()
     @return_readonly_id_array
+    @cache_result_in_object()
     def active_adjacent_nodes_at_node(self):
         """Adjacent nodes for each grid node.
 
@@ -2838,17 +2855,11 @@ class ModelGrid(ModelDataFieldsMixIn, EventLayersMixIn, MaterialLayersMixIn):
         >>> hg.link_at_face
         array([ 3,  4,  5,  6,  8,  9, 10, 12, 13, 14, 15])
         """
-        num_faces = len(self.width_of_face)
-        self._link_at_face = np.empty(num_faces, dtype=int)
-        face_id = 0
-        node_at_link_tail = self.node_at_link_tail
-        node_at_link_head = self.node_at_link_head
-        for link in range(self.number_of_links):
-            tc = self.cell_at_node[node_at_link_tail[link]]
-            hc = self.cell_at_node[node_at_link_head[link]]
-            if tc != BAD_INDEX_VALUE or hc != BAD_INDEX_VALUE:
-                self._link_at_face[face_id] = link
-                face_id += 1
+        cell_at_node = self.cell_at_node
+        link_has_face = (cell_at_node[self.node_at_link_tail] != BAD_INDEX_VALUE) | (
+            cell_at_node[self.node_at_link_head] != BAD_INDEX_VALUE
+        )
+        self._link_at_face = np.flatnonzero(link_has_face).astype(int)
 
         return self._link_at_face
 
@@ -3042,41 +3053,157 @@ class ModelGrid(ModelDataFieldsMixIn, EventLayersMixIn, MaterialLayersMixIn):
         self._activelink_fromnode = self.node_at_link_tail[self.active_links]
         self._activelink_tonode = self.node_at_link_head[self.active_links]
 
-    def reset_status_at_node(self):
-        attrs = [
-            "_active_link_dirs_at_node",
-            "_status_at_link",
+    def reset_status_at_node(self, nodes=None):
+        """Reset the quantities that depend on the status of nodes.
+
+        Parameters
+        ----------
+        nodes : array_like of int, optional
+            Nodes whose status changed. If given, and the status of links
+            has already been calculated, only the status of links attached
+            to these nodes is recalculated. Otherwise everything that
+            depends on the status of nodes is recalculated the next time it
+            is used.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid, CLOSED_BOUNDARY
+        >>> grid = RasterModelGrid((4, 5))
+        >>> grid.status_at_link[6]
+        0
+        >>> grid._node_status[7] = CLOSED_BOUNDARY
+        >>> grid.reset_status_at_node(nodes=[7])
+        >>> grid.status_at_link[6]
+        4
+        >>> grid.changed_links_since(grid.bc_set_code - 1)
+        array([ 6, 10, 11, 15])
+        """
+        node_attrs = [
+            "_core_nodes",
+            "_core_cells",
+            "_fixed_value_boundary_nodes",
+            "_node_at_core_cell",
+        ]
+        link_attrs = [
             "_active_links",
             "_fixed_links",
             "_activelink_fromnode",
             "_activelink_tonode",
             "_active_faces",
-            "_core_nodes",
-            "_core_cells",
-            "_fixed_links",
-            "_active_adjacent_nodes_at_node",
-            "_fixed_value_boundary_nodes",
-            "_node_at_core_cell",
-            "_link_status_at_node",
+            "__node_active_inlink_matrix",
+            "__node_active_outlink_matrix",
         ]
 
-        for attr in attrs:
-            try:
-                del self.__dict__[attr]
-            except KeyError:
-                pass
+        if nodes is not None and "_status_at_link" in self.__dict__:
+            links = self.links_at_node[np.asarray(nodes, dtype=int)].reshape((-1,))
+            changed = update_status_at_link(
+                self._status_at_link,
+                self.status_at_node,
+                self.nodes_at_link,
+                np.unique(links[links >= 0]),
+            )
+            if changed.size > 0:
+                nodes = self.nodes_at_link[changed].reshape((-1,))
+                if np.any(changed == self.number_of_links - 1):
+                    # The -1 slots of links_at_node read the last link.
+                    nodes = np.concatenate(
+                        (nodes, np.where(np.any(self.links_at_node == -1, axis=1))[0])
+                    )
+                self._update_link_status_at_nodes(np.unique(nodes))
+            else:
+                link_attrs = []
+        else:
+            changed = None
+            link_attrs += [
+                "_status_at_link",
+                "_link_status_at_node",
+                "_active_link_dirs_at_node",
+                "_active_adjacent_nodes_at_node",
+            ]
+
+        for attr in node_attrs + link_attrs:
+            self.__dict__.pop(attr, None)
+
         try:
             self.bc_set_code += 1
         except AttributeError:
             self.bc_set_code = 0
-        try:
-            del self.__dict__["__node_active_inlink_matrix"]
-        except KeyError:
-            pass
-        try:
-            del self.__dict__["__node_active_outlink_matrix"]
-        except KeyError:
-            pass
+
+        changes = self.__dict__.setdefault("_link_status_changes", [])
+        changes.append((self.bc_set_code, changed))
+        del changes[:-_MAX_LINK_STATUS_CHANGES]
+
+    def _update_link_status_at_nodes(self, nodes):
+        """Update the at-node arrays of link status for some nodes."""
+        status_at_link = self._status_at_link[self.links_at_node[nodes]]
+        is_active = status_at_link == ACTIVE_LINK
+        if "_link_status_at_node" in self.__dict__:
+            self._link_status_at_node[nodes] = status_at_link
+        if "_active_link_dirs_at_node" in self.__dict__:
+            self._active_link_dirs_at_node[nodes] = np.choose(
+                is_active, (0, self.link_dirs_at_node[nodes])
+            )
+        if "_active_adjacent_nodes_at_node" in self.__dict__:
+            self._active_adjacent_nodes_at_node[nodes] = np.choose(
+                is_active, (-1, self.adjacent_nodes_at_node[nodes])
+            )
+
+    def changed_links_since(self, bc_set_code):
+        """Links whose status may have changed since a boundary update.
+
+        Components that keep quantities that depend on the status of links
+        can use this to update only the links whose status changed.
+
+        Parameters
+        ----------
+        bc_set_code : int
+            A previous value of the grid's *bc_set_code*.
+
+        Returns
+        -------
+        ndarray of int or None
+            The links whose status may have changed, or ``None`` if they
+            are not known (in which case the status of any link may have
+            changed).
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid, CLOSED_BOUNDARY
+        >>> grid = RasterModelGrid((4, 5))
+        >>> grid.status_at_link.size
+        31
+        >>> bc_set_code = grid.bc_set_code
+        >>> grid.changed_links_since(bc_set_code)
+        array([], dtype=int64)
+        >>> grid.status_at_node[7] = CLOSED_BOUNDARY
+        >>> grid.status_at_node[12] = CLOSED_BOUNDARY
+        >>> grid.changed_links_since(bc_set_code)
+        array([ 6, 10, 11, 15, 19, 20, 24])
+
+        Setting all of the node status at once, or using methods that
+        change the status of many nodes at once, can change the status of
+        any link.
+
+        >>> grid.set_closed_boundaries_at_grid_edges(True, True, True, True)
+        >>> grid.changed_links_since(bc_set_code) is None
+        True
+
+        LLCATS: LINF BC
+        """
+        if bc_set_code == self.bc_set_code:
+            return np.empty(0, dtype=int)
+
+        changes = [
+            changed
+            for (code, changed) in self.__dict__.get("_link_status_changes", [])
+            if code > bc_set_code
+        ]
+        if len(changes) != self.bc_set_code - bc_set_code or any(
+            changed is None for changed in changes
+        ):
+            return None
+        else:
+            return np.unique(np.concatenate(changes))
 
     @deprecated(use="set_nodata_nodes_to_closed", version="0.2")
     def set_nodata_nodes_to_inactive(self, node_data, nodata_value):
@@ -7,9 +7,13 @@ Grid decorators
     :toctree: generated/
 
     ~landlab.grid.decorators.override_array_setitem_and_reset
+    ~landlab.grid.decorators.defer_resets
+    ~landlab.grid.decorators.BatchStatusUpdateMixIn
     ~landlab.grid.decorators.return_id_array
     ~landlab.grid.decorators.return_readonly_id_array
 """
+from collections import OrderedDict
+from contextlib import contextmanager
 from functools import wraps
 
 import numpy as np
@@ -17,6 +21,189 @@ import numpy as np
 from ..core.utils import as_id_array
 
 
+def _indices_of(ind, size):
+    """Indices of the elements of a 1D array selected by *ind*.
+
+    Returns ``None`` if the indices can not be easily determined.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.decorators import _indices_of
+    >>> _indices_of(slice(1, None, 2), 6)
+    array([1, 3, 5])
+    >>> _indices_of(-1, 6)
+    array([5])
+    >>> _indices_of(np.array([True, False, True]), 3)
+    array([0, 2])
+    >>> _indices_of(Ellipsis, 6) is None
+    True
+    """
+    if isinstance(ind, tuple) and len(ind) == 1:
+        ind = ind[0]
+    if isinstance(ind, slice):
+        return np.arange(*ind.indices(size))
+
+    ind = np.asarray(ind)
+    if ind.dtype == np.bool_:
+        return np.flatnonzero(ind) if ind.shape == (size,) else None
+    elif np.issubdtype(ind.dtype, np.integer):
+        return np.mod(ind.reshape((-1,)), size)
+    else:
+        return None
+
+
+def _reset_or_defer(grid, reset, changed=None, pass_changed=False):
+    """Call a grid's reset method, unless resets are being deferred.
+
+    If *pass_changed* is True, the reset method is called with the ids of
+    the elements that changed (or ``None`` if they are unknown).
+    """
+    deferred = getattr(grid, "_deferred_resets", None)
+    if deferred is None:
+        if pass_changed:
+            getattr(grid, reset)(changed)
+        else:
+            getattr(grid, reset)()
+    else:
+        if reset not in deferred:
+            deferred[reset] = (pass_changed, [])
+        changes = deferred[reset][1]
+        if changed is None or (changes and changes[-1] is None):
+            changes[:] = [None]
+        else:
+            changes.append(changed)
+
+
+@contextmanager
+def defer_resets(grid):
+    """Defer the resets of a grid's state until the end of a block.
+
+    Within the block, setting values of an array returned by a method
+    decorated with :class:`override_array_setitem_and_reset` does not call
+    the grid's reset method. Instead, each reset method is called once, at
+    the end of the outermost block.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        A landlab grid.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid, CLOSED_BOUNDARY
+    >>> from landlab.grid.decorators import defer_resets
+    >>> grid = RasterModelGrid((3, 4))
+    >>> bc_set_code = grid.bc_set_code
+    >>> with defer_resets(grid):
+    ...     for node in (5, 6):
+    ...         grid.status_at_node[node] = CLOSED_BOUNDARY
+    ...     grid.bc_set_code == bc_set_code
+    True
+    >>> grid.bc_set_code == bc_set_code + 1
+    True
+    >>> grid.active_links.size
+    0
+    """
+    if getattr(grid, "_deferred_resets", None) is not None:
+        yield
+        return
+
+    grid._deferred_resets = OrderedDict()
+    try:
+        yield
+    finally:
+        deferred, grid._deferred_resets = grid._deferred_resets, None
+        for reset, (pass_changed, changes) in deferred.items():
+            if not pass_changed:
+                getattr(grid, reset)()
+            elif changes and changes[-1] is None:
+                getattr(grid, reset)(None)
+            else:
+                getattr(grid, reset)(np.unique(np.concatenate(changes)))
+
+
+class BatchStatusUpdateMixIn(object):
+
+    """Add the *batch_status_update* context manager to a grid."""
+
+    def batch_status_update(self):
+        """Update the status of nodes as a batch.
+
+        Use as a context manager. Within the block, setting values of
+        :attr:`status_at_node` does not reset the quantities that depend on
+        node status (link status, active links, core nodes, and so on).
+        They are reset, and ``bc_set_code`` incremented, once when the
+        block ends. Until then, any of them that have already been used
+        may not reflect the new node status.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid, CLOSED_BOUNDARY
+        >>> grid = RasterModelGrid((4, 5))
+        >>> with grid.batch_status_update():
+        ...     for node in grid.nodes_at_left_edge:
+        ...         grid.status_at_node[node] = CLOSED_BOUNDARY
+        >>> grid.active_links
+        array([ 5,  6,  7, 10, 11, 12, 14, 15, 16, 19, 20, 21, 23, 24, 25])
+
+        LLCATS: NINF BC
+        """
+        return defer_resets(self)
+
+
+# The class is named "array" so that it is printed as a numpy array is.
+class array(np.ndarray):
+
+    """A numpy array that resets grid state after its values are set."""
+
+    def __new__(cls, arr, grid, reset, pass_changed=False):
+        """Instantiate the class with a view of the base array."""
+        obj = np.asarray(arr).view(cls)
+        obj.grid = grid
+        obj.reset = reset
+        obj.pass_changed = pass_changed
+        return obj
+
+    def __array_finalize__(self, obj):
+        if obj is None:
+            return
+
+    def _set_and_reset(self, setter, ind, *args):
+        """Set values with *setter*, then call reset function."""
+        if self.pass_changed and self.ndim == 1:
+            indices = _indices_of(ind, self.size)
+        else:
+            indices = None
+
+        values = self.view(np.ndarray)
+        if indices is not None:
+            before = values[indices]
+        setter(self, ind, *args)
+        if indices is not None:
+            indices = np.unique(indices[values[indices] != before])
+
+        _reset_or_defer(
+            self.grid, self.reset, changed=indices, pass_changed=self.pass_changed
+        )
+
+    def itemset(self, ind, value):
+        """Set value of array, then call reset function."""
+        self._set_and_reset(np.ndarray.itemset, ind, value)
+
+    def __setitem__(self, ind, value):
+        """Set value of array, then call reset function."""
+        self._set_and_reset(np.ndarray.__setitem__, ind, value)
+
+    def __setslice__(self, start, stop, value):
+        """Set values of array, then call reset function."""
+        self._set_and_reset(
+            lambda arr, ind, value: np.ndarray.__setitem__(arr, ind, value),
+            slice(start, stop),
+            value,
+        )
+
+
 class override_array_setitem_and_reset(object):
 
     """Decorator that calls a grid method after setting array values.
@@ -25,25 +212,33 @@ class override_array_setitem_and_reset(object):
     so that it returns a wrapped array that overrides the numpy array
     `__setitem__`, `__setslice__`, and `itemset` methods. The wrapped methods
     set values in the array but then also call a grid method that resets some
-    state variables of the grid.
+    state variables of the grid. Within a :func:`defer_resets` block, the
+    grid method is called once, at the end of the block.
 
     Parameters
     ----------
     reset : str
         The name of the grid method to call after setting values. The
-        corresponding method must take no arguments.
+        corresponding method must take no arguments, unless *pass_changed*
+        is True.
+    pass_changed : bool, optional
+        If True, call the grid method with the ids of the elements whose
+        values changed (or ``None``, if they can not be determined) so that
+        it can reset only the state affected by the change.
     """
 
-    def __init__(self, reset):
+    def __init__(self, reset, pass_changed=False):
         """Initialize the decorator with an argument.
 
         Parameters
         ----------
         reset : str
-            The name of the grid method to call after setting values. The
-            corresponding method must take no arguments.
+            The name of the grid method to call after setting values.
+        pass_changed : bool, optional
+            Pass the ids of changed elements to the grid method.
         """
         self._reset = reset
+        self._pass_changed = pass_changed
 
     def __call__(self, func):
         """Get a wrapped version of the method.
@@ -58,41 +253,11 @@ class override_array_setitem_and_reset(object):
         function
             The wrapped function.
         """
-        reset = self._reset
+        reset, pass_changed = self._reset, self._pass_changed
 
         def _wrapped(grid):
             """Embed a grid into a numpy array and override set methods."""
-
-            class array(np.ndarray):
-
-                """Override numpy setters and reset grid topology."""
-
-                def __new__(cls, arr):
-                    """Instantiate the class with a view of the base array."""
-                    obj = np.asarray(arr).view(cls)
-                    obj.grid = grid
-                    return obj
-
-                def __array_finalize__(self, obj):
-                    if obj is None:
-                        return
-
-                def itemset(self, ind, value):
-                    """Set value of array, then call reset function."""
-                    np.ndarray.itemset(self, ind, value)
-                    getattr(self.grid, reset)()
-
-                def __setitem__(self, ind, value):
-                    """Set value of array, then call reset function."""
-                    np.ndarray.__setitem__(self, ind, value)
-                    getattr(self.grid, reset)()
-
-                def __setslice__(self, start, stop, value):
-                    """Set values of array, then call reset function."""
-                    np.ndarray.__setslice__(self, start, stop, value)
-                    getattr(self.grid, reset)()
-
-            return array(func(grid))
+            return array(func(grid), grid, reset, pass_changed=pass_changed)
 
         _wrapped.__name__ = func.__name__
         _wrapped.__doc__ = func.__doc__
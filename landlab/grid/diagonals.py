@@ -3,7 +3,8 @@ import numpy as np
 
 from ..utils.decorators import cache_result_in_object, make_return_array_immutable
 from .decorators import return_readonly_id_array
-from .linkstatus import ACTIVE_LINK, set_status_at_link
+from .linkstatus import ACTIVE_LINK, set_status_at_link, update_status_at_link
+from .structured_quad import links as squad_links, nodes as squad_nodes
 
 
 def create_nodes_at_diagonal(shape, out=None):
@@ -209,13 +210,7 @@ class DiagonalsMixIn(object):
 
         LLCATS: NINF CONN
         """
-        node_is_at_tail = np.choose(
-            self.diagonal_dirs_at_node + 1, np.array((1, -1, 0), dtype=np.int8)
-        )
-        out = self.nodes_at_diagonal[self.diagonals_at_node, node_is_at_tail]
-        out[node_is_at_tail == -1] = -1
-
-        return out
+        return squad_nodes.diagonal_adjacent_nodes_at_node(self.shape)
 
     @property
     @cache_result_in_object()
@@ -319,16 +314,14 @@ class DiagonalsMixIn(object):
 
         LLCATS: NINF LINF CONN
         """
-        diagonals_at_node = self.diagonals_at_node.copy()
-        diagonals_at_node[diagonals_at_node >= 0] += self.number_of_links
-        return np.hstack((super(DiagonalsMixIn, self).links_at_node, diagonals_at_node))
+        return squad_links.d8s_at_node(self.shape)
 
     @property
     @cache_result_in_object()
     @make_return_array_immutable
     def d8_dirs_at_node(self):
         return np.hstack(
-            (super(DiagonalsMixIn, self).link_dirs_at_node, self.diagonal_dirs_at_node)
+            (self.link_dirs_at_node, self.diagonal_dirs_at_node)
         )
 
     @property
@@ -381,10 +374,9 @@ class DiagonalsMixIn(object):
             (super(DiagonalsMixIn, self).length_of_link, self.length_of_diagonal)
         )
 
-    def reset_status_at_node(self):
-        super(DiagonalsMixIn, self).reset_status_at_node()
+    def reset_status_at_node(self, nodes=None):
+        super(DiagonalsMixIn, self).reset_status_at_node(nodes=nodes)
         attrs = [
-            "_status_at_diagonal",
             "_diagonal_status_at_node",
             "_active_diagonals",
             "_active_diagonal_dirs_at_node",
@@ -393,6 +385,23 @@ class DiagonalsMixIn(object):
             "_active_d8_dirs_at_node",
         ]
 
+        if nodes is not None and "_status_at_diagonal" in self.__dict__:
+            diagonals = self.diagonals_at_node[np.asarray(nodes, dtype=int)]
+            diagonals = diagonals.reshape((-1,))
+            status_at_diagonal = self._status_at_diagonal
+            status_at_diagonal.flags.writeable = True
+            try:
+                update_status_at_link(
+                    status_at_diagonal,
+                    self.status_at_node,
+                    self.nodes_at_diagonal,
+                    np.unique(diagonals[diagonals >= 0]),
+                )
+            finally:
+                status_at_diagonal.flags.writeable = False
+        else:
+            attrs.append("_status_at_diagonal")
+
         for attr in attrs:
             try:
                 del self.__dict__[attr]
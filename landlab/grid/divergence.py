@@ -2,6 +2,7 @@
 """Calculate vector divergence and related quantities at nodes or cells."""
 import numpy as np
 
+from landlab.core.utils import float_dtype_of
 from landlab.utils.decorators import use_field_name_or_array
 
 
@@ -52,6 +53,11 @@ def calc_flux_div_at_node(grid, unit_flux, out=None):
     array([ 0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  1.64,  0.94,  0.  ,  0.  ,
             0.  ,  0.  ,  0.  ])
 
+    The divergence of single-precision fluxes is single precision.
+
+    >>> calc_flux_div_at_node(rg, -lg.astype(np.float32)).dtype
+    dtype('float32')
+
 
     Notes
     -----
@@ -62,13 +68,13 @@ def calc_flux_div_at_node(grid, unit_flux, out=None):
     if unit_flux.size != grid.number_of_links:
         raise ValueError("Parameter unit_flux must be num links " "long")
     if out is None:
-        out = grid.zeros(at="node")
+        out = grid.zeros(at="node", dtype=float_dtype_of(unit_flux))
     elif out.size != grid.number_of_nodes:
         raise ValueError("output buffer length mismatch with number of nodes")
 
-    out[grid.node_at_cell] = (
-        _calc_net_face_flux_at_cell(grid, unit_flux[grid.link_at_face])
-        / grid.area_of_cell
+    net_flux = _calc_net_face_flux_at_cell(grid, unit_flux[grid.link_at_face])
+    out[grid.node_at_cell] = np.divide(
+        net_flux, grid.area_of_cell, out=net_flux, casting="same_kind"
     )
 
     return out
@@ -137,19 +143,15 @@ def calc_flux_div_at_cell(grid, unit_flux, out=None):
             "or the field name for a at_link array"
         )
     if out is None:
-        out = grid.zeros(at="cell")
+        out = grid.zeros(at="cell", dtype=float_dtype_of(unit_flux))
     elif out.size != grid.number_of_cells:
         raise ValueError("output buffer length mismatch with number of cells")
 
     if unit_flux.size == grid.number_of_links:
-        out = (
-            _calc_net_face_flux_at_cell(grid, unit_flux[grid.link_at_face])
-            / grid.area_of_cell
-        )
-    elif unit_flux.size == grid.number_of_faces:
-        out = _calc_net_face_flux_at_cell(grid, unit_flux) / grid.area_of_cell
+        unit_flux = unit_flux[grid.link_at_face]
+    _calc_net_face_flux_at_cell(grid, unit_flux, out=out)
 
-    return out
+    return np.divide(out, grid.area_of_cell, out=out, casting="same_kind")
 
 
 @use_field_name_or_array("link")
@@ -224,7 +226,7 @@ def calc_net_flux_at_node(grid, unit_flux_at_links, out=None):
     LLCATS: NINF GRAD
     """
     if out is None:
-        out = grid.zeros(at="node")
+        out = grid.zeros(at="node", dtype=float_dtype_of(unit_flux_at_links))
 
     out[grid.node_at_cell] = _calc_net_face_flux_at_cell(
         grid, unit_flux_at_links[grid.link_at_face]
@@ -294,9 +296,12 @@ def _calc_net_face_flux_at_cell(grid, unit_flux_at_faces, out=None):
     will be in mass per unit time).
     """
     if out is None:
-        out = grid.empty(at="cell")
-    total_flux = unit_flux_at_faces * grid.width_of_face
-    out = np.zeros(grid.number_of_cells)
+        out = grid.zeros(at="cell", dtype=float_dtype_of(unit_flux_at_faces))
+    else:
+        out.fill(0.)
+    total_flux = np.multiply(
+        unit_flux_at_faces, grid.width_of_face, dtype=out.dtype, casting="same_kind"
+    )
     fac = grid.faces_at_cell
     for c in range(grid.link_dirs_at_node.shape[1]):
         out -= total_flux[fac[:, c]] * grid.link_dirs_at_node[grid.node_at_cell, c]
@@ -409,9 +414,12 @@ def _calc_net_active_face_flux_at_cell(grid, unit_flux_at_faces, out=None):
     will be in mass per unit time).
     """
     if out is None:
-        out = grid.empty(at="cell")
-    total_flux = unit_flux_at_faces * grid.width_of_face
-    out = np.zeros(grid.number_of_cells)
+        out = grid.zeros(at="cell", dtype=float_dtype_of(unit_flux_at_faces))
+    else:
+        out.fill(0.)
+    total_flux = np.multiply(
+        unit_flux_at_faces, grid.width_of_face, dtype=out.dtype, casting="same_kind"
+    )
     fac = grid.faces_at_cell
     for c in range(grid.active_link_dirs_at_node.shape[1]):
         out -= (
@@ -17,7 +17,7 @@ Gradient calculation functions
 
 import numpy as np
 
-from landlab.core.utils import radians_to_degrees
+from landlab.core.utils import float_dtype_of, radians_to_degrees
 from landlab.grid.base import CLOSED_BOUNDARY
 from landlab.utils.decorators import deprecated, use_field_name_or_array
 
@@ -45,6 +45,7 @@ def calc_grad_at_link(grid, node_values, out=None):
 
     Examples
     --------
+    >>> import numpy as np
     >>> from landlab import RasterModelGrid
     >>> rg = RasterModelGrid((3, 4), xy_spacing=10.0)
     >>> z = rg.add_zeros('node', 'topographic__elevation')
@@ -63,10 +64,16 @@ def calc_grad_at_link(grid, node_values, out=None):
     array([ 0. ,  0. ,  0. ,  5. ,  5. ,  3.6,  3.6,  0. ,  5. , -1.4, -3.6,
             0. , -5. , -5. , -3.6, -3.6,  0. ,  0. ,  0. ])
 
+    Gradients of single-precision values are single precision.
+
+    >>> z = z.astype(np.float32)
+    >>> calc_grad_at_link(hg, z).dtype
+    dtype('float32')
+
     LLCATS: LINF GRAD
     """
     if out is None:
-        out = grid.empty(at="link")
+        out = grid.empty(at="link", dtype=float_dtype_of(node_values))
     return np.divide(
         node_values[grid.node_at_link_head] - node_values[grid.node_at_link_tail],
         grid.length_of_link,
@@ -125,7 +132,7 @@ def calc_grad_at_active_link(grid, node_values, out=None):
     LLCATS: DEPR LINF GRAD
     """
     if out is None:
-        out = np.empty(len(grid.active_links), dtype=float)
+        out = np.empty(len(grid.active_links), dtype=float_dtype_of(node_values))
     return np.divide(
         np.diff(node_values[grid.nodes_at_link[grid.active_links]], axis=1).flatten(),
         grid.length_of_link[grid.active_links],
@@ -177,7 +184,7 @@ def calculate_gradients_at_faces(grid, node_values, out=None):
     LLCATS: DEPR GRAD
     """
     if out is None:
-        out = grid.empty(at="face")
+        out = grid.empty(at="face", dtype=float_dtype_of(node_values))
     laf = grid.link_at_face
     return np.divide(
         node_values[grid.node_at_link_head[laf]]
@@ -220,9 +227,9 @@ def calc_diff_at_link(grid, node_values, out=None):
 
     LLCATS: LINF GRAD
     """
-    if out is None:
-        out = grid.empty(at="link")
     node_values = np.asarray(node_values)
+    if out is None:
+        out = grid.empty(at="link", dtype=float_dtype_of(node_values))
     return np.subtract(
         node_values[grid.node_at_link_head],
         node_values[grid.node_at_link_tail],
@@ -279,9 +286,9 @@ def calculate_diff_at_active_links(grid, node_values, out=None):
 
     LLCATS: DEPR LINF GRAD
     """
-    if out is None:
-        out = np.empty(len(grid.active_links), dtype=float)
     node_values = np.asarray(node_values)
+    if out is None:
+        out = np.empty(len(grid.active_links), dtype=float_dtype_of(node_values))
     node_values = node_values[grid.nodes_at_link[grid.active_links]]
     return np.subtract(node_values[:, 1], node_values[:, 0], out=out)
 
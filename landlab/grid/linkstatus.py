@@ -172,3 +172,48 @@ def set_status_at_link(node_status_at_link, out=None):
     out[_is_fixed_link] = FIXED_LINK
 
     return out
+
+
+def update_status_at_link(status_at_link, status_at_node, nodes_at_link, links):
+    """Update the status of some links.
+
+    Parameters
+    ----------
+    status_at_link : ndarray of int, shape `(n_links, )`
+        Status of all links, which is updated in place.
+    status_at_node : ndarray of int, shape `(n_nodes, )`
+        Status of all nodes.
+    nodes_at_link : ndarray of int, shape `(n_links, 2)`
+        Tail and head node of each link.
+    links : array_like of int
+        Links to update (for instance, the links attached to nodes whose
+        status has changed).
+
+    Returns
+    -------
+    ndarray of int
+        The links whose status changed.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.linkstatus import set_status_at_link, update_status_at_link
+    >>> from landlab import CLOSED_BOUNDARY, CORE_NODE, FIXED_VALUE_BOUNDARY
+    >>> nodes_at_link = np.array([[0, 1], [1, 2], [2, 3]])
+    >>> status_at_node = np.array([FIXED_VALUE_BOUNDARY, CORE_NODE, CORE_NODE,
+    ...                            FIXED_VALUE_BOUNDARY], dtype=np.uint8)
+    >>> status_at_link = set_status_at_link(status_at_node[nodes_at_link])
+    >>> status_at_link
+    array([0, 0, 0], dtype=uint8)
+
+    >>> status_at_node[3] = CLOSED_BOUNDARY
+    >>> update_status_at_link(status_at_link, status_at_node, nodes_at_link, [2])
+    array([2])
+    >>> status_at_link
+    array([0, 0, 4], dtype=uint8)
+    """
+    links = np.asarray(links, dtype=int).reshape((-1,))
+    new_status = set_status_at_link(status_at_node[nodes_at_link[links]])
+    changed = links[new_status != status_at_link[links]]
+    status_at_link[links] = new_status
+    return changed
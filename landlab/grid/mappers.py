@@ -57,6 +57,7 @@ from __future__ import division
 
 import numpy as np
 
+from landlab.core.utils import float_dtype_of
 from landlab.grid.base import CLOSED_BOUNDARY, INACTIVE_LINK
 
 
@@ -111,7 +112,7 @@ def map_link_head_node_to_link(grid, var_name, out=None):
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
     if out is None:
-        out = grid.empty(at="link")
+        out = grid.empty(at="link", dtype=float_dtype_of(var_name))
     out[:] = var_name[grid.node_at_link_head]
 
     return out
@@ -166,11 +167,10 @@ def map_link_tail_node_to_link(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="link")
-
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.empty(at="link", dtype=float_dtype_of(var_name))
     out[:] = var_name[grid.node_at_link_tail]
 
     return out
@@ -224,11 +224,10 @@ def map_min_of_link_nodes_to_link(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="link")
-
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.empty(at="link", dtype=float_dtype_of(var_name))
     np.minimum(
         var_name[grid.node_at_link_head], var_name[grid.node_at_link_tail], out=out
     )
@@ -284,11 +283,10 @@ def map_max_of_link_nodes_to_link(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="link")
-
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.empty(at="link", dtype=float_dtype_of(var_name))
     np.maximum(
         var_name[grid.node_at_link_head], var_name[grid.node_at_link_tail], out=out
     )
@@ -343,11 +341,10 @@ def map_mean_of_link_nodes_to_link(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="link")
-
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.empty(at="link", dtype=float_dtype_of(var_name))
     out[:] = 0.5 * (var_name[grid.node_at_link_head] + var_name[grid.node_at_link_tail])
 
     return out
@@ -403,13 +400,12 @@ def map_value_at_min_node_to_link(grid, control_name, value_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="link")
-
     if type(control_name) is str:
         control_name = grid.at_node[control_name]
     if type(value_name) is str:
         value_name = grid.at_node[value_name]
+    if out is None:
+        out = grid.empty(at="link", dtype=float_dtype_of(value_name))
     head_control = control_name[grid.node_at_link_head]
     tail_control = control_name[grid.node_at_link_tail]
     head_vals = value_name[grid.node_at_link_head]
@@ -469,13 +465,12 @@ def map_value_at_max_node_to_link(grid, control_name, value_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="link")
-
     if type(control_name) is str:
         control_name = grid.at_node[control_name]
     if type(value_name) is str:
         value_name = grid.at_node[value_name]
+    if out is None:
+        out = grid.empty(at="link", dtype=float_dtype_of(value_name))
     head_control = control_name[grid.node_at_link_head]
     tail_control = control_name[grid.node_at_link_tail]
     head_vals = value_name[grid.node_at_link_head]
@@ -528,11 +523,10 @@ def map_node_to_cell(grid, var_name, out=None):
 
     LLCATS: CINF NINF MAP
     """
-    if out is None:
-        out = grid.empty(at="cell")
-
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.empty(at="cell", dtype=float_dtype_of(var_name))
     out[:] = var_name[grid.node_at_cell]
 
     return out
@@ -585,15 +579,15 @@ def map_min_of_node_links_to_node(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
+    if type(var_name) is str:
+        var_name = grid.at_link[var_name]
     if out is None:
-        out = grid.empty(at="node")
+        out = grid.empty(at="node", dtype=float_dtype_of(var_name))
 
-    values_at_linksX = np.empty(grid.number_of_links + 1, dtype=float)
-    values_at_linksX[-1] = np.finfo(dtype=float).max
-    if type(var_name) is str:
-        values_at_linksX[:-1] = grid.at_link[var_name]
-    else:
-        values_at_linksX[:-1] = var_name
+    dtype = float_dtype_of(out) or float
+    values_at_linksX = np.empty(grid.number_of_links + 1, dtype=dtype)
+    values_at_linksX[-1] = np.finfo(dtype=dtype).max
+    values_at_linksX[:-1] = var_name
     np.amin(values_at_linksX[grid.links_at_node], axis=1, out=out)
 
     return out
@@ -646,15 +640,15 @@ def map_max_of_node_links_to_node(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
+    if type(var_name) is str:
+        var_name = grid.at_link[var_name]
     if out is None:
-        out = grid.empty(at="node")
+        out = grid.empty(at="node", dtype=float_dtype_of(var_name))
 
-    values_at_linksX = np.empty(grid.number_of_links + 1, dtype=float)
-    values_at_linksX[-1] = np.finfo(dtype=float).min
-    if type(var_name) is str:
-        values_at_linksX[:-1] = grid.at_link[var_name]
-    else:
-        values_at_linksX[:-1] = var_name
+    dtype = float_dtype_of(out) or float
+    values_at_linksX = np.empty(grid.number_of_links + 1, dtype=dtype)
+    values_at_linksX[-1] = np.finfo(dtype=dtype).min
+    values_at_linksX[:-1] = var_name
     np.amax(values_at_linksX[grid.links_at_node], axis=1, out=out)
 
     return out
@@ -715,11 +709,10 @@ def map_upwind_node_link_max_to_node(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="node")
-
     if type(var_name) is str:
         var_name = grid.at_link[var_name]
+    if out is None:
+        out = grid.empty(at="node", dtype=float_dtype_of(var_name))
     values_at_links = var_name[grid.links_at_node] * grid.link_dirs_at_node
     # this procedure makes incoming links NEGATIVE
     np.amax(-values_at_links, axis=1, out=out)
@@ -782,11 +775,10 @@ def map_downwind_node_link_max_to_node(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="node")
-
     if type(var_name) is str:
         var_name = grid.at_link[var_name]
+    if out is None:
+        out = grid.empty(at="node", dtype=float_dtype_of(var_name))
     values_at_links = var_name[grid.links_at_node] * grid.link_dirs_at_node
     # this procedure makes incoming links NEGATIVE
     steepest_links_at_node = np.amax(values_at_links, axis=1)
@@ -850,11 +842,10 @@ def map_upwind_node_link_mean_to_node(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="node")
-
     if type(var_name) is str:
         var_name = grid.at_link[var_name]
+    if out is None:
+        out = grid.empty(at="node", dtype=float_dtype_of(var_name))
     values_at_links = var_name[grid.links_at_node] * grid.link_dirs_at_node
     # this procedure makes incoming links NEGATIVE
     vals_in_positive = -values_at_links
@@ -922,11 +913,10 @@ def map_downwind_node_link_mean_to_node(grid, var_name, out=None):
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="node")
-
     if type(var_name) is str:
         var_name = grid.at_link[var_name]
+    if out is None:
+        out = grid.empty(at="node", dtype=float_dtype_of(var_name))
     values_at_links = var_name[grid.links_at_node] * grid.link_dirs_at_node
     # this procedure makes incoming links NEGATIVE
     vals_in_positive = values_at_links
@@ -1000,13 +990,12 @@ def map_value_at_upwind_node_link_max_to_node(grid, control_name, value_name, ou
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="node")
-
     if type(control_name) is str:
         control_name = grid.at_link[control_name]
     if type(value_name) is str:
         value_name = grid.at_link[value_name]
+    if out is None:
+        out = grid.empty(at="node", dtype=float_dtype_of(value_name))
     values_at_nodes = control_name[grid.links_at_node] * grid.link_dirs_at_node
     # this procedure makes incoming links NEGATIVE
     which_link = np.argmax(-values_at_nodes, axis=1)
@@ -1081,13 +1070,12 @@ def map_value_at_downwind_node_link_max_to_node(
 
     LLCATS: NINF LINF MAP
     """
-    if out is None:
-        out = grid.empty(at="node")
-
     if type(control_name) is str:
         control_name = grid.at_link[control_name]
     if type(value_name) is str:
         value_name = grid.at_link[value_name]
+    if out is None:
+        out = grid.empty(at="node", dtype=float_dtype_of(value_name))
     values_at_nodes = control_name[grid.links_at_node] * grid.link_dirs_at_node
     # this procedure makes incoming links NEGATIVE
     which_link = np.argmax(values_at_nodes, axis=1)
@@ -1148,11 +1136,10 @@ def map_mean_of_patch_nodes_to_patch(
 
     LLCATS: PINF NINF MAP
     """
-    if out is None:
-        out = np.zeros(grid.number_of_patches, dtype=float)
-
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.zeros(at="patch", dtype=float_dtype_of(var_name))
     values_at_nodes = var_name[grid.nodes_at_patch]
     if ignore_closed_nodes:
         values_at_nodes = np.ma.masked_where(
@@ -1220,11 +1207,10 @@ def map_max_of_patch_nodes_to_patch(grid, var_name, ignore_closed_nodes=True, ou
 
     LLCATS: PINF NINF MAP
     """
-    if out is None:
-        out = np.zeros(grid.number_of_patches, dtype=float)
-
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.zeros(at="patch", dtype=float_dtype_of(var_name))
     values_at_nodes = var_name[grid.nodes_at_patch]
     if ignore_closed_nodes:
         values_at_nodes = np.ma.masked_where(
@@ -1292,11 +1278,10 @@ def map_min_of_patch_nodes_to_patch(grid, var_name, ignore_closed_nodes=True, ou
 
     LLCATS: PINF NINF MAP
     """
-    if out is None:
-        out = np.zeros(grid.number_of_patches, dtype=float)
-
     if type(var_name) is str:
         var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.zeros(at="patch", dtype=float_dtype_of(var_name))
     values_at_nodes = var_name[grid.nodes_at_patch]
     if ignore_closed_nodes:
         values_at_nodes = np.ma.masked_where(
@@ -1395,16 +1380,15 @@ def map_link_vector_sum_to_patch(grid, var_name, ignore_inactive_links=True, out
 
     LLCATS: PINF LINF MAP
     """
+    if type(var_name) is str:
+        var_name = grid.at_link[var_name]
     if out is None:
         out = [
-            np.zeros(grid.number_of_patches, dtype=float),
-            np.zeros(grid.number_of_patches, dtype=float),
+            grid.zeros(at="patch", dtype=float_dtype_of(var_name)),
+            grid.zeros(at="patch", dtype=float_dtype_of(var_name)),
         ]
     else:
         assert len(out) == 2
-
-    if type(var_name) is str:
-        var_name = grid.at_link[var_name]
     angles_at_links = grid.angle_of_link  # CCW round tail
     hoz_cpt = np.cos(angles_at_links)
     vert_cpt = np.sin(angles_at_links)
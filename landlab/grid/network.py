@@ -10,11 +10,15 @@ from ..core.utils import add_module_functions_to_class
 from ..field import GraphFields
 from ..graph import NetworkGraph
 from ..utils.decorators import cache_result_in_object
-from .decorators import override_array_setitem_and_reset, return_readonly_id_array
-from .linkstatus import ACTIVE_LINK, set_status_at_link
+from .decorators import (
+    BatchStatusUpdateMixIn,
+    override_array_setitem_and_reset,
+    return_readonly_id_array,
+)
+from .linkstatus import ACTIVE_LINK, set_status_at_link, update_status_at_link
 
 
-class NetworkModelGrid(NetworkGraph, GraphFields):
+class NetworkModelGrid(NetworkGraph, GraphFields, BatchStatusUpdateMixIn):
     """Create a ModelGrid of just nodes and links.
 
     Parameters
@@ -39,6 +43,15 @@ class NetworkModelGrid(NetworkGraph, GraphFields):
     array([[0, 1],
            [2, 1],
            [1, 3]])
+
+    Set the status of several nodes, updating link status just once.
+
+    >>> from landlab import CLOSED_BOUNDARY
+    >>> with grid.batch_status_update():
+    ...     grid.status_at_node[0] = CLOSED_BOUNDARY
+    ...     grid.status_at_node[2] = CLOSED_BOUNDARY
+    >>> grid.status_at_link
+    array([4, 4, 0], dtype=uint8)
     """
 
     def __init__(self, yx_of_node, links, **kwds):
@@ -52,7 +65,7 @@ class NetworkModelGrid(NetworkGraph, GraphFields):
         self.bc_set_code = 0
 
     @property
-    @override_array_setitem_and_reset("reset_status_at_node")
+    @override_array_setitem_and_reset("reset_status_at_node", pass_changed=True)
     def status_at_node(self):
         """Get array of the boundary status for each node.
 
@@ -86,13 +99,11 @@ class NetworkModelGrid(NetworkGraph, GraphFields):
     @status_at_node.setter
     def status_at_node(self, new_status):
         """Set the array of node boundary statuses."""
-        self._node_status[:] = new_status[:]
-        self.reset_status_at_node()
+        self.status_at_node[:] = new_status[:]
 
-    def reset_status_at_node(self):
+    def reset_status_at_node(self, nodes=None):
         attrs = [
             "_active_link_dirs_at_node",
-            "_status_at_link",
             "_active_links",
             "_fixed_links",
             "_activelink_fromnode",
@@ -102,6 +113,17 @@ class NetworkModelGrid(NetworkGraph, GraphFields):
             "_fixed_value_boundary_nodes",
             "_link_status_at_node",
         ]
+        if nodes is not None and "_status_at_link" in self.__dict__:
+            links = self.links_at_node[np.asarray(nodes, dtype=int)].reshape((-1,))
+            update_status_at_link(
+                self._status_at_link,
+                self.status_at_node,
+                self.nodes_at_link,
+                np.unique(links[links >= 0]),
+            )
+        else:
+            attrs.append("_status_at_link")
+
         for attr in attrs:
             try:
                 del self.__dict__[attr]
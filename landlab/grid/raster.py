@@ -19,6 +19,7 @@ from landlab.grid.structured_quad import (
     cells as squad_cells,
     faces as squad_faces,
     links as squad_links,
+    nodes as squad_nodes,
 )
 from landlab.utils import structured_grid as sgrid
 from landlab.utils.decorators import deprecated, make_return_array_immutable
@@ -550,6 +551,15 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
                 )
         self.bc_set_code = state_dict["bc_set_code"]
 
+        # Restore axes, reference coordinates and layers, which grids
+        # pickled by older versions may not have.
+        self.axis_name = state_dict.get("_axis_name", self.axis_name)
+        self.axis_units = state_dict.get("_axis_units", self.axis_units)
+        self.xy_of_reference = state_dict.get("xy_of_reference", (0., 0.))
+        for attr in ("_event_layers", "_material_layers"):
+            if attr in state_dict:
+                self.__dict__[attr] = state_dict[attr]
+
     def __getstate__(self):
         """Get state for pickling."""
         # initialize state_dict
@@ -600,6 +610,12 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
         # save BC set code
         state_dict["bc_set_code"] = self.bc_set_code
 
+        # save reference coordinates and layers, if there are any
+        state_dict["xy_of_reference"] = self.xy_of_reference
+        for attr in ("_event_layers", "_material_layers"):
+            if attr in self.__dict__:
+                state_dict[attr] = self.__dict__[attr]
+
         # return state_dict
         return state_dict
 
@@ -783,8 +799,6 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
         # |-------|-------|-------|
         #
 
-        self._links_at_node = squad_links.links_at_node(self.shape)
-
         # Link lists:
         # For all links, we encode the "tail" and "head" nodes, and the face
         # (if any) associated with the link. If the link does not intersect a
@@ -810,16 +824,10 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
         #  |       |       |       |       |
         #  *---0-->*---1-->*---2-->*---3-->*
         #
-        #   create the tail-node and head-node lists
-        (node_at_link_tail, node_at_link_head) = sgrid.node_index_at_link_ends(
-            self.shape
-        )
-        self._nodes_at_link = np.hstack(
-            (node_at_link_tail.reshape((-1, 1)), node_at_link_head.reshape((-1, 1)))
-        )
-
-        # Sort them by midpoint coordinates
-        self._sort_links_by_midpoint()
+        #   create the tail-node and head-node lists. Links are numbered row
+        #   by row, horizontal links before vertical ones, which means they
+        #   are already sorted by midpoint.
+        self._nodes_at_link = squad_links.nodes_at_link(self.shape)
 
         # Flag indicating whether we have created patches
         self._patches_created = False
@@ -830,13 +838,10 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
         # set up the list of active links
         self._reset_link_status_list()
 
-        # Create 2D array containing, for each node, direction of connected
-        # link (1=incoming, -1=outgoing, 0=no link present at this position)
-        # needs to come after BC setting
-        self._create_link_dirs_at_node()
-
-        #   set up link unit vectors and node unit-vector sums
-        self._create_link_unit_vectors()
+        # Links and link directions at nodes, and link unit vectors, follow
+        # from the row and column of each node. They are not stored here but
+        # created the first time they are used (see links_at_node,
+        # link_dirs_at_node and _create_link_unit_vectors).
 
         #   set up link faces
         #
@@ -1199,6 +1204,81 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
             self._vertical_links = squad_links.vertical_link_ids(self.shape)
             return self._vertical_links
 
+    @property
+    @make_return_array_immutable
+    @cache_result_in_object()
+    def links_at_node(self):
+        """Get links of nodes.
+
+        Links at a node are ordered counterclockwise from east (that is,
+        east, north, west and south) with -1 for missing links. The
+        array is created, from the row and column of each node, the first
+        time it is used.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((4, 3))
+        >>> grid.links_at_node # doctest: +NORMALIZE_WHITESPACE
+        array([[ 0,  2, -1, -1], [ 1,  3,  0, -1], [-1,  4,  1, -1],
+               [ 5,  7, -1,  2], [ 6,  8,  5,  3], [-1,  9,  6,  4],
+               [10, 12, -1,  7], [11, 13, 10,  8], [-1, 14, 11,  9],
+               [15, -1, -1, 12], [16, -1, 15, 13], [-1, -1, 16, 14]])
+
+        LLCATS: NINF LINF CONN
+        """
+        return squad_links.links_at_node(self.shape)
+
+    @property
+    @make_return_array_immutable
+    def link_dirs_at_node(self):
+        """Link directions at each node: 1=incoming, -1=outgoing, 0=none.
+
+        Directions are ordered as :attr:`links_at_node`. The array is
+        created the first time it is used.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((4, 3))
+        >>> grid.link_dirs_at_node[4]
+        array([-1, -1,  1,  1], dtype=int8)
+        >>> grid.link_dirs_at_node[(0, 11), :]
+        array([[-1, -1,  0,  0],
+               [ 0,  0,  1,  1]], dtype=int8)
+
+        LLCATS: NINF LINF CONN
+        """
+        try:
+            return self._link_dirs_at_node
+        except AttributeError:
+            self._create_link_dirs_at_node()
+            return self._link_dirs_at_node
+
+    @property
+    @cache_result_in_object()
+    @make_return_array_immutable
+    def adjacent_nodes_at_node(self):
+        """Get adjacent nodes.
+
+        Nodes are ordered counterclockwise from east with -1 for missing
+        neighbors. The array is created, from the row and column of each
+        node, the first time it is used.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((4, 3))
+        >>> grid.adjacent_nodes_at_node # doctest: +NORMALIZE_WHITESPACE
+        array([[ 1,  3, -1, -1], [ 2,  4,  0, -1], [-1,  5,  1, -1],
+               [ 4,  6, -1,  0], [ 5,  7,  3,  1], [-1,  8,  4,  2],
+               [ 7,  9, -1,  3], [ 8, 10,  6,  4], [-1, 11,  7,  5],
+               [10, -1, -1,  6], [11, -1,  9,  7], [-1, -1, 10,  8]])
+
+        LLCATS: NINF CONN
+        """
+        return squad_nodes.adjacent_nodes_at_node(self.shape)
+
     @property
     @return_readonly_id_array
     def patches_at_node(self):
@@ -1231,35 +1311,7 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
         try:
             return self.node_patch_matrix
         except AttributeError:
-            self.node_patch_matrix = np.full((self.number_of_nodes, 4), -1, dtype=int)
-            self.node_patch_matrix[:, 2][
-                np.setdiff1d(
-                    np.arange(self.number_of_nodes),
-                    np.union1d(self.nodes_at_left_edge, self.nodes_at_bottom_edge),
-                )
-            ] = np.arange(self.number_of_patches)
-            self.node_patch_matrix[:, 3][
-                np.setdiff1d(
-                    np.arange(self.number_of_nodes),
-                    np.union1d(self.nodes_at_right_edge, self.nodes_at_bottom_edge),
-                )
-            ] = np.arange(self.number_of_patches)
-            self.node_patch_matrix[:, 1][
-                np.setdiff1d(
-                    np.arange(self.number_of_nodes),
-                    np.union1d(self.nodes_at_left_edge, self.nodes_at_top_edge),
-                )
-            ] = np.arange(self.number_of_patches)
-            self.node_patch_matrix[:, 0][
-                np.setdiff1d(
-                    np.arange(self.number_of_nodes),
-                    np.union1d(self.nodes_at_right_edge, self.nodes_at_top_edge),
-                )
-            ] = np.arange(self.number_of_patches)
-            # we no longer blank out any patches that have a closed node as any
-            # vertex, per modern LL style. Instead, we will make a closed/open
-            # mask
-            self._patches_created = True
+            self.node_patch_matrix = squad_nodes.patches_at_node(self.shape)
             return self.node_patch_matrix
 
     @property
@@ -1381,7 +1433,7 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
         --------
         >>> from landlab import RasterModelGrid
         >>> rmg = RasterModelGrid((3, 4))
-        >>> rmg._links_at_node
+        >>> rmg.links_at_node
         array([[ 0,  3, -1, -1],
                [ 1,  4,  0, -1],
                [ 2,  5,  1, -1],
@@ -1394,6 +1446,7 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
                [15, -1, 14, 11],
                [16, -1, 15, 12],
                [-1, -1, 16, 13]])
+        >>> rmg._create_link_dirs_at_node()
         >>> rmg._link_dirs_at_node
         array([[-1, -1,  0,  0],
                [-1, -1,  1,  0],
@@ -1408,36 +1461,9 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
                [-1,  0,  1,  1],
                [ 0,  0,  1,  1]], dtype=int8)
         """
-        # Create arrays for link-at-node information
-        self._link_dirs_at_node = np.zeros((self.number_of_nodes, 4), dtype=np.int8)
-        num_links_per_row = (self.number_of_node_columns * 2) - 1
-        # Sweep over all links
-        node_at_link_tail = self.node_at_link_tail
-        node_at_link_head = self.node_at_link_head
-        for lk in range(self.number_of_links):
-            # Find the orientation
-            is_horiz = (lk % num_links_per_row) < (self.number_of_node_columns - 1)
-            # Find the IDs of the tail and head nodes
-            t = node_at_link_tail[lk]
-            h = node_at_link_head[lk]
-
-            # If the link is horizontal, the index (row) in the links_at_node
-            # array should be 0 (east) for the tail node, and 2 (west) for the
-            # head node.
-            # If vertical, the index should be 1 (north) for the tail node and
-            # 3 (south) for the head node.
-            if is_horiz:
-                tail_index = 0
-                head_index = 2
-            else:
-                tail_index = 1
-                head_index = 3
-
-            # Add this link to the list for this node, set the direction
-            # (outgoing, indicated by -1), and increment the number found so
-            # far
-            self._link_dirs_at_node[t][tail_index] = -1
-            self._link_dirs_at_node[h][head_index] = 1
+        self._link_dirs_at_node = squad_links.link_dirs_at_node(
+            self.shape, out=np.empty((self.number_of_nodes, 4), dtype=np.int8)
+        )
 
         # setup the active link equivalent
         # self._active_link_dirs_at_node = self._link_dirs_at_node.copy()
@@ -1505,12 +1531,18 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
         >>> mg.unit_vector_at_node[:, 1]
         array([ 1.,  1.,  1.,  1.,  2.,  2.,  2.,  2.,  1.,  1.,  1.,  1.])
         """
-        unit_vec_at_link = np.zeros((self.number_of_links + 1, 2), dtype=float)
+        unit_vec_at_link = np.zeros((self.number_of_links, 2), dtype=float)
         unit_vec_at_link[self.horizontal_links, 0] = 1.
         unit_vec_at_link[self.vertical_links, 1] = 1.
 
-        self._unit_vec_at_node = unit_vec_at_link[self.links_at_node].sum(axis=1)
-        self._unit_vec_at_link = unit_vec_at_link[:-1, :]
+        # Nodes on the left and right edges have one horizontal link, and
+        # nodes on the top and bottom edges have one vertical link.
+        unit_vec_at_node = np.full(self.shape + (2,), 2.)
+        unit_vec_at_node[:, (0, -1), 0] = 1.
+        unit_vec_at_node[(0, -1), :, 1] = 1.
+
+        self._unit_vec_at_node = unit_vec_at_node.reshape((-1, 2))
+        self._unit_vec_at_link = unit_vec_at_link
 
     def _setup_link_at_face(self):
         """Set up links associated with faces.
@@ -18,7 +18,11 @@ from collections import deque
 
 import numpy as np
 
-from landlab.core.utils import make_optional_arg_into_id_array, radians_to_degrees
+from landlab.core.utils import (
+    float_dtype_of,
+    make_optional_arg_into_id_array,
+    radians_to_degrees,
+)
 from landlab.grid import gradients
 from landlab.grid.base import BAD_INDEX_VALUE, CLOSED_BOUNDARY
 from landlab.utils.decorators import use_field_name_or_array
@@ -149,7 +153,7 @@ def calc_grad_at_active_link(grid, node_values, out=None):
     LLCATS: LINF GRAD
     """
     if out is None:
-        out = np.empty(len(grid.active_links), dtype=float)
+        out = np.empty(len(grid.active_links), dtype=float_dtype_of(node_values))
 
     if len(out) != len(grid.active_links):
         raise ValueError("output buffer does not match that of the grid.")
@@ -0,0 +1,164 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+DTYPE = np.int
+ctypedef np.int_t DTYPE_t
+
+ctypedef fused dirs_t:
+    np.int8_t
+    np.int_t
+
+
+# The connectivity of a node of a structured quad grid follows from its row
+# and column alone. Elements around a node are ordered counterclockwise,
+# starting from east (E, N, W, S) for links and adjacent nodes, and starting
+# from north-east (NE, NW, SW, SE) for patches and diagonals. Missing
+# elements are -1.
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _links_at_node(shape, np.ndarray[DTYPE_t, ndim=2] out):
+    cdef long n_rows = shape[0]
+    cdef long n_cols = shape[1]
+    cdef long links_per_row = 2 * n_cols - 1
+    cdef long row, col, node, link
+
+    with nogil:
+        node = 0
+        for row in range(n_rows):
+            for col in range(n_cols):
+                link = row * links_per_row + col
+                out[node, 0] = link if col < n_cols - 1 else -1
+                out[node, 1] = link + n_cols - 1 if row < n_rows - 1 else -1
+                out[node, 2] = link - 1 if col > 0 else -1
+                out[node, 3] = link - n_cols if row > 0 else -1
+                node += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _link_dirs_at_node(shape, np.ndarray[dirs_t, ndim=2] out):
+    cdef long n_rows = shape[0]
+    cdef long n_cols = shape[1]
+    cdef long row, col, node
+
+    with nogil:
+        node = 0
+        for row in range(n_rows):
+            for col in range(n_cols):
+                out[node, 0] = -1 if col < n_cols - 1 else 0
+                out[node, 1] = -1 if row < n_rows - 1 else 0
+                out[node, 2] = 1 if col > 0 else 0
+                out[node, 3] = 1 if row > 0 else 0
+                node += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _adjacent_nodes_at_node(shape, np.ndarray[DTYPE_t, ndim=2] out):
+    cdef long n_rows = shape[0]
+    cdef long n_cols = shape[1]
+    cdef long row, col, node
+
+    with nogil:
+        node = 0
+        for row in range(n_rows):
+            for col in range(n_cols):
+                out[node, 0] = node + 1 if col < n_cols - 1 else -1
+                out[node, 1] = node + n_cols if row < n_rows - 1 else -1
+                out[node, 2] = node - 1 if col > 0 else -1
+                out[node, 3] = node - n_cols if row > 0 else -1
+                node += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _diagonal_adjacent_nodes_at_node(shape, np.ndarray[DTYPE_t, ndim=2] out):
+    cdef long n_rows = shape[0]
+    cdef long n_cols = shape[1]
+    cdef long row, col, node
+    cdef bint has_east, has_north, has_west, has_south
+
+    with nogil:
+        node = 0
+        for row in range(n_rows):
+            for col in range(n_cols):
+                has_east, has_west = col < n_cols - 1, col > 0
+                has_north, has_south = row < n_rows - 1, row > 0
+                out[node, 0] = node + n_cols + 1 if has_north and has_east else -1
+                out[node, 1] = node + n_cols - 1 if has_north and has_west else -1
+                out[node, 2] = node - n_cols - 1 if has_south and has_west else -1
+                out[node, 3] = node - n_cols + 1 if has_south and has_east else -1
+                node += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _patches_at_node(shape, np.ndarray[DTYPE_t, ndim=2] out):
+    cdef long n_rows = shape[0]
+    cdef long n_cols = shape[1]
+    cdef long patches_per_row = n_cols - 1
+    cdef long row, col, node, patch
+    cdef bint has_east, has_north, has_west, has_south
+
+    with nogil:
+        node = 0
+        for row in range(n_rows):
+            for col in range(n_cols):
+                has_east, has_west = col < n_cols - 1, col > 0
+                has_north, has_south = row < n_rows - 1, row > 0
+                patch = row * patches_per_row + col
+                out[node, 0] = patch if has_north and has_east else -1
+                out[node, 1] = patch - 1 if has_north and has_west else -1
+                out[node, 2] = (
+                    patch - patches_per_row - 1 if has_south and has_west else -1
+                )
+                out[node, 3] = (
+                    patch - patches_per_row if has_south and has_east else -1
+                )
+                node += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _d8s_at_node(shape, np.ndarray[DTYPE_t, ndim=2] out):
+    cdef long n_rows = shape[0]
+    cdef long n_cols = shape[1]
+    cdef long links_per_row = 2 * n_cols - 1
+    cdef long n_links = n_rows * links_per_row - n_cols
+    cdef long patches_per_row = n_cols - 1
+    cdef long row, col, node, link, diagonal
+    cdef bint has_east, has_north, has_west, has_south
+
+    with nogil:
+        node = 0
+        for row in range(n_rows):
+            for col in range(n_cols):
+                has_east, has_west = col < n_cols - 1, col > 0
+                has_north, has_south = row < n_rows - 1, row > 0
+
+                link = row * links_per_row + col
+                out[node, 0] = link if has_east else -1
+                out[node, 1] = link + n_cols - 1 if has_north else -1
+                out[node, 2] = link - 1 if has_west else -1
+                out[node, 3] = link - n_cols if has_south else -1
+
+                # Diagonals are numbered after the links, two per patch. The
+                # first goes from the lower-left to the upper-right corner of
+                # the patch and the second from the lower-right to the
+                # upper-left corner.
+                diagonal = n_links + 2 * (row * patches_per_row + col)
+                out[node, 4] = diagonal if has_north and has_east else -1
+                out[node, 5] = diagonal - 1 if has_north and has_west else -1
+                out[node, 6] = (
+                    diagonal - 2 * patches_per_row - 2
+                    if has_south and has_west else -1
+                )
+                out[node, 7] = (
+                    diagonal - 2 * patches_per_row + 1
+                    if has_south and has_east else -1
+                )
+                node += 1
@@ -455,13 +455,45 @@ def node_out_link_ids(shape):
     return _node_link_ids[_node_link_ids >= 0], offset
 
 
-def links_at_node(shape):
+def nodes_at_link(shape, out=None):
+    """Get the tail and head nodes of each link.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    out : (L, 2) ndarray of int, optional
+        Buffer to place the node ids into.
+
+    Returns
+    -------
+    (L, 2) ndarray of int
+        Tail and head node of each link.
+
+    Examples
+    --------
+    >>> from landlab.grid.structured_quad.links import nodes_at_link
+    >>> nodes_at_link((3, 3)) # doctest: +NORMALIZE_WHITESPACE
+    array([[0, 1], [1, 2], [0, 3], [1, 4], [2, 5], [3, 4],
+           [4, 5], [3, 6], [4, 7], [5, 8], [6, 7], [7, 8]])
+    """
+    from ...graph.structured_quad.ext.at_link import fill_nodes_at_link
+
+    if out is None:
+        out = np.empty((number_of_links(shape), 2), dtype=int)
+    fill_nodes_at_link(shape, out)
+    return out
+
+
+def links_at_node(shape, out=None):
     """Get link ids for each node.
 
     Parameters
     ----------
     shape : tuple of int
         Shape of grid of nodes.
+    out : (N, 4) ndarray of int, optional
+        Buffer to place the link ids into.
 
     Returns
     -------
@@ -477,25 +509,23 @@ def links_at_node(shape):
            [10, 12, -1,  7], [11, 13, 10,  8], [-1, 14, 11,  9],
            [15, -1, -1, 12], [16, -1, 15, 13], [-1, -1, 16, 14]])
     """
-    (south_links, west_links) = _node_in_link_ids(shape)
-    (north_links, east_links) = _node_out_link_ids(shape)
+    from .c_nodes import _links_at_node
 
-    return (
-        np.vstack(
-            (east_links.flat, north_links.flat, west_links.flat, south_links.flat)
-        )
-        .transpose()
-        .copy()
-    )
+    if out is None:
+        out = np.empty((nodes.number_of_nodes(shape), 4), dtype=int)
+    _links_at_node(shape, out)
+    return out
 
 
-def link_dirs_at_node(shape):
+def link_dirs_at_node(shape, out=None):
     """Construct a matrix of link directions at each node.
 
     Parameters
     ----------
     shape : tuple of int
         Shape of grid of nodes.
+    out : (N, 4) ndarray of int or int8, optional
+        Buffer to place the link directions into.
 
     Returns
     -------
@@ -511,27 +541,53 @@ def link_dirs_at_node(shape):
            [-1, -1,  0,  1], [-1, -1,  1,  1], [ 0, -1,  1,  1],
            [-1,  0,  0,  1], [-1,  0,  1,  1], [ 0,  0,  1,  1]])
     """
-    south_link_dirs = np.full(shape, 1, dtype=int)
-    south_link_dirs[0, :] = 0
-    north_link_dirs = np.full(shape, -1, dtype=int)
-    north_link_dirs[-1, :] = 0
-    west_link_dirs = np.full(shape, 1, dtype=int)
-    west_link_dirs[:, 0] = 0
-    east_link_dirs = np.full(shape, -1, dtype=int)
-    east_link_dirs[:, -1] = 0
+    from .c_nodes import _link_dirs_at_node
 
-    return (
-        np.vstack(
-            (
-                east_link_dirs.flat,
-                north_link_dirs.flat,
-                west_link_dirs.flat,
-                south_link_dirs.flat,
-            )
-        )
-        .transpose()
-        .copy()
-    )
+    if out is None:
+        out = np.empty((nodes.number_of_nodes(shape), 4), dtype=int)
+    _link_dirs_at_node(shape, out)
+    return out
+
+
+def d8s_at_node(shape, out=None):
+    """Get link and diagonal ids for each node.
+
+    Diagonals are numbered after the links, so that the links and diagonals
+    of a grid together make up its D8 connections.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    out : (N, 8) ndarray of int, optional
+        Buffer to place the link and diagonal ids into.
+
+    Returns
+    -------
+    (N, 8) ndarray of int
+        Links (E, N, W, S) followed by diagonals (NE, NW, SW, SE) at each
+        node.
+
+    Examples
+    --------
+    >>> from landlab.grid.structured_quad.links import d8s_at_node
+    >>> d8s_at_node((3, 3)) # doctest: +NORMALIZE_WHITESPACE
+    array([[ 0,  2, -1, -1, 12, -1, -1, -1],
+           [ 1,  3,  0, -1, 14, 13, -1, -1],
+           [-1,  4,  1, -1, -1, 15, -1, -1],
+           [ 5,  7, -1,  2, 16, -1, -1, 13],
+           [ 6,  8,  5,  3, 18, 17, 12, 15],
+           [-1,  9,  6,  4, -1, 19, 14, -1],
+           [10, -1, -1,  7, -1, -1, -1, 17],
+           [11, -1, 10,  8, -1, -1, 16, 19],
+           [-1, -1, 11,  9, -1, -1, 18, -1]])
+    """
+    from .c_nodes import _d8s_at_node
+
+    if out is None:
+        out = np.empty((nodes.number_of_nodes(shape), 8), dtype=int)
+    _d8s_at_node(shape, out)
+    return out
 
 
 def node_link_ids(shape):
@@ -274,6 +274,104 @@ def perimeter(shape):
     return np.fromiter(perimeter_iter(shape), dtype=np.int)
 
 
+def adjacent_nodes_at_node(shape, out=None):
+    """Get the nodes adjacent to each node.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    out : (N, 4) ndarray of int, optional
+        Buffer to place the node ids into.
+
+    Returns
+    -------
+    (N, 4) ndarray of int
+        Nodes to the east, north, west and south of each node, with -1 for
+        missing neighbors.
+
+    Examples
+    --------
+    >>> from landlab.grid.structured_quad.nodes import adjacent_nodes_at_node
+    >>> adjacent_nodes_at_node((3, 3)) # doctest: +NORMALIZE_WHITESPACE
+    array([[ 1,  3, -1, -1], [ 2,  4,  0, -1], [-1,  5,  1, -1],
+           [ 4,  6, -1,  0], [ 5,  7,  3,  1], [-1,  8,  4,  2],
+           [ 7, -1, -1,  3], [ 8, -1,  6,  4], [-1, -1,  7,  5]])
+    """
+    from .c_nodes import _adjacent_nodes_at_node
+
+    if out is None:
+        out = np.empty((number_of_nodes(shape), 4), dtype=int)
+    _adjacent_nodes_at_node(shape, out)
+    return out
+
+
+def diagonal_adjacent_nodes_at_node(shape, out=None):
+    """Get the nodes diagonally adjacent to each node.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    out : (N, 4) ndarray of int, optional
+        Buffer to place the node ids into.
+
+    Returns
+    -------
+    (N, 4) ndarray of int
+        Nodes to the north-east, north-west, south-west and south-east of
+        each node, with -1 for missing neighbors.
+
+    Examples
+    --------
+    >>> from landlab.grid.structured_quad.nodes import (
+    ...     diagonal_adjacent_nodes_at_node
+    ... )
+    >>> diagonal_adjacent_nodes_at_node((3, 3)) # doctest: +NORMALIZE_WHITESPACE
+    array([[ 4, -1, -1, -1], [ 5,  3, -1, -1], [-1,  4, -1, -1],
+           [ 7, -1, -1,  1], [ 8,  6,  0,  2], [-1,  7,  1, -1],
+           [-1, -1, -1,  4], [-1, -1,  3,  5], [-1, -1,  4, -1]])
+    """
+    from .c_nodes import _diagonal_adjacent_nodes_at_node
+
+    if out is None:
+        out = np.empty((number_of_nodes(shape), 4), dtype=int)
+    _diagonal_adjacent_nodes_at_node(shape, out)
+    return out
+
+
+def patches_at_node(shape, out=None):
+    """Get the patches that touch each node.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    out : (N, 4) ndarray of int, optional
+        Buffer to place the patch ids into.
+
+    Returns
+    -------
+    (N, 4) ndarray of int
+        Patches to the north-east, north-west, south-west and south-east of
+        each node, with -1 for missing patches.
+
+    Examples
+    --------
+    >>> from landlab.grid.structured_quad.nodes import patches_at_node
+    >>> patches_at_node((3, 3)) # doctest: +NORMALIZE_WHITESPACE
+    array([[ 0, -1, -1, -1], [ 1,  0, -1, -1], [-1,  1, -1, -1],
+           [ 2, -1, -1,  0], [ 3,  2,  0,  1], [-1,  3,  1, -1],
+           [-1, -1, -1,  2], [-1, -1,  2,  3], [-1, -1,  3, -1]])
+    """
+    from .c_nodes import _patches_at_node
+
+    if out is None:
+        out = np.empty((number_of_nodes(shape), 4), dtype=int)
+    _patches_at_node(shape, out)
+    return out
+
+
 def status_with_perimeter_as_boundary(shape, node_status=CLOSED_BOUNDARY):
     """Node status for a grid whose boundary is along its perimeter.
 
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from landlab import HexModelGrid, NetworkModelGrid, RasterModelGrid
+from landlab.grid import mappers
+
+GRIDS = [lambda: RasterModelGrid((4, 5), xy_spacing=2.), lambda: HexModelGrid(4, 5)]
+
+NODE_TO_LINK = [
+    "map_link_head_node_to_link",
+    "map_link_tail_node_to_link",
+    "map_min_of_link_nodes_to_link",
+    "map_max_of_link_nodes_to_link",
+    "map_mean_of_link_nodes_to_link",
+]
+LINK_TO_NODE = [
+    "map_min_of_node_links_to_node",
+    "map_max_of_node_links_to_node",
+    "map_upwind_node_link_max_to_node",
+    "map_downwind_node_link_max_to_node",
+    "map_upwind_node_link_mean_to_node",
+    "map_downwind_node_link_mean_to_node",
+]
+NODE_TO_PATCH = [
+    "map_mean_of_patch_nodes_to_patch",
+    "map_max_of_patch_nodes_to_patch",
+    "map_min_of_patch_nodes_to_patch",
+]
+
+
+@pytest.fixture(params=GRIDS)
+def grid(request):
+    grid = request.param()
+    grid.at_node["z"] = np.random.rand(grid.number_of_nodes)
+    grid.at_link["q"] = np.random.rand(grid.number_of_links) - .5
+    return grid
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_grad_keeps_dtype(grid, dtype):
+    z = grid.at_node["z"].astype(dtype)
+    assert grid.calc_grad_at_link(z).dtype == dtype
+    assert grid.calc_diff_at_link(z).dtype == dtype
+    assert_array_almost_equal(
+        grid.calc_grad_at_link(z), grid.calc_grad_at_link("z"), decimal=5
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_divergence_keeps_dtype(grid, dtype):
+    q = grid.at_link["q"].astype(dtype)
+    for func in ("calc_flux_div_at_node", "calc_net_flux_at_node"):
+        assert getattr(grid, func)(q).dtype == dtype
+        assert_array_almost_equal(
+            getattr(grid, func)(q), getattr(grid, func)("q"), decimal=5
+        )
+    assert grid.calc_flux_div_at_cell(q).dtype == dtype
+
+
+@pytest.mark.parametrize("func", NODE_TO_LINK + NODE_TO_PATCH + ["map_node_to_cell"])
+def test_node_mappers_keep_dtype(grid, func):
+    z = grid.at_node["z"].astype(np.float32)
+    actual = getattr(mappers, func)(grid, z)
+    assert actual.dtype == np.float32
+    assert_array_almost_equal(actual, getattr(mappers, func)(grid, "z"), decimal=5)
+
+
+@pytest.mark.parametrize("func", LINK_TO_NODE)
+def test_link_mappers_keep_dtype(grid, func):
+    q = grid.at_link["q"].astype(np.float32)
+    actual = getattr(mappers, func)(grid, q)
+    assert actual.dtype == np.float32
+    assert_array_almost_equal(actual, getattr(mappers, func)(grid, "q"), decimal=5)
+
+
+def test_mappers_of_ints_are_float(grid):
+    z = np.arange(grid.number_of_nodes)
+    assert mappers.map_mean_of_link_nodes_to_link(grid, z).dtype == np.float64
+
+
+def test_value_mappers_keep_dtype(grid):
+    q = grid.at_link["q"].astype(np.float32)
+    z = grid.at_node["z"].astype(np.float32)
+    assert mappers.map_value_at_max_node_to_link(grid, "z", z).dtype == np.float32
+    assert mappers.map_value_at_min_node_to_link(grid, "z", z).dtype == np.float32
+    assert (
+        mappers.map_value_at_upwind_node_link_max_to_node(grid, "q", q).dtype
+        == np.float32
+    )
+    assert (
+        mappers.map_value_at_downwind_node_link_max_to_node(grid, "q", q).dtype
+        == np.float32
+    )
+
+
+def test_default_dtype(grid):
+    grid.default_dtype = np.float32
+    assert grid.add_zeros("node", "water__depth").dtype == np.float32
+    assert grid.add_empty("link", "water__discharge").dtype == np.float32
+    assert grid.add_ones("node", "spam", dtype=float).dtype == np.float64
+
+    grid.at_node["water__depth"][:] = 1.
+    assert grid.calc_grad_at_link("water__depth").dtype == np.float32
+    assert mappers.map_mean_of_link_nodes_to_link(grid, "water__depth").dtype == (
+        np.float32
+    )
+
+
+def test_default_dtype_of_network_grid():
+    grid = NetworkModelGrid(((0, 1, 2), (0, 0, 0)), links=((0, 1), (1, 2)))
+    grid.default_dtype = np.float32
+    assert grid.add_zeros("node", "water__depth").dtype == np.float32
+    assert grid.add_ones("link", "water__discharge").dtype == np.float32
+    assert grid.add_empty("node", "spam", dtype=float).dtype == np.float64
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+
+SHAPES = [(3, 3), (3, 7), (6, 4), (5, 5)]
+
+
+def _node_at_offset(grid, d_row, d_col):
+    rows, cols = np.indices(grid.shape)
+    rows, cols = (rows + d_row).flatten(), (cols + d_col).flatten()
+    is_inside = (rows >= 0) & (rows < grid.shape[0])
+    is_inside &= (cols >= 0) & (cols < grid.shape[1])
+    return np.where(is_inside, rows * grid.shape[1] + cols, -1)
+
+
+def _link_to_node(grid, nodes):
+    link_of_pair = {tuple(pair): link for link, pair in enumerate(grid.nodes_at_link)}
+    links = np.full(grid.number_of_nodes, -1, dtype=int)
+    for node, other in enumerate(nodes):
+        links[node] = link_of_pair.get(
+            (node, other), link_of_pair.get((other, node), -1)
+        )
+    return links
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_links_at_node(shape):
+    grid = RasterModelGrid(shape)
+    neighbors = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    expected = np.column_stack(
+        [_link_to_node(grid, _node_at_offset(grid, *n)) for n in neighbors]
+    )
+    assert_array_equal(grid.links_at_node, expected)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_link_dirs_at_node(shape):
+    grid = RasterModelGrid(shape)
+    expected = np.zeros_like(grid.links_at_node)
+    has_link = grid.links_at_node >= 0
+    at_tail = grid.node_at_link_tail[grid.links_at_node] == np.arange(
+        grid.number_of_nodes
+    ).reshape((-1, 1))
+    expected[has_link & at_tail] = -1
+    expected[has_link & ~at_tail] = 1
+
+    assert grid.link_dirs_at_node.dtype == np.int8
+    assert_array_equal(grid.link_dirs_at_node, expected)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_adjacent_nodes_at_node(shape):
+    grid = RasterModelGrid(shape)
+    expected = np.column_stack(
+        [_node_at_offset(grid, *n) for n in [(0, 1), (1, 0), (0, -1), (-1, 0)]]
+    )
+    assert_array_equal(grid.adjacent_nodes_at_node, expected)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_diagonal_adjacent_nodes_at_node(shape):
+    grid = RasterModelGrid(shape)
+    expected = np.column_stack(
+        [_node_at_offset(grid, *n) for n in [(1, 1), (1, -1), (-1, -1), (-1, 1)]]
+    )
+    assert_array_equal(grid.diagonal_adjacent_nodes_at_node, expected)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_d8s_at_node(shape):
+    grid = RasterModelGrid(shape)
+    diagonals = grid.diagonals_at_node + grid.number_of_links
+    diagonals[grid.diagonals_at_node == -1] = -1
+
+    assert_array_equal(grid.d8s_at_node[:, :4], grid.links_at_node)
+    assert_array_equal(grid.d8s_at_node[:, 4:], diagonals)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_patches_at_node(shape):
+    grid = RasterModelGrid(shape)
+    for node, patches in enumerate(grid.patches_at_node):
+        for patch in patches[patches >= 0]:
+            assert node in grid.nodes_at_patch[patch]
+        assert np.count_nonzero(patches >= 0) == np.count_nonzero(
+            grid.nodes_at_patch == node
+        )
+
+
+def test_connectivity_is_created_when_used():
+    grid = RasterModelGrid((4, 5))
+    assert not hasattr(grid, "_links_at_node")
+    assert not hasattr(grid, "_link_dirs_at_node")
+
+    assert grid.links_at_node.base is grid._links_at_node
+    assert grid.link_dirs_at_node.base is grid._link_dirs_at_node
+
+
+def test_connectivity_is_read_only():
+    grid = RasterModelGrid((4, 5))
+    with pytest.raises(ValueError):
+        grid.links_at_node[0] = 0
+    with pytest.raises(ValueError):
+        grid.link_dirs_at_node[0] = 0
+    with pytest.raises(ValueError):
+        grid.d8s_at_node[0] = 0
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_unit_vector_at_node(shape):
+    grid = RasterModelGrid(shape)
+    unit_vec_at_link = np.vstack((grid.unit_vector_at_link, [0., 0.]))
+    assert_array_equal(
+        grid.unit_vector_at_node, unit_vec_at_link[grid.links_at_node].sum(axis=1)
+    )
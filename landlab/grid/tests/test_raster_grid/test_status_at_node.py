@@ -78,3 +78,123 @@ def test_set_status_with_array():
     assert_array_equal(
         grid.active_links, [9, 10, 11, 12, 14, 15, 16, 18, 19, 20, 21, 23, 24, 25]
     )
+
+
+def test_batch_status_update():
+    """Test that a batch resets the grid once, at its end."""
+    grid = RasterModelGrid((4, 5))
+    expected = RasterModelGrid((4, 5))
+    expected.status_at_node[expected.nodes_at_left_edge] = CB
+
+    active_links = grid.active_links.copy()
+    bc_set_code = grid.bc_set_code
+    with grid.batch_status_update():
+        for node in grid.nodes_at_left_edge:
+            grid.status_at_node[node] = CB
+        assert grid.bc_set_code == bc_set_code
+        assert_array_equal(grid.active_links, active_links)
+
+    assert grid.bc_set_code == bc_set_code + 1
+    assert_array_equal(grid.status_at_node, expected.status_at_node)
+    assert_array_equal(grid.status_at_link, expected.status_at_link)
+    assert_array_equal(grid.active_links, expected.active_links)
+    assert_array_equal(grid.core_nodes, expected.core_nodes)
+
+
+def test_batch_status_update_is_nestable():
+    """Test that nested batches reset the grid at the end of the outer one."""
+    grid = RasterModelGrid((4, 5))
+    bc_set_code = grid.bc_set_code
+    with grid.batch_status_update():
+        with grid.batch_status_update():
+            grid.status_at_node[6] = CB
+        grid.status_at_node = np.full(20, CB)
+        assert grid.bc_set_code == bc_set_code
+
+    assert grid.bc_set_code == bc_set_code + 1
+    assert grid.active_links.size == 0
+
+
+def test_batch_status_update_without_changes():
+    """Test that a batch without changes does not reset the grid."""
+    grid = RasterModelGrid((4, 5))
+    bc_set_code = grid.bc_set_code
+    with grid.batch_status_update():
+        pass
+    assert grid.bc_set_code == bc_set_code
+
+
+def test_batch_status_update_with_error():
+    """Test that the grid is reset if a batch is interrupted."""
+    grid = RasterModelGrid((4, 5))
+    grid.active_links
+    try:
+        with grid.batch_status_update():
+            grid.status_at_node[6] = CB
+            raise RuntimeError()
+    except RuntimeError:
+        pass
+
+    assert 6 not in grid.core_nodes
+    grid.status_at_node[7] = CB
+    assert 7 not in grid.core_nodes
+
+
+def test_status_at_link_is_updated_in_place():
+    """Test that changing a few nodes only patches the status of links."""
+    grid = RasterModelGrid((6, 7))
+    grid.status_at_link, grid.active_adjacent_nodes_at_node, grid.status_at_diagonal
+    status_at_link = grid._status_at_link
+    bc_set_code = grid.bc_set_code
+
+    grid.status_at_node[[8, 16, 30]] = CB
+    grid.status_at_node[9] = FV
+
+    expected = RasterModelGrid((6, 7))
+    expected.status_at_node = grid.status_at_node
+
+    assert grid._status_at_link is status_at_link
+    assert_array_equal(grid.status_at_link, expected.status_at_link)
+    assert_array_equal(grid.active_links, expected.active_links)
+    assert_array_equal(grid.link_status_at_node, expected.link_status_at_node)
+    assert_array_equal(
+        grid.active_link_dirs_at_node, expected.active_link_dirs_at_node
+    )
+    assert_array_equal(
+        grid.active_adjacent_nodes_at_node, expected.active_adjacent_nodes_at_node
+    )
+    assert_array_equal(grid.status_at_diagonal, expected.status_at_diagonal)
+    assert_array_equal(grid.status_at_d8, expected.status_at_d8)
+
+    changed = np.flatnonzero(
+        RasterModelGrid((6, 7)).status_at_link != expected.status_at_link
+    )
+    assert set(changed) <= set(grid.changed_links_since(bc_set_code))
+
+
+def test_changed_links_since_with_unchanged_links():
+    """Test a status change that doesn't change the status of links."""
+    grid = RasterModelGrid((4, 5))
+    grid.status_at_link
+    bc_set_code = grid.bc_set_code
+    grid.status_at_node[0] = CB
+
+    assert grid.bc_set_code == bc_set_code + 1
+    assert grid.changed_links_since(bc_set_code).size == 0
+    assert grid.changed_links_since(bc_set_code - 1) is None
+
+
+def test_link_status_at_node_when_last_link_changes():
+    """Test updating nodes with missing links after the last link changes."""
+    grid = RasterModelGrid((4, 5))
+    grid.link_status_at_node, grid.active_adjacent_nodes_at_node
+    grid.status_at_node[18] = 0
+
+    expected = RasterModelGrid((4, 5))
+    expected.status_at_node = grid.status_at_node
+
+    assert grid.status_at_link[-1] != RasterModelGrid((4, 5)).status_at_link[-1]
+    assert_array_equal(grid.link_status_at_node, expected.link_status_at_node)
+    assert_array_equal(
+        grid.active_adjacent_nodes_at_node, expected.active_adjacent_nodes_at_node
+    )
@@ -0,0 +1,145 @@
+import gc
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from landlab import CORE_NODE, FieldError, RasterModelGrid
+from landlab.grid.tiled import TiledRasterModelGrid, _Finalizer
+
+
+@pytest.mark.parametrize("tile_shape", [(1, 1), (2, 3), (4, 4), (100, 100)])
+def test_connectivity(tile_shape):
+    grid = RasterModelGrid((7, 9))
+    with TiledRasterModelGrid((7, 9), tile_shape=tile_shape) as tiled:
+        assert tiled.number_of_nodes == grid.number_of_nodes
+        assert tiled.number_of_links == grid.number_of_links
+
+        nodes = np.arange(grid.number_of_nodes)
+        links = np.arange(grid.number_of_links)
+        assert_array_equal(tiled.nodes_at_link(links), grid.nodes_at_link)
+        assert_array_equal(tiled.links_at_node(nodes), grid.links_at_node)
+        assert_array_equal(tiled.link_dirs_at_node(nodes), grid.link_dirs_at_node)
+        assert_array_equal(tiled.status_at_node, grid.status_at_node)
+
+
+@pytest.mark.parametrize("tile_shape", [(1, 1), (2, 3), (5, 4)])
+def test_tiles_cover_grid(tile_shape):
+    with TiledRasterModelGrid((7, 9), tile_shape=tile_shape) as tiled:
+        count = np.zeros(tiled.shape, dtype=int)
+        for tile in tiled.tiles(halo=2):
+            count[tile.rows, tile.cols] += 1
+            padded = np.zeros(count.shape, dtype=bool)
+            padded[tile.padded_rows, tile.padded_cols] = True
+            assert padded[tile.rows, tile.cols].all()
+        assert np.all(count == 1)
+
+
+def test_read_and_write_tiles():
+    values = np.arange(63.)
+    with TiledRasterModelGrid((7, 9), tile_shape=(3, 4)) as tiled:
+        z = tiled.add_field("node", "topographic__elevation", values)
+        doubled = tiled.add_zeros("node", "doubled")
+        for tile in tiled.tiles(halo=1):
+            block = tiled.read_tile("topographic__elevation", tile)
+            assert_array_equal(
+                block, values.reshape((7, 9))[tile.padded_rows, tile.padded_cols]
+            )
+            tiled.write_tile(doubled, tile, 2. * block)
+        assert_array_equal(doubled, 2. * z)
+
+
+def test_diffusion_matches_raster_grid():
+    D, dt = 0.1, 1.
+    z0 = np.random.rand(11 * 13)
+
+    grid = RasterModelGrid((11, 13), xy_spacing=2.)
+    z = grid.add_field("node", "topographic__elevation", z0.copy())
+    for _ in range(10):
+        q = -D * grid.calc_grad_at_link(z)
+        z[grid.core_nodes] -= dt * grid.calc_flux_div_at_node(q)[grid.core_nodes]
+
+    with TiledRasterModelGrid((11, 13), xy_spacing=2., tile_shape=(4, 5)) as tiled:
+        z_tiled = tiled.add_field("node", "topographic__elevation", z0)
+        q = tiled.add_zeros("link", "sediment__flux")
+        dzdt = tiled.add_zeros("node", "topographic__elevation_rate")
+        is_core = tiled.status_at_node == CORE_NODE
+        for _ in range(10):
+            tiled.calc_grad_at_link("topographic__elevation", out=q)
+            q *= -D
+            tiled.calc_flux_div_at_node(q, out=dzdt)
+            z_tiled[is_core] -= dt * dzdt[is_core]
+
+        assert_array_almost_equal(z_tiled, z)
+
+
+def test_fields_in_directory(tmpdir):
+    with TiledRasterModelGrid((4, 5), directory=str(tmpdir)) as tiled:
+        tiled.add_field("node", "topographic__elevation", np.arange(20.))
+        tiled.add_ones("link", "sediment__flux")
+    assert_array_equal(
+        np.load(str(tmpdir.join("node__topographic__elevation.npy"))), np.arange(20.)
+    )
+    assert_array_equal(np.load(str(tmpdir.join("link__sediment__flux.npy"))), 1.)
+
+
+def test_temporary_directory_is_removed():
+    tiled = TiledRasterModelGrid((4, 5))
+    tiled.add_zeros("node", "topographic__elevation")
+    tiled.calc_grad_at_link("topographic__elevation")
+    assert os.path.isdir(tiled.directory)
+    tiled.close()
+    assert not os.path.exists(tiled.directory)
+    tiled.close()
+
+
+def test_temporary_directory_is_removed_with_grid():
+    tiled = TiledRasterModelGrid((4, 5))
+    tiled.add_zeros("node", "topographic__elevation")
+    directory = tiled.directory
+    del tiled
+    gc.collect()
+    assert not os.path.exists(directory)
+
+
+def test_finalizer_fallback():
+    class Obj(object):
+        pass
+
+    calls = []
+    obj = Obj()
+    finalizer = _Finalizer(obj, calls.append, "collected")
+    del obj
+    gc.collect()
+    assert calls == ["collected"]
+    finalizer()
+    assert calls == ["collected"]
+
+    obj = Obj()
+    _Finalizer(obj, calls.append, "at exit")
+    _Finalizer._call_all()
+    assert calls == ["collected", "at exit"]
+
+
+def test_bad_fields():
+    with TiledRasterModelGrid((4, 5)) as tiled:
+        tiled.add_zeros("node", "topographic__elevation")
+        with pytest.raises(FieldError):
+            tiled.add_zeros("node", "topographic__elevation")
+        tiled.add_ones("node", "topographic__elevation", noclobber=False)
+        assert_array_equal(tiled.at_node["topographic__elevation"], 1.)
+
+        with pytest.raises(ValueError):
+            tiled.add_field("node", "soil__depth", np.zeros(19))
+        with pytest.raises(ValueError):
+            tiled.add_zeros("cell", "soil__depth")
+        with pytest.raises(ValueError):
+            tiled.calc_grad_at_link("topographic__elevation", out=np.empty(30))
+
+
+def test_bad_shapes():
+    with pytest.raises(ValueError):
+        TiledRasterModelGrid((2, 5))
+    with pytest.raises(ValueError):
+        TiledRasterModelGrid((4, 5), tile_shape=(0, 5))
@@ -0,0 +1,772 @@
+#! /usr/bin/env python
+"""A raster grid, too large to fit into memory, that is processed in tiles.
+
+Tiled raster grids
+++++++++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.grid.tiled.TiledRasterModelGrid
+    ~landlab.grid.tiled.Tile
+
+A :class:`~landlab.grid.tiled.TiledRasterModelGrid` stores its fields as
+disk-backed (memory-mapped) arrays and does not store any connectivity
+arrays. Node and link ids, and the connections between them, follow those
+of a :class:`~landlab.RasterModelGrid` of the same shape but are calculated
+from the shape of the grid when needed. Local operators, like gradients and
+divergences, are evaluated a tile (plus a halo of nodes around it) at a
+time so that only a tile's worth of values need be in memory at once.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+import weakref
+from collections import namedtuple
+
+import numpy as np
+import six
+
+from ..field.scalar_data_fields import FieldError
+from .base import CORE_NODE, FIXED_VALUE_BOUNDARY
+
+
+class _Finalizer(object):
+
+    """Call a function when an object is garbage collected, or at exit.
+
+    A minimal stand-in for :class:`weakref.finalize`, which python 2 does
+    not have. Calling the finalizer calls the function, at most once.
+    """
+
+    _alive = set()
+
+    def __init__(self, obj, func, *args, **kwds):
+        self._func, self._args, self._kwds = func, args, kwds
+        self._ref = weakref.ref(obj, self)
+        _Finalizer._alive.add(self)
+
+    def __call__(self, *args):
+        if self in _Finalizer._alive:
+            _Finalizer._alive.discard(self)
+            return self._func(*self._args, **self._kwds)
+
+    @classmethod
+    def _call_all(cls):
+        for finalizer in list(cls._alive):
+            finalizer()
+
+
+try:
+    _finalize = weakref.finalize
+except AttributeError:
+    _finalize = _Finalizer
+    atexit.register(_Finalizer._call_all)
+
+
+class Tile(namedtuple("Tile", ["rows", "cols", "padded_rows", "padded_cols"])):
+
+    """A block of nodes of a tiled grid.
+
+    Attributes
+    ----------
+    rows, cols : slice
+        Rows and columns of nodes in the tile.
+    padded_rows, padded_cols : slice
+        Rows and columns of the tile plus its halo (clipped to the grid).
+    """
+
+    __slots__ = ()
+
+    @property
+    def shape(self):
+        """Shape of the tile, without its halo."""
+        return (self.rows.stop - self.rows.start, self.cols.stop - self.cols.start)
+
+    @property
+    def interior(self):
+        """Slices of a padded block that select the tile's nodes."""
+        row_start = self.rows.start - self.padded_rows.start
+        col_start = self.cols.start - self.padded_cols.start
+        return (
+            slice(row_start, row_start + self.shape[0]),
+            slice(col_start, col_start + self.shape[1]),
+        )
+
+
+class TiledRasterModelGrid(object):
+
+    """A raster grid whose fields are stored on disk and processed in tiles.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Number of rows and columns of nodes.
+    xy_spacing : float or tuple of float, optional
+        Node spacing along x and y.
+    xy_of_lower_left : tuple of float, optional
+        Coordinates of the lower-left node.
+    tile_shape : tuple of int, optional
+        Number of rows and columns of nodes in a tile.
+    directory : str, optional
+        Directory to store fields in, as *.npy* files named
+        *<at>__<name>.npy*. If not given, fields are stored in a temporary
+        directory that is removed when the grid is closed, garbage
+        collected, or when the interpreter exits.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.tiled import TiledRasterModelGrid
+    >>> grid = TiledRasterModelGrid((4, 5), tile_shape=(2, 3))
+    >>> grid.number_of_nodes, grid.number_of_links
+    (20, 31)
+    >>> [tile.shape for tile in grid.tiles()]
+    [(2, 3), (2, 2), (2, 3), (2, 2)]
+
+    Connectivity is calculated from node and link ids.
+
+    >>> grid.nodes_at_link([0, 4, 30])
+    array([[ 0,  1],
+           [ 0,  5],
+           [18, 19]])
+    >>> grid.links_at_node([0, 6])
+    array([[ 0,  4, -1, -1],
+           [10, 14,  9,  5]])
+
+    Fields are memory-mapped arrays.
+
+    >>> z = grid.add_field("node", "topographic__elevation", np.arange(20.) ** 2)
+    >>> isinstance(z, np.memmap)
+    True
+    >>> grad = grid.calc_grad_at_link("topographic__elevation")
+    >>> grad[:4]
+    memmap([ 1.,  3.,  5.,  7.])
+    >>> div = grid.calc_flux_div_at_node(grad)
+    >>> div.reshape((4, 5))
+    memmap([[  0.,   0.,   0.,   0.,   0.],
+            [  0.,  52.,  52.,  52.,   0.],
+            [  0.,  52.,  52.,  52.,   0.],
+            [  0.,   0.,   0.,   0.,   0.]])
+    >>> grid.close()
+    """
+
+    def __init__(
+        self,
+        shape,
+        xy_spacing=1.,
+        xy_of_lower_left=(0., 0.),
+        tile_shape=(1024, 1024),
+        directory=None,
+    ):
+        shape = tuple(int(n) for n in shape)
+        if len(shape) != 2 or shape[0] < 3 or shape[1] < 3:
+            raise ValueError("grid must have at least three rows and columns")
+        tile_shape = tuple(int(n) for n in tile_shape)
+        if len(tile_shape) != 2 or tile_shape[0] < 1 or tile_shape[1] < 1:
+            raise ValueError("tile must have at least one row and column")
+
+        self._shape = shape
+        self._tile_shape = tile_shape
+        self._dx, self._dy = np.broadcast_to(xy_spacing, (2,)).astype(float)
+        self._xy_of_lower_left = tuple(float(xy) for xy in xy_of_lower_left)
+
+        if directory is None:
+            self._directory = tempfile.mkdtemp(prefix="landlab-")
+            self._remove_directory = _finalize(
+                self, shutil.rmtree, self._directory, ignore_errors=True
+            )
+        else:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            self._directory = directory
+            self._remove_directory = None
+
+        self._groups = {"node": {}, "link": {}}
+        self._status_at_node = None
+
+    @property
+    def shape(self):
+        """Number of rows and columns of nodes."""
+        return self._shape
+
+    @property
+    def tile_shape(self):
+        """Number of rows and columns of nodes in a tile."""
+        return self._tile_shape
+
+    @property
+    def dx(self):
+        """Spacing of columns of nodes."""
+        return self._dx
+
+    @property
+    def dy(self):
+        """Spacing of rows of nodes."""
+        return self._dy
+
+    @property
+    def xy_of_lower_left(self):
+        """Coordinates of the lower-left node."""
+        return self._xy_of_lower_left
+
+    @property
+    def directory(self):
+        """Directory that holds the fields."""
+        return self._directory
+
+    @property
+    def number_of_nodes(self):
+        """Number of nodes."""
+        return self._shape[0] * self._shape[1]
+
+    @property
+    def number_of_links(self):
+        """Number of links."""
+        n_rows, n_cols = self._shape
+        return n_rows * (n_cols - 1) + (n_rows - 1) * n_cols
+
+    @property
+    def at_node(self):
+        """Fields defined at nodes."""
+        return self._groups["node"]
+
+    @property
+    def at_link(self):
+        """Fields defined at links."""
+        return self._groups["link"]
+
+    def __getitem__(self, group):
+        return self._groups[group]
+
+    def number_of_elements(self, at):
+        """Number of elements of a given type."""
+        if at == "node":
+            return self.number_of_nodes
+        elif at == "link":
+            return self.number_of_links
+        else:
+            raise ValueError("{0}: fields must be at nodes or links".format(at))
+
+    def _path_to_field(self, at, name):
+        return os.path.join(self._directory, "{0}__{1}.npy".format(at, name))
+
+    def add_empty(self, at, name, dtype=float, noclobber=True):
+        """Add a new, uninitialized, disk-backed field.
+
+        Parameters
+        ----------
+        at : {'node', 'link'}
+            Grid element the values are defined at.
+        name : str
+            Name of the field.
+        dtype : data-type, optional
+            Data type of the field.
+        noclobber : bool, optional
+            Raise an exception if the field already exists.
+
+        Returns
+        -------
+        numpy.memmap
+            The values of the field.
+        """
+        size = self.number_of_elements(at)
+        if noclobber and name in self[at]:
+            raise FieldError("{name}@{at}".format(name=name, at=at))
+
+        self[at].pop(name, None)
+        values = np.lib.format.open_memmap(
+            self._path_to_field(at, name), mode="w+", dtype=dtype, shape=(size,)
+        )
+        self[at][name] = values
+        return values
+
+    def add_zeros(self, at, name, dtype=float, noclobber=True):
+        """Add a new disk-backed field filled with zeros.
+
+        Parameters
+        ----------
+        at : {'node', 'link'}
+            Grid element the values are defined at.
+        name : str
+            Name of the field.
+        dtype : data-type, optional
+            Data type of the field.
+        noclobber : bool, optional
+            Raise an exception if the field already exists.
+
+        Returns
+        -------
+        numpy.memmap
+            The values of the field.
+        """
+        return self.add_full(at, name, 0, dtype=dtype, noclobber=noclobber)
+
+    def add_ones(self, at, name, dtype=float, noclobber=True):
+        """Add a new disk-backed field filled with ones.
+
+        Parameters
+        ----------
+        at : {'node', 'link'}
+            Grid element the values are defined at.
+        name : str
+            Name of the field.
+        dtype : data-type, optional
+            Data type of the field.
+        noclobber : bool, optional
+            Raise an exception if the field already exists.
+
+        Returns
+        -------
+        numpy.memmap
+            The values of the field.
+        """
+        return self.add_full(at, name, 1, dtype=dtype, noclobber=noclobber)
+
+    def add_full(self, at, name, fill_value, dtype=float, noclobber=True):
+        """Add a new disk-backed field filled with a value.
+
+        Parameters
+        ----------
+        at : {'node', 'link'}
+            Grid element the values are defined at.
+        name : str
+            Name of the field.
+        fill_value : scalar
+            Value of every element.
+        dtype : data-type, optional
+            Data type of the field.
+        noclobber : bool, optional
+            Raise an exception if the field already exists.
+
+        Returns
+        -------
+        numpy.memmap
+            The values of the field.
+        """
+        values = self.add_empty(at, name, dtype=dtype, noclobber=noclobber)
+        for start, stop in self._blocks(values.size):
+            values[start:stop] = fill_value
+        return values
+
+    def add_field(self, at, name, values, noclobber=True):
+        """Add a disk-backed field, copying values, a block at a time.
+
+        Parameters
+        ----------
+        at : {'node', 'link'}
+            Grid element the values are defined at.
+        name : str
+            Name of the field.
+        values : array_like
+            Values of the field (which can themselves be memory-mapped).
+        noclobber : bool, optional
+            Raise an exception if the field already exists.
+
+        Returns
+        -------
+        numpy.memmap
+            The values of the field.
+        """
+        values = np.asanyarray(values).reshape((-1,))
+        if values.size != self.number_of_elements(at):
+            raise ValueError(
+                "{name}@{at}: size mismatch ({size} != {expected})".format(
+                    name=name,
+                    at=at,
+                    size=values.size,
+                    expected=self.number_of_elements(at),
+                )
+            )
+        field = self.add_empty(at, name, dtype=values.dtype, noclobber=noclobber)
+        for start, stop in self._blocks(values.size):
+            field[start:stop] = values[start:stop]
+        return field
+
+    def _blocks(self, size):
+        """Ranges of elements, about a tile's worth, to process at a time."""
+        step = self._tile_shape[0] * self._tile_shape[1]
+        for start in range(0, size, step):
+            yield start, min(start + step, size)
+
+    @property
+    def status_at_node(self):
+        """Status of each node (disk-backed).
+
+        Nodes on the perimeter of the grid are fixed-value boundaries, all
+        others are core nodes.
+
+        Examples
+        --------
+        >>> from landlab.grid.tiled import TiledRasterModelGrid
+        >>> grid = TiledRasterModelGrid((3, 4), tile_shape=(2, 2))
+        >>> grid.status_at_node.reshape((3, 4))
+        memmap([[1, 1, 1, 1],
+                [1, 0, 0, 1],
+                [1, 1, 1, 1]], dtype=uint8)
+        >>> grid.close()
+        """
+        if self._status_at_node is None:
+            status = np.lib.format.open_memmap(
+                os.path.join(self._directory, "status_at_node.npy"),
+                mode="w+",
+                dtype=np.uint8,
+                shape=(self.number_of_nodes,),
+            )
+            n_rows, n_cols = self._shape
+            for tile in self.tiles():
+                block = np.full(tile.shape, CORE_NODE, dtype=np.uint8)
+                rows = np.arange(tile.rows.start, tile.rows.stop)
+                cols = np.arange(tile.cols.start, tile.cols.stop)
+                block[(rows == 0) | (rows == n_rows - 1), :] = FIXED_VALUE_BOUNDARY
+                block[:, (cols == 0) | (cols == n_cols - 1)] = FIXED_VALUE_BOUNDARY
+                self.write_tile(status, tile, block, padded=False)
+            self._status_at_node = status
+        return self._status_at_node
+
+    def nodes_at_link(self, links):
+        """Tail and head nodes of links.
+
+        Parameters
+        ----------
+        links : array_like of int
+            Link ids.
+
+        Returns
+        -------
+        ndarray of int, shape `(n_links, 2)`
+            Tail and head node of each link.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.grid.tiled import TiledRasterModelGrid
+        >>> grid = TiledRasterModelGrid((3, 4))
+        >>> links = np.arange(grid.number_of_links)
+        >>> np.all(grid.nodes_at_link(links) == RasterModelGrid((3, 4)).nodes_at_link)
+        True
+        >>> grid.close()
+        """
+        links = np.asarray(links, dtype=int)
+        n_cols = self._shape[1]
+        row, offset = np.divmod(links, 2 * n_cols - 1)
+        is_horizontal = offset < n_cols - 1
+
+        out = np.empty(links.shape + (2,), dtype=int)
+        out[..., 0] = row * n_cols + np.where(
+            is_horizontal, offset, offset - (n_cols - 1)
+        )
+        out[..., 1] = out[..., 0] + np.where(is_horizontal, 1, n_cols)
+        return out
+
+    def links_at_node(self, nodes):
+        """Links (east, north, west, south) of nodes, or -1.
+
+        Parameters
+        ----------
+        nodes : array_like of int
+            Node ids.
+
+        Returns
+        -------
+        ndarray of int, shape `(n_nodes, 4)`
+            Links to the east, north, west and south of each node, or -1
+            if there is no link.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.grid.tiled import TiledRasterModelGrid
+        >>> grid = TiledRasterModelGrid((3, 4))
+        >>> nodes = np.arange(grid.number_of_nodes)
+        >>> np.all(grid.links_at_node(nodes) == RasterModelGrid((3, 4)).links_at_node)
+        True
+        >>> grid.close()
+        """
+        nodes = np.asarray(nodes, dtype=int)
+        n_rows, n_cols = self._shape
+        row, col = np.divmod(nodes, n_cols)
+        first_link = row * (2 * n_cols - 1)
+
+        out = np.empty(nodes.shape + (4,), dtype=int)
+        out[..., 0] = np.where(col < n_cols - 1, first_link + col, -1)
+        out[..., 1] = np.where(row < n_rows - 1, first_link + n_cols - 1 + col, -1)
+        out[..., 2] = np.where(col > 0, first_link + col - 1, -1)
+        out[..., 3] = np.where(row > 0, first_link - n_cols + col, -1)
+        return out
+
+    def link_dirs_at_node(self, nodes):
+        """Directions of links at nodes.
+
+        Directions are -1 for links that leave a node, 1 for links that
+        enter it, and 0 if there is no link.
+
+        Examples
+        --------
+        >>> from landlab.grid.tiled import TiledRasterModelGrid
+        >>> grid = TiledRasterModelGrid((3, 4))
+        >>> grid.link_dirs_at_node([0, 5, 11])
+        array([[-1, -1,  0,  0],
+               [-1, -1,  1,  1],
+               [ 0,  0,  1,  1]], dtype=int8)
+        >>> grid.close()
+        """
+        dirs = np.array([-1, -1, 1, 1], dtype=np.int8)
+        return np.where(self.links_at_node(nodes) == -1, 0, dirs).astype(np.int8)
+
+    def tiles(self, halo=0):
+        """Iterate over the tiles of the grid.
+
+        Parameters
+        ----------
+        halo : int, optional
+            Width, in nodes, of the halo around each tile.
+
+        Yields
+        ------
+        Tile
+            Tiles, row by row, starting from the lower left.
+
+        Examples
+        --------
+        >>> from landlab.grid.tiled import TiledRasterModelGrid
+        >>> grid = TiledRasterModelGrid((4, 5), tile_shape=(2, 3))
+        >>> tile = next(grid.tiles(halo=1))
+        >>> tile.rows, tile.cols
+        (slice(0, 2, None), slice(0, 3, None))
+        >>> tile.padded_rows, tile.padded_cols
+        (slice(0, 3, None), slice(0, 4, None))
+        >>> grid.close()
+        """
+        n_rows, n_cols = self._shape
+        tile_rows, tile_cols = self._tile_shape
+        for row in range(0, n_rows, tile_rows):
+            for col in range(0, n_cols, tile_cols):
+                rows = slice(row, min(row + tile_rows, n_rows))
+                cols = slice(col, min(col + tile_cols, n_cols))
+                yield Tile(
+                    rows,
+                    cols,
+                    slice(max(rows.start - halo, 0), min(rows.stop + halo, n_rows)),
+                    slice(max(cols.start - halo, 0), min(cols.stop + halo, n_cols)),
+                )
+
+    def _as_node_array(self, values):
+        if isinstance(values, six.string_types):
+            values = self.at_node[values]
+        return np.asanyarray(values).reshape(self._shape)
+
+    def _as_link_arrays(self, values):
+        """Horizontal and vertical link values as views shaped like nodes."""
+        if isinstance(values, six.string_types):
+            values = self.at_link[values]
+        values = np.asanyarray(values).reshape((-1,))
+        if values.size != self.number_of_links:
+            raise ValueError("values must be given at links")
+
+        n_rows, n_cols = self._shape
+        stride = values.strides[0]
+        horizontal = np.lib.stride_tricks.as_strided(
+            values,
+            shape=(n_rows, n_cols - 1),
+            strides=((2 * n_cols - 1) * stride, stride),
+        )
+        vertical = np.lib.stride_tricks.as_strided(
+            values[n_cols - 1 :],
+            shape=(n_rows - 1, n_cols),
+            strides=((2 * n_cols - 1) * stride, stride),
+        )
+        return horizontal, vertical
+
+    def read_tile(self, values, tile, padded=True):
+        """Read node values of a tile into memory.
+
+        Parameters
+        ----------
+        values : str or array_like
+            Node field name or values at nodes.
+        tile : Tile
+            The tile to read.
+        padded : bool, optional
+            Include the tile's halo.
+
+        Returns
+        -------
+        ndarray
+            Values of the tile's nodes as a 2D array.
+        """
+        values = self._as_node_array(values)
+        if padded:
+            return np.array(values[tile.padded_rows, tile.padded_cols])
+        else:
+            return np.array(values[tile.rows, tile.cols])
+
+    def write_tile(self, values, tile, block, padded=True):
+        """Write node values of a tile.
+
+        Parameters
+        ----------
+        values : str or array_like
+            Node field name or values at nodes to write into.
+        tile : Tile
+            The tile to write.
+        block : ndarray
+            Values of the tile's nodes, including the tile's halo if
+            *padded*. Values in the halo are not written.
+        padded : bool, optional
+            Indicates that *block* includes the tile's halo.
+        """
+        values = self._as_node_array(values)
+        if padded:
+            block = block[tile.interior]
+        values[tile.rows, tile.cols] = block
+
+    def empty(self, at, dtype=float):
+        """A new, disk-backed, array of values that is not a field.
+
+        The array is backed by an anonymous file, in the grid's directory,
+        that is removed once the array is no longer used.
+        """
+        return np.memmap(
+            tempfile.TemporaryFile(dir=self._directory),
+            dtype=dtype,
+            mode="w+",
+            shape=(self.number_of_elements(at),),
+        )
+
+    def _get_output(self, at, out):
+        if out is None:
+            return self.empty(at)
+        elif isinstance(out, six.string_types):
+            if out in self[at]:
+                return self[at][out]
+            return self.add_empty(at, out)
+        elif np.asanyarray(out).size != self.number_of_elements(at):
+            raise ValueError("out must be an array of values at {0}s".format(at))
+        else:
+            return out
+
+    def calc_grad_at_link(self, node_values, out=None):
+        """Calculate gradients of node values at links, a tile at a time.
+
+        Parameters
+        ----------
+        node_values : str or array_like
+            Node field name or values at nodes.
+        out : str or ndarray, optional
+            Name of a link field, or an array, to hold the result. If not
+            given, a new disk-backed array.
+
+        Returns
+        -------
+        ndarray
+            Gradients at links.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.grid.tiled import TiledRasterModelGrid
+        >>> z = np.random.rand(30)
+        >>> with TiledRasterModelGrid((5, 6), tile_shape=(2, 2)) as grid:
+        ...     grad = grid.calc_grad_at_link(z)
+        ...     np.allclose(grad, RasterModelGrid((5, 6)).calc_grad_at_link(z))
+        True
+        """
+        out = self._get_output("link", out)
+        values = self._as_node_array(node_values)
+        horizontal, vertical = self._as_link_arrays(out)
+
+        n_rows, n_cols = self._shape
+        for tile in self.tiles():
+            rows, cols = tile.rows, tile.cols
+
+            stop = min(cols.stop + 1, n_cols)
+            block = np.array(values[rows, cols.start : stop], dtype=float)
+            horizontal[rows, cols.start : stop - 1] = np.diff(block, axis=1) / self.dx
+
+            stop = min(rows.stop + 1, n_rows)
+            block = np.array(values[rows.start : stop, cols], dtype=float)
+            vertical[rows.start : stop - 1, cols] = np.diff(block, axis=0) / self.dy
+
+        return out
+
+    def calc_flux_div_at_node(self, unit_flux, out=None):
+        """Calculate divergence of link fluxes at nodes, a tile at a time.
+
+        Divergences are calculated at nodes that are not on the perimeter
+        of the grid. Perimeter nodes of a new output array are zero.
+
+        Parameters
+        ----------
+        unit_flux : str or array_like
+            Link field name or fluxes per unit width at links.
+        out : str or ndarray, optional
+            Name of a node field, or an array, to hold the result. If not
+            given, a new disk-backed array.
+
+        Returns
+        -------
+        ndarray
+            Divergence of fluxes at nodes.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.grid.tiled import TiledRasterModelGrid
+        >>> q = np.random.rand(49)
+        >>> grid = RasterModelGrid((5, 6), xy_spacing=2.)
+        >>> with TiledRasterModelGrid((5, 6), xy_spacing=2., tile_shape=(2, 3)) as t:
+        ...     div = t.calc_flux_div_at_node(q)
+        ...     np.allclose(np.asarray(div), grid.calc_flux_div_at_node(q))
+        True
+        """
+        is_new = out is None
+        out = self._get_output("node", out)
+        values = self._as_node_array(out)
+        horizontal, vertical = self._as_link_arrays(unit_flux)
+
+        n_rows, n_cols = self._shape
+        for tile in self.tiles():
+            rows = slice(max(tile.rows.start, 1), min(tile.rows.stop, n_rows - 1))
+            cols = slice(max(tile.cols.start, 1), min(tile.cols.stop, n_cols - 1))
+            if is_new:
+                values[tile.rows, tile.cols] = 0.
+            if rows.start >= rows.stop or cols.start >= cols.stop:
+                continue
+
+            q = np.array(horizontal[rows, cols.start - 1 : cols.stop], dtype=float)
+            div = np.diff(q, axis=1) / self.dx
+            q = np.array(vertical[rows.start - 1 : rows.stop, cols], dtype=float)
+            div += np.diff(q, axis=0) / self.dy
+
+            values[rows, cols] = div
+
+        return out
+
+    def flush(self):
+        """Write any changes to fields to disk."""
+        for group in self._groups.values():
+            for values in group.values():
+                values.flush()
+        if self._status_at_node is not None:
+            self._status_at_node.flush()
+
+    def close(self):
+        """Close the fields of the grid.
+
+        Fields are flushed to disk. If the grid was created without a
+        directory, its temporary directory is removed.
+        """
+        if self._groups is None:
+            return
+        self.flush()
+        self._groups, self._status_at_node = None, None
+        if self._remove_directory is not None:
+            self._remove_directory()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
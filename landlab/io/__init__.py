@@ -1,8 +1,10 @@
 """
 Modules that read/write ModelGrids from various file formats.
 """
-from .shapefile import read_shapefile
+from .shapefile import read_shapefile, write_shapefile
 from .esri_ascii import read_esri_ascii, read_asc_header, write_esri_ascii
+from .geotiff import read_geotiff, write_geotiff
+from .background import BackgroundWriter
 from .esri_ascii import (
     MissingRequiredKeyError,
     KeyTypeError,
@@ -16,7 +18,11 @@ __all__ = [
     "read_esri_ascii",
     "read_asc_header",
     "read_shapefile",
+    "write_shapefile",
     "write_esri_ascii",
+    "read_geotiff",
+    "write_geotiff",
+    "BackgroundWriter",
     "MissingRequiredKeyError",
     "KeyTypeError",
     "DataSizeError",
@@ -0,0 +1,323 @@
+#! /usr/bin/env python
+"""Write landlab output in the background while a model runs.
+
+Background writer
++++++++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.io.background.BackgroundWriter
+    ~landlab.io.background.snapshot_fields
+
+Landlab's writers (for instance,
+:func:`~landlab.io.netcdf.write_netcdf`,
+:func:`~landlab.io.esri_ascii.write_esri_ascii` or
+:func:`~landlab.io.native_landlab.save_grid`) block a model's time loop
+while they encode and write a grid's fields. A
+:class:`~landlab.io.background.BackgroundWriter` instead takes a snapshot
+of the fields to write, which is cheap, and hands the snapshot to a writer
+running in a background thread. The model is then free to change its fields
+while the snapshot is written.
+
+Snapshots copy field values into buffers that are reused once a snapshot
+has been written (so that, in steady state, no new memory is allocated).
+The number of snapshots waiting to be written is bounded; once the bound is
+reached a model blocks until a writer catches up.
+"""
+import threading
+
+import numpy as np
+import six
+from six.moves import queue
+
+from ..field import GraphFields, ModelDataFields
+
+
+def _find_grids(args, kwds):
+    """Positions and keywords of arguments that hold fields."""
+    fields_types = (ModelDataFields, GraphFields)
+    positions = [n for n, arg in enumerate(args) if isinstance(arg, fields_types)]
+    keys = [key for key, arg in kwds.items() if isinstance(arg, fields_types)]
+    return positions, keys
+
+
+class _BufferPool(object):
+
+    """Reusable arrays to hold copies of field values."""
+
+    def __init__(self):
+        self._free = {}
+        self._lock = threading.Lock()
+
+    def copy(self, key, values):
+        """Copy values into an unused buffer."""
+        with self._lock:
+            free = self._free.get(key, [])
+            while free:
+                buffer = free.pop()
+                if buffer.shape == values.shape and buffer.dtype == values.dtype:
+                    break
+            else:
+                buffer = np.empty_like(values)
+        buffer[...] = values
+        return buffer
+
+    def release(self, buffers):
+        """Return buffers to the pool."""
+        with self._lock:
+            for key, buffer in buffers:
+                self._free.setdefault(key, []).append(buffer)
+
+
+def snapshot_fields(grid, names=None, at=None):
+    """Snapshot the fields of a grid.
+
+    Create a copy of a grid that shares the grid's geometry but that holds
+    copies of (some of) its fields and of its node status. Changes to the
+    grid's fields or boundary conditions are not seen by the snapshot.
+    Arrays that describe the geometry of the grid (node coordinates,
+    connectivity, areas, lengths, etc.) are shared and must not be
+    changed.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        A landlab grid.
+    names : str or iterable of str, optional
+        Names of fields to copy. If not given, copy all fields.
+    at : str, optional
+        Grid location of the fields to copy. If not given, copy the named
+        fields from every location that has them.
+
+    Returns
+    -------
+    ModelGrid
+        The snapshot.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.background import snapshot_fields
+    >>> grid = RasterModelGrid((3, 4))
+    >>> z = grid.add_ones("node", "topographic__elevation", units="m")
+    >>> _ = grid.add_zeros("link", "water__discharge")
+    >>> snapshot = snapshot_fields(grid, names="topographic__elevation")
+    >>> z[:] = 2.
+    >>> snapshot.at_node["topographic__elevation"]
+    array([ 1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.])
+    >>> snapshot.at_node.units["topographic__elevation"]
+    'm'
+    >>> "water__discharge" in snapshot.at_link
+    False
+    >>> snapshot.shape
+    (3, 4)
+    """
+    return _snapshot_fields(
+        grid, names=names, at=at, copy=lambda key, values: values.copy()
+    )
+
+
+def _snapshot_fields(grid, names=None, at=None, copy=None):
+    """Snapshot the fields of a grid, copying values with *copy(key, values)*."""
+    if isinstance(names, six.string_types):
+        names = [names]
+
+    snapshot = object.__new__(type(grid))
+    snapshot.__dict__.update(grid.__dict__)
+    snapshot._groups = type(grid._groups)()
+
+    # The snapshot shares the grid's geometry but gets its own node status.
+    # Caches derived from the status are dropped so that they are rebuilt
+    # from the snapshot's copy rather than shared with the grid.
+    snapshot._node_status = grid._node_status.copy()
+    snapshot.reset_status_at_node()
+    snapshot.bc_set_code = grid.bc_set_code
+    snapshot._link_status_changes = []
+
+    groups = sorted(grid.groups)
+    for group in groups:
+        snapshot.new_field_location(group, grid[group].size)
+
+    for group in groups if at is None else [at]:
+        fields = grid[group]
+        for name in list(fields.keys()) if names is None else names:
+            if name not in fields:
+                if at is None:
+                    continue
+                raise KeyError("{name}@{at}".format(name=name, at=at))
+            values = copy((group, name), fields[name])
+            snapshot.add_field(group, name, values, noclobber=False)
+            snapshot[group].units[name] = fields.units.get(name, "?")
+
+    return snapshot
+
+
+class BackgroundWriter(object):
+
+    """Write landlab fields in background threads.
+
+    Parameters
+    ----------
+    max_pending : int, optional
+        Maximum number of snapshots that can be waiting to be written.
+        Once reached, :meth:`write` blocks until a snapshot is written.
+    n_workers : int, optional
+        Number of threads that write snapshots. Snapshots are written in
+        the order they are submitted only if there is a single thread.
+
+    Examples
+    --------
+    >>> import os
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io import BackgroundWriter, read_esri_ascii, write_esri_ascii
+    >>> from landlab.testing.tools import cdtemp
+
+    >>> grid = RasterModelGrid((3, 4))
+    >>> z = grid.add_zeros("node", "topographic__elevation")
+
+    Each call to :meth:`write` returns as soon as the fields are copied,
+    so the model can carry on while the files are written.
+
+    >>> with cdtemp() as _:
+    ...     with BackgroundWriter(max_pending=2) as writer:
+    ...         for time in range(3):
+    ...             z += 1.
+    ...             writer.write(
+    ...                 write_esri_ascii,
+    ...                 "dem-{0}.asc".format(time),
+    ...                 grid,
+    ...                 names="topographic__elevation",
+    ...             )
+    ...     (grid, z_last) = read_esri_ascii("dem-2.asc")
+    ...     sorted(os.listdir("."))
+    ['dem-0.asc', 'dem-1.asc', 'dem-2.asc']
+    >>> z_last.reshape((3, 4))
+    array([[ 3.,  3.,  3.,  3.],
+           [ 3.,  3.,  3.,  3.],
+           [ 3.,  3.,  3.,  3.]])
+    """
+
+    def __init__(self, max_pending=2, n_workers=1):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least one")
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least one")
+
+        self._jobs = queue.Queue(maxsize=max_pending)
+        self._pool = _BufferPool()
+        self._error = None
+        self._closed = False
+
+        self._workers = []
+        for _ in range(n_workers):
+            worker = threading.Thread(target=self._run)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    @property
+    def number_of_pending(self):
+        """Number of snapshots waiting to be, or being, written."""
+        return self._jobs.unfinished_tasks
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                if job is None:
+                    return
+                func, args, kwds, buffers = job
+                if self._error is None:
+                    func(*args, **kwds)
+            except Exception as error:
+                if self._error is None:
+                    self._error = error
+            finally:
+                if job is not None:
+                    self._pool.release(buffers)
+                self._jobs.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def write(self, func, *args, **kwds):
+        """Write a snapshot of fields in the background.
+
+        Arguments are passed on to *func* with any grid replaced by a
+        snapshot of its fields. If the *names* keyword is given, only the
+        named fields (at the location given by an *at* keyword, if
+        there is one) are copied, otherwise all fields are copied.
+
+        Parameters
+        ----------
+        func : callable
+            Function that writes fields (for instance,
+            :func:`~landlab.io.netcdf.write_netcdf`).
+        args : tuple
+            Positional arguments for *func*.
+        kwds : dict
+            Keyword arguments for *func*.
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed.
+
+        Notes
+        -----
+        An exception raised while writing a snapshot is raised by the next
+        call to :meth:`write`, :meth:`flush` or :meth:`close`. Snapshots
+        submitted after the exception are not written.
+        """
+        if self._closed:
+            raise ValueError("writer is closed")
+        self._raise_error()
+
+        names, at = kwds.get("names"), kwds.get("at")
+
+        args, kwds = list(args), dict(kwds)
+        positions, keys = _find_grids(args, kwds)
+        grids = [args[n] for n in positions] + [kwds[key] for key in keys]
+
+        buffers = []
+
+        def copy(key, values):
+            buffer = self._pool.copy(key, values)
+            buffers.append((key, buffer))
+            return buffer
+
+        snapshots = [
+            _snapshot_fields(grid, names=names, at=at, copy=copy) for grid in grids
+        ]
+        for n, snapshot in zip(positions, snapshots):
+            args[n] = snapshot
+        for key, snapshot in zip(keys, snapshots[len(positions) :]):
+            kwds[key] = snapshot
+
+        self._jobs.put((func, tuple(args), kwds, buffers))
+
+    def flush(self):
+        """Wait for all pending snapshots to be written."""
+        self._jobs.join()
+        self._raise_error()
+
+    def close(self):
+        """Write pending snapshots and stop the background threads."""
+        if self._closed:
+            return
+        self._closed = True
+        self._jobs.join()
+        for _ in self._workers:
+            self._jobs.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._raise_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
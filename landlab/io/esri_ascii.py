@@ -18,6 +18,9 @@ import re
 import numpy as np
 import six
 
+from .ext._format import format_rows
+from .ext.esri_ascii import fill_rows_from_text
+
 _VALID_HEADER_KEYS = [
     "ncols",
     "nrows",
@@ -41,6 +44,11 @@ _HEADER_VALUE_TESTS = {
     "nodata_value": (float, lambda x: True),
 }
 
+# Number of characters of an ESRI ASCII file to parse at a time.
+_READ_CHUNK_SIZE = 2 ** 22
+# Number of values to format at a time when writing an ESRI ASCII file.
+_WRITE_CHUNK_SIZE = 2 ** 18
+
 
 class Error(Exception):
 
@@ -311,19 +319,60 @@ def read_asc_header(asc_file):
     return header
 
 
-def _read_asc_data(asc_file):
+def _read_asc_data(asc_file, out):
     """Read gridded data from an ESRI ASCII data file.
 
+    The file is parsed a chunk at a time, with each value stored directly
+    into *out*.
+
     Parameters
     ----------
     asc_file : file-like
         File-like object of the data file pointing to the start of the data.
+    out : ndarray of float, shape (n_rows, n_cols)
+        Array to read the data into, which can be a strided view.
+
+    Returns
+    -------
+    int
+        Number of values in the file. Values that do not fit into *out*
+        are counted but not stored.
 
     .. note::
         First row of the data is at the top of the raster grid, the second
         row is the second from the top, and so on.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from six import StringIO
+    >>> from landlab.io.esri_ascii import _read_asc_data
+    >>> data = np.zeros((2, 3))
+    >>> _read_asc_data(StringIO('0 1 2\\n3 4 5'), data[::-1])
+    6
+    >>> data
+    array([[ 3.,  4.,  5.],
+           [ 0.,  1.,  2.]])
     """
-    return np.loadtxt(asc_file)
+    n_values = 0
+    text = b""
+    while True:
+        chunk = asc_file.read(_READ_CHUNK_SIZE)
+        if isinstance(chunk, six.text_type):
+            chunk = chunk.encode()
+        final = len(chunk) == 0
+
+        text += chunk
+        n_parsed, n_consumed = fill_rows_from_text(
+            text, out, start=n_values, final=final
+        )
+        n_values += n_parsed
+        text = text[n_consumed:]
+
+        if final:
+            break
+
+    return n_values
 
 
 def read_esri_ascii(asc_file, grid=None, reshape=False, name=None, halo=0):
@@ -399,63 +448,19 @@ def read_esri_ascii(asc_file, grid=None, reshape=False, name=None, halo=0):
     from ..grid import RasterModelGrid
 
     # if the asc_file is provided as a string, open it and pass the pointer to
-    # _read_asc_header, and _read_asc_data
+    # read_esri_ascii.
     if isinstance(asc_file, six.string_types):
         with open(asc_file, "r") as f:
-            header = read_asc_header(f)
-            data = _read_asc_data(f)
+            return read_esri_ascii(
+                f, grid=grid, reshape=reshape, name=name, halo=halo
+            )
 
-    # otherwise, pass asc_file directly.
-    else:
-        header = read_asc_header(asc_file)
-        data = _read_asc_data(asc_file)
+    header = read_asc_header(asc_file)
 
     # There is no reason for halo to be negative.
     # Assume that if a negative value is given it should be 0.
-    if halo <= 0:
-        shape = (header["nrows"], header["ncols"])
-        if data.size != shape[0] * shape[1]:
-            raise DataSizeError(shape[0] * shape[1], data.size)
-    else:
-        shape = (header["nrows"] + 2 * halo, header["ncols"] + 2 * halo)
-        # check to see if a nodata_value was given.  If not, assign -9999.
-        if "nodata_value" in header.keys():
-            nodata_value = header["nodata_value"]
-        else:
-            header["nodata_value"] = -9999.
-            nodata_value = header["nodata_value"]
-        if data.size != (shape[0] - 2 * halo) * (shape[1] - 2 * halo):
-            raise DataSizeError(shape[0] * shape[1], data.size)
-    xy_spacing = (header["cellsize"], header["cellsize"])
-    xy_of_lower_left = (
-        header["xllcorner"] - halo * header["cellsize"],
-        header["yllcorner"] - halo * header["cellsize"],
-    )
-
-    data = np.flipud(data)
-
-    # REMEMBER, shape contains the size with halo in place
-    # header contains the shape of the original data
-    # Add halo below
-    if halo > 0:
-        helper_row = np.ones(shape[1]) * nodata_value
-        # for the first halo row(s), add num cols worth of nodata vals to data
-        for i in range(0, halo):
-            data = np.insert(data, 0, helper_row)
-        # then for header['nrows'] add halo number nodata vals, header['ncols']
-        # of data, then halo number of nodata vals
-        helper_row_ends = np.ones(halo) * nodata_value
-        for i in range(halo, header["nrows"] + halo):
-            # this adds at the beginning of the row
-            data = np.insert(data, i * shape[1], helper_row_ends)
-            # this adds at the end of the row
-            data = np.insert(data, (i + 1) * shape[1] - halo, helper_row_ends)
-        # for the last halo row(s), add num cols worth of nodata vals to data
-        for i in range(header["nrows"] + halo, shape[0]):
-            data = np.insert(data, data.size, helper_row)
-
-    if not reshape:
-        data = data.flatten()
+    halo = max(halo, 0)
+    shape = (header["nrows"] + 2 * halo, header["ncols"] + 2 * halo)
 
     if grid is not None:
         if (grid.number_of_node_rows != shape[0]) or (
@@ -466,6 +471,32 @@ def read_esri_ascii(asc_file, grid=None, reshape=False, name=None, halo=0):
                 grid.number_of_node_rows * grid.number_of_node_columns,
             )
 
+    if halo > 0:
+        # check to see if a nodata_value was given.  If not, assign -9999.
+        if "nodata_value" not in header.keys():
+            header["nodata_value"] = -9999.
+        data = np.full(shape, header["nodata_value"], dtype=float)
+    else:
+        data = np.empty(shape, dtype=float)
+
+    # REMEMBER, shape contains the size with halo in place
+    # header contains the shape of the original data. Rows are read, from the
+    # top of the grid down, straight into the nodes inside of the halo.
+    n_values = _read_asc_data(
+        asc_file, data[halo : shape[0] - halo, halo : shape[1] - halo][::-1]
+    )
+    if n_values != header["nrows"] * header["ncols"]:
+        raise DataSizeError(n_values, header["nrows"] * header["ncols"])
+
+    xy_spacing = (header["cellsize"], header["cellsize"])
+    xy_of_lower_left = (
+        header["xllcorner"] - halo * header["cellsize"],
+        header["yllcorner"] - halo * header["cellsize"],
+    )
+
+    if not reshape:
+        data = data.reshape((-1,))
+
     if grid is None:
         grid = RasterModelGrid(
             shape, xy_spacing=xy_spacing, xy_of_lower_left=xy_of_lower_left
@@ -544,11 +575,17 @@ def write_esri_ascii(path, fields, names=None, clobber=False):
         "cellsize": fields.dx,
     }
 
+    header_lines = ["%s %s" % (key, str(val)) for key, val in list(header.items())]
+    rows_per_chunk = max(1, _WRITE_CHUNK_SIZE // header["ncols"])
+
     for path, name in zip(paths, names):
-        header_lines = ["%s %s" % (key, str(val)) for key, val in list(header.items())]
-        data = fields.at_node[name].reshape(header["nrows"], header["ncols"])
-        np.savetxt(
-            path, np.flipud(data), header=os.linesep.join(header_lines), comments=""
+        data = np.asarray(fields.at_node[name], dtype=float).reshape(
+            header["nrows"], header["ncols"]
         )
+        with open(path, "wb") as fp:
+            fp.write((os.linesep.join(header_lines) + "\n").encode())
+            rows = np.flipud(data)
+            for start in range(0, header["nrows"], rows_per_chunk):
+                fp.write(format_rows(rows[start : start + rows_per_chunk]))
 
     return paths
@@ -0,0 +1,81 @@
+import re
+
+cimport cython
+
+from libc.stdio cimport snprintf
+
+
+# Longest string that snprintf will produce for a double with any of the
+# usual %e, %f or %g formats, plus a separator.
+DEF MAX_VALUE_WIDTH = 32
+
+# A printf format with a single floating-point conversion.
+_FLOAT_FORMAT_REGEX = re.compile(br"^[^%]*%[-+ #0]*\d*(\.\d+)?[eEfFgG][^%]*$")
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def format_rows(const double[:, :] values, bytes fmt=b"%.17g"):
+    """Format the rows of an array as lines of whitespace-separated values.
+
+    Parameters
+    ----------
+    values : ndarray of float, shape (n_rows, n_cols)
+        Values to format. This can be a strided view.
+    fmt : bytes, optional
+        printf-style format, with a single floating-point conversion, for
+        each value.
+
+    Returns
+    -------
+    bytes
+        The formatted lines.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.ext._format import format_rows
+    >>> format_rows(np.array([[0., 1.5], [-2., 1e20]]))
+    b'0 1.5\\n-2 1e+20\\n'
+    >>> format_rows(np.array([[0., 1.5]]), fmt=b'%.2f')
+    b'0.00 1.50\\n'
+    """
+    cdef Py_ssize_t n_rows = values.shape[0]
+    cdef Py_ssize_t n_cols = values.shape[1]
+    cdef const char *c_fmt = fmt
+    cdef bytearray buffer = bytearray(n_rows * n_cols * MAX_VALUE_WIDTH + n_rows)
+    cdef char *out = buffer
+    cdef Py_ssize_t length = 0
+    cdef Py_ssize_t row, col
+    cdef int width
+    cdef bint too_wide = False
+
+    if not _FLOAT_FORMAT_REGEX.match(fmt):
+        raise ValueError("{0!r}: not a floating-point format".format(fmt.decode()))
+    if n_cols == 0:
+        return b'\n' * n_rows
+
+    with nogil:
+        for row in range(n_rows):
+            for col in range(n_cols):
+                width = snprintf(
+                    out + length, MAX_VALUE_WIDTH, c_fmt, values[row, col]
+                )
+                if width < 0 or width >= MAX_VALUE_WIDTH:
+                    too_wide = True
+                    break
+                length += width
+                out[length] = b' '
+                length += 1
+            if too_wide:
+                break
+            out[length - 1] = b'\n'
+
+    if too_wide:
+        raise ValueError(
+            "{0!r} formats values wider than {1} characters".format(
+                fmt.decode(), MAX_VALUE_WIDTH - 1
+            )
+        )
+
+    return out[:length]
@@ -0,0 +1,143 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+from libc.stdlib cimport strtod
+
+
+cdef inline bint _is_space(char c) nogil:
+    return c == b' ' or c == b'\n' or c == b'\r' or c == b'\t' or c == b'\v' or c == b'\f'
+
+
+cdef inline char _lower(char c) nogil:
+    if c >= b'A' and c <= b'Z':
+        return c + 32
+    return c
+
+
+cdef inline bint _is_decimal_token(const char *ptr, const char *end) nogil:
+    """Check that a token is a decimal number, inf or nan.
+
+    strtod also accepts hexadecimal numbers, "infinity" and "nan(...)",
+    none of which are valid values here.
+    """
+    cdef const char *start
+
+    if ptr < end and (ptr[0] == b'+' or ptr[0] == b'-'):
+        ptr += 1
+    start = ptr
+    if end - ptr == 3:
+        if _lower(ptr[0]) == b'i':
+            return _lower(ptr[1]) == b'n' and _lower(ptr[2]) == b'f'
+        elif _lower(ptr[0]) == b'n':
+            return _lower(ptr[1]) == b'a' and _lower(ptr[2]) == b'n'
+
+    while ptr < end:
+        if not (
+            (ptr[0] >= b'0' and ptr[0] <= b'9')
+            or ptr[0] == b'.'
+            or ptr[0] == b'e'
+            or ptr[0] == b'E'
+            or ptr[0] == b'+'
+            or ptr[0] == b'-'
+        ):
+            return False
+        ptr += 1
+    return ptr > start
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fill_rows_from_text(bytes text, double[:, :] out, Py_ssize_t start=0,
+                        bint final=True):
+    """Parse whitespace-separated values into the rows of an array.
+
+    Values are stored into *out*, row by row, starting at the *start*-th
+    value. Values that do not fit into *out* are parsed, and counted, but
+    not stored. Values are decimal numbers, or *inf* or *nan* in any case.
+    Hexadecimal numbers and other spellings of infinity are rejected. As
+    values are parsed with ``strtod``, the decimal point is that of the
+    C locale's LC_NUMERIC category, which Python leaves as ``.`` unless a
+    program changes it.
+
+    Parameters
+    ----------
+    text : bytes
+        Text to parse.
+    out : ndarray of float, shape (n_rows, n_cols)
+        Array to store parsed values in. This can be a strided view.
+    start : int, optional
+        Position, as if *out* were flattened, of the first value.
+    final : bool, optional
+        Indicates that *text* is the end of the data. If not, and *text*
+        does not end with whitespace, the last, possibly incomplete, value
+        is not parsed.
+
+    Returns
+    -------
+    (n_values, n_chars) : tuple of int
+        Number of values parsed and number of characters consumed.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.ext.esri_ascii import fill_rows_from_text
+    >>> out = np.zeros((2, 3))
+    >>> fill_rows_from_text(b'1 2\\n3 4.5', out, final=False)
+    (3, 5)
+    >>> out
+    array([[ 1.,  2.,  3.],
+           [ 0.,  0.,  0.]])
+    >>> fill_rows_from_text(b'4.5 -6e1\\n', out, start=3)
+    (2, 9)
+    >>> out
+    array([[  1. ,   2. ,   3. ],
+           [  4.5, -60. ,   0. ]])
+    """
+    cdef const char *begin = text
+    cdef const char *end = begin + len(text)
+    cdef const char *ptr = begin
+    cdef char *token_end
+    cdef const char *token_stop
+    cdef Py_ssize_t n_cols = out.shape[1]
+    cdef Py_ssize_t size = out.shape[0] * n_cols
+    cdef Py_ssize_t n = start
+    cdef Py_ssize_t consumed = 0
+    cdef double value
+    cdef bint bad_value = False
+
+    with nogil:
+        while True:
+            while ptr < end and _is_space(ptr[0]):
+                ptr += 1
+            if ptr == end:
+                consumed = end - begin
+                break
+
+            # a token that runs to the end of non-final text may be cut
+            # short, so leave it for the next chunk without checking it
+            token_stop = ptr
+            while token_stop < end and not _is_space(token_stop[0]):
+                token_stop += 1
+            if token_stop == end and not final:
+                break
+
+            value = strtod(ptr, &token_end)
+            if token_end != token_stop or not _is_decimal_token(ptr, token_stop):
+                bad_value = True
+                break
+
+            if n < size:
+                out[n // n_cols, n % n_cols] = value
+            n += 1
+            ptr = token_stop
+            consumed = ptr - begin
+
+    if bad_value:
+        raise ValueError(
+            "unable to convert {0!r} to float".format(
+                text[ptr - begin:].split(None, 1)[0].decode(errors="replace")
+            )
+        )
+
+    return n - start, consumed
@@ -0,0 +1,335 @@
+#! /usr/bin/env python
+"""Read/write data from a GeoTIFF file into a RasterModelGrid.
+
+GeoTIFF functions
++++++++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.io.geotiff.read_geotiff
+    ~landlab.io.geotiff.write_geotiff
+
+These functions require the `rasterio <https://rasterio.readthedocs.io>`_
+package.
+
+Nodes of a :class:`~landlab.RasterModelGrid` are placed at the centers of the
+pixels of an image. The first row of pixels in a GeoTIFF file is the top row
+of the image while the first row of nodes of a grid is the bottom row, so
+rows are flipped as they are read and written. Both are done a block of
+rows at a time so that only the image or grid values, and not copies of
+them, need fit into memory.
+"""
+
+import os
+
+import numpy as np
+import six
+
+try:
+    import rasterio
+except ImportError:
+    WITH_RASTERIO = False
+else:
+    from rasterio.enums import Resampling
+    from rasterio.transform import from_origin
+    from rasterio.windows import Window
+
+    WITH_RASTERIO = True
+
+
+# Number of values to read or write at a time.
+_CHUNK_SIZE = 2 ** 22
+
+
+def _assert_rasterio_is_installed():
+    if not WITH_RASTERIO:
+        raise ImportError("GeoTIFF files require the rasterio package")
+
+
+def _get_window(src, window=None):
+    """Get a window of a dataset as a rasterio Window.
+
+    Parameters
+    ----------
+    src : rasterio dataset
+        An open dataset.
+    window : tuple of slice or Window, optional
+        Rows and columns of pixels. If not given, the entire dataset.
+
+    Returns
+    -------
+    Window
+        The window, clipped to the dataset.
+    """
+    if window is None:
+        return Window(0, 0, src.width, src.height)
+    if not isinstance(window, Window):
+        rows, cols = window
+        window = Window.from_slices(
+            rows, cols, height=src.height, width=src.width, boundless=False
+        )
+    full = Window(0, 0, src.width, src.height)
+    return window.intersection(full)
+
+
+def _rows_per_chunk(n_cols, block_rows=1):
+    """Number of rows, a multiple of a block's rows, to read at a time."""
+    n_rows = max(1, _CHUNK_SIZE // max(n_cols, 1))
+    return max(block_rows, n_rows // block_rows * block_rows)
+
+
+def read_geotiff(path, grid=None, reshape=False, name=None, band=1, window=None):
+    """Read :class:`~landlab.RasterModelGrid` from a GeoTIFF file.
+
+    Read a band of a GeoTIFF file, or of a window of it, into a new, or an
+    existing, :class:`~landlab.RasterModelGrid`. The grid and the data
+    read from the file are returned as a tuple (*grid*, *data*) where
+    *data* is a numpy array, of the same type as the band, with a value
+    for each node.
+
+    Parameters
+    ----------
+    path : str
+        Path to a GeoTIFF file.
+    grid : RasterModelGrid, optional
+        Adds data to an existing *grid* instead of creating a new one.
+    reshape : boolean, optional
+        Reshape the returned array, otherwise return a flattened array.
+    name : str, optional
+        Add data to the grid as a named field.
+    band : int, optional
+        Band of the file to read (the first band is 1).
+    window : tuple of slice or rasterio.windows.Window, optional
+        Rows and columns of pixels to read. Rows, as in the file, are
+        counted from the top of the image.
+
+    Returns
+    -------
+    (grid, data) : tuple
+        A newly-created RasterModel grid and the associated node data.
+
+    Raises
+    ------
+    ValueError
+        If the image is rotated, or if a grid is passed and its shape does
+        not agree with the shape of the data.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.geotiff import read_geotiff, write_geotiff
+    >>> from landlab.testing.tools import cdtemp
+
+    >>> grid = RasterModelGrid((4, 5), xy_spacing=2., xy_of_lower_left=(1., 3.))
+    >>> _ = grid.add_field('node', 'topographic__elevation', np.arange(20.))
+    >>> with cdtemp() as _:
+    ...     files = write_geotiff('dem.tif', grid)
+    ...     (grid, z) = read_geotiff('dem.tif', name='topographic__elevation')
+    ...     (part, z_part) = read_geotiff(
+    ...         'dem.tif', window=(slice(0, 3), slice(2, 5)))
+    >>> grid.shape, grid.dx
+    ((4, 5), 2.0)
+    >>> grid.x_of_node[:5]
+    array([ 1.,  3.,  5.,  7.,  9.])
+    >>> grid.at_node['topographic__elevation'] is z
+    True
+    >>> z.reshape((4, 5))
+    array([[  0.,   1.,   2.,   3.,   4.],
+           [  5.,   6.,   7.,   8.,   9.],
+           [ 10.,  11.,  12.,  13.,  14.],
+           [ 15.,  16.,  17.,  18.,  19.]])
+
+    The window holds the upper three rows of the right three columns.
+
+    >>> part.shape
+    (3, 3)
+    >>> part.x_of_node[0], part.y_of_node[0]
+    (5.0, 5.0)
+    >>> z_part.reshape((3, 3))
+    array([[  7.,   8.,   9.],
+           [ 12.,  13.,  14.],
+           [ 17.,  18.,  19.]])
+    """
+    from ..grid import RasterModelGrid
+
+    _assert_rasterio_is_installed()
+
+    with rasterio.open(path) as src:
+        transform = src.transform
+        if transform.b != 0. or transform.d != 0.:
+            raise ValueError("{0}: rotated images are not supported".format(path))
+
+        window = _get_window(src, window)
+        shape = (int(window.height), int(window.width))
+        row_off, col_off = int(window.row_off), int(window.col_off)
+
+        if grid is not None and grid.shape != shape:
+            raise ValueError(
+                "grid shape {0} does not match the shape of the data {1}".format(
+                    grid.shape, shape
+                )
+            )
+
+        data = np.empty(shape, dtype=src.dtypes[band - 1])
+
+        block_rows = src.block_shapes[band - 1][0]
+        rows_per_chunk = _rows_per_chunk(shape[1], block_rows=block_rows)
+        for start in range(0, shape[0], rows_per_chunk):
+            n_rows = min(rows_per_chunk, shape[0] - start)
+            chunk = src.read(
+                band, window=Window(col_off, row_off + start, shape[1], n_rows)
+            )
+            data[shape[0] - start - n_rows : shape[0] - start] = chunk[::-1]
+
+    dx, dy = transform.a, -transform.e
+    xy_of_lower_left = (
+        transform.c + (col_off + .5) * dx,
+        transform.f - (row_off + shape[0] - .5) * dy,
+    )
+
+    if not reshape:
+        data = data.reshape((-1,))
+
+    if grid is None:
+        grid = RasterModelGrid(
+            shape, xy_spacing=(dx, dy), xy_of_lower_left=xy_of_lower_left
+        )
+    if name:
+        grid.add_field("node", name, data)
+
+    return (grid, data)
+
+
+def write_geotiff(
+    path,
+    fields,
+    names=None,
+    clobber=False,
+    crs=None,
+    nodata=None,
+    tile_size=256,
+    compress="deflate",
+    overviews=None,
+):
+    """Write landlab fields to a tiled GeoTIFF file.
+
+    Write node fields of a :class:`~landlab.RasterModelGrid` as the bands
+    of a tiled, compressed, GeoTIFF file. The fields are written a block of
+    tiles at a time.
+
+    Parameters
+    ----------
+    path : str
+        Path to output file.
+    fields : RasterModelGrid
+        Landlab grid that holds the fields.
+    names : iterable of str, optional
+        Names of the node fields to write, one band for each. If not
+        provided, write all node fields. Fields are converted to a common
+        data type.
+    clobber : boolean, optional
+        If *path* exists, clobber the existing file, otherwise raise an
+        exception.
+    crs : str or dict, optional
+        Coordinate reference system of the grid (for instance,
+        ``'EPSG:32613'``).
+    nodata : number, optional
+        Value that marks missing data.
+    tile_size : int, optional
+        Width and height of tiles, a multiple of 16.
+    compress : str, optional
+        Compression method (for instance, 'deflate', 'lzw' or 'zstd'), or
+        ``None`` for no compression.
+    overviews : iterable of int, optional
+        Decimation factors of reduced-resolution overviews to add to the
+        file (for instance, ``[2, 4, 8]``). Overviews are averages of the
+        full-resolution values.
+
+    Returns
+    -------
+    list of str
+        Paths of the files written.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.geotiff import write_geotiff
+    >>> from landlab.testing.tools import cdtemp
+    >>> import rasterio
+
+    >>> grid = RasterModelGrid((64, 64), xy_spacing=10.)
+    >>> _ = grid.add_field('node', 'topographic__elevation', np.arange(64. * 64.))
+    >>> _ = grid.add_ones('node', 'soil__depth')
+    >>> with cdtemp() as _:
+    ...     files = write_geotiff('dem.tif', grid, tile_size=32, overviews=[2, 4])
+    ...     with rasterio.open('dem.tif') as src:
+    ...         (src.count, src.descriptions, src.block_shapes[0])
+    ...         src.overviews(1)
+    (2, ('soil__depth', 'topographic__elevation'), (32, 32))
+    [2, 4]
+    >>> files
+    ['dem.tif']
+    """
+    _assert_rasterio_is_installed()
+
+    if os.path.exists(path) and not clobber:
+        raise ValueError("file exists")
+
+    if isinstance(names, six.string_types):
+        names = [names]
+    names = sorted(names or fields.at_node.keys())
+    if len(names) == 0:
+        raise ValueError("no node fields to write")
+
+    bad_names = set(names) - set(fields.at_node.keys())
+    if len(bad_names) > 0:
+        raise ValueError("unknown field name(s): %s" % ",".join(bad_names))
+
+    n_rows, n_cols = fields.shape
+    dtype = np.result_type(*[fields.at_node[name] for name in names])
+    if dtype == np.bool_:
+        dtype = np.dtype(np.uint8)
+
+    profile = {
+        "driver": "GTiff",
+        "width": n_cols,
+        "height": n_rows,
+        "count": len(names),
+        "dtype": dtype.name,
+        "crs": crs,
+        "transform": from_origin(
+            fields.x_of_node[0] - fields.dx * .5,
+            fields.y_of_node[-1] + fields.dy * .5,
+            fields.dx,
+            fields.dy,
+        ),
+        "nodata": nodata,
+        "tiled": True,
+        "blockxsize": tile_size,
+        "blockysize": tile_size,
+    }
+    if compress:
+        profile["compress"] = compress
+
+    rows_per_chunk = _rows_per_chunk(n_cols, block_rows=tile_size)
+    with rasterio.open(path, "w", **profile) as dst:
+        for (band, name) in enumerate(names, start=1):
+            values = fields.at_node[name].reshape((n_rows, n_cols))
+            for start in range(0, n_rows, rows_per_chunk):
+                n = min(rows_per_chunk, n_rows - start)
+                chunk = values[n_rows - start - n : n_rows - start][::-1]
+                dst.write(
+                    chunk.astype(dtype, copy=False),
+                    band,
+                    window=Window(0, start, n_cols, n),
+                )
+            dst.set_band_description(band, name)
+
+        if overviews:
+            dst.build_overviews(list(overviews), Resampling.average)
+            dst.update_tags(ns="rio_overview", resampling="average")
+
+    return [path]
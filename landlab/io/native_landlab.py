@@ -1,5 +1,11 @@
 #! /usr/bin/env python
-"""Read data from a pickled Landlab grid file into a RasterModelGrid.
+"""Save and load Landlab grids, and their fields, to Landlab native files.
+
+Raster and Voronoi grids are saved in a binary format: a small JSON header,
+that describes the grid and lists its arrays, followed by the raw contents of
+the arrays. When loaded, the arrays are memory mapped so that field values
+are only read from the file as they are used. Other grids, and grids with
+event or material layers, are pickled.
 
 Read Landlab native
 +++++++++++++++++++
@@ -11,17 +17,278 @@ Read Landlab native
     ~landlab.io.native_landlab.save_grid
 """
 
+import json
 import os
+import struct
+import tempfile
 
+import numpy as np
 from six.moves import cPickle
 
 from landlab import ModelGrid
 
+# Version of the binary format written by save_grid.
+FORMAT_VERSION = 1
+
+_MAGIC = b"\x93LANDLAB"
+# Header length is saved as a little-endian, unsigned 32-bit integer.
+_HEADER_LENGTH = struct.Struct("<I")
+# Arrays in the file start at multiples of this number of bytes.
+_ALIGNMENT = 64
+
+# os.replace is not available with Python 2, where os.rename already
+# replaces an existing file (other than on Windows).
+_replace = getattr(os, "replace", os.rename)
+
+# Grid state that the binary format doesn't save.
+_UNSUPPORTED_ATTRS = ("_event_layers", "_material_layers")
+
+
+def _geometry_of_grid(grid):
+    """Get the parameters and arrays needed to recreate a grid.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        A Landlab grid.
+
+    Returns
+    -------
+    (params, arrays) : (dict, dict) or None
+        Parameters and arrays that define the grid, or ``None`` if the
+        grid is not supported by the binary format.
+
+    Notes
+    -----
+    Besides its geometry, the binary format keeps a grid's axis names and
+    units, and its reference coordinates. Grids that have event or
+    material layers are not supported, and so are pickled.
+    """
+    from landlab import RasterModelGrid, VoronoiDelaunayGrid
+
+    if any(attr in grid.__dict__ for attr in _UNSUPPORTED_ATTRS):
+        return None
+
+    params = {
+        "axis_name": list(grid.axis_name),
+        "axis_units": list(grid.axis_units),
+        "xy_of_reference": [float(coord) for coord in grid.xy_of_reference],
+    }
+    if type(grid) is RasterModelGrid:
+        params.update(
+            shape=list(grid.shape),
+            xy_spacing=[grid.dx, grid.dy],
+            xy_of_lower_left=[float(coord) for coord in grid.xy_of_lower_left],
+        )
+        return params, {}
+    elif type(grid) is VoronoiDelaunayGrid:
+        return params, {"x_of_node": grid.x_of_node, "y_of_node": grid.y_of_node}
+    else:
+        return None
+
+
+def _grid_from_geometry(grid_type, params, arrays):
+    """Create a grid from its parameters and arrays.
+
+    Parameters
+    ----------
+    grid_type : str
+        Name of the grid class.
+    params : dict
+        Parameters that define the grid.
+    arrays : dict
+        Arrays that define the grid.
+
+    Returns
+    -------
+    ModelGrid
+        A newly-created grid.
+    """
+    from landlab import RasterModelGrid, VoronoiDelaunayGrid
+
+    if grid_type == "RasterModelGrid":
+        grid = RasterModelGrid(
+            params["shape"],
+            xy_spacing=params["xy_spacing"],
+            xy_of_lower_left=params["xy_of_lower_left"],
+        )
+    elif grid_type == "VoronoiDelaunayGrid":
+        grid = VoronoiDelaunayGrid(
+            np.array(arrays["x_of_node"]), np.array(arrays["y_of_node"])
+        )
+    else:
+        raise ValueError("{0}: grid type not supported".format(grid_type))
+
+    if "axis_name" in params:
+        grid.axis_name = params["axis_name"]
+    if "axis_units" in params:
+        grid.axis_units = params["axis_units"]
+    if "xy_of_reference" in params:
+        grid.xy_of_reference = params["xy_of_reference"]
+
+    return grid
+
+
+def _aligned(offset):
+    """Round an offset up to the next alignment boundary.
+
+    Examples
+    --------
+    >>> from landlab.io.native_landlab import _aligned
+    >>> _aligned(0), _aligned(1), _aligned(64), _aligned(65)
+    (0, 64, 64, 128)
+    """
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _write_binary_grid(grid, params, geometry, file_like):
+    """Write a grid, and its fields, in the binary format.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        The grid to write.
+    params : dict
+        Parameters that define the grid.
+    geometry : dict
+        Arrays that define the grid.
+    file_like : file_like
+        Binary file to write to.
+    """
+    arrays = []
+    fields = {}
+    for group in sorted(grid._groups):
+        fields[group] = {}
+        for name in sorted(grid._groups[group].keys()):
+            values = grid.field_values(group, name)
+            fields[group][name] = {
+                "array": len(arrays),
+                "units": grid.field_units(group, name),
+                "pickled": values.dtype.hasobject,
+            }
+            if values.dtype.hasobject:
+                values = np.frombuffer(cPickle.dumps(values, 2), dtype=np.uint8)
+            arrays.append(values)
+
+    geometry_index = {}
+    for name in sorted(geometry):
+        geometry_index[name] = len(arrays)
+        arrays.append(geometry[name])
+    status_index = len(arrays)
+    arrays.append(grid.status_at_node)
+
+    array_info = []
+    offset = 0
+    for array in arrays:
+        array_info.append(
+            {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        )
+        offset = _aligned(offset + array.nbytes)
+
+    header = json.dumps(
+        {
+            "version": FORMAT_VERSION,
+            "type": type(grid).__name__,
+            "params": params,
+            "geometry": geometry_index,
+            "status_at_node": status_index,
+            "fields": fields,
+            "arrays": array_info,
+        },
+        sort_keys=True,
+    ).encode("utf-8")
+    data_start = _aligned(len(_MAGIC) + _HEADER_LENGTH.size + len(header))
+    header += b" " * (data_start - len(_MAGIC) - _HEADER_LENGTH.size - len(header))
+
+    file_like.write(_MAGIC)
+    file_like.write(_HEADER_LENGTH.pack(len(header)))
+    file_like.write(header)
+    for array, info in zip(arrays, array_info):
+        file_like.seek(data_start + info["offset"])
+        file_like.write(np.ascontiguousarray(array).tobytes())
+
+
+def _read_binary_grid(path, mmap_mode="c"):
+    """Read a grid, and its fields, saved in the binary format.
+
+    Parameters
+    ----------
+    path : str
+        Path to a binary grid file.
+    mmap_mode : {'c', 'r', 'r+', None}, optional
+        Mode to memory map arrays with, or ``None`` to read them into
+        memory.
+
+    Returns
+    -------
+    ModelGrid
+        The loaded grid.
+    """
+    with open(path, "rb") as file_like:
+        file_like.seek(len(_MAGIC))
+        (header_length,) = _HEADER_LENGTH.unpack(
+            file_like.read(_HEADER_LENGTH.size)
+        )
+        header = json.loads(file_like.read(header_length).decode("utf-8"))
+        data_start = file_like.tell()
+
+        if header["version"] > FORMAT_VERSION:
+            raise ValueError(
+                "{0}: file format version is {1}, but only versions up to {2}"
+                " are supported".format(path, header["version"], FORMAT_VERSION)
+            )
+
+        if mmap_mode is None:
+            buffer = np.fromfile(file_like, dtype=np.uint8)
+            data_start = 0
+
+    if mmap_mode is not None:
+        buffer = np.memmap(path, dtype=np.uint8, mode=mmap_mode)
+
+    arrays = []
+    for info in header["arrays"]:
+        array = np.ndarray(
+            tuple(info["shape"]),
+            dtype=np.dtype(str(info["dtype"])),
+            buffer=buffer,
+            offset=data_start + info["offset"],
+        )
+        arrays.append(array)
+
+    geometry = dict(
+        (name, arrays[index]) for (name, index) in header["geometry"].items()
+    )
+    grid = _grid_from_geometry(header["type"], header["params"], geometry)
+
+    grid.status_at_node[:] = arrays[header["status_at_node"]]
+
+    for group, fields in header["fields"].items():
+        for name, field in fields.items():
+            values = arrays[field["array"]]
+            if field["pickled"]:
+                values = cPickle.loads(values.tobytes())
+            grid.add_field(group, name, values, units=field["units"])
+
+    return grid
+
+
+def _is_binary_grid_file(path):
+    """Check if a file is in the binary grid format."""
+    with open(path, "rb") as file_like:
+        return file_like.read(len(_MAGIC)) == _MAGIC
+
 
 def save_grid(grid, path, clobber=False):
     """Save a grid and fields to a Landlab "native" format.
 
-    This method uses cPickle to save a grid as a cPickle file.
+    Raster and Voronoi grids are saved in a binary format. The file starts
+    with a small, versioned, JSON header that describes the grid (its
+    geometry, axis names and units, and reference coordinates) and is
+    followed by the raw contents of the node status array and of every
+    field (fields of objects are pickled). Other types of grids, and grids
+    with event or material layers, are saved using cPickle. Other state of
+    a grid, such as cached values that can be recalculated, is not saved
+    in the binary format.
     All fields will be saved, along with the grid.
 
     The recommended suffix for the save file is '.grid'. This will
@@ -29,7 +296,7 @@ def save_grid(grid, path, clobber=False):
 
     Caution: Pickling can be slow, and can produce very large files.
     Caution 2: Future updates to Landlab could potentially render old
-    saves unloadable.
+    pickled saves unloadable.
 
     Parameters
     ----------
@@ -60,25 +327,45 @@ def save_grid(grid, path, clobber=False):
         ext = ext + ".grid"
     path = base + ext
 
-    with open(path, "wb") as file_like:
-        cPickle.dump(grid, file_like)
+    # The fields of a loaded grid may be memory mapped from the file being
+    # written to, so write to a new file rather than truncate the old one.
+    geometry = _geometry_of_grid(grid)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".", suffix=".grid", dir=os.path.dirname(os.path.abspath(path))
+    )
+    try:
+        with os.fdopen(fd, "wb") as file_like:
+            if geometry is None:
+                cPickle.dump(grid, file_like)
+            else:
+                _write_binary_grid(grid, geometry[0], geometry[1], file_like)
+        _replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
 
 
-def load_grid(path):
+def load_grid(path, mmap_mode="c"):
     """Load a grid and its fields from a Landlab "native" format.
 
-    This method uses cPickle to load a saved grid.
-    It assumes you saved using vmg.save() or save_grid, i.e., that the
-    pickle file is a .grid file.
+    This method loads a grid saved with save_grid, i.e., it assumes the
+    file is a .grid file. Fields of grids saved in the binary format are
+    memory mapped from the file, so that their values are only read as they
+    are used. Grids saved as pickles are loaded with cPickle.
 
     Caution: Pickling can be slow, and can produce very large files.
     Caution 2: Future updates to Landlab could potentially render old
-    saves unloadable.
+    pickled saves unloadable.
 
     Parameters
     ----------
     path : str
         Path to output file, either without suffix, or '.grid'
+    mmap_mode : {'c', 'r', 'r+', None}, optional
+        How to memory map the fields of binary grid files. With the default,
+        'c' (copy-on-write), fields can be changed but the changes are not
+        written to the file. Use 'r' for read-only fields and 'r+' to write
+        changes back to the file. If ``None``, read fields into memory.
 
     Examples
     --------
@@ -92,12 +379,33 @@ def load_grid(path):
     >>> save_grid(grid_out, 'testsavedgrid.grid', clobber=True)
     >>> grid_in = load_grid('testsavedgrid.grid')
     >>> os.remove('testsavedgrid.grid') #to remove traces of this test
+
+    >>> from landlab import RasterModelGrid
+    >>> grid_out = RasterModelGrid((4, 5), xy_spacing=2.)
+    >>> z = grid_out.add_field('node', 'topographic__elevation',
+    ...                        np.arange(20.), units='m')
+    >>> grid_out.status_at_node[7] = grid_out.BC_NODE_IS_CLOSED
+    >>> save_grid(grid_out, 'testsavedgrid.grid', clobber=True)
+    >>> grid_in = load_grid('testsavedgrid.grid')
+    >>> grid_in.shape, grid_in.dx
+    ((4, 5), 2.0)
+    >>> grid_in.at_node['topographic__elevation'][:5]
+    array([ 0.,  1.,  2.,  3.,  4.])
+    >>> grid_in.field_units('node', 'topographic__elevation')
+    'm'
+    >>> grid_in.status_at_node[7] == grid_out.BC_NODE_IS_CLOSED
+    True
+    >>> del grid_in, z
+    >>> os.remove('testsavedgrid.grid') #to remove traces of this test
     """
     (base, ext) = os.path.splitext(path)
     if ext != ".grid":
         ext = ext + ".grid"
     path = base + ext
-    with open(path, "rb") as file_like:
-        loaded_grid = cPickle.load(file_like)
+    if _is_binary_grid_file(path):
+        loaded_grid = _read_binary_grid(path, mmap_mode=mmap_mode)
+    else:
+        with open(path, "rb") as file_like:
+            loaded_grid = cPickle.load(file_like)
     assert issubclass(type(loaded_grid), ModelGrid)
     return loaded_grid
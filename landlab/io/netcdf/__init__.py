@@ -3,6 +3,7 @@ import os
 from .read import read_netcdf
 from .write import write_netcdf
 from .write import write_raster_netcdf
+from .write import NetcdfTimeSeriesWriter
 
 from .errors import NotRasterGridError
 
@@ -27,6 +28,7 @@ __all__ = [
     "read_netcdf",
     "write_netcdf",
     "write_raster_netcdf",
+    "NetcdfTimeSeriesWriter",
     "NotRasterGridError",
     "WITH_NETCDF4",
     "NETCDF4_EXAMPLE_FILE",
@@ -17,6 +17,8 @@ except ImportError:
 
     warnings.warn("Unable to import netCDF4.", ImportWarning)
 
+import tempfile
+
 import numpy as np
 from scipy.io import netcdf as nc
 
@@ -27,6 +29,9 @@ from landlab.io.netcdf._constants import (
 )
 from landlab.io.netcdf.errors import NotRasterGridError
 
+# Number of values to copy from a variable at a time when reading out of core.
+_BLOCK_SIZE = 2 ** 22
+
 
 def _length_of_axis_dimension(root, axis_name):
     """Get the size of an axis by axis name.
@@ -71,13 +76,15 @@ def _read_netcdf_grid_shape(root):
     return tuple(shape)
 
 
-def _read_netcdf_coordinate_values(root):
+def _read_netcdf_coordinate_values(root, window=None):
     """Get arrays of coordinates for grid points.
 
     Parameters
     ----------
     root : netcdf_file
         A NetCDF file.
+    window : tuple of slice, optional
+        Slice of the grid to read coordinates for.
 
     Returns
     -------
@@ -87,12 +94,79 @@ def _read_netcdf_coordinate_values(root):
     values = []
     for coordinate_name in _AXIS_COORDINATE_NAMES:
         try:
-            values.append(root.variables[coordinate_name][:].copy())
+            var = root.variables[coordinate_name]
         except KeyError:
             pass
+        else:
+            index = _get_variable_index(root, var.dimensions, window=window)
+            values.append(np.array(var[index]))
     return tuple(values)
 
 
+def _get_window_shape(shape, window=None):
+    """Get the shape of a window of a structured grid.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of a structured grid.
+    window : tuple of slice, optional
+        Slice along each dimension of the grid.
+
+    Returns
+    -------
+    tuple of int
+        Shape of the window.
+
+    Examples
+    --------
+    >>> from landlab.io.netcdf.read import _get_window_shape
+    >>> _get_window_shape((4, 5))
+    (4, 5)
+    >>> _get_window_shape((4, 5), (slice(1, 3), slice(None)))
+    (2, 5)
+    """
+    if window is None:
+        return tuple(shape)
+    return tuple(
+        len(range(*dim_slice.indices(dim))) for (dim, dim_slice) in zip(shape, window)
+    )
+
+
+def _get_variable_index(root, dimensions, time=-1, window=None):
+    """Get the index that reads a window of a variable at one time.
+
+    Parameters
+    ----------
+    root : netcdf_file
+        A NetCDF file.
+    dimensions : tuple of str
+        Dimension names of the variable.
+    time : int, optional
+        Index of the time step to read, if the variable has a time dimension.
+    window : tuple of slice, optional
+        Slice along each dimension of the grid.
+
+    Returns
+    -------
+    tuple
+        Index into the variable.
+    """
+    shape = _read_netcdf_grid_shape(root)
+    slice_of_dimension = {}
+    if window is not None:
+        dimension_names = _AXIS_DIMENSION_NAMES[-len(shape) :]
+        slice_of_dimension = dict(zip(dimension_names, window))
+
+    index = []
+    for name in dimensions:
+        if name == "nt":
+            index.append(time)
+        else:
+            index.append(slice_of_dimension.get(name, slice(None)))
+    return tuple(index)
+
+
 def _read_netcdf_coordinate_units(root):
     """Get units for coodinate values.
 
@@ -115,13 +189,15 @@ def _read_netcdf_coordinate_units(root):
     return tuple(units)
 
 
-def _read_netcdf_structured_grid(root):
+def _read_netcdf_structured_grid(root, window=None):
     """Get node coordinates for a structured grid.
 
     Parameters
     ----------
     root : netcdf_file
         A NetCDF file.
+    window : tuple of slice, optional
+        Slice of the grid to read.
 
     Returns
     -------
@@ -129,8 +205,8 @@ def _read_netcdf_structured_grid(root):
         Node coordinates for each dimension reshaped to match the shape
         of the grid.
     """
-    shape = _read_netcdf_grid_shape(root)
-    coordinates = _read_netcdf_coordinate_values(root)
+    shape = _get_window_shape(_read_netcdf_grid_shape(root), window)
+    coordinates = _read_netcdf_coordinate_values(root, window=window)
 
     for coordinate in coordinates:
         coordinate.shape = shape
@@ -138,13 +214,15 @@ def _read_netcdf_structured_grid(root):
     return coordinates
 
 
-def _read_netcdf_raster_structured_grid(root):
+def _read_netcdf_raster_structured_grid(root, window=None):
     """Get node coordinates for a structured grid written as a raster.
 
     Parameters
     ----------
     root : netcdf_file
         A NetCDF file.
+    window : tuple of slice, optional
+        Slice of the grid to read.
 
     Returns
     -------
@@ -152,8 +230,8 @@ def _read_netcdf_raster_structured_grid(root):
         Node coordinates for each dimension reshaped to match the shape
         of the grid.
     """
-    shape = _read_netcdf_grid_shape(root)
-    coordinates = _read_netcdf_coordinate_values(root)
+    shape = _get_window_shape(_read_netcdf_grid_shape(root), window)
+    coordinates = _read_netcdf_coordinate_values(root, window=window)
 
     if len(coordinates) != 2:
         assert ValueError("Rasters must have only two spatial coordinate dimensions")
@@ -166,13 +244,81 @@ def _read_netcdf_raster_structured_grid(root):
     return coordinates
 
 
-def _read_netcdf_structured_data(root):
+def _read_netcdf_variable_to_memmap(root, var, index, cache_dir=None):
+    """Copy a variable into a memory-mapped array, a block of rows at a time.
+
+    Parameters
+    ----------
+    root : netcdf_file
+        A NetCDF file.
+    var : netcdf_variable
+        Variable to read.
+    index : tuple
+        Index into the variable to read.
+    cache_dir : str, optional
+        Directory to create the (anonymous) file that backs the array in.
+
+    Returns
+    -------
+    ndarray
+        Flattened values in native byte order, backed by a memory-mapped
+        temporary file.
+    """
+    is_sliced = [isinstance(dim_index, slice) for dim_index in index]
+    shape = _get_window_shape(
+        var.shape,
+        [
+            dim_index if sliced else slice(None)
+            for (dim_index, sliced) in zip(index, is_sliced)
+        ],
+    )
+    shape = tuple(size for (size, sliced) in zip(shape, is_sliced) if sliced)
+
+    try:
+        dtype = np.dtype(var.dtype)
+    except AttributeError:  # if scipy is doing the reading
+        dtype = var.data.dtype
+    dtype = dtype.newbyteorder("=")
+    values = np.memmap(
+        tempfile.TemporaryFile(dir=cache_dir),
+        dtype=dtype,
+        mode="w+",
+        shape=shape if len(shape) > 0 else (1,),
+    )
+    if len(shape) < 2:
+        values[:] = var[index]
+        return values.reshape((-1,))
+
+    axis = is_sliced.index(True)
+    rows = range(*index[axis].indices(var.shape[axis]))
+    block_size = max(1, _BLOCK_SIZE // (values.size // len(rows)))
+    for start in range(0, len(rows), block_size):
+        block = rows[start : start + block_size]
+        block_index = list(index)
+        block_index[axis] = slice(block.start, block.stop, block.step)
+        values[start : start + len(block)] = var[tuple(block_index)]
+    values.flush()
+
+    return values.reshape((-1,))
+
+
+def _read_netcdf_structured_data(
+    root, time=-1, window=None, out_of_core=False, cache_dir=None
+):
     """Get data values for a structured grid.
 
     Parameters
     ----------
     root : netcdf_file
         A NetCDF file.
+    time : int, optional
+        Index of the time step to read, for variables with a time dimension.
+    window : tuple of slice, optional
+        Slice of the grid to read.
+    out_of_core : bool, optional
+        Copy values into memory-mapped arrays, rather than into memory.
+    cache_dir : str, optional
+        Directory for the files that back memory-mapped arrays.
 
     Returns
     -------
@@ -197,8 +343,14 @@ def _read_netcdf_structured_data(root):
         dont_use.append(grid_mapping)
     for (name, var) in root.variables.items():
         if name not in dont_use:
-            fields[name] = var[:].copy()
-            fields[name].shape = (fields[name].size,)
+            index = _get_variable_index(root, var.dimensions, time=time, window=window)
+            if out_of_core:
+                fields[name] = _read_netcdf_variable_to_memmap(
+                    root, var, index, cache_dir=cache_dir
+                )
+            else:
+                fields[name] = var[index].copy()
+                fields[name].shape = (fields[name].size,)
 
     if grid_mapping_exists:
         grid_mapping_variable = root.variables[grid_mapping]
@@ -239,7 +391,14 @@ def _get_raster_spacing(coords):
     return spacing[0]
 
 
-def read_netcdf(nc_file, just_grid=False):
+def read_netcdf(
+    nc_file,
+    just_grid=False,
+    time=-1,
+    window=None,
+    out_of_core=False,
+    cache_dir=None,
+):
     """Create a :class:`~.RasterModelGrid` from a netcdf file.
 
     Create a new :class:`~.RasterModelGrid` from the netcdf file, *nc_file*.
@@ -247,12 +406,31 @@ def read_netcdf(nc_file, just_grid=False):
     To create a new grid without any associated data from the netcdf file,
     set the *just_grid* keyword to ``True``.
 
+    The lower-left node of the new grid is placed at the coordinates of the
+    first node in the file rather than at (0, 0).
+
     Parameters
     ----------
     nc_file : str
         Name of a netcdf file.
     just_grid : boolean, optional
         Create a new grid but don't add value data.
+    time : int, optional
+        Index of the time step to read data at, for files with more than one
+        time step. The default is the last time step.
+    window : tuple of slice, optional
+        Rows and columns of nodes to read, as a pair of slices. The new grid
+        is made up of just these nodes.
+    out_of_core : boolean, optional
+        Copy data, a block at a time, into memory-mapped temporary files
+        rather than reading it all into memory. Field values are then only
+        paged into memory as they are used. Note that all of the data (or
+        the *window* of it) are still read from the file, and written to
+        the temporary files, when the grid is created, so memory use is
+        bounded but reading a large file is not any faster.
+    cache_dir : str, optional
+        Directory for the temporary files used with *out_of_core*. The
+        default is the system's temporary directory.
 
     Returns
     -------
@@ -292,6 +470,18 @@ def read_netcdf(nc_file, just_grid=False):
     True
     >>> grid.dy, grid.dx
     (1.0, 1.0)
+
+    Read just the upper three rows of the grid, copying its data into
+    memory-mapped temporary files rather than into memory.
+
+    >>> grid = read_netcdf(NETCDF4_EXAMPLE_FILE, window=(slice(1, 4), slice(0, 3)),
+    ...                    out_of_core=True)
+    >>> grid.shape == (3, 3)
+    True
+    >>> grid.y_of_node
+    array([ 1.,  1.,  1.,  2.,  2.,  2.,  3.,  3.,  3.])
+    >>> grid.at_node['surface__elevation']
+    array([  3.,   4.,   5.,   6.,   7.,   8.,   9.,  10.,  11.])
     """
     from landlab import RasterModelGrid
 
@@ -301,13 +491,13 @@ def read_netcdf(nc_file, just_grid=False):
         root = nc4.Dataset(nc_file, "r", format="NETCDF4")
 
     try:
-        node_coords = _read_netcdf_structured_grid(root)
+        node_coords = _read_netcdf_structured_grid(root, window=window)
     except ValueError:
         if (len(root.variables["x"].dimensions) == 1) and (
             len(root.variables["y"].dimensions) == 1
         ):
 
-            node_coords = _read_netcdf_raster_structured_grid(root)
+            node_coords = _read_netcdf_raster_structured_grid(root, window=window)
         else:
             assert ValueError(
                 "x and y dimensions must both either be 2D "
@@ -320,10 +510,21 @@ def read_netcdf(nc_file, just_grid=False):
 
     shape = node_coords[0].shape
 
-    grid = RasterModelGrid(shape, xy_spacing=spacing)
+    grid = RasterModelGrid(
+        shape,
+        xy_spacing=spacing,
+        xy_of_lower_left=(node_coords[1][0, 0], node_coords[0][0, 0]),
+    )
 
+    grid_mapping_dict = None
     if not just_grid:
-        fields, grid_mapping_dict = _read_netcdf_structured_data(root)
+        fields, grid_mapping_dict = _read_netcdf_structured_data(
+            root,
+            time=time,
+            window=window,
+            out_of_core=out_of_core,
+            cache_dir=cache_dir,
+        )
         for (name, values) in fields.items():
             grid.add_field("node", name, values)
 
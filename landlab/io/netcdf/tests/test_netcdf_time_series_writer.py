@@ -0,0 +1,121 @@
+#! /usr/bin/env python
+"""Unit tests for landlab.io.netcdf.NetcdfTimeSeriesWriter."""
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.io.netcdf import NetcdfTimeSeriesWriter
+
+try:
+    import netCDF4 as nc
+except ImportError:
+    pass
+
+
+def test_write_snapshots(tmpdir):
+    """Test that buffered snapshots all end up in the file."""
+    grid = RasterModelGrid((4, 3))
+    z = grid.add_zeros("node", "topographic__elevation")
+    grid.add_ones("node", "uplift_rate", dtype=int)
+
+    with tmpdir.as_cwd():
+        with NetcdfTimeSeriesWriter("test.nc", grid, buffer_size=3) as writer:
+            for time in range(7):
+                z[:] = time
+                writer.write(time=0.5 * time)
+                assert writer.number_of_snapshots == time + 1
+
+        root = nc.Dataset("test.nc", "r")
+        assert root.data_model == "NETCDF4"
+        assert_array_equal(root.variables["t"][:], 0.5 * np.arange(7))
+        assert root.variables["topographic__elevation"].shape == (7, 4, 3)
+        for time in range(7):
+            assert_array_equal(root.variables["topographic__elevation"][time], time)
+        assert root.variables["uplift_rate"][:].dtype == np.int64
+        assert_array_equal(root.variables["x"][0], [0., 1., 2.])
+        root.close()
+
+
+def test_close_without_snapshots(tmpdir):
+    """Test that a writer closed before any snapshots has no times."""
+    grid = RasterModelGrid((4, 3))
+    grid.add_zeros("node", "topographic__elevation")
+
+    with tmpdir.as_cwd():
+        with NetcdfTimeSeriesWriter("test.nc", grid) as writer:
+            assert writer.number_of_snapshots == 0
+
+        root = nc.Dataset("test.nc", "r")
+        assert root.variables["t"].shape == (0,)
+        assert root.variables["t"].units == "days since 00:00:00 UTC"
+        assert root.variables["topographic__elevation"].shape == (0, 4, 3)
+        root.close()
+
+def test_write_compressed(tmpdir):
+    """Test chunking and compression of field variables."""
+    grid = RasterModelGrid((10, 20))
+    grid.add_zeros("node", "topographic__elevation")
+
+    with tmpdir.as_cwd():
+        with NetcdfTimeSeriesWriter(
+            "test.nc", grid, buffer_size=4, chunk_size=2, zlib=True, complevel=6
+        ) as writer:
+            writer.write()
+            writer.write()
+
+        root = nc.Dataset("test.nc", "r")
+        var = root.variables["topographic__elevation"]
+        assert var.chunking() == [2, 10, 20]
+        filters = var.filters()
+        assert filters["zlib"] and filters["shuffle"]
+        assert filters["complevel"] == 6
+        assert_array_equal(root.variables["t"][:], [0., 1.])
+        root.close()
+
+
+def test_write_at_cells(tmpdir):
+    """Test writing fields defined at cells."""
+    grid = RasterModelGrid((4, 5))
+    temperature = grid.add_field("cell", "air__temperature", np.arange(6.))
+
+    with tmpdir.as_cwd():
+        writer = NetcdfTimeSeriesWriter("test.nc", grid, at="cell")
+        writer.write()
+        temperature *= 2.
+        writer.write()
+        writer.close()
+
+        root = nc.Dataset("test.nc", "r")
+        assert_array_equal(
+            root.variables["air__temperature"][:].reshape((2, -1)),
+            [np.arange(6.), 2. * np.arange(6.)],
+        )
+        root.close()
+
+
+def test_write_after_close(tmpdir):
+    grid = RasterModelGrid((4, 3))
+    grid.add_zeros("node", "topographic__elevation")
+
+    with tmpdir.as_cwd():
+        writer = NetcdfTimeSeriesWriter("test.nc", grid)
+        writer.close()
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.write()
+
+
+def test_bad_arguments(tmpdir):
+    grid = RasterModelGrid((4, 3))
+    grid.add_zeros("node", "topographic__elevation")
+
+    with tmpdir.as_cwd():
+        with pytest.raises(ValueError):
+            NetcdfTimeSeriesWriter("test.nc", grid, format="NETCDF3_64BIT")
+        with pytest.raises(ValueError):
+            NetcdfTimeSeriesWriter("test.nc", grid, at="link")
+        with pytest.raises(ValueError):
+            NetcdfTimeSeriesWriter("test.nc", grid, buffer_size=0)
+        with pytest.raises(ValueError):
+            NetcdfTimeSeriesWriter("test.nc", grid, names="not_a_field")
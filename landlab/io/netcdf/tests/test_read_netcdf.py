@@ -3,9 +3,17 @@
 
 import os
 
+import numpy as np
 import pytest
+from numpy.testing import assert_array_equal
 
-from landlab.io.netcdf import WITH_NETCDF4, read_netcdf
+from landlab import RasterModelGrid
+from landlab.io.netcdf import (
+    NetcdfTimeSeriesWriter,
+    WITH_NETCDF4,
+    read_netcdf,
+    write_netcdf,
+)
 
 _TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 
@@ -43,3 +51,87 @@ def test_read_netcdf4():
 
 def test_read_llc():
     pass
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_read_just_grid():
+    """Test read_netcdf without reading data."""
+    grid = read_netcdf(
+        os.path.join(_TEST_DATA_DIR, "test-netcdf3-64bit.nc"), just_grid=True
+    )
+    assert grid.shape == (4, 3)
+    assert len(grid.at_node) == 0
+
+
+@pytest.mark.parametrize("out_of_core", [False, True])
+def test_read_window(out_of_core):
+    """Test reading a window of rows and columns."""
+    grid = read_netcdf(
+        os.path.join(_TEST_DATA_DIR, "test-netcdf3-64bit.nc"),
+        window=(slice(0, 3), slice(None)),
+        out_of_core=out_of_core,
+    )
+    assert grid.shape == (3, 3)
+    assert_array_equal(grid.y_of_node, [0., 0., 0., 1., 1., 1., 2., 2., 2.])
+    values = grid.at_node["planet_surface__elevation"]
+    assert_array_equal(values, np.arange(9.))
+    assert _is_memory_mapped(values) == out_of_core
+    if out_of_core:
+        assert values.dtype.isnative
+
+
+def test_read_keeps_lower_left(tmpdir):
+    """Test that the grid is placed at the coordinates in the file."""
+    grid = RasterModelGrid((4, 3), xy_spacing=2., xy_of_lower_left=(10., 20.))
+    grid.add_ones("node", "topographic__elevation")
+    with tmpdir.as_cwd():
+        write_netcdf("test.nc", grid, format="NETCDF3_64BIT")
+        copy = read_netcdf("test.nc")
+
+    assert copy.xy_of_lower_left == (10., 20.)
+    assert_array_equal(copy.x_of_node, grid.x_of_node)
+    assert_array_equal(copy.y_of_node, grid.y_of_node)
+
+
+@pytest.mark.skipif(not WITH_NETCDF4, reason="netCDF4 package not installed")
+def test_read_time_step(tmpdir):
+    """Test reading data at a given time step."""
+    grid = RasterModelGrid((5, 4), xy_spacing=2., xy_of_lower_left=(10., 20.))
+    z = grid.add_zeros("node", "topographic__elevation")
+
+    with tmpdir.as_cwd():
+        with NetcdfTimeSeriesWriter("test.nc", grid) as writer:
+            for time in range(3):
+                z[:] = np.arange(20.) * time
+                writer.write()
+
+        last = read_netcdf("test.nc")
+        assert_array_equal(last.at_node["topographic__elevation"], z)
+        assert_array_equal(last.x_of_node, grid.x_of_node)
+        assert_array_equal(last.y_of_node, grid.y_of_node)
+
+        first = read_netcdf("test.nc", time=0)
+        assert_array_equal(first.at_node["topographic__elevation"], 0.)
+
+        window = read_netcdf(
+            "test.nc",
+            time=1,
+            window=(slice(1, 4), slice(1, 4)),
+            out_of_core=True,
+            cache_dir=str(tmpdir),
+        )
+        assert window.shape == (3, 3)
+        assert window.x_of_node[0] == 12.
+        assert window.y_of_node[0] == 22.
+        assert_array_equal(
+            window.at_node["topographic__elevation"],
+            np.arange(20.).reshape((5, 4))[1:4, 1:4].flat,
+        )
+        assert _is_memory_mapped(window.at_node["topographic__elevation"])
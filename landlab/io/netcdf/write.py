@@ -8,6 +8,7 @@ Write netcdf
     :toctree: generated/
 
     ~landlab.io.netcdf.write.write_netcdf
+    ~landlab.io.netcdf.write.NetcdfTimeSeriesWriter
 """
 
 
@@ -498,6 +499,28 @@ def _add_variables_at_cells(root, fields, names=None):
         var.long_name = var_name
 
 
+def _create_time_variable(root, units="days", reference="00:00:00 UTC"):
+    """Create an empty time variable, named ``t``, in a NetCDF file.
+
+    Parameters
+    ----------
+    root : netcdf_file
+        A NetCDF file.
+    units : str, optional
+        Time units.
+    reference : str, optional
+        Reference time.
+
+    Returns
+    -------
+    The new time variable.
+    """
+    time_var = root.createVariable("t", "f8", ("nt",))
+    time_var.units = " ".join([units, "since", reference])
+    time_var.long_name = "time"
+    return time_var
+
+
 def _add_time_variable(root, time, **kwds):
     """Add a time value to a NetCDF file.
 
@@ -523,9 +546,7 @@ def _add_time_variable(root, time, **kwds):
     try:
         time_var = netcdf_vars["t"]
     except KeyError:
-        time_var = root.createVariable("t", "f8", ("nt",))
-        time_var.units = " ".join([units, "since", reference])
-        time_var.long_name = "time"
+        time_var = _create_time_variable(root, units=units, reference=reference)
 
     try:
         n_times = len(time_var)
@@ -840,3 +861,221 @@ def write_raster_netcdf(
     # print(warning_message(message))
 
     root.close()
+
+
+class NetcdfTimeSeriesWriter(object):
+
+    """Write a time series of landlab fields to a NetCDF4 file.
+
+    Unlike calling :func:`write_netcdf` with *append=True*, which reopens
+    the file and rewrites its metadata for every snapshot, the writer keeps
+    the file open for the whole run. The spatial variables and metadata are
+    written once, when the writer is created. Snapshots are copied into an
+    in-memory buffer and written to the file, *buffer_size* at a time, as a
+    single block. Field variables are chunked along time and can optionally
+    be compressed.
+
+    The file has the same layout as those written by :func:`write_netcdf`,
+    with an additional time variable, ``t``.
+
+    Parameters
+    ----------
+    path : str
+        Path to output file.
+    fields : field-like
+        Landlab field object that holds a grid and associated values.
+    names : iterable of str, optional
+        Names of the fields to include in the netcdf file. If not provided,
+        write all fields.
+    at : {'node', 'cell'}, optional
+        The location where values are defined.
+    attrs : dict, optional
+        Attributes to add to netcdf file.
+    format : {'NETCDF4', 'NETCDF4_CLASSIC'}, optional
+        Format of output netcdf file.
+    buffer_size : int, optional
+        Number of snapshots to keep in memory before writing them to the
+        file.
+    chunk_size : int, optional
+        Number of time steps in a chunk of a field variable. The default is
+        *buffer_size*.
+    zlib : bool, optional
+        Compress field variables with deflate.
+    complevel : int, optional
+        Compression level (1 to 9) used with *zlib*.
+    shuffle : bool, optional
+        Apply the HDF5 shuffle filter before compressing.
+    units : str, optional
+        Time units.
+    reference : str, optional
+        Reference time.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.netcdf import NetcdfTimeSeriesWriter
+
+    >>> rmg = RasterModelGrid(4, 3)
+    >>> z = rmg.add_zeros('node', 'topographic__elevation')
+
+    Create a temporary directory to write the netcdf file into.
+
+    >>> import tempfile, os
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> os.chdir(temp_dir)
+
+    Write five snapshots, two at a time.
+
+    >>> with NetcdfTimeSeriesWriter('test.nc', rmg, buffer_size=2,
+    ...                             zlib=True) as writer:
+    ...     for time in range(5):
+    ...         z += 1.
+    ...         writer.write(time=10. * time)
+    >>> writer.number_of_snapshots
+    5
+
+    >>> import netCDF4
+    >>> root = netCDF4.Dataset('test.nc')
+    >>> root.variables['t'][:].tolist()
+    [0.0, 10.0, 20.0, 30.0, 40.0]
+    >>> root.variables['topographic__elevation'][:, 0, 0].tolist()
+    [1.0, 2.0, 3.0, 4.0, 5.0]
+    >>> root.variables['topographic__elevation'].chunking()
+    [2, 4, 3]
+    >>> root.close()
+    """
+
+    def __init__(
+        self,
+        path,
+        fields,
+        names=None,
+        at="node",
+        attrs=None,
+        format="NETCDF4",
+        buffer_size=16,
+        chunk_size=None,
+        zlib=False,
+        complevel=4,
+        shuffle=True,
+        units="days",
+        reference="00:00:00 UTC",
+    ):
+        if format not in ("NETCDF4", "NETCDF4_CLASSIC"):
+            raise ValueError("format must be NETCDF4 or NETCDF4_CLASSIC")
+        if at not in ("cell", "node"):
+            raise ValueError("value location not understood")
+        if buffer_size < 1:
+            raise ValueError("buffer size must be at least one")
+
+        if isinstance(names, six.string_types):
+            names = (names,)
+        names = list(names or fields[at].keys())
+        if not set(fields[at].keys()).issuperset(names):
+            raise ValueError("fields must all be at {at}".format(at=at))
+
+        self._fields = fields
+        self._at = at
+        self._names = names
+        self._buffer_size = buffer_size
+        self._n_buffered = 0
+        self._n_written = 0
+
+        if at == "node":
+            self._shape = tuple(fields.shape)
+        else:
+            self._shape = tuple(dim - 2 for dim in fields.shape)
+
+        self._root = nc4.Dataset(path, "w", format=format)
+        _set_netcdf_attributes(self._root, attrs or {})
+        if at == "node":
+            _set_netcdf_structured_dimensions(self._root, fields.shape)
+            _add_spatial_variables(self._root, fields)
+        else:
+            _set_netcdf_cell_structured_dimensions(self._root, fields.shape)
+            _add_cell_spatial_variables(self._root, fields)
+        _create_time_variable(self._root, units=units, reference=reference)
+        self._times = np.empty(buffer_size, dtype=float)
+
+        dims = ["nt"] + _get_dimension_names(self._shape)
+        chunksizes = [chunk_size or buffer_size] + list(self._shape)
+        self._buffers = {}
+        for name in names:
+            values = fields[at][name]
+            var = self._root.createVariable(
+                name,
+                _NP_TO_NC_TYPE[str(values.dtype)],
+                dims,
+                zlib=zlib,
+                complevel=complevel,
+                shuffle=shuffle,
+                chunksizes=chunksizes,
+            )
+            var.units = fields[at].units[name] or "?"
+            var.long_name = name
+            if hasattr(fields, "grid_mapping"):
+                setattr(var, "grid_mapping", fields.grid_mapping["name"])
+            self._buffers[name] = np.empty(
+                (buffer_size,) + self._shape, dtype=values.dtype
+            )
+
+        if hasattr(fields, "grid_mapping"):
+            _set_netcdf_grid_mapping_variable(self._root, dict(fields.grid_mapping))
+
+    @property
+    def number_of_snapshots(self):
+        """Number of snapshots written or buffered so far."""
+        return self._n_written + self._n_buffered
+
+    def write(self, time=None):
+        """Add a snapshot of the current field values.
+
+        Parameters
+        ----------
+        time : float, optional
+            Time of the snapshot. If not given, the number of the snapshot
+            is used.
+        """
+        if self._root is None:
+            raise ValueError("writer is closed")
+
+        n = self._n_buffered
+        for name in self._names:
+            self._buffers[name][n].flat = self._fields[self._at][name]
+        if time is None:
+            time = self.number_of_snapshots
+        self._times[n] = time
+        self._n_buffered += 1
+
+        if self._n_buffered == self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered snapshots to the file."""
+        n = self._n_buffered
+        if n == 0:
+            return
+
+        start, stop = self._n_written, self._n_written + n
+        variables = self._root.variables
+        variables["t"][start:stop] = self._times[:n]
+        for name in self._names:
+            variables[name][start:stop] = self._buffers[name][:n]
+        self._root.sync()
+
+        self._n_written = stop
+        self._n_buffered = 0
+
+    def close(self):
+        """Write buffered snapshots and close the file."""
+        if self._root is not None:
+            self.flush()
+            self._root.close()
+            self._root = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,3 +1,4 @@
 from .read_shapefile import read_shapefile
+from .write_shapefile import write_shapefile
 
-__all__ = ["read_shapefile"]
+__all__ = ["read_shapefile", "write_shapefile"]
@@ -3,24 +3,126 @@
 """
 Functions to read shapefiles and create a NetworkModelGrid.
 """
+import itertools
+
+import numpy as np
 import shapefile as ps
+import six
 from shapefile import ShapefileException
 
+from landlab.core.utils import argsort_points_by_x_then_y
 from landlab.grid.network import NetworkModelGrid
 
 
-def read_shapefile(file, dbf=None, store_polyline_vertices=True):
+def _open_shapefile(file, dbf=None):
+    """Open a shapefile from a path or from file-like objects."""
+    try:
+        if isinstance(file, six.string_types):
+            return ps.Reader(file)
+        else:
+            return ps.Reader(shp=file, dbf=dbf)
+    except ShapefileException:
+        raise ShapefileException(("Bad file path provided to read_shapefile."))
+
+
+def _unique_points(xy, decimals=None):
+    """Find the unique points of an array of points.
+
+    Points are compared by sorting, so that duplicates are found in
+    O(n log n) time.
+
+    Parameters
+    ----------
+    xy : ndarray of float, shape `(n_points, 2)`
+        Coordinates of points.
+    decimals : int, optional
+        Round coordinates to this many decimals before comparing them.
+
+    Returns
+    -------
+    (first, inverse) : tuple of ndarray of int
+        Index of the first occurrence of each unique point and, for each
+        point, the index of its unique point.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.shapefile.read_shapefile import _unique_points
+    >>> xy = np.array([[0., 1.], [1., 1.], [0., 1.], [1., 1.0001]])
+    >>> first, inverse = _unique_points(xy)
+    >>> first
+    array([0, 1, 3])
+    >>> inverse
+    array([0, 1, 0, 2])
+    >>> first, inverse = _unique_points(xy, decimals=2)
+    >>> first
+    array([0, 1])
+    >>> inverse
+    array([0, 1, 0, 1])
+    """
+    if decimals is not None:
+        xy = np.round(xy, decimals=decimals)
+    _, first, inverse = np.unique(xy, axis=0, return_index=True, return_inverse=True)
+    return first, inverse
+
+
+def _dbf_values_to_array(field, values):
+    """Convert the values of a dbf field to an array.
+
+    Numeric fields become arrays of int or, if they have decimals or missing
+    values, of float, with missing values as NaN.
+
+    Parameters
+    ----------
+    field : tuple
+        Name, type, size and number of decimals of the dbf field.
+    values : iterable
+        Values of the field, with missing values as None.
+
+    Returns
+    -------
+    ndarray
+        The values.
+
+    Examples
+    --------
+    >>> from landlab.io.shapefile.read_shapefile import _dbf_values_to_array
+    >>> _dbf_values_to_array(("spam", "N", 4, 0), (1, 2, 3))
+    array([1, 2, 3])
+    >>> _dbf_values_to_array(("spam", "N", 4, 0), (1, None, 3))
+    array([  1.,  nan,   3.])
+    >>> _dbf_values_to_array(("eggs", "C", 10, 0), ("foo", "bar"))
+    array(['foo', 'bar'],
+          dtype='<U3')
+    """
+    _, field_type, _, decimals = field
+    if field_type in ("N", "F"):
+        if decimals == 0 and None not in values:
+            return np.array(values, dtype=int)
+        else:
+            return np.array(
+                [np.nan if value is None else value for value in values],
+                dtype=float,
+            )
+    else:
+        return np.asarray(values)
+
+
+def read_shapefile(file, dbf=None, store_polyline_vertices=True, decimals=None):
     """Read shapefile and create a NetworkModelGrid.
 
     There are a number of assumptions that are requied about the shapefile.
         * The shape file must be a polyline shapefile.
         * All polylines must be their own object (e.g. no multi-part
           polylines).
-        * Polyline endpoints match perfectly.
+        * Polyline endpoints match perfectly (or, if *decimals* is given,
+          match once rounded).
 
-    You might notice that there is no ``write_shapefile`` function. If this is
-    something you need for your work, please make a GitHub issue to start this
-    process.
+    The endpoints of all polylines are gathered into a single array and
+    duplicate endpoints are found by sorting, so that large networks are
+    read in O(n log n) time. Use
+    :func:`~landlab.io.shapefile.write_shapefile.write_shapefile` to write a
+    :class:`~landlab.grid.network.NetworkModelGrid` to a shapefile.
 
     Parameters
     ----------
@@ -31,6 +133,9 @@ def read_shapefile(file, dbf=None, store_polyline_vertices=True):
     store_polyline_vertices: bool, optional
         If True (default), store the vertices of the polylines in
         the at_link fields ``x_of_polyline`` and ``y_of_polyline``.
+    decimals : int, optional
+        If given, polyline endpoints that are equal when rounded to this
+        many decimals are joined at the same node.
 
     Returns
     -------
@@ -38,6 +143,7 @@ def read_shapefile(file, dbf=None, store_polyline_vertices=True):
         The network model grid will have nodes at the endpoints of the
         polylines, and links that connect these nodes. Any fields
         associated with the shapefile will be added as at-link fields.
+        Missing values of numeric fields are NaN.
 
     Examples
     --------
@@ -78,16 +184,12 @@ def read_shapefile(file, dbf=None, store_polyline_vertices=True):
     >>> assert "spam" in grid.at_link
     >>> grid.at_link["spam"]
     array([100, 239, 37])
+    >>> grid.at_link["x_of_polyline"][1]
+    array([ 5.,  0.])
     """
-    try:
-        sf = ps.Reader(file)
-    except ShapefileException:
-        try:
-            sf = ps.Reader(shp=file, dbf=dbf)
-        except ShapefileException:
-            raise ShapefileException(("Bad file path provided to read_shapefile."))
+    sf = _open_shapefile(file, dbf=dbf)
 
-    if sf.shapeType is not 3:
+    if sf.shapeType != 3:
         raise ValueError(
             (
                 "landlab.io.shapefile read requires a polyline "
@@ -96,81 +198,70 @@ def read_shapefile(file, dbf=None, store_polyline_vertices=True):
             )
         )
 
-    # get record information, the first element is ('DeletionFlag', 'C', 1, 0)
-    # which we will ignore.
-    records = sf.fields[1:]
-
-    # initialize data structures for node (x,y) tuples,
-    # link (head_node_id, tail_node_id) tuples, and a dictionary of at-link
-    # fields.
-    # besides the at-link fields on the shapefile, we'll also store an array of
-    # x and y of the full polyline segment'.
-
-    node_xy = []
-    links = []
-    fields = {rec[0]: [] for rec in records}
-
-    if store_polyline_vertices:
-        fields["x_of_polyline"] = []
-        fields["y_of_polyline"] = []
-
-    record_order = [rec[0] for rec in records]
-
-    # itterate through shapes and records
-    shapeRecs = sf.shapeRecords()
-    for sr in shapeRecs:
-
-        # if not a multi-part polyline:
-        if len(sr.shape.parts) == 1:
-
-            # get all the points on the polyline and deconstruct into x and y
-            points = sr.shape.points
-            x, y = zip(*points)
-
-            # construct the (x,y) tuples of the head and tail nodes of each
-            # polyline. Note here, that head and tail just refer to starting and
-            # ending, they will be re-oriented if necessary by landlab.
-
-            head_node_xy = (x[0], y[0])
-            tail_node_xy = (x[-1], y[-1])
-
-            # we should expect that the head node and tail node of later links will
-            # already be part of the model grid. So we check, and add the nodes,
-            # if they don't already exist.
-
-            if head_node_xy not in node_xy:
-                node_xy.append(head_node_xy)
-
-            if tail_node_xy not in node_xy:
-                node_xy.append(tail_node_xy)
-
-            # get the index of the head and tail node index.
-            head_node__node_id = node_xy.index(head_node_xy)
-            tail_node__node_id = node_xy.index(tail_node_xy)
-
-            # append the head and tail node ids to the link array
-            links.append((head_node__node_id, tail_node__node_id))
+    shapes = sf.shapes()
+    if any(len(shape.parts) != 1 for shape in shapes):
+        raise ValueError(
+            (
+                "landlab.io.shapefile currently does not support "
+                "reading multipart polyline shapefiles."
+            )
+        )
 
-            for i in range(len(sr.record)):
-                field_name = record_order[i]
-                fields[field_name].append(sr.record[i])
+    # gather the vertices of all of the polylines into a single array, with
+    # offsets to the first vertex of each polyline.
+    n_vertices = np.fromiter((len(shape.points) for shape in shapes), dtype=int)
+    offset = np.concatenate(([0], np.cumsum(n_vertices)))
+    vertices = np.array(
+        list(itertools.chain.from_iterable(shape.points for shape in shapes)),
+        dtype=float,
+    ).reshape((-1, 2))
+
+    # endpoints are ordered as (head of link 0, tail of link 0, head of
+    # link 1, ...). Note here, that head and tail just refer to starting and
+    # ending, they will be re-oriented if necessary by landlab.
+    endpoints = np.empty((len(shapes), 2, 2), dtype=float)
+    endpoints[:, 0] = vertices[offset[:-1]]
+    endpoints[:, 1] = vertices[offset[1:] - 1]
+
+    first, node_at_endpoint = _unique_points(
+        endpoints.reshape((-1, 2)), decimals=decimals
+    )
+    x_of_node = endpoints.reshape((-1, 2))[first, 0]
+    y_of_node = endpoints.reshape((-1, 2))[first, 1]
+    nodes_at_link = node_at_endpoint.reshape((-1, 2))
+
+    # put nodes and links into the order that the grid sorts them into so
+    # that at-link values line up with their links.
+    sorted_nodes = argsort_points_by_x_then_y(
+        (x_of_node, np.round(y_of_node, decimals=6))
+    )
+    x_of_node, y_of_node = x_of_node[sorted_nodes], y_of_node[sorted_nodes]
+    nodes_at_link = np.argsort(sorted_nodes)[nodes_at_link]
+
+    sorted_links = argsort_points_by_x_then_y(
+        (
+            x_of_node[nodes_at_link].mean(axis=1),
+            np.round(y_of_node, decimals=6)[nodes_at_link].mean(axis=1),
+        )
+    )
+    nodes_at_link = nodes_at_link[sorted_links]
 
-            if store_polyline_vertices:
-                fields["x_of_polyline"].append(x)
-                fields["y_of_polyline"].append(y)
+    grid = NetworkModelGrid((y_of_node, x_of_node), nodes_at_link)
 
-        else:
-            raise ValueError(
-                (
-                    "landlab.io.shapefile currently does not support ",
-                    "reading multipart polyline shapefiles.",
-                )
-            )
+    # get record information, the first element is ('DeletionFlag', 'C', 1, 0)
+    # which we will ignore.
+    records = sf.records()
+    for field, values in zip(sf.fields[1:], zip(*records)):
+        grid.at_link[field[0]] = _dbf_values_to_array(field, values)[sorted_links]
 
-    # Create a Network Model Grid
-    x_of_node, y_of_node = zip(*node_xy)
-    grid = NetworkModelGrid((y_of_node, x_of_node), links)
-    for field_name in fields:
-        grid.at_link[field_name] = fields[field_name]
+    if store_polyline_vertices:
+        x_of_polyline = np.empty(len(shapes), dtype=object)
+        y_of_polyline = np.empty(len(shapes), dtype=object)
+        for link, polyline in enumerate(sorted_links):
+            start, stop = offset[polyline], offset[polyline + 1]
+            x_of_polyline[link] = vertices[start:stop, 0]
+            y_of_polyline[link] = vertices[start:stop, 1]
+        grid.at_link["x_of_polyline"] = x_of_polyline
+        grid.at_link["y_of_polyline"] = y_of_polyline
 
     return grid
@@ -1,8 +1,13 @@
 import os
 
+import numpy as np
+import shapefile
+from numpy.testing import assert_array_equal
 from pytest import approx, raises
 from shapefile import ShapefileException
+from six import BytesIO
 
+from landlab.grid.network import NetworkModelGrid
 from landlab.io.shapefile import read_shapefile
 
 _TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
@@ -40,3 +45,57 @@ def test_multipart():
     file = os.path.join(_TEST_DATA_DIR, "multipartpolyline.shp")
     with raises(ValueError):
         read_shapefile(file)
+
+
+def test_links_out_of_order(tmpdir):
+    grid = NetworkModelGrid(((0, 5, 10, 10), (5, 5, 0, 10)), ((0, 1), (1, 2), (1, 3)))
+    grid.add_field("link", "spam", np.array([100, 239, 37]))
+
+    shp, shx, dbf = BytesIO(), BytesIO(), BytesIO()
+    w = shapefile.Writer(shp=shp, shx=shx, dbf=dbf, shapeType=3)
+    w.field("spam", "N")
+    for link in (2, 0, 1):
+        tail, head = grid.nodes_at_link[link]
+        w.line(
+            [[[grid.x_of_node[head], grid.y_of_node[head]],
+              [grid.x_of_node[tail], grid.y_of_node[tail]]]]
+        )
+        w.record(grid.at_link["spam"][link])
+    w.close()
+
+    copy = read_shapefile(shp, dbf=dbf)
+    assert_array_equal(np.sort(copy.nodes_at_link, axis=1), grid.nodes_at_link)
+    assert_array_equal(copy.at_link["spam"], grid.at_link["spam"])
+    assert_array_equal(copy.at_link["x_of_polyline"][0], [5., 5.])
+    assert_array_equal(copy.at_link["y_of_polyline"][0], [5., 0.])
+
+
+def test_nearly_matching_endpoints(tmpdir):
+    with tmpdir.as_cwd():
+        with shapefile.Writer("lines.shp", shapeType=3) as w:
+            w.field("spam", "N")
+            w.line([[[5., 0.], [5., 5.]]])
+            w.record(1)
+            w.line([[[5.0001, 5.], [0., 10.]]])
+            w.record(2)
+
+        assert read_shapefile("lines.shp").number_of_nodes == 4
+        assert read_shapefile("lines.shp", decimals=2).number_of_nodes == 3
+
+
+def test_missing_values(tmpdir):
+    with tmpdir.as_cwd():
+        with shapefile.Writer("lines.shp", shapeType=3) as w:
+            w.field("count", "N", 4, 0)
+            w.field("width", "N", 12, 6)
+            w.field("name", "C", 10)
+            w.line([[[5., 0.], [5., 5.]]])
+            w.record(1, None, "Twisp")
+            w.line([[[5., 5.], [0., 10.]]])
+            w.record(None, 2.5, "Methow")
+
+        grid = read_shapefile("lines.shp")
+
+    assert_array_equal(grid.at_link["count"], [1., np.nan])
+    assert_array_equal(grid.at_link["width"], [np.nan, 2.5])
+    assert_array_equal(grid.at_link["name"], ["Twisp", "Methow"])
@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from pytest import raises
+
+from landlab.grid.network import NetworkModelGrid
+from landlab.io.shapefile import read_shapefile, write_shapefile
+
+_TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def test_round_trip_methow(tmpdir):
+    grid = read_shapefile(os.path.join(_TEST_DATA_DIR, "Methow_Network.shp"))
+    with tmpdir.as_cwd():
+        write_shapefile("methow.shp", grid)
+        copy = read_shapefile("methow.shp")
+
+    assert_array_equal(copy.x_of_node, grid.x_of_node)
+    assert_array_equal(copy.y_of_node, grid.y_of_node)
+    assert_array_equal(copy.nodes_at_link, grid.nodes_at_link)
+    for name in ("Length_m", "ToLink", "usarea_km2", "uselev_m", "dselev_m", "Slope"):
+        assert_array_almost_equal(copy.at_link[name], grid.at_link[name], decimal=8)
+    for link in range(grid.number_of_links):
+        assert_array_equal(
+            copy.at_link["x_of_polyline"][link], grid.at_link["x_of_polyline"][link]
+        )
+
+
+def test_field_types(tmpdir):
+    grid = NetworkModelGrid(((0, 5, 10), (5, 5, 0)), ((0, 1), (1, 2)))
+    grid.add_field("link", "is_river", np.array([True, False]))
+    grid.add_field("link", "name", np.array(["Methow", "Twisp"]))
+    grid.add_field("link", "width", np.array([1.25, 2.5]))
+    grid.add_field("link", "order", np.array([1, 2]))
+    with tmpdir.as_cwd():
+        write_shapefile("network.shp", grid)
+        copy = read_shapefile("network.shp", store_polyline_vertices=False)
+
+    assert sorted(copy.at_link.keys()) == ["is_river", "name", "order", "width"]
+    assert_array_equal(copy.at_link["is_river"], [True, False])
+    assert_array_equal(copy.at_link["name"], ["Methow", "Twisp"])
+    assert_array_equal(copy.at_link["width"], [1.25, 2.5])
+    assert_array_equal(copy.at_link["order"], [1, 2])
+
+
+def test_no_fields(tmpdir):
+    grid = NetworkModelGrid(((0, 5, 10), (5, 5, 0)), ((0, 1), (1, 2)))
+    with tmpdir.as_cwd():
+        write_shapefile("network.shp", grid)
+        copy = read_shapefile("network.shp", store_polyline_vertices=False)
+
+    assert list(copy.at_link.keys()) == ["link"]
+    assert_array_equal(copy.at_link["link"], [0, 1])
+
+
+def test_clobber(tmpdir):
+    grid = NetworkModelGrid(((0, 5, 10), (5, 5, 0)), ((0, 1), (1, 2)))
+    with tmpdir.as_cwd():
+        write_shapefile("network.shp", grid)
+        with raises(ValueError):
+            write_shapefile("network.shp", grid)
+        write_shapefile("network.shp", grid, clobber=True)
+
+
+def test_bad_field(tmpdir):
+    grid = NetworkModelGrid(((0, 5, 10), (5, 5, 0)), ((0, 1), (1, 2)))
+    grid.add_ones("link", "a_long_field_name")
+    with tmpdir.as_cwd():
+        with raises(ValueError):
+            write_shapefile("network.shp", grid)
+        with raises(ValueError):
+            write_shapefile("network.shp", grid, names=["not_a_field"])
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Functions to write a NetworkModelGrid to a shapefile.
+"""
+import os
+
+import numpy as np
+import shapefile as ps
+import six
+
+# Width and number of decimals of the dbf fields that hold integer and
+# floating-point values.
+_INT_FIELD_SIZE = 19
+_FLOAT_FIELD_SIZE, _FLOAT_FIELD_DECIMALS = 19, 11
+
+# The longest name of a dbf field, and the widest character field.
+_MAX_FIELD_NAME_LENGTH = 10
+_MAX_CHAR_FIELD_SIZE = 254
+
+_POLYLINE_FIELDS = ("x_of_polyline", "y_of_polyline")
+
+
+def _get_dbf_field(name, values):
+    """Describe the dbf field that stores an array of values.
+
+    Parameters
+    ----------
+    name : str
+        Name of the field.
+    values : ndarray
+        Values of the field.
+
+    Returns
+    -------
+    tuple
+        The field's (name, type, size, decimals) as used by
+        :meth:`shapefile.Writer.field`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.shapefile.write_shapefile import _get_dbf_field
+    >>> _get_dbf_field("spam", np.array([1, 2]))
+    ('spam', 'N', 19, 0)
+    >>> _get_dbf_field("eggs", np.array(["foo", "spam"]))
+    ('eggs', 'C', 4, 0)
+    """
+    if len(name) > _MAX_FIELD_NAME_LENGTH:
+        raise ValueError(
+            "{0}: dbf field names must be at most {1} characters".format(
+                name, _MAX_FIELD_NAME_LENGTH
+            )
+        )
+    if values.ndim != 1:
+        raise ValueError("{0}: field must have one value per link".format(name))
+
+    if values.dtype == np.bool_:
+        return (name, "L", 1, 0)
+    elif np.issubdtype(values.dtype, np.integer):
+        return (name, "N", _INT_FIELD_SIZE, 0)
+    elif np.issubdtype(values.dtype, np.floating):
+        return (name, "N", _FLOAT_FIELD_SIZE, _FLOAT_FIELD_DECIMALS)
+    elif values.dtype.kind in ("U", "S"):
+        size = np.char.str_len(values).max() if len(values) > 0 else 1
+        return (name, "C", int(min(max(size, 1), _MAX_CHAR_FIELD_SIZE)), 0)
+    else:
+        raise ValueError(
+            "{0}: unable to write field of type {1}".format(name, values.dtype)
+        )
+
+
+def _values_to_list(values):
+    """Convert an array to a list of values with NaN as missing (None).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.shapefile.write_shapefile import _values_to_list
+    >>> _values_to_list(np.array([1., np.nan]))
+    [1.0, None]
+    """
+    as_list = values.tolist()
+    if np.issubdtype(values.dtype, np.floating):
+        for index in np.flatnonzero(np.isnan(values)):
+            as_list[index] = None
+    return as_list
+
+
+def write_shapefile(path, grid, names=None, clobber=False):
+    """Write a NetworkModelGrid to a polyline shapefile.
+
+    Each link of *grid* is written as a polyline, and at-link fields are
+    written as the polylines' records. If *grid* has the at-link fields
+    ``x_of_polyline`` and ``y_of_polyline`` (as created by
+    :func:`~landlab.io.shapefile.read_shapefile.read_shapefile`), they are
+    used as the polylines' vertices, otherwise each polyline joins the two
+    nodes of its link. A grid written this way is recreated by reading the
+    file back in.
+
+    Parameters
+    ----------
+    path : str
+        Path to the output shapefile. The *.shx* and *.dbf* files are
+        written next to it.
+    grid : NetworkModelGrid
+        The grid to write.
+    names : iterable of str, optional
+        Names of the at-link fields to write. If not provided, write all
+        at-link fields, other than the polyline vertices, that hold a value
+        per link.
+    clobber : boolean, optional
+        If *path* exists, clobber the existing file, otherwise raise an
+        exception.
+
+    Returns
+    -------
+    list of str
+        Paths of the files written.
+
+    Notes
+    -----
+    A dbf file must have at least one field so, if there are no fields to
+    write, the link ids are written as the field *link*. Integer and
+    floating-point fields are written as dbf numeric fields, with NaN as a
+    missing value, and floating-point values are written with up to 11
+    decimals. Names of dbf fields are at most 10 characters.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.network import NetworkModelGrid
+    >>> from landlab.io.shapefile import read_shapefile, write_shapefile
+    >>> from landlab.testing.tools import cdtemp
+
+    >>> grid = NetworkModelGrid(
+    ...     ((0, 5, 10, 10), (5, 5, 0, 10)), ((0, 1), (1, 2), (1, 3))
+    ... )
+    >>> _ = grid.add_field("link", "spam", np.array([100, 239, 37]))
+    >>> with cdtemp() as _:
+    ...     files = write_shapefile("network.shp", grid)
+    ...     copy = read_shapefile("network.shp")
+    >>> files
+    ['network.shp', 'network.shx', 'network.dbf']
+    >>> copy.x_of_node
+    array([  5.,   5.,   0.,  10.])
+    >>> copy.nodes_at_link
+    array([[0, 1],
+           [1, 2],
+           [1, 3]])
+    >>> copy.at_link["spam"]
+    array([100, 239, 37])
+    """
+    root, ext = os.path.splitext(path)
+    if ext.lower() != ".shp":
+        root = path
+    paths = [root + suffix for suffix in (".shp", ".shx", ".dbf")]
+
+    if not clobber and any(os.path.exists(p) for p in paths):
+        raise ValueError("file exists")
+
+    if isinstance(names, six.string_types):
+        names = [names]
+    if names is None:
+        names = [
+            name
+            for name in sorted(grid.at_link.keys())
+            if name not in _POLYLINE_FIELDS and grid.at_link[name].ndim == 1
+        ]
+    else:
+        bad_names = set(names) - set(grid.at_link.keys())
+        if len(bad_names) > 0:
+            raise ValueError("unknown field name(s): %s" % ",".join(bad_names))
+
+    fields = [_get_dbf_field(name, grid.at_link[name]) for name in names]
+
+    if all(name in grid.at_link for name in _POLYLINE_FIELDS):
+        x_of_polyline = grid.at_link["x_of_polyline"]
+        y_of_polyline = grid.at_link["y_of_polyline"]
+    else:
+        x_of_polyline = grid.x_of_node[grid.nodes_at_link]
+        y_of_polyline = grid.y_of_node[grid.nodes_at_link]
+
+    # convert all of the values to python objects up front rather than
+    # one record at a time.
+    if names:
+        records = zip(*[_values_to_list(grid.at_link[name]) for name in names])
+    else:
+        fields = [("link", "N", _INT_FIELD_SIZE, 0)]
+        records = ((link,) for link in range(grid.number_of_links))
+
+    with ps.Writer(paths[0], shapeType=ps.POLYLINE) as shp:
+        for field in fields:
+            shp.field(*field)
+        for x, y, record in zip(x_of_polyline, y_of_polyline, records):
+            shp.line([np.column_stack((x, y)).tolist()])
+            shp.record(*record)
+
+    return paths
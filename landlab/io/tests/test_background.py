@@ -0,0 +1,150 @@
+import threading
+
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.grid.network import NetworkModelGrid
+from landlab.io import BackgroundWriter
+from landlab.io.background import snapshot_fields
+from landlab.io.native_landlab import load_grid, save_grid
+from landlab.io.netcdf import read_netcdf, write_netcdf
+
+
+def test_snapshots_are_not_changed(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    z = grid.add_zeros("node", "topographic__elevation")
+    with tmpdir.as_cwd():
+        with BackgroundWriter(max_pending=3) as writer:
+            for time in range(4):
+                z[:] = time
+                writer.write(write_netcdf, "z-{0}.nc".format(time), grid)
+                z[:] = -1.
+
+        for time in range(4):
+            copy = read_netcdf("z-{0}.nc".format(time))
+            assert_array_equal(copy.at_node["topographic__elevation"], time)
+
+
+def test_grid_as_keyword(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    grid.add_ones("node", "topographic__elevation")
+    with tmpdir.as_cwd():
+        with BackgroundWriter() as writer:
+            writer.write(save_grid, grid=grid, path="grid.grid")
+        copy = load_grid("grid.grid")
+    assert_array_equal(copy.at_node["topographic__elevation"], 1.)
+
+
+def test_snapshot_named_fields():
+    grid = RasterModelGrid((4, 5))
+    grid.add_zeros("node", "topographic__elevation")
+    grid.add_zeros("node", "soil__depth")
+    grid.add_zeros("cell", "soil__depth")
+
+    snapshot = snapshot_fields(grid, names=["soil__depth"])
+    assert list(snapshot.at_node.keys()) == ["soil__depth"]
+    assert list(snapshot.at_cell.keys()) == ["soil__depth"]
+
+    snapshot = snapshot_fields(grid, names="soil__depth", at="cell")
+    assert list(snapshot.at_node.keys()) == []
+    assert list(snapshot.at_cell.keys()) == ["soil__depth"]
+
+    with pytest.raises(KeyError):
+        snapshot_fields(grid, names="topographic__elevation", at="cell")
+
+    assert list(grid.at_node.keys()) == ["topographic__elevation", "soil__depth"]
+
+
+def test_snapshot_network_grid():
+    grid = NetworkModelGrid(((0, 5, 10), (5, 5, 0)), ((0, 1), (1, 2)))
+    width = grid.add_ones("link", "channel_width")
+    snapshot = snapshot_fields(grid)
+    width[:] = 2.
+    assert_array_equal(snapshot.at_link["channel_width"], 1.)
+    assert_array_equal(snapshot.nodes_at_link, grid.nodes_at_link)
+
+
+def test_snapshot_has_its_own_node_status():
+    grid = RasterModelGrid((4, 5))
+    grid.add_zeros("node", "topographic__elevation")
+    status_at_link = grid.status_at_link.copy()
+    active_links = grid.active_links.copy()
+
+    snapshot = snapshot_fields(grid)
+    grid.status_at_node[7] = grid.BC_NODE_IS_CLOSED
+
+    assert_array_equal(snapshot.status_at_link, status_at_link)
+    assert_array_equal(snapshot.active_links, active_links)
+    assert snapshot.status_at_node[7] == grid.BC_NODE_IS_CORE
+    assert grid.status_at_link[grid.links_at_node[7]].tolist() == [4, 4, 4, 4]
+
+    snapshot.status_at_node[8] = grid.BC_NODE_IS_CLOSED
+    assert grid.status_at_node[8] == grid.BC_NODE_IS_CORE
+    assert snapshot.status_at_link[grid.links_at_node[7]].tolist() == [4, 0, 0, 0]
+
+
+def test_buffers_are_reused():
+    grid = RasterModelGrid((4, 5))
+    grid.add_zeros("node", "topographic__elevation")
+    written = []
+
+    def write(grid):
+        written.append(grid.at_node["topographic__elevation"])
+
+    with BackgroundWriter() as writer:
+        writer.write(write, grid)
+        writer.flush()
+        writer.write(write, grid)
+
+    assert written[0] is written[1]
+    assert written[0] is not grid.at_node["topographic__elevation"]
+
+
+def test_backpressure():
+    grid = RasterModelGrid((4, 5))
+    grid.add_zeros("node", "topographic__elevation")
+    release = threading.Event()
+    n_written = []
+
+    def write(grid):
+        release.wait()
+        n_written.append(1)
+
+    writer = BackgroundWriter(max_pending=1)
+    writer.write(write, grid)
+    writer.write(write, grid)
+
+    blocked = threading.Thread(target=writer.write, args=(write, grid))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+    assert writer.number_of_pending == 2
+
+    release.set()
+    blocked.join()
+    writer.close()
+    assert len(n_written) == 3
+    assert writer.number_of_pending == 0
+
+
+def test_error_is_raised():
+    grid = RasterModelGrid((4, 5))
+
+    def write(grid):
+        raise RuntimeError("disk full")
+
+    writer = BackgroundWriter()
+    writer.write(write, grid)
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write(write, grid)
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        BackgroundWriter(max_pending=0)
+    with pytest.raises(ValueError):
+        BackgroundWriter(n_workers=0)
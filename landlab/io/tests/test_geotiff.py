@@ -0,0 +1,100 @@
+#! /usr/bin/env python
+"""Unit tests for landlab.io.geotiff module."""
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.io import read_geotiff, write_geotiff
+from landlab.io.geotiff import WITH_RASTERIO
+
+if WITH_RASTERIO:
+    import rasterio
+    from rasterio.windows import Window
+
+pytestmark = pytest.mark.skipif(
+    not WITH_RASTERIO, reason="rasterio package not installed"
+)
+
+
+def test_write_then_read(tmpdir):
+    grid = RasterModelGrid((40, 30), xy_spacing=(2., 3.), xy_of_lower_left=(15., 10.))
+    values = grid.add_field("node", "air__temperature", np.random.rand(1200))
+
+    with tmpdir.as_cwd():
+        write_geotiff("test.tif", grid)
+        new_grid, field = read_geotiff("test.tif")
+
+    assert new_grid.shape == (40, 30)
+    assert (new_grid.dx, new_grid.dy) == (2., 3.)
+    assert_array_equal(new_grid.x_of_node, grid.x_of_node)
+    assert_array_equal(new_grid.y_of_node, grid.y_of_node)
+    assert_array_equal(field, values)
+
+
+def test_read_in_chunks(tmpdir, monkeypatch):
+    import landlab.io.geotiff
+
+    monkeypatch.setattr(landlab.io.geotiff, "_CHUNK_SIZE", 100)
+
+    grid = RasterModelGrid((100, 60))
+    values = grid.add_field("node", "topographic__elevation", np.arange(6000.))
+
+    with tmpdir.as_cwd():
+        write_geotiff("test.tif", grid, tile_size=16, compress=None)
+        with rasterio.open("test.tif") as src:
+            assert src.block_shapes[0] == (16, 16)
+            assert src.compression is None
+        _, field = read_geotiff("test.tif", reshape=True)
+        _, part = read_geotiff("test.tif", window=Window(5, 10, 40, 50))
+
+    assert_array_equal(field, values.reshape((100, 60)))
+    assert_array_equal(part, values.reshape((100, 60))[40:90, 5:45].flat)
+
+
+def test_read_bands(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    grid.add_field("node", "a", np.arange(20, dtype=np.int16))
+    grid.add_field("node", "b", np.arange(20, dtype=np.int32) * 2)
+
+    with tmpdir.as_cwd():
+        write_geotiff("test.tif", grid, crs="EPSG:32613", nodata=-1)
+        with rasterio.open("test.tif") as src:
+            assert src.crs.to_epsg() == 32613
+            assert src.nodata == -1
+            assert src.descriptions == ("a", "b")
+
+        _, a = read_geotiff("test.tif", band=1)
+        new_grid, b = read_geotiff("test.tif", band=2, name="b", grid=RasterModelGrid((4, 5)))
+
+    assert a.dtype == np.int32
+    assert_array_equal(a, np.arange(20))
+    assert_array_equal(b, np.arange(20) * 2)
+    assert new_grid.at_node["b"] is b
+
+
+def test_grid_shape_mismatch(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    grid.add_ones("node", "topographic__elevation")
+
+    with tmpdir.as_cwd():
+        write_geotiff("test.tif", grid)
+        with pytest.raises(ValueError):
+            read_geotiff("test.tif", grid=RasterModelGrid((5, 4)))
+
+
+def test_bad_arguments(tmpdir):
+    grid = RasterModelGrid((4, 5))
+
+    with tmpdir.as_cwd():
+        with pytest.raises(ValueError):
+            write_geotiff("test.tif", grid)
+
+        grid.add_ones("node", "topographic__elevation")
+        with pytest.raises(ValueError):
+            write_geotiff("test.tif", grid, names="not_a_field")
+
+        write_geotiff("test.tif", grid)
+        with pytest.raises(ValueError):
+            write_geotiff("test.tif", grid)
+        write_geotiff("test.tif", grid, clobber=True)
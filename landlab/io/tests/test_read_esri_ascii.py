@@ -415,3 +415,92 @@ def test_halo_keyword_no_nodata_value():
             ]
         ),
     )
+
+
+def test_read_in_small_chunks(monkeypatch):
+    """Test that values split across chunks are read correctly."""
+    import landlab.io.esri_ascii
+
+    monkeypatch.setattr(landlab.io.esri_ascii, "_READ_CHUNK_SIZE", 3)
+    (grid, field) = read_esri_ascii(os.path.join(_TEST_DATA_DIR, "4_x_3.asc"), halo=1)
+
+    assert_array_equal(
+        field.reshape((6, 5))[1:-1, 1:-1],
+        [[9., 10., 11.], [6., 7., 8.], [3., 4., 5.], [0., 1., 2.]],
+    )
+    assert np.all(field.reshape((6, 5))[(0, -1), :] == -9999.)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 25))
+def test_read_values_split_across_chunks(monkeypatch, chunk_size):
+    """Test that signs, exponents, inf and nan can be split across chunks."""
+    import landlab.io.esri_ascii
+
+    monkeypatch.setattr(landlab.io.esri_ascii, "_READ_CHUNK_SIZE", chunk_size)
+    asc_file = StringIO(
+        """nrows 3
+ncols 3
+xllcorner 0.
+yllcorner 0.
+cellsize 1.
+NODATA_value -9999
+1e5 2e5 -3
+1.5e-3 inf nan
+1 -9999 3
+"""
+    )
+    (grid, field) = read_esri_ascii(asc_file)
+
+    assert_array_equal(
+        field, [1., -9999., 3., 1.5e-3, np.inf, np.nan, 1e5, 2e5, -3.]
+    )
+
+
+def test_bad_value():
+    asc_file = StringIO(
+        """
+nrows         4
+ncols         3
+xllcorner     1.
+yllcorner     2.
+cellsize      10.
+1. 2. 3. 4. 5. 6. 7. 8. 9. 10. eleven 12.
+        """
+    )
+    with pytest.raises(ValueError):
+        read_esri_ascii(asc_file)
+
+
+@pytest.mark.parametrize("value", ["0x10", "infinity", "nan(1)", "1,5"])
+def test_bad_value_spelling(value):
+    asc_file = StringIO(
+        """
+nrows         3
+ncols         3
+xllcorner     1.
+yllcorner     2.
+cellsize      10.
+1. 2. 3. 4. 5. 6. 7. 8. {0}
+        """.format(
+            value
+        )
+    )
+    with pytest.raises(ValueError):
+        read_esri_ascii(asc_file)
+
+
+def test_inf_and_nan_values():
+    asc_file = StringIO(
+        """
+nrows         3
+ncols         3
+xllcorner     1.
+yllcorner     2.
+cellsize      10.
+1e3 inf -INF
+NaN 0. 0.
+0. 0. 0.
+        """
+    )
+    (grid, field) = read_esri_ascii(asc_file)
+    assert_array_equal(field[3:], [np.nan, 0., 0., 1e3, np.inf, -np.inf])
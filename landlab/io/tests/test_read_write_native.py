@@ -2,11 +2,13 @@
 import os
 import pickle
 
+import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
-from landlab import RasterModelGrid
+from landlab import HexModelGrid, RasterModelGrid, VoronoiDelaunayGrid
 from landlab.components import FlowAccumulator
-from landlab.io.native_landlab import load_grid, save_grid
+from landlab.io.native_landlab import FORMAT_VERSION, load_grid, save_grid
 
 
 def compare_dictionaries(dict_1, dict_2, dict_1_name, dict_2_name, path=""):
@@ -144,3 +146,157 @@ def test_save():
     #     raise
     # finally:
     #     os.remove('testsavedgrid.grid')
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+@pytest.mark.parametrize("mmap_mode", ["c", "r", "r+", None])
+def test_save_binary_raster(tmpdir, mmap_mode):
+    grid = RasterModelGrid((4, 5), xy_spacing=(2., 3.), xy_of_lower_left=(1., -1.))
+    grid.add_field("node", "topographic__elevation", np.arange(20.), units="m")
+    grid.add_field("link", "flag", np.arange(31, dtype=np.int8))
+    grid.status_at_node[6] = grid.BC_NODE_IS_CLOSED
+
+    with tmpdir.as_cwd():
+        save_grid(grid, "test.grid")
+        with open("test.grid", "rb") as fp:
+            assert fp.read(8) == b"\x93LANDLAB"
+
+        loaded = load_grid("test.grid", mmap_mode=mmap_mode)
+        assert type(loaded) is RasterModelGrid
+        assert loaded.shape == (4, 5)
+        assert (loaded.dx, loaded.dy) == (2., 3.)
+        assert_array_equal(loaded.x_of_node, grid.x_of_node)
+        assert_array_equal(loaded.y_of_node, grid.y_of_node)
+        assert_array_equal(loaded.status_at_node, grid.status_at_node)
+        assert_array_equal(loaded.status_at_link, grid.status_at_link)
+
+        z = loaded.at_node["topographic__elevation"]
+        assert_array_equal(z, np.arange(20.))
+        assert loaded.field_units("node", "topographic__elevation") == "m"
+        assert loaded.at_link["flag"].dtype == np.int8
+        assert_array_equal(loaded.at_link["flag"], np.arange(31))
+
+        assert _is_memory_mapped(z) == (mmap_mode is not None)
+        if mmap_mode == "r":
+            with pytest.raises(ValueError):
+                z[0] = 100.
+        else:
+            z[0] = 100.
+            del z, loaded
+            z = load_grid("test.grid").at_node["topographic__elevation"]
+            assert z[0] == (100. if mmap_mode == "r+" else 0.)
+            del z
+
+
+def test_save_binary_voronoi(tmpdir):
+    grid = VoronoiDelaunayGrid(np.random.rand(20), np.random.rand(20))
+    grid.add_field("cell", "air__temperature", np.random.rand(grid.number_of_cells))
+
+    with tmpdir.as_cwd():
+        save_grid(grid, "test")
+        loaded = load_grid("test", mmap_mode=None)
+
+    assert type(loaded) is VoronoiDelaunayGrid
+    assert_array_equal(loaded.x_of_node, grid.x_of_node)
+    assert_array_equal(loaded.nodes_at_link, grid.nodes_at_link)
+    assert_array_equal(loaded.at_cell["air__temperature"], grid.at_cell["air__temperature"])
+
+
+def test_save_other_grid_as_pickle(tmpdir):
+    grid = HexModelGrid(3, 4)
+
+    with tmpdir.as_cwd():
+        save_grid(grid, "test.grid")
+        with open("test.grid", "rb") as fp:
+            assert isinstance(pickle.load(fp), HexModelGrid)
+        loaded = load_grid("test.grid")
+
+    assert type(loaded) is HexModelGrid
+    assert_array_equal(loaded.x_of_node, grid.x_of_node)
+
+
+def test_load_pickled_raster(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    grid.add_ones("node", "topographic__elevation")
+
+    with tmpdir.as_cwd():
+        with open("test.grid", "wb") as fp:
+            pickle.dump(grid, fp)
+        loaded = load_grid("test.grid")
+
+    assert loaded.shape == (4, 5)
+    assert_array_equal(loaded.at_node["topographic__elevation"], 1.)
+
+
+def test_load_newer_version(tmpdir):
+    with tmpdir.as_cwd():
+        save_grid(RasterModelGrid((3, 3)), "test.grid")
+        with open("test.grid", "r+b") as fp:
+            header = fp.read(4096)
+            fp.seek(header.index(b'"version": ') + 11)
+            fp.write(str(FORMAT_VERSION + 1).encode())
+        with pytest.raises(ValueError):
+            load_grid("test.grid")
+
+
+@pytest.mark.parametrize("mmap_mode", ["c", "r", "r+"])
+def test_save_loaded_grid_to_same_file(tmpdir, mmap_mode):
+    grid = RasterModelGrid((4, 5))
+    grid.add_field("node", "topographic__elevation", np.arange(20.))
+
+    with tmpdir.as_cwd():
+        save_grid(grid, "test.grid")
+        for _ in range(3):
+            loaded = load_grid("test.grid", mmap_mode=mmap_mode)
+            if mmap_mode != "r":
+                loaded.at_node["topographic__elevation"] += 1.
+            save_grid(loaded, "test.grid", clobber=True)
+        z = loaded.at_node["topographic__elevation"]
+        expected = np.arange(20.) + (0. if mmap_mode == "r" else 3.)
+        assert_array_equal(z, expected)
+
+        reloaded = load_grid("test.grid", mmap_mode=None)
+        assert os.listdir(".") == ["test.grid"]
+
+    assert_array_equal(reloaded.at_node["topographic__elevation"], expected)
+
+
+def test_save_binary_keeps_axes_and_reference(tmpdir):
+    grid = RasterModelGrid(
+        (3, 4), axis_name=("northing", "easting"), axis_units=("km", "km")
+    )
+    grid.xy_of_reference = (1000., 2000.)
+
+    with tmpdir.as_cwd():
+        save_grid(grid, "test.grid")
+        with open("test.grid", "rb") as fp:
+            assert fp.read(8) == b"\x93LANDLAB"
+        loaded = load_grid("test.grid", mmap_mode=None)
+
+    assert loaded.axis_name == ("northing", "easting")
+    assert loaded.axis_units == ("km", "km")
+    assert loaded.xy_of_reference == (1000., 2000.)
+
+
+def test_save_grid_with_layers_as_pickle(tmpdir):
+    grid = RasterModelGrid((3, 4))
+    grid.event_layers.add(1.5)
+    grid.material_layers.add(2., age=3.)
+
+    with tmpdir.as_cwd():
+        save_grid(grid, "test.grid")
+        with open("test.grid", "rb") as fp:
+            assert fp.read(8) != b"\x93LANDLAB"
+        loaded = load_grid("test.grid")
+
+    assert loaded.event_layers.number_of_layers == 1
+    assert_array_equal(loaded.event_layers.thickness, 1.5)
+    assert loaded.material_layers.number_of_layers == 1
+    assert_array_equal(loaded.material_layers["age"], 3.)
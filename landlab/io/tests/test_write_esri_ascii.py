@@ -3,7 +3,7 @@ import os
 
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from landlab import RasterModelGrid
 from landlab.io import read_esri_ascii, write_esri_ascii
@@ -120,3 +120,17 @@ def test_write_then_read(tmpdir):
     assert_array_almost_equal(grid.node_x, new_grid.node_x)
     assert_array_almost_equal(grid.node_y, new_grid.node_y)
     assert_array_almost_equal(field, grid.at_node["air__temperature"])
+
+
+def test_write_then_read_is_exact(tmpdir):
+    grid = RasterModelGrid((5, 4), xy_spacing=(0.1, 0.1))
+    values = grid.add_field("node", "air__temperature", np.random.rand(20) * 1e3)
+    grid.add_field("node", "land_surface__elevation", np.arange(20))
+
+    with tmpdir.as_cwd():
+        write_esri_ascii("test.asc", grid)
+        _, field = read_esri_ascii("test_air__temperature.asc")
+        assert_array_equal(field, values)
+
+        _, field = read_esri_ascii("test_land_surface__elevation.asc")
+        assert_array_equal(field, np.arange(20.))
@@ -1,9 +1,12 @@
 #!/bin/env python
 
 import base64
+import zlib
 
 import numpy as np
 
+from landlab.io.ext._format import format_rows
+
 
 class EncoderError(Exception):
     pass
@@ -11,7 +14,7 @@ class EncoderError(Exception):
 
 class UnknownEncoderError(EncoderError):
     def __init__(self, name):
-        self._name
+        self._name = name
 
     def __str__(self):
         return "%s: Unknown encoder" % self._name
@@ -24,10 +27,11 @@ class EncoderInterface(object):
 
 class AsciiEncoder(object):
     def encode(self, array):
-        try:
-            return " ".join([str(val) for val in array.flatten()])
-        except AttributeError:
-            return " ".join([str(val) for val in array])
+        array = np.asarray(array)
+        if array.dtype.kind == "f":
+            return format_rows(array.reshape((1, -1)).astype(float))[:-1].decode()
+        else:
+            return " ".join([str(val) for val in array.reshape((-1,)).tolist()])
 
 
 class RawEncoder(object):
@@ -46,14 +50,102 @@ class Base64Encoder(object):
             as_str = array.tostring()
         except AttributeError:
             as_str = np.array(array).tostring()
-        as_str = base64.b64encode(as_str)
         block_size = base64.b64encode(np.array(len(as_str), dtype=np.int32).tostring())
-        return block_size + as_str
+        as_str = base64.b64encode(as_str)
+        return (block_size + as_str).decode("ascii")
 
     def decode(self, array):
         pass
 
 
+class AppendedRawEncoder(object):
+
+    """Encode arrays as blocks of VTK appended raw data.
+
+    Each block is preceded by a header of unsigned 64-bit integers. For
+    uncompressed data, the header is the number of bytes in the block. For
+    compressed data, the array is split into chunks of *block_size* bytes
+    that are compressed separately, and the header is the number of chunks,
+    the uncompressed size of a chunk, the size of the last chunk if it is
+    partial (otherwise 0), and then the compressed size of each chunk.
+
+    Parameters
+    ----------
+    compress : bool, optional
+        Compress blocks with zlib.
+    block_size : int, optional
+        Number of bytes in each compressed chunk.
+    level : int, optional
+        zlib compression level.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.vtk.encoders import AppendedRawEncoder
+
+    >>> encoder = AppendedRawEncoder()
+    >>> block = b"".join(encoder.iter_encode(np.arange(3, dtype=np.uint8)))
+    >>> np.frombuffer(block[:8], dtype=np.uint64)
+    array([3], dtype=uint64)
+    >>> block[8:]
+    b'\\x00\\x01\\x02'
+
+    >>> encoder = AppendedRawEncoder(compress=True, block_size=2)
+    >>> block = b"".join(encoder.iter_encode(np.arange(3, dtype=np.uint8)))
+    >>> header = np.frombuffer(block[:40], dtype=np.uint64)
+    >>> header[:3]
+    array([2, 2, 1], dtype=uint64)
+    >>> import zlib
+    >>> zlib.decompress(block[40 : 40 + int(header[3])])
+    b'\\x00\\x01'
+    """
+
+    header_type = np.dtype("<u8") if np.little_endian else np.dtype(">u8")
+
+    def __init__(self, compress=False, block_size=2 ** 15, level=6):
+        self._compress = compress
+        self._block_size = block_size
+        self._level = level
+
+    @property
+    def compress(self):
+        return self._compress
+
+    def iter_encode(self, array):
+        """Iterate over the encoded pieces of an array.
+
+        Parameters
+        ----------
+        array : ndarray
+            Array to encode.
+
+        Yields
+        ------
+        buffer
+            Encoded pieces of the array. Pieces of uncompressed arrays are
+            views of the array's data.
+        """
+        data = memoryview(np.ascontiguousarray(array).reshape((-1,)).view(np.uint8))
+
+        if not self.compress:
+            yield np.array([len(data)], dtype=self.header_type).tobytes()
+            if len(data) > 0:
+                yield data
+            return
+
+        n_blocks = -(-len(data) // self._block_size)
+        blocks = [
+            zlib.compress(data[start : start + self._block_size], self._level)
+            for start in range(0, len(data), self._block_size)
+        ]
+        header = np.empty(3 + n_blocks, dtype=self.header_type)
+        header[:3] = (n_blocks, self._block_size, len(data) % self._block_size)
+        header[3:] = [len(block) for block in blocks]
+        yield header.tobytes()
+        for block in blocks:
+            yield block
+
+
 _ENCODERS = {"ascii": AsciiEncoder(), "raw": RawEncoder(), "base64": Base64Encoder()}
 
 
@@ -0,0 +1,121 @@
+#! /usr/bin/env python
+"""Unit tests for landlab.io.vtk.vti."""
+import xml.dom.minidom
+import zlib
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.io.vtk.vti import (
+    VtkUniformRectilinearDatabase,
+    VtkUniformRectilinearWriter,
+)
+from landlab.io.vtk.writer import InvalidEncodingError, InvalidFormatError
+
+
+def _read_appended_raw(path):
+    """Read the data arrays of a VTK file with appended raw data."""
+    with open(path, "rb") as fp:
+        contents = fp.read()
+    (head, data) = contents.split(b"<AppendedData", 1)
+    data = data[data.index(b"_") + 1 :]
+
+    doc = xml.dom.minidom.parseString(head + b"</VTKFile>")
+    is_compressed = doc.documentElement.hasAttribute("compressor")
+
+    arrays = {}
+    for element in doc.getElementsByTagName("DataArray"):
+        dtype = np.dtype(element.getAttribute("type").lower())
+        offset = int(element.getAttribute("offset"))
+        if is_compressed:
+            n_blocks = int(np.frombuffer(data, dtype=np.uint64, count=1, offset=offset))
+            header = np.frombuffer(
+                data, dtype=np.uint64, count=3 + n_blocks, offset=offset
+            )
+            start = offset + header.nbytes
+            blocks = []
+            for size in header[3:].astype(int):
+                blocks.append(zlib.decompress(data[start : start + size]))
+                start += size
+            values = np.frombuffer(b"".join(blocks), dtype=dtype)
+        else:
+            n_bytes = int(np.frombuffer(data, dtype=np.uint64, count=1, offset=offset))
+            values = np.frombuffer(
+                data, dtype=dtype, count=n_bytes // dtype.itemsize, offset=offset + 8
+            )
+        arrays[element.getAttribute("Name")] = values
+    return doc, arrays
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_appended_raw(tmpdir, compress):
+    grid = RasterModelGrid((30, 40), xy_spacing=(2., 3.), xy_of_lower_left=(1., 2.))
+    z = grid.add_field("node", "topographic__elevation", np.random.rand(1200))
+    status = grid.add_field("node", "status", grid.status_at_node.copy())
+    area = grid.add_field("patch", "area", np.arange(39 * 29, dtype=np.int32))
+
+    writer = VtkUniformRectilinearWriter(
+        format="appended", encoding="raw", compress=compress, block_size=1000
+    )
+    with tmpdir.as_cwd():
+        writer.write("test.vti", grid)
+        doc, arrays = _read_appended_raw("test.vti")
+
+    image = doc.getElementsByTagName("ImageData")[0]
+    assert image.getAttribute("WholeExtent") == "0 39 0 29 0 0"
+    assert image.getAttribute("Origin") == "1.000000 2.000000 0.000000"
+    assert image.getAttribute("Spacing") == "2.000000 3.000000 0.000000"
+
+    assert_array_equal(arrays["topographic__elevation"], z)
+    assert_array_equal(arrays["status"], status)
+    assert arrays["status"].dtype == np.uint8
+    assert_array_equal(arrays["area"], area)
+
+
+def test_ascii(tmpdir):
+    grid = RasterModelGrid((3, 4))
+    z = grid.add_field("node", "topographic__elevation", np.random.rand(12))
+
+    writer = VtkUniformRectilinearWriter(format="ascii")
+    with tmpdir.as_cwd():
+        writer.write("test.vti", grid)
+        doc = xml.dom.minidom.parse("test.vti")
+
+    (element,) = doc.getElementsByTagName("DataArray")
+    assert element.getAttribute("format") == "ascii"
+    assert_array_equal(np.fromstring(element.firstChild.data, sep=" "), z)
+
+
+def test_database(tmpdir):
+    grid = RasterModelGrid((3, 4))
+    z = grid.add_zeros("node", "topographic__elevation")
+
+    database = VtkUniformRectilinearDatabase(format="appended", encoding="raw")
+    with tmpdir.as_cwd():
+        for time in range(3):
+            z[:] = time
+            database.write("run.vti", grid, time=0.5 * time)
+
+        collection = xml.dom.minidom.parse("run.pvd")
+        for time in range(3):
+            _, arrays = _read_appended_raw("run_%04d.vti" % time)
+            assert_array_equal(arrays["topographic__elevation"], time)
+
+    datasets = collection.getElementsByTagName("DataSet")
+    assert [dataset.getAttribute("file") for dataset in datasets] == [
+        "run_0000.vti",
+        "run_0001.vti",
+        "run_0002.vti",
+    ]
+    assert [float(dataset.getAttribute("timestep")) for dataset in datasets] == [
+        0., 0.5, 1.
+    ]
+
+
+def test_bad_format():
+    with pytest.raises(InvalidFormatError):
+        VtkUniformRectilinearWriter(format="xml")
+    with pytest.raises(InvalidEncodingError):
+        VtkUniformRectilinearWriter(format="appended", encoding="hex")
@@ -11,16 +11,54 @@ from landlab.io.vtk.vtkxml import (
     VtkRootElement,
     VtkSpacing,
 )
-from landlab.io.vtk.writer import VtkWriter
+from landlab.io.vtk.writer import VTKDatabase, VtkWriter
 
 
 class VtkUniformRectilinearWriter(VtkWriter):
+
+    """Write a raster grid, and its fields, as VTK ImageData.
+
+    Nodes of the grid are the points of the image, and patches are its
+    cells, so node fields are written as point data and patch fields as
+    cell data.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.vtk.vti import VtkUniformRectilinearWriter
+    >>> from landlab.testing.tools import cdtemp
+
+    >>> grid = RasterModelGrid((3, 4), xy_spacing=(2., 1.))
+    >>> _ = grid.add_field('node', 'topographic__elevation', np.arange(12.))
+    >>> writer = VtkUniformRectilinearWriter(
+    ...     format='appended', encoding='raw', compress=True)
+    >>> with cdtemp() as _:
+    ...     writer.write('grid.vti', grid)
+    ...     header = open('grid.vti', 'rb').read().split(b'<AppendedData')[0]
+    >>> print(header.decode()) # doctest: +NORMALIZE_WHITESPACE
+    <?xml version="1.0" ?>
+    <VTKFile byte_order="LittleEndian" compressor="vtkZLibDataCompressor"
+        header_type="UInt64" type="ImageData" version="1.0">
+        <ImageData Origin="0.000000 0.000000 0.000000"
+            Spacing="2.000000 1.000000 0.000000" WholeExtent="0 3 0 2 0 0">
+            <Piece Extent="0 3 0 2 0 0">
+                <PointData>
+                    <DataArray Name="topographic__elevation"
+                        NumberOfComponents="1" format="appended" offset="0"
+                        type="Float64"/>
+                </PointData>
+                <CellData/>
+            </Piece>
+        </ImageData>
+    """
+
     _vtk_grid_type = VtkUniformRectilinear
 
     def construct_field_elements(self, field):
         extent = VtkExtent(field.shape[::-1])
-        origin = VtkOrigin(field.origin[::-1], field.spacing[::-1])
-        spacing = VtkSpacing(field.spacing[::-1])
+        origin = VtkOrigin(field.xy_of_lower_left)
+        spacing = VtkSpacing((field.dx, field.dy))
 
         element = {
             "VTKFile": VtkRootElement(VtkUniformRectilinear),
@@ -35,8 +73,33 @@ class VtkUniformRectilinearWriter(VtkWriter):
                 field.at_node, append=self.data, encoding=self.encoding
             ),
             "CellData": VtkCellDataElement(
-                field.at_cell, append=self.data, encoding=self.encoding
+                field.at_patch, append=self.data, encoding=self.encoding
             ),
         }
 
         return element
+
+
+class VtkUniformRectilinearDatabase(VTKDatabase, VtkUniformRectilinearWriter):
+
+    """Write a time series of raster grids as VTK ImageData files.
+
+    Examples
+    --------
+    >>> import os
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.vtk.vti import VtkUniformRectilinearDatabase
+    >>> from landlab.testing.tools import cdtemp
+
+    >>> grid = RasterModelGrid((3, 4))
+    >>> z = grid.add_zeros('node', 'topographic__elevation')
+    >>> database = VtkUniformRectilinearDatabase(format='appended', encoding='raw')
+    >>> with cdtemp() as _:
+    ...     for time in range(3):
+    ...         z += 1.
+    ...         database.write('run.vti', grid, time=time * 10.)
+    ...     files = sorted(os.listdir('.'))
+    >>> files
+    ['run.pvd', 'run_0000.vti', 'run_0001.vti', 'run_0002.vti']
+    """
@@ -1,6 +1,8 @@
 #! /bin/env python
 
+import shutil
 import sys
+import tempfile
 import xml.dom.minidom
 
 import numpy as np
@@ -33,25 +35,25 @@ class VtkExtent(object):
 
 
 class VtkOrigin(object):
-    def __init__(self, origin, spacing):
-        assert len(spacing) <= 3
-        assert len(spacing) == len(origin)
+    def __init__(self, origin):
+        assert len(origin) <= 3
 
-        self._spacing = spacing
-        self._cell_origin = []
-        for (dx, x0) in zip(spacing, origin):
-            self._cell_origin.append(x0 - dx * .5)
+        self._origin = origin
+
+        self._padded_origin = []
+        for x0 in origin:
+            self._padded_origin.append(x0)
 
         for _ in range(3 - len(origin)):
-            self._cell_origin.append(0.)
+            self._padded_origin.append(0.)
 
-        self._origin_str = " ".join(["%f" % x for x in self._cell_origin])
+        self._origin_str = " ".join(["%f" % x for x in self._padded_origin])
 
     def __str__(self):
         return self._origin_str
 
     def __repr__(self):
-        return "VtkOrigin(%s, %s)" % (self._cell_origin, self._spacing)
+        return "VtkOrigin(%s)" % (self._origin,)
 
 
 class VtkSpacing(object):
@@ -80,6 +82,7 @@ class VtkSpacing(object):
 class VtkElement(xml.dom.minidom.Element):
     def __init__(self, name, **kwargs):
         xml.dom.minidom.Element.__init__(self, str(name), namespaceURI="VTK")
+        self.ownerDocument = None
         self.setAttributes(**kwargs)
 
     def setAttributes(self, **kwargs):
@@ -104,7 +107,8 @@ class VtkElement(xml.dom.minidom.Element):
 
 class VtkTextElement(xml.dom.minidom.Text):
     def __init__(self, text):
-        self.replaceWholeText(text)
+        xml.dom.minidom.Text.__init__(self)
+        self.data = text
 
 
 class VtkDataArrayElement(VtkElement):
@@ -116,24 +120,26 @@ class VtkDataArrayElement(VtkElement):
 
 
 class VtkDataElement(VtkElement):
-    format = "ascii"
-
     def __init__(self, name, **kwargs):
         VtkElement.__init__(self, name)
 
     def addData(self, data, name, append=None, encoding="ascii", **kwargs):
-        data_string = encode(data, encoding=encoding)
         data_array = VtkDataArrayElement(
-            data_string, Name=name, type=NUMPY_TO_VTK_TYPE[str(data.dtype)], **kwargs
+            data, Name=name, type=NUMPY_TO_VTK_TYPE[str(data.dtype)], **kwargs
         )
         self.appendChild(data_array)
 
         if append is not None:
             data_array.setAttributes(offset=append.offset(), format="appended")
-            append.addData(data_string)
+            if isinstance(append, VtkAppendedRawDataElement):
+                append.addData(data)
+            else:
+                append.addData(encode(data, encoding=encoding))
         else:
-            data_array.setAttributes(format=self.format)
-            data_array.addData(data_string)
+            data_array.setAttributes(
+                format="ascii" if encoding == "ascii" else "binary"
+            )
+            data_array.addData(encode(data, encoding=encoding))
 
 
 class VtkRootElement(VtkElement):
@@ -169,6 +175,62 @@ class VtkAppendedDataElement(VtkElement):
         return self.firstChild.length - 1
 
 
+class VtkAppendedRawDataElement(VtkElement):
+
+    """AppendedData element for raw, possibly compressed, binary data.
+
+    Raw data cannot be part of an XML document, so the element holds just
+    a placeholder. Arrays that are added are kept, uncompressed, as
+    references or, compressed, in a temporary file until the data are
+    written by :meth:`writeData`.
+    """
+
+    placeholder = "_LANDLAB_APPENDED_RAW_DATA_"
+
+    def __init__(self, encoder, **kwargs):
+        VtkElement.__init__(self, "AppendedData", encoding="raw", **kwargs)
+        self.appendChild(VtkTextElement(self.placeholder))
+        self._encoder = encoder
+        self._arrays = []
+        self._offset = 0
+        if encoder.compress:
+            self._blocks = tempfile.TemporaryFile()
+        else:
+            self._blocks = None
+
+    @property
+    def encoder(self):
+        return self._encoder
+
+    def addData(self, array):
+        if self._blocks is None:
+            self._arrays.append(array)
+            self._offset += self.encoder.header_type.itemsize + array.nbytes
+        else:
+            for piece in self.encoder.iter_encode(array):
+                self._blocks.write(piece)
+                self._offset += len(piece)
+
+    def offset(self):
+        return self._offset
+
+    def writeData(self, file_like):
+        """Write the appended data to a binary file."""
+        if self._blocks is None:
+            for array in self._arrays:
+                for piece in self.encoder.iter_encode(array):
+                    file_like.write(piece)
+        else:
+            self._blocks.seek(0)
+            shutil.copyfileobj(self._blocks, file_like)
+
+    def close(self):
+        """Release the arrays and temporary storage held by the element."""
+        self._arrays = []
+        if self._blocks is not None:
+            self._blocks.close()
+
+
 class VtkPointsElement(VtkDataElement):
     def __init__(self, coords, **kwargs):
         n_components = 3
@@ -221,3 +283,12 @@ class VtkCellDataElement(VtkDataElement):
         VtkDataElement.__init__(self, "CellData", **kwargs)
         for (name, value) in values.items():
             self.addData(value, name, NumberOfComponents=1, **kwargs)
+
+
+class VtkCollectionElement(VtkElement):
+    def __init__(self, datasets, **kwargs):
+        VtkElement.__init__(self, "Collection", **kwargs)
+        for (time, path) in datasets:
+            self.appendChild(
+                VtkElement("DataSet", timestep=time, group="", part=0, file=path)
+            )
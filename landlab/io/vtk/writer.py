@@ -2,7 +2,12 @@
 import os
 import xml.dom.minidom
 
-from .vtkxml import VtkAppendedDataElement
+from .encoders import AppendedRawEncoder
+from .vtkxml import (
+    VtkAppendedDataElement,
+    VtkAppendedRawDataElement,
+    VtkCollectionElement,
+)
 
 _VALID_ENCODINGS = set(["ascii", "base64", "raw"])
 _VALID_FORMATS = set(["ascii", "base64", "raw", "appended"])
@@ -57,8 +62,8 @@ def assemble_vtk_document(element):
 
 
 def assert_format_is_valid(format_string):
-    if format not in _VALID_FORMATS:
-        raise InvalidFormatError(format)
+    if format_string not in _VALID_FORMATS:
+        raise InvalidFormatError(format_string)
 
 
 def assert_encoding_is_valid(encoding):
@@ -67,20 +72,36 @@ def assert_encoding_is_valid(encoding):
 
 
 class VtkWriter(xml.dom.minidom.Document):
+
+    """Write grids and their fields to VTK XML files.
+
+    Parameters
+    ----------
+    format : {'ascii', 'base64', 'raw', 'appended'}, optional
+        Where to put data arrays. With 'appended', arrays are written to
+        a single block at the end of the file.
+    encoding : {'ascii', 'base64', 'raw'}, optional
+        How to encode data arrays. Appended 'raw' arrays are written
+        directly from their buffers to the file.
+    compress : bool, optional
+        Compress appended raw arrays with zlib.
+    block_size : int, optional
+        Number of bytes in each compressed block.
+    """
+
     def __init__(self, **kwds):
         self._format = kwds.pop("format", "ascii")
         self._encoding = kwds.pop("encoding", "ascii")
+        self._compress = kwds.pop("compress", False)
+        self._block_size = kwds.pop("block_size", 2 ** 15)
 
         assert_format_is_valid(self.format)
         assert_encoding_is_valid(self.encoding)
 
-        if format == "ascii":
+        if self.format == "ascii":
             self._encoding = "ascii"
 
-        if self.format == "appended":
-            self._data = VtkAppendedDataElement("", encoding=self.encoding)
-        else:
-            self._data = None
+        self._data = None
 
         xml.dom.minidom.Document.__init__(self)
 
@@ -92,40 +113,126 @@ class VtkWriter(xml.dom.minidom.Document):
     def encoding(self):
         return self._encoding
 
+    @property
+    def compress(self):
+        return self._compress
+
     @property
     def data(self):
         return self._data
 
+    def _new_appended_data(self):
+        if self.format != "appended":
+            return None
+        elif self.encoding == "raw":
+            return VtkAppendedRawDataElement(
+                AppendedRawEncoder(compress=self.compress, block_size=self._block_size)
+            )
+        else:
+            return VtkAppendedDataElement("", encoding=self.encoding)
+
     def construct_field_elements(self, field):
         raise NotImplementedError()
 
     def write(self, path, field):
         self.unlink()
+        self.childNodes = []
+        self._data = self._new_appended_data()
+
         elements = self.construct_field_elements(field)
 
         if self.data is not None:
             elements["AppendedData"] = self.data
 
+        if isinstance(self.data, VtkAppendedRawDataElement):
+            elements["VTKFile"].setAttributes(version="1.0", header_type="UInt64")
+            if self.compress:
+                elements["VTKFile"].setAttributes(compressor="vtkZLibDataCompressor")
+
         self.appendChild(assemble_vtk_document(elements))
-        self.to_xml(path)
+        try:
+            self.to_xml(path)
+        finally:
+            if isinstance(self.data, VtkAppendedRawDataElement):
+                self.data.close()
 
     def to_xml(self, path):
-        with open(path, "w") as xml_file:
-            xml_file.write(self.toprettyxml())
+        if isinstance(self.data, VtkAppendedRawDataElement):
+            (head, tail) = self.toprettyxml().split(self.data.placeholder)
+            with open(path, "wb") as xml_file:
+                xml_file.write(head.encode("utf-8"))
+                xml_file.write(b"_")
+                self.data.writeData(xml_file)
+                xml_file.write(tail.encode("utf-8"))
+        else:
+            with open(path, "w") as xml_file:
+                xml_file.write(self.toprettyxml())
+
+
+def write_pvd(path, datasets):
+    """Write a ParaView collection file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the collection (.pvd) file.
+    datasets : iterable of (float, str)
+        Time and path, relative to the collection file, of each data file.
+
+    Examples
+    --------
+    >>> from landlab.io.vtk.writer import write_pvd
+    >>> from landlab.testing.tools import cdtemp
+    >>> with cdtemp() as _:
+    ...     write_pvd('run.pvd', [(0., 'run_0000.vti'), (0.5, 'run_0001.vti')])
+    ...     print(open('run.pvd').read()) # doctest: +NORMALIZE_WHITESPACE
+    <?xml version="1.0" ?>
+    <VTKFile byte_order="LittleEndian" type="Collection" version="0.1">
+        <Collection>
+            <DataSet file="run_0000.vti" group="" part="0" timestep="0.0"/>
+            <DataSet file="run_0001.vti" group="" part="0" timestep="0.5"/>
+        </Collection>
+    </VTKFile>
+    <BLANKLINE>
+    """
+    from .vtkxml import VtkRootElement
+
+    doc = xml.dom.minidom.Document()
+    root = VtkRootElement("Collection")
+    root.appendChild(VtkCollectionElement(datasets))
+    doc.appendChild(root)
+    with open(path, "w") as pvd_file:
+        pvd_file.write(doc.toprettyxml())
+    doc.unlink()
 
 
 class VTKDatabase(VtkWriter):
-    def write(self, path, **kwargs):
+
+    """Write a time series of VTK files and a ParaView collection for them.
+
+    Each call to :meth:`write` writes a new file, numbered by the number of
+    files already written. The collection file, which has the same name as
+    the data files but without the number and with a .pvd extension, is
+    rewritten with each new file so that it is always complete.
+    """
+
+    def __init__(self, **kwds):
+        VtkWriter.__init__(self, **kwds)
+        self._count = 0
+        self._datasets = []
+
+    def write(self, path, field, time=None):
         (base, file) = os.path.split(path)
         (root, ext) = os.path.splitext(file)
 
-        try:
-            next_file = "%s_%04d%s" % (root, self._count, ext)
-        except NameError:
-            self._count = 0
-            next_file = "%s_%04d%s" % (root, self._count, ext)
+        next_file = "%s_%04d%s" % (root, self._count, ext)
+
+        VtkWriter.write(self, os.path.join(base, next_file), field)
 
-        VtkWriter.write(self, os.path.join(base, next_file), **kwargs)
+        if time is None:
+            time = self._count
+        self._datasets.append((time, next_file))
+        write_pvd(os.path.join(base, root + ".pvd"), self._datasets)
 
         self._count += 1
 
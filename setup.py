@@ -31,6 +31,14 @@ ext_modules = [
         "landlab.components.flow_director.cfuncs",
         ["landlab/components/flow_director/cfuncs.pyx"],
     ),
+    Extension(
+        "landlab.components.flow_routing.cfuncs",
+        ["landlab/components/flow_routing/cfuncs.pyx"],
+    ),
+    Extension(
+        "landlab.components.overland_flow.cfuncs",
+        ["landlab/components/overland_flow/cfuncs.pyx"],
+    ),
     Extension(
         "landlab.components.stream_power.cfuncs",
         ["landlab/components/stream_power/cfuncs.pyx"],
@@ -106,7 +114,13 @@ ext_modules = [
         "landlab.grid.structured_quad.c_faces",
         ["landlab/grid/structured_quad/c_faces.pyx"],
     ),
+    Extension(
+        "landlab.grid.structured_quad.c_nodes",
+        ["landlab/grid/structured_quad/c_nodes.pyx"],
+    ),
     Extension("landlab.layers.ext.eventlayers", ["landlab/layers/ext/eventlayers.pyx"]),
+    Extension("landlab.io.ext._format", ["landlab/io/ext/_format.pyx"]),
+    Extension("landlab.io.ext.esri_ascii", ["landlab/io/ext/esri_ascii.pyx"]),
 ]
 
 